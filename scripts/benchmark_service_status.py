@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""Benchmark service status lookups for whisper, kokoro and livekit.
+
+Compares the /proc socket-table fast path (Linux) with the psutil scan of
+every process, for the raw port-to-process lookup and for the full
+check_service_status call used by the service tools.
+
+Usage:
+    python scripts/benchmark_service_status.py [--iterations N]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import psutil
+
+from voice_mode.config import KOKORO_PORT, LIVEKIT_PORT, WHISPER_PORT
+from voice_mode.utils.services import common
+
+SERVICES = {"whisper": WHISPER_PORT, "kokoro": KOKORO_PORT, "livekit": LIVEKIT_PORT}
+
+
+def time_ms(func, port, iterations):
+    """Median and max wall time of func(port) in milliseconds."""
+    samples = []
+    result = None
+    for _ in range(iterations):
+        start = time.perf_counter()
+        result = func(port)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), max(samples), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", "-n", type=int, default=20)
+    args = parser.parse_args()
+
+    fast_path = sys.platform.startswith("linux")
+    print(f"Processes: {len(psutil.pids())}, iterations: {args.iterations}, "
+          f"/proc fast path: {'yes' if fast_path else 'no (not Linux)'}")
+    print(f"{'service':<10}{'port':>6}  {'psutil scan':>14}  {'/proc':>14}  {'status':>14}  result")
+
+    for name, port in SERVICES.items():
+        scan_med, scan_max, _ = time_ms(common._find_process_by_port_psutil, port, args.iterations)
+        if fast_path:
+            proc_med, proc_max, _ = time_ms(common._find_process_by_port_proc, port, args.iterations)
+            proc_col = f"{proc_med:6.2f}/{proc_max:6.2f}"
+        else:
+            proc_col = "n/a"
+        status_med, status_max, (status, proc) = time_ms(common.check_service_status, port, args.iterations)
+        owner = f" (pid {proc.pid})" if proc else ""
+        print(f"{name:<10}{port:>6}  {scan_med:6.2f}/{scan_max:6.2f}  {proc_col:>14}  "
+              f"{status_med:6.2f}/{status_max:6.2f}  {status}{owner}")
+
+    print("\nTimes are median/max in ms.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""Benchmark the per-chunk cost of preparing microphone audio for WebRTC VAD.
+
+Compares the old per-chunk FFT resample (scipy.signal.resample on each 30 ms
+chunk, then truncated) with the streaming polyphase VADFrontEnd, on the same
+chunks the recorder sees. Also reports how far each path's 16 kHz output is
+from resampling the whole recording at once, which shows the chunk-edge
+artifacts of the per-chunk resample.
+
+Usage:
+    python scripts/benchmark_vad_frontend.py [--seconds S] [--runs N]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import numpy as np
+from scipy import signal
+
+from voice_mode.config import SAMPLE_RATE, VAD_CHUNK_DURATION_MS
+from voice_mode.resample import resample
+from voice_mode.vad_frontend import VAD_SAMPLE_RATE, VADFrontEnd
+
+CHUNK = SAMPLE_RATE * VAD_CHUNK_DURATION_MS // 1000
+VAD_FRAME = VAD_SAMPLE_RATE * VAD_CHUNK_DURATION_MS // 1000
+
+
+def test_audio(seconds):
+    """Voiced-like harmonics plus noise, as int16 at the capture rate."""
+    rng = np.random.default_rng(0)
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    pitch = 140 + 30 * np.sin(2 * np.pi * 0.5 * t)
+    phase = 2 * np.pi * np.cumsum(pitch) / SAMPLE_RATE
+    audio = sum(np.sin(k * phase) / k for k in range(1, 30)) * 4000 + rng.normal(0, 300, len(t))
+    audio = audio[:len(audio) // CHUNK * CHUNK]
+    return np.clip(audio, -32768, 32767).astype(np.int16)
+
+
+def per_chunk_fft(chunks):
+    """The recorder's previous front end, one chunk at a time."""
+    frames = []
+    for chunk in chunks:
+        vad_chunk = signal.resample(chunk, int(len(chunk) * VAD_SAMPLE_RATE / SAMPLE_RATE))
+        frames.append(vad_chunk[:VAD_FRAME].astype(np.int16).tobytes())
+    return frames
+
+
+def streaming_polyphase(chunks):
+    front_end = VADFrontEnd(SAMPLE_RATE, VAD_CHUNK_DURATION_MS)
+    frames = []
+    for chunk in chunks:
+        frames.extend(front_end.process(chunk))
+    return frames
+
+
+def time_per_chunk_us(func, chunks, runs):
+    """Median and max CPU time per chunk in microseconds, over runs."""
+    samples = []
+    frames = None
+    for _ in range(runs):
+        start = time.process_time()
+        frames = func(chunks)
+        samples.append((time.process_time() - start) / len(chunks) * 1e6)
+    return statistics.median(samples), max(samples), frames
+
+
+def error_db(frames, reference, delay):
+    """Error relative to the whole-recording resample, in dB below the signal."""
+    output = np.frombuffer(b"".join(frames), dtype=np.int16).astype(np.float64)[delay:]
+    reference = reference[:len(output)].astype(np.float64)
+    error = np.sqrt(np.mean((output - reference) ** 2))
+    level = np.sqrt(np.mean(reference ** 2))
+    return 20 * np.log10(level / error) if error else float("inf")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", "-s", type=float, default=30.0)
+    parser.add_argument("--runs", "-n", type=int, default=5)
+    args = parser.parse_args()
+
+    audio = test_audio(args.seconds)
+    chunks = [audio[i:i + CHUNK] for i in range(0, len(audio), CHUNK)]
+    reference = resample(audio, SAMPLE_RATE, VAD_SAMPLE_RATE)
+    delay = VADFrontEnd(SAMPLE_RATE)._resampler.delay
+
+    print(f"{len(chunks)} chunks of {VAD_CHUNK_DURATION_MS} ms ({SAMPLE_RATE} Hz -> {VAD_SAMPLE_RATE} Hz), "
+          f"{args.runs} runs")
+    print(f"{'front end':<22}{'us/chunk':>18}  {'frames':>7}  {'SNR vs whole-recording':>24}")
+
+    for name, func, frame_delay in (("per-chunk FFT", per_chunk_fft, 0),
+                                    ("streaming polyphase", streaming_polyphase, delay)):
+        med, worst, frames = time_per_chunk_us(func, chunks, args.runs)
+        snr = error_db(frames, reference, frame_delay)
+        print(f"{name:<22}{med:8.1f}/{worst:8.1f}  {len(frames):>7}  {snr:>21.1f} dB")
+
+    try:
+        import webrtcvad
+    except ImportError:
+        print("\nwebrtcvad not installed - VAD decision cost not measured")
+    else:
+        vad = webrtcvad.Vad(2)
+        frames = streaming_polyphase(chunks)
+        start = time.process_time()
+        for frame in frames:
+            vad.is_speech(frame, VAD_SAMPLE_RATE)
+        print(f"\nwebrtcvad.is_speech: {(time.process_time() - start) / len(frames) * 1e6:.1f} us/frame")
+
+    print("\nTimes are median/max CPU microseconds per chunk. "
+          "Each chunk has a 30 ms real-time budget.")
+
+
+if __name__ == "__main__":
+    main()
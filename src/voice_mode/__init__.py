@@ -9,9 +9,25 @@ This package provides MCP servers for voice interactions through multiple transp
 
 from .version import __version__
 
+from contextlib import asynccontextmanager
+
+
+@asynccontextmanager
+async def _lifespan(server):
+    """Release shared resources when the server stops.
+
+    Runs on the server's own event loop, which pooled HTTP clients are bound to.
+    """
+    try:
+        yield {}
+    finally:
+        from .core import cleanup
+        await cleanup({})
+
+
 # Create the MCP instance here so tools can import it
 from fastmcp import FastMCP
-mcp = FastMCP("chatta")
+mcp = FastMCP("chatta", lifespan=_lifespan)
 
 # Import tools to register them with the mcp instance
 # We need to do this here so they're registered before server.py runs
@@ -17,6 +17,8 @@ from enum import Enum
 from collections import deque
 import threading
 
+from .vad_frontend import VADFrontEnd
+
 logger = logging.getLogger(__name__)
 
 # Try to import webrtcvad for advanced VAD
@@ -197,12 +199,14 @@ class WebRTCVADDetector:
         self.sample_rate = sample_rate
         self.frame_duration_ms = 30  # WebRTC VAD works with 10, 20, or 30ms frames
         self.frame_size = int(sample_rate * self.frame_duration_ms / 1000)
+        # Resamples rates WebRTC VAD does not accept, keeping filter state between frames
+        self.front_end = VADFrontEnd(sample_rate, self.frame_duration_ms)
     
     def detect(self, audio_data: bytes) -> Tuple[bool, float]:
         """Detect speech using WebRTC VAD."""
         try:
             # WebRTC VAD returns True for speech, False for silence
-            is_speech = self.vad.is_speech(audio_data, self.sample_rate)
+            is_speech = self.front_end.is_speech(self.vad, np.frombuffer(audio_data, dtype=np.int16))
             is_silent = not is_speech
             confidence = 0.9 if is_silent else 0.1  # High confidence in WebRTC VAD
             return is_silent, confidence
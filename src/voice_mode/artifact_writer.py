@@ -0,0 +1,176 @@
+"""
+Background writer for saved audio, debug files and transcriptions.
+
+With SAVE_AUDIO, DEBUG or SAVE_TRANSCRIPTIONS enabled, every turn writes
+several files. Doing that inline adds disk latency (and WAV encoding) to
+the turn. ArtifactWriter takes those writes off the hot path: callers get
+the final path back immediately, and a worker thread encodes and writes
+the file afterwards.
+
+The queue is bounded; when it is full the write happens inline instead of
+being dropped. Everything still queued is flushed on shutdown.
+"""
+
+import atexit
+import logging
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Union
+
+from .config import ARTIFACT_QUEUE_SIZE, ARTIFACT_WRITER_ENABLED
+
+logger = logging.getLogger("voice-mode")
+
+ArtifactData = Union[bytes, str, Callable[[], Union[bytes, str]]]
+
+
+class ArtifactWriter:
+    """Writes files on a worker thread through a bounded queue."""
+
+    def __init__(self, max_queue: int = ARTIFACT_QUEUE_SIZE, enabled: bool = ARTIFACT_WRITER_ENABLED):
+        self.enabled = enabled
+        self._queue: "queue.Queue[Optional[tuple]]" = queue.Queue(maxsize=max(1, max_queue))
+        self._worker: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+        # Session counters
+        self.submitted = 0
+        self.written = 0
+        self.failed = 0
+        self.inline_writes = 0  # Written by the caller (queue full or writer disabled)
+        self.max_depth = 0
+        self.bytes_written = 0
+        self.write_seconds = 0.0
+
+    def submit(self, path: Union[str, Path], data: ArtifactData) -> Path:
+        """Queue a file write.
+
+        Args:
+            path: Destination; parent directories are created by the writer
+            data: File contents, or a callable producing them (run on the
+                worker, e.g. to encode WAV off the hot path)
+
+        Returns:
+            The destination path (the file may not exist yet)
+        """
+        path = Path(path)
+        with self._lock:
+            self.submitted += 1
+
+        if not self.enabled:
+            self._write(path, data)
+            with self._lock:
+                self.inline_writes += 1
+            return path
+
+        self._ensure_worker()
+        try:
+            self._queue.put_nowait((path, data))
+        except queue.Full:
+            logger.debug(f"Artifact queue full - writing {path.name} inline")
+            self._write(path, data)
+            with self._lock:
+                self.inline_writes += 1
+            return path
+
+        with self._lock:
+            self.max_depth = max(self.max_depth, self._queue.qsize())
+        return path
+
+    def _ensure_worker(self):
+        with self._lock:
+            if self._worker is not None and self._worker.is_alive():
+                return
+            self._worker = threading.Thread(target=self._run, name="artifact-writer", daemon=True)
+            self._worker.start()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                self._write(*item)
+            finally:
+                self._queue.task_done()
+
+    def _write(self, path: Path, data: ArtifactData):
+        start = time.perf_counter()
+        try:
+            if callable(data):
+                data = data()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            if isinstance(data, str):
+                data = data.encode("utf-8")
+            with open(path, 'wb') as f:
+                f.write(data)
+            with self._lock:
+                self.written += 1
+                self.bytes_written += len(data)
+                self.write_seconds += time.perf_counter() - start
+            logger.debug(f"Artifact saved: {path}")
+        except Exception as e:
+            with self._lock:
+                self.failed += 1
+            logger.error(f"Failed to save {path}: {e}")
+
+    @property
+    def depth(self) -> int:
+        """Writes still queued or in progress."""
+        return self._queue.unfinished_tasks
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued write has finished.
+
+        Returns:
+            True if the queue drained within the timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def close(self, timeout: float = 10.0):
+        """Flush pending writes and stop the worker."""
+        if not self.flush(timeout):
+            logger.warning(f"Artifact writer closed with {self.depth} write(s) still pending")
+            return
+        with self._lock:
+            worker = self._worker
+            self._worker = None
+        if worker is not None and worker.is_alive():
+            self._queue.put(None)
+            worker.join(timeout)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'submitted': self.submitted,
+                'written': self.written,
+                'failed': self.failed,
+                'inline_writes': self.inline_writes,
+                'depth': self.depth,
+                'max_depth': self.max_depth,
+                'bytes_written': self.bytes_written,
+                'write_seconds': self.write_seconds,
+            }
+
+
+_artifact_writer: Optional[ArtifactWriter] = None
+_artifact_writer_lock = threading.Lock()
+
+
+def get_artifact_writer() -> ArtifactWriter:
+    """Get the global artifact writer (flushed at interpreter exit)."""
+    global _artifact_writer
+    with _artifact_writer_lock:
+        if _artifact_writer is None:
+            _artifact_writer = ArtifactWriter()
+            atexit.register(_artifact_writer.close)
+        return _artifact_writer
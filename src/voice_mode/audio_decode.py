@@ -0,0 +1,284 @@
+"""
+In-memory decoding of TTS responses.
+
+PCM and 16-bit WAV responses are parsed directly with numpy. Compressed
+formats (mp3, opus, aac, flac) are piped through a single ffmpeg process
+on stdin/stdout, so nothing is written to disk. For buffered playback the
+result is a float32 buffer ready for sounddevice, allocated once with any
+leading silence already in place and in the source's channel layout;
+StreamingDecoder decodes a response incrementally while it is still
+downloading, downmixed to mono for the streaming output.
+"""
+
+import asyncio
+import logging
+import shutil
+import struct
+import subprocess
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from .config import SAMPLE_RATE
+
+logger = logging.getLogger("voice-mode")
+
+# ffmpeg demuxer names for formats that can't be reliably probed from a pipe
+FFMPEG_INPUT_FORMATS = {
+    "mp3": "mp3",
+    "opus": "ogg",
+    "ogg": "ogg",
+    "aac": "aac",
+    "flac": "flac",
+    "wav": "wav",
+    "webm": "webm",
+}
+
+_WAVE_FORMAT_PCM = 1
+_WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+
+class AudioDecodeError(Exception):
+    """Raised when audio bytes cannot be decoded."""
+
+
+@dataclass
+class DecodedAudio:
+    """Decoded audio ready for playback."""
+    samples: np.ndarray  # float32 in [-1, 1], shape (frames,) or (frames, channels)
+    sample_rate: int
+    channels: int
+    leading_frames: int = 0  # Frames of silence prepended to the audio
+
+    @property
+    def duration(self) -> float:
+        """Duration in seconds, including leading silence."""
+        return len(self.samples) / self.sample_rate if self.sample_rate else 0.0
+
+    def pcm16(self, mono: bool = False) -> np.ndarray:
+        """Return the audio (without leading silence) as int16, optionally downmixed to mono."""
+        audio = self.samples[self.leading_frames:]
+        if mono and audio.ndim > 1:
+            audio = audio.mean(axis=1)
+        return np.clip(audio * 32768.0, -32768, 32767).astype(np.int16)
+
+
+def _int16_to_float32(pcm: np.ndarray, channels: int, sample_rate: int, leading_silence: float) -> DecodedAudio:
+    """Convert int16 samples into a single float32 buffer with leading silence."""
+    frames = len(pcm) // channels
+    pcm = pcm[:frames * channels]
+    pad = int(sample_rate * leading_silence)
+
+    out = np.zeros((pad + frames) * channels, dtype=np.float32)
+    np.multiply(pcm, np.float32(1.0 / 32768.0), out=out[pad * channels:], casting="unsafe")
+    if channels > 1:
+        out = out.reshape((-1, channels))
+    return DecodedAudio(samples=out, sample_rate=sample_rate, channels=channels, leading_frames=pad)
+
+
+def _parse_wav(data: bytes) -> Optional[tuple]:
+    """Locate the sample data of a 16-bit PCM WAV file.
+
+    Returns:
+        (int16 samples, channels, sample_rate), or None if the file isn't
+        16-bit PCM and needs ffmpeg instead.
+    """
+    if len(data) < 12 or data[:4] != b"RIFF" or data[8:12] != b"WAVE":
+        raise AudioDecodeError("Not a RIFF/WAVE file")
+
+    offset = 12
+    fmt = None
+    while offset + 8 <= len(data):
+        chunk_id = data[offset:offset + 4]
+        chunk_size = struct.unpack_from("<I", data, offset + 4)[0]
+        body = offset + 8
+        if chunk_id == b"fmt ":
+            fmt = struct.unpack_from("<HHIIHH", data, body)
+        elif chunk_id == b"data":
+            if fmt is None:
+                raise AudioDecodeError("WAV data chunk before fmt chunk")
+            format_tag, channels, sample_rate, _, _, bits = fmt
+            if format_tag not in (_WAVE_FORMAT_PCM, _WAVE_FORMAT_EXTENSIBLE) or bits != 16:
+                return None
+            # Streamed WAVs often carry a placeholder size; use what we have
+            end = min(body + chunk_size, len(data))
+            end -= (end - body) % 2
+            return np.frombuffer(data, dtype=np.int16, count=(end - body) // 2, offset=body), channels, sample_rate
+        offset = body + chunk_size + (chunk_size & 1)
+
+    raise AudioDecodeError("WAV file has no data chunk")
+
+
+def _ffmpeg_command(format: str, sample_rate: int, low_latency: bool = False, keep_channels: bool = False) -> list:
+    """Build an ffmpeg command decoding stdin to 16-bit PCM on stdout.
+
+    The output is headerless mono s16le, or with keep_channels a WAV stream
+    in the source's channel layout (the header carries the channel count).
+    """
+    ffmpeg = shutil.which("ffmpeg")
+    if not ffmpeg:
+        raise AudioDecodeError("ffmpeg not found - required to decode compressed audio")
+
+    cmd = [ffmpeg, "-hide_banner", "-loglevel", "error", "-nostdin"]
+    if low_latency:
+        # Start decoding from the first frame instead of probing seconds of input
+        cmd += ["-fflags", "nobuffer", "-probesize", "32", "-analyzeduration", "0"]
+    input_format = FFMPEG_INPUT_FORMATS.get(format)
+    if input_format:
+        cmd += ["-f", input_format]
+    cmd += ["-i", "pipe:0"]
+    if keep_channels:
+        cmd += ["-f", "wav", "-acodec", "pcm_s16le", "-ar", str(sample_rate)]
+    else:
+        cmd += ["-f", "s16le", "-acodec", "pcm_s16le", "-ac", "1", "-ar", str(sample_rate)]
+    if low_latency:
+        cmd += ["-flush_packets", "1"]
+    cmd.append("pipe:1")
+    return cmd
+
+
+def _ffmpeg_decode(data: bytes, format: str, sample_rate: int, timeout: float = 30.0) -> tuple:
+    """Decode compressed audio to int16 PCM through an ffmpeg pipe, keeping its channels.
+
+    Returns:
+        (interleaved int16 samples, channels)
+    """
+    cmd = _ffmpeg_command(format, sample_rate, keep_channels=True)
+
+    try:
+        result = subprocess.run(cmd, input=data, capture_output=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        raise AudioDecodeError(f"ffmpeg timed out decoding {format} audio")
+    if result.returncode != 0:
+        raise AudioDecodeError(f"ffmpeg failed to decode {format}: {result.stderr.decode(errors='replace').strip()}")
+
+    parsed = _parse_wav(result.stdout)
+    if parsed is None:
+        raise AudioDecodeError(f"ffmpeg did not produce 16-bit PCM for {format}")
+    pcm, channels, _ = parsed
+    return pcm, channels
+
+
+def decode_audio_bytes(
+    data: bytes,
+    format: str,
+    sample_rate: int = SAMPLE_RATE,
+    leading_silence: float = 0.0
+) -> DecodedAudio:
+    """Decode a complete TTS response held in memory.
+
+    Args:
+        data: Response body
+        format: Audio format of the response (pcm, wav, mp3, opus, ...)
+        sample_rate: Sample rate of raw PCM, and output rate for compressed formats
+        leading_silence: Seconds of silence to prepend (avoids clipping on wake-up)
+
+    Returns:
+        DecodedAudio with a float32 buffer ready for playback
+
+    Raises:
+        AudioDecodeError: If the audio can't be decoded
+    """
+    if not data:
+        raise AudioDecodeError("No audio data")
+
+    if format == "pcm":
+        # Raw 16-bit mono at the standard TTS rate
+        pcm = np.frombuffer(data, dtype=np.int16, count=len(data) // 2)
+        return _int16_to_float32(pcm, 1, sample_rate, leading_silence)
+
+    if format == "wav":
+        parsed = _parse_wav(data)
+        if parsed is not None:
+            pcm, channels, wav_rate = parsed
+            return _int16_to_float32(pcm, channels, wav_rate, leading_silence)
+        logger.debug("WAV is not 16-bit PCM, decoding with ffmpeg")
+
+    pcm, channels = _ffmpeg_decode(data, format, sample_rate)
+    return _int16_to_float32(pcm, channels, sample_rate, leading_silence)
+
+
+class StreamingDecoder:
+    """Incremental decoder for compressed audio arriving over the network.
+
+    Keeps one ffmpeg process alive for the whole response: compressed chunks
+    are written to its stdin as they arrive and PCM is read from its stdout
+    as soon as each frame is decoded, so playback can start after the first
+    few frames instead of after the whole response.
+
+    Feeding and reading must happen in separate tasks; when the reader stops
+    consuming, ffmpeg stops reading and feed() waits (natural backpressure).
+    """
+
+    def __init__(self, format: str, sample_rate: int = SAMPLE_RATE):
+        self.format = format
+        self.sample_rate = sample_rate
+        self.process: Optional[asyncio.subprocess.Process] = None
+        self._leftover = b""
+
+    async def start(self) -> None:
+        """Launch the ffmpeg process."""
+        cmd = _ffmpeg_command(self.format, self.sample_rate, low_latency=True)
+        self.process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        logger.debug(f"Started streaming {self.format} decoder (pid {self.process.pid})")
+
+    async def feed(self, data: bytes) -> None:
+        """Write compressed data to the decoder."""
+        try:
+            self.process.stdin.write(data)
+            await self.process.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError):
+            raise AudioDecodeError(f"ffmpeg exited while decoding {self.format}: {await self._stderr()}")
+
+    async def close_input(self) -> None:
+        """Signal the end of the compressed stream."""
+        try:
+            self.process.stdin.close()
+            await self.process.stdin.wait_closed()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    async def read(self, max_bytes: int = 8192) -> Optional[np.ndarray]:
+        """Read the next decoded int16 samples.
+
+        Returns:
+            Samples as soon as any are available, or None once the stream has
+            been fully decoded
+
+        Raises:
+            AudioDecodeError: If ffmpeg failed
+        """
+        while True:
+            data = await self.process.stdout.read(max_bytes)
+            if not data:
+                returncode = await self.process.wait()
+                if returncode != 0:
+                    raise AudioDecodeError(f"ffmpeg failed to decode {self.format}: {await self._stderr()}")
+                return None
+            data = self._leftover + data
+            usable = len(data) - (len(data) % 2)
+            self._leftover = data[usable:]
+            if usable:
+                return np.frombuffer(data, dtype=np.int16, count=usable // 2)
+
+    async def _stderr(self) -> str:
+        try:
+            err = await asyncio.wait_for(self.process.stderr.read(), timeout=1.0)
+            return err.decode(errors="replace").strip()
+        except Exception:
+            return "unknown error"
+
+    async def close(self) -> None:
+        """Terminate the decoder if it is still running."""
+        if self.process and self.process.returncode is None:
+            try:
+                self.process.kill()
+            except ProcessLookupError:
+                pass
+            await self.process.wait()
@@ -0,0 +1,245 @@
+"""
+In-memory audio encoding for STT uploads and saved recordings.
+
+WAV is built directly from the int16 buffer (a 44-byte header, no
+resampling or copies through pydub). Compressed formats (mp3, opus, aac,
+flac) are encoded by piping the PCM through a single ffmpeg process, so
+nothing touches the disk. StreamingEncoder does the same while the
+recording is still being captured, so the upload is ready at end of speech,
+and can resample to the upload rate on the way in.
+"""
+
+import io
+import logging
+import queue
+import shutil
+import subprocess
+import threading
+import time
+import wave
+from dataclasses import dataclass
+from typing import Optional, Union
+
+import numpy as np
+
+from .config import AAC_BITRATE, MP3_BITRATE, OPUS_BITRATE, SAMPLE_RATE
+
+logger = logging.getLogger("voice-mode")
+
+# ffmpeg codec/muxer arguments per upload format
+FFMPEG_OUTPUT_ARGS = {
+    "mp3": ["-c:a", "libmp3lame", "-b:a", MP3_BITRATE, "-f", "mp3"],
+    "opus": ["-c:a", "libopus", "-b:a", str(OPUS_BITRATE), "-f", "ogg"],
+    "aac": ["-c:a", "aac", "-b:a", AAC_BITRATE, "-f", "adts"],
+    "flac": ["-c:a", "flac", "-f", "flac"],
+}
+
+
+class AudioEncodeError(Exception):
+    """Raised when audio can't be encoded."""
+
+
+def to_int16(samples: np.ndarray) -> np.ndarray:
+    """Convert float samples in [-1, 1] to int16 (int16 passes through)."""
+    if samples.dtype == np.int16:
+        return samples
+    return np.clip(samples * 32767.0, -32768, 32767).astype(np.int16)
+
+
+def encode_wav(samples: Union[np.ndarray, bytes], sample_rate: int, channels: int = 1) -> bytes:
+    """Encode 16-bit PCM as a WAV file in memory.
+
+    Args:
+        samples: int16 samples (float samples in [-1, 1] are converted) or raw PCM bytes
+        sample_rate: Sample rate in Hz
+        channels: Channel count
+
+    Returns:
+        WAV file bytes
+    """
+    if isinstance(samples, np.ndarray):
+        samples = to_int16(samples).tobytes()
+
+    buffer = io.BytesIO()
+    with wave.open(buffer, 'wb') as wav_file:
+        wav_file.setnchannels(channels)
+        wav_file.setsampwidth(2)  # 16-bit
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(samples)
+    return buffer.getvalue()
+
+
+def ffmpeg_encode_command(format: str, sample_rate: int) -> list:
+    """Build an ffmpeg command encoding mono s16le PCM on stdin to format on stdout."""
+    if format not in FFMPEG_OUTPUT_ARGS:
+        raise AudioEncodeError(f"Unsupported encode format: {format}")
+    ffmpeg = shutil.which("ffmpeg")
+    if not ffmpeg:
+        raise AudioEncodeError("ffmpeg not found - required to encode compressed audio")
+    return [ffmpeg, "-hide_banner", "-loglevel", "error", "-nostdin",
+            "-f", "s16le", "-ar", str(sample_rate), "-ac", "1", "-i", "pipe:0",
+            *FFMPEG_OUTPUT_ARGS[format], "pipe:1"]
+
+
+def encode_audio(samples: np.ndarray, format: str, sample_rate: int = SAMPLE_RATE,
+                 timeout: float = 30.0) -> bytes:
+    """Encode mono samples to an upload format without temporary files.
+
+    Args:
+        samples: int16 (or float in [-1, 1]) mono samples
+        format: wav, mp3, opus, aac or flac
+        sample_rate: Sample rate of samples
+
+    Returns:
+        Encoded file bytes
+
+    Raises:
+        AudioEncodeError: If ffmpeg is missing or fails
+    """
+    if format == "wav":
+        return encode_wav(samples, sample_rate)
+
+    cmd = ffmpeg_encode_command(format, sample_rate)
+    try:
+        result = subprocess.run(cmd, input=to_int16(samples).tobytes(), capture_output=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        raise AudioEncodeError(f"ffmpeg timed out encoding {format} audio")
+    if result.returncode != 0 or not result.stdout:
+        raise AudioEncodeError(f"ffmpeg failed to encode {format}: {result.stderr.decode(errors='replace').strip()}")
+    return result.stdout
+
+
+def upload_file(data: bytes, format: str, name: str = "audio") -> io.BytesIO:
+    """Wrap encoded audio for an OpenAI-compatible transcription upload.
+
+    The client infers the content type from the file name, so it carries
+    the format's extension.
+    """
+    file = io.BytesIO(data)
+    file.name = f"{name}.{format}"
+    return file
+
+
+@dataclass
+class EncodedAudio:
+    """An upload body encoded while recording."""
+    data: bytes
+    format: str
+    samples: int  # Input samples encoded, to check it matches the final recording
+    sample_rate: int = SAMPLE_RATE  # Rate of the encoded audio
+
+
+class StreamingEncoder:
+    """Encodes audio chunks with ffmpeg as they are captured.
+
+    feed() only queues the chunk, so it is safe to call from an audio
+    callback. A writer thread resamples chunks to upload_rate, pipes them
+    into ffmpeg and a reader thread collects its output; finish() only waits
+    for ffmpeg to flush the last frames.
+    """
+
+    def __init__(self, format: str, sample_rate: int = SAMPLE_RATE, upload_rate: Optional[int] = None):
+        self.format = format
+        self.sample_rate = sample_rate
+        self.upload_rate = upload_rate or sample_rate
+        self.samples = 0
+        self.finish_time = 0.0  # Seconds finish() waited for the tail
+
+        self._resampler = None
+        if self.upload_rate != sample_rate:
+            from .resample import PolyphaseResampler
+            self._resampler = PolyphaseResampler(sample_rate, self.upload_rate)
+
+        cmd = ffmpeg_encode_command(format, self.upload_rate)
+        self.process = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                        stderr=subprocess.PIPE)
+        self._chunks: "queue.Queue[Optional[np.ndarray]]" = queue.Queue()
+        self._output = bytearray()
+        self._closed = False
+        self._write_error: Optional[Exception] = None
+        self._writer = threading.Thread(target=self._write_loop, name="upload-encoder-in", daemon=True)
+        self._reader = threading.Thread(target=self._read_loop, name="upload-encoder-out", daemon=True)
+        self._writer.start()
+        self._reader.start()
+
+    def feed(self, samples: np.ndarray):
+        """Queue captured samples for encoding."""
+        if self._closed:
+            return
+        pcm = to_int16(np.asarray(samples).reshape(-1))
+        self.samples += len(pcm)
+        self._chunks.put(pcm)
+
+    def _write_loop(self):
+        try:
+            while True:
+                pcm = self._chunks.get()
+                if pcm is None:
+                    break
+                self.process.stdin.write(self._convert(pcm).tobytes())
+            if self._resampler is not None:
+                self.process.stdin.write(self._resampler.flush().tobytes())
+        except (BrokenPipeError, OSError, ValueError) as e:
+            self._write_error = e
+        finally:
+            try:
+                self.process.stdin.close()
+            except OSError:
+                pass
+
+    def _convert(self, pcm: np.ndarray) -> np.ndarray:
+        return pcm if self._resampler is None else self._resampler.process(pcm)
+
+    def _read_loop(self):
+        while True:
+            data = self.process.stdout.read(65536)
+            if not data:
+                break
+            self._output.extend(data)
+
+    def finish(self, timeout: float = 5.0) -> Optional[EncodedAudio]:
+        """Stop feeding and wait for the encoded upload.
+
+        Returns:
+            EncodedAudio, or None if encoding failed or timed out
+        """
+        if self._closed:
+            return None
+        self._closed = True
+        start = time.perf_counter()
+        self._chunks.put(None)
+        self._writer.join(timeout)
+        self._reader.join(max(0.0, timeout - (time.perf_counter() - start)))
+        try:
+            returncode = self.process.wait(max(0.1, timeout - (time.perf_counter() - start)))
+        except subprocess.TimeoutExpired:
+            logger.warning(f"Streaming {self.format} encoder timed out")
+            self.abort()
+            return None
+        self.finish_time = time.perf_counter() - start
+
+        stderr = self.process.stderr.read().decode(errors='replace').strip()
+        self._close_pipes()
+        if returncode != 0 or self._write_error or not self._output:
+            logger.warning(f"Streaming {self.format} encoder failed: {stderr or self._write_error}")
+            return None
+        logger.debug(f"Upload encoded while recording: {len(self._output)} bytes {self.format}, "
+                     f"finished {self.finish_time * 1000:.0f}ms after end of speech")
+        return EncodedAudio(bytes(self._output), self.format, self.samples, self.upload_rate)
+
+    def abort(self):
+        """Discard the encoding (no speech, or the recording restarted)."""
+        self._closed = True
+        self._chunks.put(None)
+        if self.process.poll() is None:
+            self.process.kill()
+            self.process.wait()
+        self._reader.join(1.0)
+        self._close_pipes()
+
+    def _close_pipes(self):
+        for pipe in (self.process.stdout, self.process.stderr):
+            try:
+                pipe.close()
+            except OSError:
+                pass
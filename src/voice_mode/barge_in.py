@@ -0,0 +1,224 @@
+"""
+Barge-in: stop TTS playback when the user starts talking.
+
+While a response is being spoken, BargeInMonitor keeps a microphone stream
+open and runs WebRTC VAD on each frame in the audio callback. Sustained
+speech cancels playback (every job on the output engine), trips a
+StreamCancellationToken and wakes run_interruptible(), which cancels the
+TTS task so the HTTP stream is closed. The frames that triggered the
+interruption, plus a short pre-roll, are kept so converse can hand them to
+the recorder instead of losing the start of what the user said.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from typing import Awaitable, Callable, Deque, List, Optional, Tuple, TypeVar
+
+import numpy as np
+
+from .config import (
+    BARGE_IN_MIN_SPEECH_MS,
+    BARGE_IN_PREROLL_MS,
+    BARGE_IN_VAD_AGGRESSIVENESS,
+    CHANNELS,
+    SAMPLE_RATE,
+    VAD_CHUNK_DURATION_MS,
+)
+from .interruption_handler import InterruptionEvent, InterruptionType, StreamCancellationToken
+from .vad_frontend import VADFrontEnd
+
+logger = logging.getLogger("voice-mode")
+
+T = TypeVar("T")
+
+
+def stop_playback() -> int:
+    """Cut off whatever the output engine (or sd.play) is playing.
+
+    Returns:
+        Number of playback jobs cancelled
+    """
+    from .output_engine import get_output_engine
+
+    engine = get_output_engine()
+    if engine is not None:
+        return engine.cancel_all()
+
+    import sounddevice as sd
+    sd.stop()
+    return 0
+
+
+class BargeInMonitor:
+    """Microphone VAD monitor that runs while TTS plays."""
+
+    def __init__(
+        self,
+        vad_aggressiveness: int = BARGE_IN_VAD_AGGRESSIVENESS,
+        min_speech_ms: int = BARGE_IN_MIN_SPEECH_MS,
+        preroll_ms: int = BARGE_IN_PREROLL_MS,
+        sample_rate: int = SAMPLE_RATE,
+    ):
+        import webrtcvad
+
+        self.vad = webrtcvad.Vad(vad_aggressiveness)
+        self.sample_rate = sample_rate
+        self.frame_samples = int(sample_rate * VAD_CHUNK_DURATION_MS / 1000)
+        self.min_speech_ms = min_speech_ms
+
+        # 24kHz -> 16kHz for the VAD
+        self._front_end = VADFrontEnd(sample_rate, VAD_CHUNK_DURATION_MS)
+
+        # Frames from before the trigger: the speech that triggered it plus pre-roll
+        history_frames = max(1, (min_speech_ms + preroll_ms) // VAD_CHUNK_DURATION_MS)
+        self._history: Deque[np.ndarray] = deque(maxlen=history_frames)
+        self._captured: List[np.ndarray] = []
+        self._speech_ms = 0
+
+        self.token = StreamCancellationToken()
+        self.triggered = threading.Event()
+        self.started_at: Optional[float] = None
+        self.triggered_at: Optional[float] = None
+        self.callbacks: List[Callable[[InterruptionEvent], None]] = []
+        self.stream = None
+
+    def register_callback(self, callback: Callable[[InterruptionEvent], None]):
+        """Call callback (on the audio thread) when the user interrupts."""
+        self.callbacks.append(callback)
+
+    @property
+    def interrupted_after(self) -> Optional[float]:
+        """Seconds of playback before the user interrupted."""
+        if self.triggered_at is None or self.started_at is None:
+            return None
+        return self.triggered_at - self.started_at
+
+    def start(self):
+        """Open the microphone and start listening."""
+        import sounddevice as sd
+
+        self.started_at = time.perf_counter()
+        self.stream = sd.InputStream(
+            samplerate=self.sample_rate,
+            channels=CHANNELS,
+            dtype=np.int16,
+            blocksize=self.frame_samples,
+            callback=self._callback
+        )
+        self.stream.start()
+        logger.debug("Barge-in monitor listening")
+
+    def _callback(self, indata, frames, time_info, status):
+        if status:
+            logger.debug(f"Barge-in input status: {status}")
+        self.process(indata.reshape(-1).copy())
+
+    def _is_speech(self, frame: np.ndarray) -> bool:
+        try:
+            return self._front_end.is_speech(self.vad, frame)
+        except Exception as e:
+            logger.debug(f"Barge-in VAD error: {e}")
+            return False
+
+    def process(self, frame: np.ndarray) -> bool:
+        """Feed one VAD frame of microphone audio.
+
+        Returns:
+            True once the user has interrupted
+        """
+        if self.triggered.is_set():
+            self._captured.append(frame)
+            return True
+
+        self._history.append(frame)
+        if self._is_speech(frame):
+            self._speech_ms += VAD_CHUNK_DURATION_MS
+        else:
+            self._speech_ms = 0
+
+        if self._speech_ms >= self.min_speech_ms:
+            self._trigger()
+            return True
+        return False
+
+    def _trigger(self):
+        self.triggered_at = time.perf_counter()
+        self._captured = list(self._history)
+        self.triggered.set()
+
+        reason = f"User speech for {self._speech_ms}ms"
+        cancelled = stop_playback()
+        logger.info(f"🗣️ Barge-in after {self.interrupted_after or 0:.1f}s of playback "
+                    f"({reason}, {cancelled} playback job(s) stopped)")
+        self.token.cancel(reason)
+
+        event = InterruptionEvent(type=InterruptionType.USER_SPEECH, reason=reason)
+        for callback in self.callbacks:
+            try:
+                callback(event)
+            except Exception as e:
+                logger.error(f"Barge-in callback error: {e}")
+
+    def stop(self) -> Optional[np.ndarray]:
+        """Close the microphone.
+
+        Returns:
+            Audio captured from just before the interruption onward, or None
+            if the user didn't interrupt
+        """
+        if self.stream is not None:
+            try:
+                self.stream.stop()
+                self.stream.close()
+            except Exception as e:
+                logger.debug(f"Error closing barge-in input stream: {e}")
+            self.stream = None
+
+        if not self.triggered.is_set() or not self._captured:
+            return None
+        return np.concatenate(self._captured)
+
+    async def run_interruptible(self, awaitable: Awaitable[T]) -> Tuple[Optional[T], bool]:
+        """Run a TTS coroutine, cancelling it if the user interrupts.
+
+        Returns:
+            (result, interrupted) - result is None when interrupted
+        """
+        loop = asyncio.get_running_loop()
+        interrupted = asyncio.Event()
+        self.register_callback(lambda event: loop.call_soon_threadsafe(interrupted.set))
+        if self.triggered.is_set():
+            interrupted.set()
+
+        task = asyncio.ensure_future(awaitable)
+        waiter = asyncio.ensure_future(interrupted.wait())
+        try:
+            await asyncio.wait({task, waiter}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            waiter.cancel()
+
+        if task.done():
+            return task.result(), False
+
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.debug(f"TTS ended with {e} after barge-in")
+        return None, True
+
+
+def start_barge_in_monitor() -> Optional[BargeInMonitor]:
+    """Start a barge-in monitor, or return None if the microphone or VAD is unavailable."""
+    try:
+        monitor = BargeInMonitor()
+        monitor.start()
+        return monitor
+    except Exception as e:
+        logger.warning(f"Barge-in disabled for this turn: {e}")
+        return None
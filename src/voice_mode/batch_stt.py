@@ -0,0 +1,335 @@
+"""
+Batch transcription of saved and imported audio files.
+
+Walks a directory or glob, transcribes every audio file with a bounded pool
+of concurrent requests spread over all healthy STT endpoints, and appends
+one STT entry per file in the exchanges schema. By default each entry goes
+to the dated exchanges file for the day the audio was recorded, so the
+exchanges CLI and browser read back-filled transcripts like live ones. An
+explicit output file gets every entry instead; only readers that scan all
+exchanges_*.jsonl files (such as conversation lookups) see it.
+
+Finished files are recorded in a checkpoint file as they complete; running
+the same batch again skips them, so an interrupted run resumes where it
+stopped.
+"""
+
+import asyncio
+import glob
+import json
+import logging
+import os
+import random
+import shutil
+import string
+import subprocess
+import time
+import wave
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set
+
+import openai
+
+from .__version__ import __version__
+from .audio_encode import upload_file
+from .config import BASE_DIR, BATCH_STT_CONCURRENCY
+from .conversation_logger import ConversationLogger
+
+logger = logging.getLogger("voice-mode")
+
+AUDIO_EXTENSIONS = {".wav", ".mp3", ".flac", ".m4a", ".ogg", ".opus", ".webm"}
+
+
+def default_logs_dir() -> Path:
+    return Path(BASE_DIR) / "logs" / "conversations"
+
+
+def dated_output_path(recorded: datetime, logs_dir: Optional[Path] = None) -> Path:
+    """Exchanges file for a recording day, named as ConversationLogger names it."""
+    return (logs_dir or default_logs_dir()) / f"exchanges_{recorded.strftime('%Y-%m-%d')}.jsonl"
+
+
+def find_audio_files(target: str) -> List[Path]:
+    """List audio files in a directory (recursively) or matching a glob.
+
+    Voice mode's own saved TTS audio (*_tts / *-tts) is skipped; only
+    recordings are worth transcribing.
+    """
+    path = Path(target).expanduser()
+    if path.is_dir():
+        candidates = path.rglob("*")
+    elif path.is_file():
+        candidates = [path]
+    else:
+        candidates = (Path(p) for p in glob.glob(str(path), recursive=True))
+
+    return sorted(
+        p for p in candidates
+        if p.is_file() and p.suffix.lower() in AUDIO_EXTENSIONS
+        and not p.stem.endswith(("_tts", "-tts"))
+    )
+
+
+def audio_duration(path: Path) -> Optional[float]:
+    """Duration in seconds from the WAV header, or ffprobe for other formats."""
+    if path.suffix.lower() == ".wav":
+        try:
+            with wave.open(str(path), "rb") as wav_file:
+                return wav_file.getnframes() / wav_file.getframerate()
+        except (wave.Error, EOFError, OSError):
+            pass  # Not plain PCM WAV; let ffprobe try
+
+    ffprobe = shutil.which("ffprobe")
+    if not ffprobe:
+        return None
+    try:
+        result = subprocess.run(
+            [ffprobe, "-v", "error", "-show_entries", "format=duration", "-of", "csv=p=0", str(path)],
+            capture_output=True, text=True, timeout=30
+        )
+        return float(result.stdout.strip())
+    except (subprocess.SubprocessError, ValueError, OSError):
+        return None
+
+
+class TranscriptionCheckpoint:
+    """Append-only record of files already processed."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.done: Set[str] = set()
+        if self.path.exists():
+            with open(self.path) as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # Torn write from an interrupted run
+                    if record.get("status") == "done":
+                        self.done.add(record["file"])
+
+    def is_done(self, path: Path) -> bool:
+        return str(path.resolve()) in self.done
+
+    def record(self, path: Path, status: str, error: Optional[str] = None):
+        key = str(path.resolve())
+        if status == "done":
+            self.done.add(key)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a") as f:
+            f.write(json.dumps({"file": key, "status": status, "error": error}) + "\n")
+
+
+@dataclass
+class _Endpoint:
+    base_url: str
+    client: object
+    model: str
+    provider_type: Optional[str]
+    in_flight: int = 0
+    failed: bool = False
+
+
+@dataclass
+class BatchReport:
+    """Outcome and throughput of a batch run."""
+    files: int = 0
+    skipped: int = 0  # Already done according to the checkpoint
+    transcribed: int = 0
+    failed: int = 0
+    audio_seconds: float = 0.0
+    wall_seconds: float = 0.0
+    by_endpoint: Dict[str, int] = field(default_factory=dict)
+    errors: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def throughput(self) -> float:
+        """Audio seconds transcribed per wall-clock second."""
+        return self.audio_seconds / self.wall_seconds if self.wall_seconds else 0.0
+
+    def format(self) -> str:
+        lines = [
+            f"Files: {self.files} found, {self.skipped} already done, "
+            f"{self.transcribed} transcribed, {self.failed} failed",
+            f"Audio: {self.audio_seconds:.1f}s in {self.wall_seconds:.1f}s "
+            f"({self.throughput:.1f} audio-seconds per second)",
+        ]
+        for url, count in self.by_endpoint.items():
+            lines.append(f"  {url}: {count} files")
+        for path, error in list(self.errors.items())[:10]:
+            lines.append(f"  ❌ {path}: {error}")
+        if len(self.errors) > 10:
+            lines.append(f"  ... and {len(self.errors) - 10} more failures")
+        return "\n".join(lines)
+
+
+async def _healthy_endpoints(model: Optional[str]) -> List[_Endpoint]:
+    """Clients for every healthy STT endpoint, via the usual STT client selection."""
+    from .provider_discovery import provider_registry
+    from .providers import get_stt_client
+
+    await provider_registry.initialize()
+    endpoints = []
+    for info in provider_registry.get_healthy_endpoints("stt"):
+        try:
+            client, selected_model, info = await get_stt_client(model, base_url=info.base_url)
+        except ValueError as e:
+            logger.debug(f"Batch STT: skipping {info.base_url}: {e}")
+            continue
+        endpoints.append(_Endpoint(info.base_url, client, selected_model, info.provider_type))
+    return endpoints
+
+
+async def transcribe_batch(
+    target: str,
+    output: Optional[Path] = None,
+    checkpoint: Optional[Path] = None,
+    concurrency: int = BATCH_STT_CONCURRENCY,
+    model: Optional[str] = None,
+    progress: Optional[Callable[[Path, Optional[str], Optional[str]], None]] = None
+) -> BatchReport:
+    """Transcribe every audio file under target.
+
+    Args:
+        target: Directory (searched recursively), file or glob
+        output: Exchanges JSONL file results are appended to (default: the
+            dated exchanges file for each recording's day)
+        checkpoint: Checkpoint file (defaults to output + ".checkpoint", or
+            batch_transcription.checkpoint in the exchanges directory)
+        concurrency: Most transcriptions in flight at once across all endpoints
+        model: STT model (defaults to the endpoint's selection)
+        progress: Called with (path, text, error) as each file finishes
+
+    Returns:
+        BatchReport with counts and throughput
+    """
+    from .provider_discovery import provider_registry
+
+    output = Path(output).expanduser() if output else None
+    if checkpoint:
+        checkpoint = Path(checkpoint).expanduser()
+    elif output is not None:
+        checkpoint = output.with_name(output.name + ".checkpoint")
+    else:
+        checkpoint = default_logs_dir() / "batch_transcription.checkpoint"
+    checkpoint = TranscriptionCheckpoint(checkpoint)
+    report = BatchReport()
+    files = find_audio_files(target)
+    report.files = len(files)
+    pending = [p for p in files if not checkpoint.is_done(p)]
+    report.skipped = len(files) - len(pending)
+    if not pending:
+        return report
+
+    endpoints = await _healthy_endpoints(model)
+    if not endpoints:
+        raise RuntimeError("No healthy STT endpoints available")
+
+    conversation_id = "batch_" + datetime.now().strftime("%Y%m%d_%H%M%S") + "_" + \
+        "".join(random.choices(string.ascii_lowercase + string.digits, k=6))
+    (output.parent if output is not None else default_logs_dir()).mkdir(parents=True, exist_ok=True)
+    queue: "asyncio.Queue[Path]" = asyncio.Queue()
+    for path in pending:
+        queue.put_nowait(path)
+    loop = asyncio.get_running_loop()
+
+    def pick(tried: Set[str]) -> Optional[_Endpoint]:
+        usable = [e for e in endpoints if not e.failed and e.base_url not in tried]
+        return min(usable, key=lambda e: e.in_flight) if usable else None
+
+    async def transcribe_file(path: Path):
+        data = await loop.run_in_executor(None, path.read_bytes)
+        duration = await loop.run_in_executor(None, audio_duration, path)
+        tried: Set[str] = set()
+        error = "no healthy STT endpoint"
+        while (endpoint := pick(tried)) is not None:
+            tried.add(endpoint.base_url)
+            endpoint.in_flight += 1
+            start = time.perf_counter()
+            try:
+                transcription = await endpoint.client.audio.transcriptions.create(
+                    model=endpoint.model,
+                    file=upload_file(data, path.suffix[1:].lower(), name=path.stem),
+                    response_format="text"
+                )
+            except openai.BadRequestError as e:
+                # The file was rejected, not the endpoint
+                error = f"{endpoint.base_url}: {e}"
+                logger.warning(f"Batch STT: {endpoint.base_url} rejected {path.name}: {e}")
+                continue
+            except Exception as e:
+                error = f"{endpoint.base_url}: {e}"
+                logger.warning(f"Batch STT failed for {path.name} on {endpoint.base_url}: {e}")
+                await provider_registry.mark_unhealthy("stt", endpoint.base_url, str(e))
+                info = provider_registry.registry["stt"].get(endpoint.base_url)
+                endpoint.failed = info is not None and not info.healthy
+                continue
+            finally:
+                endpoint.in_flight -= 1
+            text = transcription.strip() if isinstance(transcription, str) else transcription.text.strip()
+            _write_entry(output, conversation_id, path, text, duration, endpoint, time.perf_counter() - start)
+            return text, duration, endpoint.base_url, None
+        return None, duration, None, error
+
+    async def worker():
+        while True:
+            try:
+                path = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            try:
+                text, duration, base_url, error = await transcribe_file(path)
+            except OSError as e:
+                text, duration, base_url, error = None, None, None, str(e)
+            if error is None:
+                checkpoint.record(path, "done")
+                report.transcribed += 1
+                report.audio_seconds += duration or 0.0
+                report.by_endpoint[base_url] = report.by_endpoint.get(base_url, 0) + 1
+            else:
+                checkpoint.record(path, "failed", error)
+                report.failed += 1
+                report.errors[str(path)] = error
+            if progress is not None:
+                progress(path, text, error)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(max(1, min(concurrency, len(pending))))))
+    report.wall_seconds = time.perf_counter() - start
+    logger.info(f"Batch STT: {report.transcribed} files, {report.audio_seconds:.0f}s of audio at "
+                f"{report.throughput:.1f}x real time")
+    return report
+
+
+def _write_entry(output: Optional[Path], conversation_id: str, path: Path, text: str, duration: Optional[float],
+                 endpoint: _Endpoint, transcription_time: float):
+    """Append one STT exchange for a transcribed file (to its day's file unless output is set)."""
+    # When the audio was recorded, not when it was transcribed
+    recorded = datetime.fromtimestamp(path.stat().st_mtime).astimezone()
+    local = "127.0.0.1" in endpoint.base_url or "localhost" in endpoint.base_url
+    metadata = {
+        "voice_mode_version": __version__,
+        "model": endpoint.model,
+        "provider": "whisper-local" if local else "openai-whisper",
+        "provider_url": endpoint.base_url,
+        "provider_type": endpoint.provider_type,
+        "audio_format": path.suffix[1:].lower(),
+        "transport": "batch",
+        "transcription_time": round(transcription_time, 3),
+    }
+    entry = {
+        "version": ConversationLogger.SCHEMA_VERSION,
+        "timestamp": recorded.isoformat(),
+        "conversation_id": conversation_id,
+        "type": "stt",
+        "text": text,
+        "project_path": os.getcwd(),
+        "audio_file": str(path.resolve()),
+        "duration_ms": int(duration * 1000) if duration is not None else None,
+        "metadata": {k: v for k, v in metadata.items() if v is not None},
+    }
+    entry = {k: v for k, v in entry.items() if v is not None}
+    with open(output or dated_output_path(recorded), "a") as f:
+        f.write(json.dumps(entry) + "\n")
@@ -0,0 +1,72 @@
+"""
+Preallocated buffer for microphone recordings.
+
+Recorders used to copy every callback block, keep the copies in a list and
+concatenate them when recording stopped: thousands of small allocations per
+turn and a large copy at the moment the user is waiting for STT. The longest
+recording is known up front (the listen duration), so CaptureBuffer
+allocates it once, the audio callback writes each block straight into the
+next slice, and stopping returns a view of what was written.
+
+The buffer doubles if a recording outgrows it. Each recording gets its own
+buffer because the returned audio is a view into it.
+"""
+
+import numpy as np
+
+
+class CaptureBuffer:
+    """Growable preallocated buffer that audio blocks are written into in place.
+
+    One thread writes (the audio callback, or the recording loop); any thread
+    may take views of what has been written.
+    """
+
+    def __init__(self, capacity: int, channels: int = 1, dtype=np.int16):
+        """Allocate room for capacity frames of channels samples."""
+        self.channels = channels
+        self._data = np.empty((max(1, int(capacity)), channels), dtype=dtype)
+        self.frames = 0
+        self.allocations = 1
+
+    def __len__(self) -> int:
+        return self.frames
+
+    @property
+    def capacity(self) -> int:
+        return len(self._data)
+
+    def append(self, block: np.ndarray) -> np.ndarray:
+        """Copy a block to the end of the recording.
+
+        Returns:
+            A view of the block as stored in the buffer
+        """
+        block = np.asarray(block).reshape(-1, self.channels)
+        end = self.frames + len(block)
+        if end > len(self._data):
+            self._grow(end)
+        stored = self._data[self.frames:end]
+        stored[...] = block
+        # Publish the frames only once they are written
+        self.frames = end
+        return stored
+
+    def _grow(self, needed: int):
+        data = np.empty((max(needed, 2 * len(self._data)), self.channels), dtype=self._data.dtype)
+        data[:self.frames] = self._data[:self.frames]
+        self._data = data
+        self.allocations += 1
+
+    def view(self, frames: int = None) -> np.ndarray:
+        """The first frames recorded (all of them by default), without copying.
+
+        Mono recordings come back 1-D, others as (frames, channels).
+        """
+        # Read the count before the array: a concurrent grow swaps in an
+        # array already holding every published frame
+        written = self.frames
+        data = self._data
+        end = written if frames is None else min(frames, written)
+        recording = data[:end]
+        return recording.reshape(-1) if self.channels == 1 else recording
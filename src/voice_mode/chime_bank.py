@@ -0,0 +1,186 @@
+"""
+Precomputed audio feedback buffers.
+
+Start/end chimes are played twice per turn. Instead of querying the output
+device and synthesizing tones, fades and silence padding every time, each
+distinct chime is synthesized once and the int16 buffer is reused. The
+output device profile (which decides chime loudness) is cached as well and
+both are invalidated when the default output device changes.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, Hashable, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger("voice-mode")
+
+# Chime amplitudes by output device type
+DEFAULT_AMPLITUDE = 0.0375  # Device unknown (very quiet)
+SPEAKER_AMPLITUDE = 0.075  # Built-in speakers
+BLUETOOTH_AMPLITUDE = 0.15  # AirPods and other Bluetooth headphones
+
+FADE_SECONDS = 0.01  # Fade in/out on each tone to prevent clicks
+
+
+@dataclass(frozen=True)
+class OutputDeviceProfile:
+    """What audio feedback needs to know about the output device."""
+    device: Optional[int]  # Configured default output, None/-1 for the host default
+    name: str
+    bluetooth: bool
+    amplitude: float
+
+
+def _probe_output_device(device: Optional[int]) -> OutputDeviceProfile:
+    try:
+        import sounddevice as sd
+        if device is None or device < 0:
+            info = sd.query_devices(kind='output')
+        else:
+            info = sd.query_devices(device)
+        name = info['name']
+    except Exception as e:
+        logger.debug(f"Could not detect output device type: {e}, using default amplitude {DEFAULT_AMPLITUDE}")
+        return OutputDeviceProfile(device=device, name="unknown", bluetooth=False, amplitude=DEFAULT_AMPLITUDE)
+
+    lowered = name.lower()
+    bluetooth = 'airpod' in lowered or 'bluetooth' in lowered or 'bt' in lowered
+    amplitude = BLUETOOTH_AMPLITUDE if bluetooth else SPEAKER_AMPLITUDE
+    logger.debug(f"{'Bluetooth device' if bluetooth else 'Built-in speaker'} detected ({name}), "
+                 f"using amplitude {amplitude}")
+    return OutputDeviceProfile(device=device, name=name, bluetooth=bluetooth, amplitude=amplitude)
+
+
+def _default_output_device() -> Optional[int]:
+    try:
+        import sounddevice as sd
+        return sd.default.device[1]
+    except Exception:
+        return None
+
+
+def synthesize_chime(
+    frequencies: Sequence[float],
+    duration: float,
+    sample_rate: int,
+    leading_silence: float,
+    trailing_silence: float,
+    amplitude: float
+) -> np.ndarray:
+    """Synthesize a chime: faded tones in sequence, padded with silence.
+
+    The output buffer is allocated once and each tone is written in place.
+
+    Returns:
+        int16 samples
+    """
+    samples_per_tone = int(sample_rate * duration)
+    fade_samples = min(int(sample_rate * FADE_SECONDS), samples_per_tone)
+    lead = int(sample_rate * leading_silence)
+    trail = int(sample_rate * trailing_silence)
+
+    out = np.zeros(lead + samples_per_tone * len(frequencies) + trail, dtype=np.float64)
+
+    t = np.linspace(0, duration, samples_per_tone, False)
+    envelope = np.ones(samples_per_tone)
+    if fade_samples:
+        envelope[:fade_samples] = np.linspace(0, 1, fade_samples)
+        envelope[-fade_samples:] *= np.linspace(1, 0, fade_samples)
+    envelope *= amplitude
+
+    for i, freq in enumerate(frequencies):
+        tone = out[lead + i * samples_per_tone:lead + (i + 1) * samples_per_tone]
+        np.sin(2 * np.pi * freq * t, out=tone)
+        tone *= envelope
+
+    out *= 32767
+    return out.astype(np.int16)
+
+
+class ChimeBank:
+    """Cache of ready-to-play int16 feedback buffers.
+
+    Buffers are read-only and shared; copy one before modifying it. The bank
+    empties itself when the default output device changes, since chime
+    amplitude depends on the device.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buffers: Dict[Hashable, np.ndarray] = {}
+        self._profile: Optional[OutputDeviceProfile] = None
+
+        # Session counters
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def device_profile(self) -> OutputDeviceProfile:
+        """Profile of the default output device, probed once per device."""
+        device = _default_output_device()
+        with self._lock:
+            if self._profile is not None and self._profile.device == device:
+                return self._profile
+            if self._profile is not None:
+                logger.debug(f"Default output device changed ({self._profile.device} -> {device}), "
+                             "discarding cached chimes")
+                self._buffers.clear()
+                self.invalidations += 1
+        profile = _probe_output_device(device)
+        with self._lock:
+            self._profile = profile
+        return profile
+
+    def invalidate(self) -> None:
+        """Forget the device profile and all buffers (e.g. after PortAudio is reinitialized)."""
+        with self._lock:
+            self._profile = None
+            self._buffers.clear()
+            self.invalidations += 1
+
+    def get(self, key: Hashable, factory: Callable[[], np.ndarray]) -> np.ndarray:
+        """Return the buffer for key, synthesizing it with factory on first use."""
+        with self._lock:
+            buffer = self._buffers.get(key)
+            if buffer is not None:
+                self.hits += 1
+                return buffer
+        buffer = factory()
+        buffer.flags.writeable = False
+        with self._lock:
+            self.misses += 1
+            self._buffers[key] = buffer
+        return buffer
+
+    def chime(
+        self,
+        frequencies: Sequence[float],
+        duration: float,
+        sample_rate: int,
+        leading_silence: float,
+        trailing_silence: float
+    ) -> np.ndarray:
+        """Chime buffer at the amplitude for the current output device."""
+        amplitude = self.device_profile().amplitude
+        key = ("chime", tuple(frequencies), duration, sample_rate, leading_silence, trailing_silence, amplitude)
+        return self.get(key, lambda: synthesize_chime(
+            frequencies, duration, sample_rate, leading_silence, trailing_silence, amplitude
+        ))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buffers.clear()
+
+    def __len__(self) -> int:
+        return len(self._buffers)
+
+
+_chime_bank = ChimeBank()
+
+
+def get_chime_bank() -> ChimeBank:
+    """Get the global chime bank."""
+    return _chime_bank
@@ -1538,6 +1538,64 @@ def converse(message, wait, duration, min_duration, transport, room_name, voice,
     asyncio.run(run_conversation())
 
 
+# Batch transcription command
+@chatta_cli.command()
+@click.help_option('-h', '--help')
+@click.argument('path')
+@click.option('--output', '-o', type=click.Path(),
+              help='Append every result to this JSONL file instead of the dated exchanges files')
+@click.option('--checkpoint', type=click.Path(),
+              help='Checkpoint file (default: output file + .checkpoint, or one in the exchanges directory)')
+@click.option('--concurrency', '-j', type=click.IntRange(min=1), default=None,
+              help='Maximum transcriptions in flight across all STT endpoints')
+@click.option('--model', help='STT model to request')
+def transcribe(path, output, checkpoint, concurrency, model):
+    """Transcribe a directory or glob of audio files into the exchanges log.
+
+    Finished files are recorded in a checkpoint, so running the same command
+    again resumes an interrupted batch.
+
+    Examples:
+
+        # Back-fill transcripts for saved recordings
+        chatta transcribe ~/.voicemode/audio
+
+        # Imported audio, eight requests at a time
+        chatta transcribe "imports/**/*.m4a" -j 8
+    """
+    from voice_mode.batch_stt import transcribe_batch
+    from voice_mode.config import BATCH_STT_CONCURRENCY
+
+    def progress(file_path, text, error):
+        if error:
+            click.echo(f"❌ {file_path}: {error}", err=True)
+        else:
+            click.echo(f"✓ {file_path}")
+
+    try:
+        report = asyncio.run(transcribe_batch(
+            path,
+            output=output,
+            checkpoint=checkpoint,
+            concurrency=concurrency or BATCH_STT_CONCURRENCY,
+            model=model,
+            progress=progress
+        ))
+    except KeyboardInterrupt:
+        click.echo("\nInterrupted - run the same command again to resume")
+        sys.exit(130)
+    except RuntimeError as e:
+        click.echo(f"❌ {e}", err=True)
+        sys.exit(1)
+
+    if report.files == 0:
+        click.echo(f"No audio files found in {path}")
+        return
+    click.echo(report.format())
+    if report.failed:
+        sys.exit(1)
+
+
 # Version command
 @chatta_cli.command()
 def version():
@@ -297,6 +297,9 @@ FRONTEND_PORT = int(os.getenv("CHATTA_FRONTEND_PORT", "3000"))
 # Auto-enable services after installation
 SERVICE_AUTO_ENABLE = env_bool("CHATTA_SERVICE_AUTO_ENABLE", False)
 
+# How long a local-vs-forwarded service lookup is reused (0 disables caching)
+SERVICE_LOCALITY_TTL = float(os.getenv("CHATTA_SERVICE_LOCALITY_TTL", "60"))
+
 # ==================== AUDIO CONFIGURATION ====================
 
 # Audio parameters
@@ -352,6 +355,22 @@ OPUS_BITRATE = int(os.getenv("CHATTA_OPUS_BITRATE", "32000"))  # Default 32kbps
 MP3_BITRATE = os.getenv("CHATTA_MP3_BITRATE", "64k")  # Default 64kbps
 AAC_BITRATE = os.getenv("CHATTA_AAC_BITRATE", "64k")  # Default 64kbps
 
+# Encode compressed STT uploads while recording instead of after end of speech
+STT_STREAMING_ENCODE = os.getenv("CHATTA_STT_STREAMING_ENCODE", "true").lower() in ("true", "1", "yes", "on")
+
+# Drop the wait for speech and the trailing silence window from VAD recordings before STT
+STT_TRIM_SILENCE = os.getenv("CHATTA_STT_TRIM_SILENCE", "true").lower() in ("true", "1", "yes", "on")
+STT_TRIM_PAD_MS = int(os.getenv("CHATTA_STT_TRIM_PAD_MS", "300"))  # Silence kept either side of speech
+
+# Resample STT uploads before encoding; Whisper works at 16 kHz, so the capture rate only
+# adds bytes. 0 uploads at SAMPLE_RATE. Per-endpoint overrides are url=rate pairs, e.g.
+# CHATTA_STT_UPLOAD_SAMPLE_RATES=https://api.openai.com/v1=24000
+STT_UPLOAD_SAMPLE_RATE = int(os.getenv("CHATTA_STT_UPLOAD_SAMPLE_RATE", "16000"))
+STT_UPLOAD_SAMPLE_RATES = {
+    url.strip().rstrip("/"): int(rate)
+    for url, rate in (item.rsplit("=", 1) for item in parse_comma_list("CHATTA_STT_UPLOAD_SAMPLE_RATES", "") if "=" in item)
+}
+
 # ==================== STREAMING CONFIGURATION ====================
 
 # Streaming playback configuration
@@ -360,6 +379,85 @@ STREAM_CHUNK_SIZE = int(os.getenv("CHATTA_STREAM_CHUNK_SIZE", "4096"))  # Downlo
 STREAM_BUFFER_MS = int(os.getenv("CHATTA_STREAM_BUFFER_MS", "150"))  # Initial buffer before playback
 STREAM_MAX_BUFFER = float(os.getenv("CHATTA_STREAM_MAX_BUFFER", "2.0"))  # Max buffer in seconds
 
+# Sentence-pipelined synthesis for long messages: the first sentence is requested
+# immediately and later segments are synthesized concurrently while it plays
+STREAM_PIPELINE_ENABLED = os.getenv("CHATTA_STREAM_PIPELINE_ENABLED", "true").lower() in ("true", "1", "yes", "on")
+STREAM_PIPELINE_MIN_CHARS = int(os.getenv("CHATTA_STREAM_PIPELINE_MIN_CHARS", "200"))  # Only pipeline messages this long
+STREAM_PIPELINE_CONCURRENCY = int(os.getenv("CHATTA_STREAM_PIPELINE_CONCURRENCY", "2"))  # Concurrent segment requests per endpoint
+
+# Keep one output stream per sample rate open across turns (playing silence when idle)
+# instead of reopening the device for every TTS playback and chime
+OUTPUT_ENGINE_ENABLED = os.getenv("CHATTA_OUTPUT_ENGINE_ENABLED", "true").lower() in ("true", "1", "yes", "on")
+
+# ==================== TTS HEDGING CONFIGURATION ====================
+
+# Race the next TTS endpoint when the preferred one is slow to produce audio
+TTS_HEDGE_ENABLED = os.getenv("CHATTA_TTS_HEDGE_ENABLED", "false").lower() in ("true", "1", "yes", "on")
+# Delay before firing the hedge request: milliseconds, or "auto" for the endpoint's learned p95 first-byte time
+_tts_hedge_delay = os.getenv("CHATTA_TTS_HEDGE_DELAY_MS", "auto")
+TTS_HEDGE_DELAY_MS = None if _tts_hedge_delay.lower() == "auto" else float(_tts_hedge_delay)
+TTS_HEDGE_DEFAULT_DELAY_MS = float(os.getenv("CHATTA_TTS_HEDGE_DEFAULT_DELAY_MS", "600"))  # "auto" delay until enough samples
+
+# ==================== TTS CACHE CONFIGURATION ====================
+
+# On-disk cache of synthesized speech, keyed on the full TTS request
+TTS_CACHE_ENABLED = os.getenv("CHATTA_TTS_CACHE_ENABLED", "true").lower() in ("true", "1", "yes", "on")
+TTS_CACHE_DIR = expand_path(os.getenv("CHATTA_TTS_CACHE_DIR", str(BASE_DIR / "cache" / "tts")))
+TTS_CACHE_MAX_MB = float(os.getenv("CHATTA_TTS_CACHE_MAX_MB", "100"))  # Evict least recently used beyond this size
+TTS_CACHE_MAX_AGE_DAYS = float(os.getenv("CHATTA_TTS_CACHE_MAX_AGE_DAYS", "30"))  # Evict entries unused for this long
+TTS_CACHE_MAX_TEXT_LENGTH = int(os.getenv("CHATTA_TTS_CACHE_MAX_TEXT_LENGTH", "500"))  # Only cache short utterances
+
+# ==================== TTS PREFETCH CONFIGURATION ====================
+
+# In-memory slots for speech synthesized ahead of converse by the prefetch_speech tool
+TTS_PREFETCH_TTL = float(os.getenv("CHATTA_TTS_PREFETCH_TTL", "60"))  # Seconds a prefetched utterance stays usable
+TTS_PREFETCH_MAX_MB = float(os.getenv("CHATTA_TTS_PREFETCH_MAX_MB", "32"))  # Drop oldest slots beyond this
+TTS_PREFETCH_WAIT = float(os.getenv("CHATTA_TTS_PREFETCH_WAIT", "10"))  # Seconds converse waits for a prefetch still synthesizing
+
+# ==================== BARGE-IN CONFIGURATION ====================
+
+# Listen to the microphone during TTS playback and stop speaking when the user talks over it.
+# Off by default: without headphones the TTS audio itself can reach the microphone.
+BARGE_IN_ENABLED = os.getenv("CHATTA_BARGE_IN_ENABLED", "false").lower() in ("true", "1", "yes", "on")
+BARGE_IN_VAD_AGGRESSIVENESS = int(os.getenv("CHATTA_BARGE_IN_VAD_AGGRESSIVENESS", "3"))  # 0-3, strict to ignore echo and noise
+BARGE_IN_MIN_SPEECH_MS = int(os.getenv("CHATTA_BARGE_IN_MIN_SPEECH_MS", "300"))  # Sustained speech needed to interrupt
+BARGE_IN_PREROLL_MS = int(os.getenv("CHATTA_BARGE_IN_PREROLL_MS", "300"))  # Audio kept from before the trigger
+
+# ==================== LISTEN OVERLAP CONFIGURATION ====================
+
+# Open the microphone during the last part of TTS playback and start recording as soon as
+# the speaker has gone quiet, instead of a fixed 0.5s pause and a fresh input stream
+LISTEN_OVERLAP_ENABLED = os.getenv("CHATTA_LISTEN_OVERLAP_ENABLED", "false").lower() in ("true", "1", "yes", "on")
+LISTEN_OVERLAP_MS = int(os.getenv("CHATTA_LISTEN_OVERLAP_MS", "500"))  # Open the mic when this much playback is left
+LISTEN_SETTLE_MAX_MS = int(os.getenv("CHATTA_LISTEN_SETTLE_MAX_MS", "500"))  # Longest wait for playback echo to die down
+LISTEN_SETTLE_RMS = float(os.getenv("CHATTA_LISTEN_SETTLE_RMS", "300"))  # int16 RMS below which the mic counts as quiet
+
+# ==================== INCREMENTAL STT CONFIGURATION ====================
+
+# Transcribe long answers in pieces while the user is still talking: speech is split at short
+# VAD pauses and each piece is sent to the local Whisper endpoint as soon as it is complete
+INCREMENTAL_STT_ENABLED = os.getenv("CHATTA_INCREMENTAL_STT_ENABLED", "false").lower() in ("true", "1", "yes", "on")
+INCREMENTAL_STT_PAUSE_MS = int(os.getenv("CHATTA_INCREMENTAL_STT_PAUSE_MS", "400"))  # Pause that ends a segment
+INCREMENTAL_STT_MIN_SEGMENT_S = float(os.getenv("CHATTA_INCREMENTAL_STT_MIN_SEGMENT_S", "3.0"))  # Shortest segment sent early
+
+# ==================== SPECULATIVE STT CONFIGURATION ====================
+
+# Start transcribing as soon as silence begins after speech instead of after the full
+# SILENCE_THRESHOLD_MS; the result is discarded if the user starts talking again
+SPECULATIVE_STT_ENABLED = os.getenv("CHATTA_SPECULATIVE_STT_ENABLED", "false").lower() in ("true", "1", "yes", "on")
+SPECULATIVE_STT_DELAY_MS = int(os.getenv("CHATTA_SPECULATIVE_STT_DELAY_MS", "200"))  # Silence before speculating
+
+# ==================== BATCH TRANSCRIPTION CONFIGURATION ====================
+
+# Transcriptions in flight at once when back-filling saved or imported audio files
+BATCH_STT_CONCURRENCY = int(os.getenv("CHATTA_BATCH_STT_CONCURRENCY", "4"))
+
+# ==================== ARTIFACT WRITER CONFIGURATION ====================
+
+# Write saved audio, debug files and transcriptions on a background thread after the turn
+ARTIFACT_WRITER_ENABLED = os.getenv("CHATTA_ARTIFACT_WRITER_ENABLED", "true").lower() in ("true", "1", "yes", "on")
+ARTIFACT_QUEUE_SIZE = int(os.getenv("CHATTA_ARTIFACT_QUEUE_SIZE", "64"))  # Pending writes before callers write inline
+
 # ==================== EVENT LOGGING CONFIGURATION ====================
 
 # Event logging configuration
@@ -594,8 +692,10 @@ def save_transcription(text: str, prefix: str = "transcript", metadata: Optional
         
         content.append(text)
         
-        filepath.write_text("\n".join(content), encoding="utf-8")
-        logger.debug(f"Transcription saved to: {filepath}")
+        # Written in the background after the turn
+        from .artifact_writer import get_artifact_writer
+        get_artifact_writer().submit(filepath, "\n".join(content))
+        logger.debug(f"Transcription queued for: {filepath}")
         return filepath
         
     except Exception as e:
@@ -661,6 +761,13 @@ HTTP_CLIENT_CONFIG = {
     }
 }
 
+# Pooled TTS/STT clients (connection_pool.client_registry). The read timeout matches
+# the openai SDK default so long STT uploads and slow local TTS are not cut off
+HTTP_CONNECT_TIMEOUT = float(os.getenv("CHATTA_HTTP_CONNECT_TIMEOUT", "5.0"))
+HTTP_READ_TIMEOUT = float(os.getenv("CHATTA_HTTP_READ_TIMEOUT", "600.0"))
+# Simple failover gives up on a hung endpoint quickly so the next one is tried
+HTTP_FAILOVER_READ_TIMEOUT = float(os.getenv("CHATTA_HTTP_FAILOVER_READ_TIMEOUT", "30.0"))
+
 # ==================== INITIALIZATION ====================
 
 # Initialize directories on module import
@@ -754,6 +861,19 @@ def validate_audio_format(format: str, provider: str, operation: str = "tts") ->
     return first_supported
 
 
+def get_stt_upload_sample_rate(base_url: Optional[str]) -> int:
+    """Get the sample rate STT audio is uploaded at for an endpoint.
+    
+    Args:
+        base_url: STT endpoint base URL
+    
+    Returns:
+        Upload sample rate in Hz (SAMPLE_RATE when resampling is off)
+    """
+    rate = STT_UPLOAD_SAMPLE_RATES.get((base_url or "").rstrip("/"), STT_UPLOAD_SAMPLE_RATE)
+    return rate if rate > 0 else SAMPLE_RATE
+
+
 def get_audio_loader_for_format(format: str):
     """Get the appropriate AudioSegment loader for a format.
     
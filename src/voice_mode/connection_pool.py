@@ -1,9 +1,17 @@
 """Connection pool management for optimized service access."""
 
 import asyncio
-from typing import Dict, Optional
+import logging
+from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional, Tuple, Any
 import httpx
 from collections import defaultdict
+from openai import AsyncOpenAI
+
+from .config import HTTP_CONNECT_TIMEOUT, HTTP_FAILOVER_READ_TIMEOUT, HTTP_READ_TIMEOUT
+
+logger = logging.getLogger("voice-mode")
+
 
 class ConnectionPoolManager:
     """Manages connection pools for different services."""
@@ -36,3 +44,244 @@ class ConnectionPoolManager:
 
 # Global pool manager
 pool_manager = ConnectionPoolManager()
+
+
+# ==================== OPENAI CLIENT REGISTRY ====================
+
+# Timeout profiles for TTS/STT clients. The profile name is part of the
+# registry key so callers with different timeout needs never share a client.
+TIMEOUT_PROFILES: Dict[str, httpx.Timeout] = {
+    "default": httpx.Timeout(HTTP_READ_TIMEOUT, connect=HTTP_CONNECT_TIMEOUT),
+    # Simple failover moves on to the next endpoint instead of waiting out a hang
+    "failover": httpx.Timeout(HTTP_FAILOVER_READ_TIMEOUT, connect=HTTP_CONNECT_TIMEOUT),
+}
+
+# How long idle keep-alive connections are kept between conversation turns.
+# httpx defaults to 5s, which is shorter than a typical user reply, so the
+# connection would be torn down before the next TTS request.
+KEEPALIVE_EXPIRY = 90.0
+
+
+def _is_local_url(base_url: Optional[str]) -> bool:
+    """Check if a base URL points at a local service."""
+    if not base_url:
+        return False
+    return "127.0.0.1" in base_url or "localhost" in base_url
+
+
+def _limits_for_endpoint(base_url: Optional[str]) -> httpx.Limits:
+    """Size the keep-alive pool for an endpoint.
+
+    Local services (Kokoro, Whisper) are cheap to connect to and serve one
+    request at a time, so a small pool is enough. Remote endpoints get a
+    larger pool so concurrent requests never pay a fresh TLS handshake.
+    """
+    if _is_local_url(base_url):
+        return httpx.Limits(
+            max_keepalive_connections=2,
+            max_connections=4,
+            keepalive_expiry=KEEPALIVE_EXPIRY
+        )
+    return httpx.Limits(
+        max_keepalive_connections=5,
+        max_connections=10,
+        keepalive_expiry=KEEPALIVE_EXPIRY
+    )
+
+
+@dataclass
+class EndpointPoolStats:
+    """Connection usage counters for a single registry entry."""
+    base_url: str
+    timeout_profile: str
+    clients_created: int = 0
+    client_reuses: int = 0
+    requests: int = 0
+    new_connections: int = 0
+    reused_connections: int = 0
+
+
+class _RegistryEntry:
+    """A cached client together with the event loop it is bound to."""
+
+    def __init__(self, client: AsyncOpenAI, http_client: httpx.AsyncClient, loop):
+        self.client = client
+        self.http_client = http_client
+        self.loop = loop
+        self.closer: Optional[asyncio.Task] = None
+
+
+async def _close_with_loop(http_client: httpx.AsyncClient) -> None:
+    """Close a client when its event loop shuts down.
+
+    asyncio.run() cancels pending tasks before it closes the loop, so the
+    client's sockets are released on the loop that opened them rather than
+    leaking until garbage collection.
+    """
+    try:
+        await asyncio.get_running_loop().create_future()
+    finally:
+        await http_client.aclose()
+
+
+class OpenAIClientRegistry:
+    """Process-wide cache of AsyncOpenAI clients keyed by endpoint.
+
+    Clients are keyed by (base_url, api_key, timeout_profile) and share a
+    single httpx connection pool per key, so connections opened during
+    warmup or a previous turn are reused by the next TTS/STT request.
+    """
+
+    def __init__(self):
+        self._entries: Dict[Tuple[str, str, str], _RegistryEntry] = {}
+        self._stats: Dict[Tuple[str, str, str], EndpointPoolStats] = {}
+        # Replaced clients whose loop was still open but not running
+        self._retired: List[_RegistryEntry] = []
+
+    def get_client(
+        self,
+        base_url: Optional[str],
+        api_key: str,
+        timeout_profile: str = "default"
+    ) -> AsyncOpenAI:
+        """Get a cached client for an endpoint, creating it on first use."""
+        key = (base_url or "", api_key or "", timeout_profile)
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = EndpointPoolStats(base_url=base_url or "", timeout_profile=timeout_profile)
+            self._stats[key] = stats
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        entry = self._entries.get(key)
+        if entry is not None and not entry.http_client.is_closed:
+            # An httpx pool cannot be used from a different event loop
+            if entry.loop is None or loop is None or entry.loop is loop:
+                if entry.loop is None:
+                    entry.loop = loop
+                stats.client_reuses += 1
+                return entry.client
+            logger.debug(f"Event loop changed, recreating HTTP client for {base_url}")
+            self._retire(entry)
+
+        http_client = httpx.AsyncClient(
+            timeout=TIMEOUT_PROFILES.get(timeout_profile, TIMEOUT_PROFILES["default"]),
+            limits=_limits_for_endpoint(base_url),
+            event_hooks={"request": [self._make_request_hook(stats)]}
+        )
+        client = AsyncOpenAI(
+            api_key=api_key,
+            base_url=base_url,
+            http_client=http_client
+        )
+        entry = _RegistryEntry(client, http_client, loop)
+        if loop is not None:
+            entry.closer = loop.create_task(_close_with_loop(http_client))
+        self._entries[key] = entry
+        stats.clients_created += 1
+        logger.debug(f"Created pooled client for {base_url} (profile: {timeout_profile})")
+        return client
+
+    def _retire(self, entry: _RegistryEntry) -> None:
+        """Close a client that is being replaced for another event loop."""
+        if entry.loop is None or entry.loop.is_closed():
+            # Nothing can run on a closed loop any more
+            return
+        if entry.loop.is_running():
+            # Still serving another thread; close it there
+            asyncio.run_coroutine_threadsafe(entry.http_client.aclose(), entry.loop)
+        else:
+            self._retired.append(entry)
+
+    @staticmethod
+    def _make_request_hook(stats: EndpointPoolStats):
+        """Build an httpx request hook that counts new vs reused connections."""
+
+        async def on_request(request: httpx.Request) -> None:
+            stats.requests += 1
+            opened = False
+
+            async def trace(event_name: str, info: Dict[str, Any]) -> None:
+                nonlocal opened
+                if event_name == "connection.connect_tcp.complete":
+                    opened = True
+                    stats.new_connections += 1
+                elif event_name == "http11.send_request_headers.started" or \
+                        event_name == "http2.send_request_headers.started":
+                    if not opened:
+                        stats.reused_connections += 1
+
+            request.extensions["trace"] = trace
+
+        return on_request
+
+    async def warm(
+        self,
+        base_url: str,
+        api_key: str,
+        timeout_profile: str = "default"
+    ) -> bool:
+        """Open a keep-alive connection to an endpoint ahead of the first request.
+
+        Any HTTP response (including 401/404) means the TCP/TLS handshake is
+        done and the connection is parked in the pool for the next request.
+        """
+        self.get_client(base_url, api_key, timeout_profile)
+        entry = self._entries[(base_url or "", api_key or "", timeout_profile)]
+        try:
+            await entry.http_client.get(
+                f"{base_url.rstrip('/')}/models",
+                headers={"Authorization": f"Bearer {api_key}"}
+            )
+            return True
+        except httpx.HTTPError as e:
+            logger.debug(f"Connection warmup failed for {base_url}: {e}")
+            return False
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get connection counters aggregated per base URL."""
+        aggregated: Dict[str, Dict[str, Any]] = {}
+        for stats in self._stats.values():
+            totals = aggregated.setdefault(stats.base_url or "default", {
+                "clients_created": 0,
+                "client_reuses": 0,
+                "requests": 0,
+                "new_connections": 0,
+                "reused_connections": 0,
+            })
+            for field, value in asdict(stats).items():
+                if field in totals:
+                    totals[field] += value
+        return aggregated
+
+    def reset_stats(self) -> None:
+        """Reset all connection counters."""
+        for stats in self._stats.values():
+            stats.clients_created = 0
+            stats.client_reuses = 0
+            stats.requests = 0
+            stats.new_connections = 0
+            stats.reused_connections = 0
+
+    async def close_all(self) -> None:
+        """Close every cached client and its connection pool."""
+        for entry in list(self._entries.values()) + self._retired:
+            if entry.loop is not None and entry.loop.is_closed():
+                # Sockets from a finished event loop can't be closed from
+                # another loop; they are released when the process exits
+                continue
+            if entry.closer is not None:
+                entry.closer.cancel()
+            try:
+                await entry.http_client.aclose()
+            except Exception as e:
+                logger.debug(f"Error closing pooled client: {e}")
+        self._entries.clear()
+        self._retired.clear()
+
+
+# Global OpenAI client registry
+client_registry = OpenAIClientRegistry()
@@ -192,6 +192,8 @@ class ConversationLogger:
             # Timing metrics
             "transcription_time": kwargs.get("transcription_time"),
             "total_turnaround_time": kwargs.get("total_turnaround_time"),
+            # Recording continued from speech that interrupted TTS
+            "barge_in": kwargs.get("barge_in"),
         }
         
         self.log_utterance("stt", text, audio_file, duration_ms, metadata)
@@ -215,6 +217,9 @@ class ConversationLogger:
             "generation_time": kwargs.get("generation_time"),
             "playback_time": kwargs.get("playback_time"),
             "total_turnaround_time": kwargs.get("total_turnaround_time"),
+            # Playback cut short by the user talking (barge-in)
+            "interrupted": kwargs.get("interrupted"),
+            "interrupted_after": kwargs.get("interrupted_after"),
         }
         
         self.log_utterance("tts", text, audio_file, duration_ms, metadata)
@@ -7,13 +7,11 @@ extracted to allow for easier testing and reuse.
 
 import asyncio
 import logging
-import os
-import tempfile
 import gc
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional, Union
 
 import numpy as np
 from pydub import AudioSegment
@@ -88,11 +86,14 @@ def get_debug_filename(prefix: str, extension: str, conversation_id: Optional[st
         return f"{timestamp}-{prefix}.{extension}"
 
 
-def save_debug_file(data: bytes, prefix: str, extension: str, debug_dir: Path, debug: bool = False, conversation_id: Optional[str] = None) -> Optional[str]:
+def save_debug_file(data: Union[bytes, Callable[[], bytes]], prefix: str, extension: str, debug_dir: Path, debug: bool = False, conversation_id: Optional[str] = None) -> Optional[str]:
     """Save debug file if debug mode is enabled.
     
+    The file is written by the background artifact writer, so it may not
+    exist yet when this returns.
+    
     Args:
-        data: File data to save
+        data: File data to save, or a callable producing it on the writer thread
         prefix: File prefix (e.g., 'tts', 'stt')
         extension: File extension
         debug_dir: Directory to save files in
@@ -106,21 +107,17 @@ def save_debug_file(data: bytes, prefix: str, extension: str, debug_dir: Path, d
         return None
     
     try:
-        # Get current date for directory structure
+        # Year/month directory structure (created by the writer)
         now = datetime.now()
-        year_dir = debug_dir / str(now.year)
-        month_dir = year_dir / f"{now.month:02d}"
-        
-        # Create year/month directory structure
-        month_dir.mkdir(parents=True, exist_ok=True)
+        month_dir = debug_dir / str(now.year) / f"{now.month:02d}"
         
         filename = get_debug_filename(prefix, extension, conversation_id)
         filepath = month_dir / filename
         
-        with open(filepath, 'wb') as f:
-            f.write(data)
+        from .artifact_writer import get_artifact_writer
+        get_artifact_writer().submit(filepath, data)
         
-        logger.debug(f"Debug file saved: {filepath}")
+        logger.debug(f"Debug file queued: {filepath}")
         return str(filepath)
     except Exception as e:
         logger.error(f"Failed to save debug file: {e}")
@@ -202,7 +199,7 @@ async def text_to_speech(
     try:
         # Import config for audio format
         from .config import (
-            TTS_AUDIO_FORMAT, validate_audio_format, get_audio_loader_for_format,
+            TTS_AUDIO_FORMAT, validate_audio_format,
             STREAMING_ENABLED, STREAM_CHUNK_SIZE, SAMPLE_RATE
         )
         
@@ -241,6 +238,24 @@ async def text_to_speech(
         # Track generation time
         generation_start = time.perf_counter()
         
+        # Serve repeated utterances straight from the on-disk cache
+        from .tts_cache import get_tts_cache, make_cache_key
+        tts_cache = get_tts_cache()
+        cache_key = None
+        if tts_cache and tts_cache.is_cacheable(text):
+            cache_key = make_cache_key(
+                text, tts_voice, tts_model, speed,
+                request_params.get("instructions"), validated_format, provider
+            )
+            cached = tts_cache.get(cache_key)
+            metrics['cache_hit'] = cached is not None
+            if cached is not None:
+                logger.info(f"✓ TTS cache hit - skipping synthesis (saves ~{cached.synthesis_time:.1f}s)")
+                metrics['cache_saved'] = cached.synthesis_time
+                metrics['generation'] = time.perf_counter() - generation_start
+                success = await play_cached_audio(cached, metrics, generation_start)
+                return success, metrics
+        
         # Check if streaming is enabled and format is supported
         use_streaming = STREAMING_ENABLED and validated_format in ["opus", "mp3", "pcm", "wav"]
         
@@ -263,13 +278,15 @@ async def text_to_speech(
                 debug=debug,
                 save_audio=save_audio,
                 audio_dir=audio_dir,
-                conversation_id=conversation_id
+                conversation_id=conversation_id,
+                capture_pcm=cache_key is not None
             )
             
             if success:
                 metrics['ttfa'] = stream_metrics.ttfa
                 metrics['generation'] = stream_metrics.generation_time
                 metrics['playback'] = stream_metrics.playback_time - stream_metrics.generation_time
+                metrics['device_open'] = stream_metrics.device_open
                 
                 # Pass through audio path if it exists
                 if stream_metrics.audio_path:
@@ -277,6 +294,9 @@ async def text_to_speech(
                 
                 logger.info(f"✓ TTS streamed successfully - TTFA: {metrics['ttfa']:.3f}s")
                 
+                if cache_key and stream_metrics.pcm_data and not served_by_other_endpoint(openai_clients[client_key], tts_base_url):
+                    tts_cache.put(cache_key, stream_metrics.pcm_data, stream_metrics.sample_rate, metrics['ttfa'])
+                
                 # Save debug files if needed (we'd need to capture the full audio)
                 # For now, skip debug saving in streaming mode
                 
@@ -322,167 +342,124 @@ async def text_to_speech(
         # Note: In voice-chat flows, there's additional latency from LLM processing that's not captured here
         metrics['ttfa'] = playback_start - generation_start
         
-        with tempfile.NamedTemporaryFile(suffix=f'.{validated_format}', delete=False) as tmp_file:
-            tmp_file.write(response_content)
-            tmp_file.flush()
-            
-            logger.debug(f"Audio written to temp file: {tmp_file.name}")
+        # Decode the response in memory into a single float32 buffer that
+        # already includes the leading silence (no temp file, no extra copies)
+        from .audio_decode import decode_audio_bytes
+        from .config import PIP_LEADING_SILENCE
+        
+        try:
+            logger.debug(f"Decoding {validated_format.upper()} audio in memory...")
+            decoded = decode_audio_bytes(
+                response_content,
+                validated_format,
+                sample_rate=SAMPLE_RATE,
+                # Prevent clipping on Bluetooth wake-up (not needed when the output stream is already open)
+                leading_silence=PIP_LEADING_SILENCE if output_needs_warmup(SAMPLE_RATE) else 0.0
+            )
+            logger.debug(f"Audio decoded - Duration: {decoded.duration:.2f}s, Channels: {decoded.channels}, Frame rate: {decoded.sample_rate}")
+        except Exception as e:
+            logger.error(f"Error decoding audio: {e}")
             
-            try:
-                # Load audio file based on format
-                logger.debug(f"Loading {validated_format.upper()} audio...")
-                
-                # Get appropriate loader for format
-                loader = get_audio_loader_for_format(validated_format)
-                if not loader:
-                    logger.error(f"No loader available for format: {validated_format}")
-                    # Fallback to generic loader
-                    audio = AudioSegment.from_file(tmp_file.name, format=validated_format)
-                else:
-                    # Special handling for PCM which needs parameters
-                    if validated_format == "pcm":
-                        # Assume 16-bit PCM at standard rate
-                        audio = loader(
-                            tmp_file.name,
-                            sample_width=2,  # 16-bit
-                            frame_rate=SAMPLE_RATE,
-                            channels=1
-                        )
-                    else:
-                        audio = loader(tmp_file.name)
-                
-                logger.debug(f"Audio loaded - Duration: {len(audio)}ms, Channels: {audio.channels}, Frame rate: {audio.frame_rate}")
-                
-                # Convert to numpy array
-                logger.debug("Converting to numpy array...")
-                samples = np.array(audio.get_array_of_samples())
-                if audio.channels == 2:
-                    samples = samples.reshape((-1, 2))
-                    logger.debug("Reshaped for stereo")
-                
-                # Convert to float32 for sounddevice
-                samples = samples.astype(np.float32) / 32767.0
-                logger.debug(f"Audio converted to float32, shape: {samples.shape}")
-                
-                # Check audio devices
-                if debug:
-                    try:
-                        import sounddevice as sd
-                        devices = sd.query_devices()
-                        default_output = sd.default.device[1]
-                        logger.debug(f"Default output device: {default_output} - {devices[default_output]['name'] if default_output is not None else 'None'}")
-                    except Exception as dev_e:
-                        logger.error(f"Error querying audio devices: {dev_e}")
-                
-                logger.debug(f"Playing audio with sounddevice at {audio.frame_rate}Hz...")
-                
-                # Try to ensure sounddevice doesn't interfere with stdout/stderr
+            # Try alternative playback method in debug mode
+            if debug:
                 try:
-                    import sounddevice as sd
-                    import sys
-                    
-                    # Save current stdio state
-                    original_stdin = sys.stdin
-                    original_stdout = sys.stdout
-                    original_stderr = sys.stderr
-                    
-                    try:
-                        # Force initialization before playing
-                        sd.default.samplerate = audio.frame_rate
-                        sd.default.channels = audio.channels
-                        
-                        # Log TTS playback start event
-                        if event_logger:
-                            event_logger.log_event(event_logger.TTS_PLAYBACK_START)
-                        
-                        # Add configurable silence at the beginning to prevent clipping
-                        from .config import PIP_LEADING_SILENCE
-                        silence_duration = PIP_LEADING_SILENCE  # seconds
-                        silence_samples = int(audio.frame_rate * silence_duration)
-                        # Match the shape of the samples array exactly
-                        if samples.ndim == 1:
-                            silence = np.zeros(silence_samples, dtype=np.float32)
-                            samples_with_buffer = np.concatenate([silence, samples])
-                        else:
-                            silence = np.zeros((silence_samples, samples.shape[1]), dtype=np.float32)
-                            samples_with_buffer = np.vstack([silence, samples])
-                        
-                        sd.play(samples_with_buffer, audio.frame_rate)
-                        sd.wait()
-                        
-                        # Log TTS playback end event
-                        if event_logger:
-                            event_logger.log_event(event_logger.TTS_PLAYBACK_END)
-                        
-                        logger.info("✓ TTS played successfully")
-                        os.unlink(tmp_file.name)
-                        metrics['playback'] = time.perf_counter() - playback_start
-                        return True, metrics
-                    finally:
-                        # Restore stdio if it was changed
-                        if sys.stdin != original_stdin:
-                            sys.stdin = original_stdin
-                        if sys.stdout != original_stdout:
-                            sys.stdout = original_stdout
-                        if sys.stderr != original_stderr:
-                            sys.stderr = original_stderr
-                except Exception as sd_error:
-                    logger.error(f"Sounddevice playback failed: {sd_error}")
-                    
-                    # Fallback to file-based playback methods
-                    logger.info("Attempting alternative playback methods...")
-                    
-                    # Try using PyDub's playback (requires simpleaudio or pyaudio)
-                    try:
-                        from pydub.playback import play as pydub_play
-                        logger.debug("Using PyDub playback...")
-                        pydub_play(audio)
-                        logger.info("✓ TTS played successfully with PyDub")
-                        os.unlink(tmp_file.name)
+                    logger.debug("Attempting alternative playback with system command...")
+                    import subprocess
+                    result = subprocess.run(['paplay'], input=response_content, capture_output=True, timeout=10)
+                    if result.returncode == 0:
+                        logger.info("✓ Alternative playback successful")
                         metrics['playback'] = time.perf_counter() - playback_start
                         return True, metrics
-                    except Exception as pydub_error:
-                        logger.error(f"PyDub playback failed: {pydub_error}")
-                    
-                    # Last resort: save to user's home directory for manual playback
-                    try:
-                        fallback_path = Path.home() / f"voice-mode-audio-{datetime.now().strftime('%Y%m%d_%H%M%S')}.{validated_format}"
-                        import shutil
-                        shutil.copy(tmp_file.name, fallback_path)
-                        logger.warning(f"Audio saved to {fallback_path} for manual playback")
-                        os.unlink(tmp_file.name)
-                        metrics['playback'] = time.perf_counter() - playback_start
-                        return False, metrics
-                    except Exception as save_error:
-                        logger.error(f"Failed to save audio file: {save_error}")
-                        os.unlink(tmp_file.name)
-                        metrics['playback'] = time.perf_counter() - playback_start
-                        return False, metrics
+                    else:
+                        logger.error(f"Alternative playback failed: {result.stderr.decode()}")
+                except Exception as alt_e:
+                    logger.error(f"Alternative playback error: {alt_e}")
+            
+            metrics['playback'] = time.perf_counter() - playback_start
+            return False, metrics
+        
+        # Check audio devices
+        if debug:
+            try:
+                import sounddevice as sd
+                devices = sd.query_devices()
+                default_output = sd.default.device[1]
+                logger.debug(f"Default output device: {default_output} - {devices[default_output]['name'] if default_output is not None else 'None'}")
+            except Exception as dev_e:
+                logger.error(f"Error querying audio devices: {dev_e}")
+        
+        logger.debug(f"Playing audio with sounddevice at {decoded.sample_rate}Hz...")
+        
+        # Try to ensure sounddevice doesn't interfere with stdout/stderr
+        try:
+            import sounddevice as sd
+            import sys
+            
+            # Save current stdio state
+            original_stdin = sys.stdin
+            original_stdout = sys.stdout
+            original_stderr = sys.stderr
+            
+            try:
+                # Force initialization before playing
+                sd.default.samplerate = decoded.sample_rate
+                sd.default.channels = decoded.channels
+                
+                # Log TTS playback start event
+                if event_logger:
+                    event_logger.log_event(event_logger.TTS_PLAYBACK_START)
                 
-            except Exception as e:
-                logger.error(f"Error playing audio: {e}")
-                logger.error(f"Audio format - Channels: {audio.channels if 'audio' in locals() else 'unknown'}, Frame rate: {audio.frame_rate if 'audio' in locals() else 'unknown'}")
-                logger.error(f"Samples shape: {samples.shape if 'samples' in locals() else 'unknown'}")
+                metrics['device_open'] = await play_samples(decoded.samples, decoded.sample_rate)
                 
-                # Try alternative playback method in debug mode
-                if debug:
-                    try:
-                        logger.debug("Attempting alternative playback with system command...")
-                        import subprocess
-                        result = subprocess.run(['paplay', tmp_file.name], capture_output=True, timeout=10)
-                        if result.returncode == 0:
-                            logger.info("✓ Alternative playback successful")
-                            os.unlink(tmp_file.name)
-                            metrics['playback'] = time.perf_counter() - playback_start
-                            return True, metrics
-                        else:
-                            logger.error(f"Alternative playback failed: {result.stderr.decode()}")
-                    except Exception as alt_e:
-                        logger.error(f"Alternative playback error: {alt_e}")
+                # Log TTS playback end event
+                if event_logger:
+                    event_logger.log_event(event_logger.TTS_PLAYBACK_END)
                 
-                os.unlink(tmp_file.name)
+                logger.info("✓ TTS played successfully")
+                metrics['playback'] = time.perf_counter() - playback_start
+                if cache_key and not served_by_other_endpoint(openai_clients[client_key], tts_base_url):
+                    tts_cache.put(cache_key, decoded.pcm16(), decoded.sample_rate, metrics['ttfa'], decoded.channels)
+                return True, metrics
+            finally:
+                # Restore stdio if it was changed
+                if sys.stdin != original_stdin:
+                    sys.stdin = original_stdin
+                if sys.stdout != original_stdout:
+                    sys.stdout = original_stdout
+                if sys.stderr != original_stderr:
+                    sys.stderr = original_stderr
+        except Exception as sd_error:
+            logger.error(f"Sounddevice playback failed: {sd_error}")
+            
+            # Fallback to alternative playback methods
+            logger.info("Attempting alternative playback methods...")
+            
+            # Try using PyDub's playback (requires simpleaudio or pyaudio)
+            try:
+                from pydub.playback import play as pydub_play
+                logger.debug("Using PyDub playback...")
+                audio = AudioSegment(
+                    data=decoded.pcm16().tobytes(),
+                    sample_width=2,
+                    frame_rate=decoded.sample_rate,
+                    channels=decoded.channels
+                )
+                pydub_play(audio)
+                logger.info("✓ TTS played successfully with PyDub")
                 metrics['playback'] = time.perf_counter() - playback_start
-                return False, metrics
+                return True, metrics
+            except Exception as pydub_error:
+                logger.error(f"PyDub playback failed: {pydub_error}")
+            
+            # Last resort: save to user's home directory for manual playback
+            try:
+                fallback_path = Path.home() / f"voice-mode-audio-{datetime.now().strftime('%Y%m%d_%H%M%S')}.{validated_format}"
+                fallback_path.write_bytes(response_content)
+                logger.warning(f"Audio saved to {fallback_path} for manual playback")
+            except Exception as save_error:
+                logger.error(f"Failed to save audio file: {save_error}")
+            metrics['playback'] = time.perf_counter() - playback_start
+            return False, metrics
                         
     except Exception as e:
         logger.error(f"TTS failed: {e}")
@@ -508,6 +485,93 @@ async def text_to_speech(
         return False, metrics
 
 
+async def play_samples(samples: np.ndarray, sample_rate: int) -> float:
+    """Play a buffer to completion on the persistent output engine.
+    
+    Falls back to sd.play() when the engine is disabled.
+    
+    Returns:
+        Seconds spent opening the output device (0.0 when it was already open)
+    """
+    import sounddevice as sd
+    from .output_engine import get_output_engine
+    
+    engine = get_output_engine()
+    if engine is None:
+        open_start = time.perf_counter()
+        sd.play(samples, sample_rate)
+        # sd.play opens a new stream every time; count it all as device open
+        open_time = time.perf_counter() - open_start
+        sd.wait()
+        return open_time
+    
+    await engine.wait_refresh()
+    job = engine.play(samples, sample_rate)
+    # Keep the event loop free so tasks such as the early mic open run during playback
+    await job.wait_async()
+    return job.open_time
+
+
+def output_needs_warmup(sample_rate: int) -> bool:
+    """Whether playback at this rate will open the device (and needs leading silence)."""
+    from .output_engine import get_output_engine
+    engine = get_output_engine()
+    return engine is None or not engine.is_warm(sample_rate)
+
+
+def served_by_other_endpoint(client, tts_base_url: str) -> bool:
+    """Whether a hedged request was answered by an endpoint other than tts_base_url.
+    
+    Such audio has a different voice than the cache key describes, so it
+    must not be cached under it.
+    """
+    from .tts_hedging import HedgedSpeechClient
+    return isinstance(client, HedgedSpeechClient) and client.served_by not in (None, tts_base_url)
+
+
+async def play_cached_audio(cached, metrics: dict, generation_start: float) -> bool:
+    """Play audio served from the TTS cache.
+    
+    Args:
+        cached: CachedAudio entry from the TTS cache
+        metrics: TTS metrics dict to fill in ('ttfa' and 'playback')
+        generation_start: perf_counter() value when the TTS request started
+    
+    Returns:
+        True if playback succeeded
+    """
+    from .config import PIP_LEADING_SILENCE
+    
+    playback_start = time.perf_counter()
+    metrics['ttfa'] = playback_start - generation_start
+    event_logger = get_event_logger()
+    
+    try:
+        samples = cached.samples
+        
+        # Same leading silence as regular playback to prevent clipping, unless the device is already awake
+        if output_needs_warmup(cached.sample_rate):
+            silence_samples = int(cached.sample_rate * PIP_LEADING_SILENCE)
+            silence = np.zeros((silence_samples,) + samples.shape[1:], dtype=np.int16)
+            samples = np.concatenate([silence, samples])
+        
+        if event_logger:
+            event_logger.log_event(event_logger.TTS_PLAYBACK_START)
+        
+        metrics['device_open'] = await play_samples(samples, cached.sample_rate)
+        
+        if event_logger:
+            event_logger.log_event(event_logger.TTS_PLAYBACK_END)
+        
+        metrics['playback'] = time.perf_counter() - playback_start
+        logger.info("✓ TTS played from cache")
+        return True
+    except Exception as e:
+        logger.error(f"Cached audio playback failed: {e}")
+        metrics['playback'] = time.perf_counter() - playback_start
+        return False
+
+
 def generate_chime(
     frequencies: list, 
     duration: float = 0.1, 
@@ -527,69 +591,58 @@ def generate_chime(
     Returns:
         Numpy array of audio samples
     """
-    samples_per_tone = int(sample_rate * duration)
-    fade_samples = int(sample_rate * 0.01)  # 10ms fade
-    
-    # Determine amplitude based on output device
-    amplitude = 0.0375  # Default (very quiet)
-    try:
-        import sounddevice as sd
-        default_output = sd.default.device[1]
-        if default_output is not None:
-            devices = sd.query_devices()
-            device_name = devices[default_output]['name'].lower()
-            # Check for Bluetooth devices (AirPods, Bluetooth headphones, etc)
-            if 'airpod' in device_name or 'bluetooth' in device_name or 'bt' in device_name:
-                amplitude = 0.15  # Higher amplitude for Bluetooth devices
-                logger.debug(f"Bluetooth device detected ({devices[default_output]['name']}), using amplitude {amplitude}")
-            else:
-                amplitude = 0.075  # Moderate amplitude for built-in speakers
-                logger.debug(f"Built-in speaker detected ({devices[default_output]['name']}), using amplitude {amplitude}")
-    except Exception as e:
-        logger.debug(f"Could not detect output device type: {e}, using default amplitude {amplitude}")
-    
-    all_samples = []
-    
-    for freq in frequencies:
-        # Generate sine wave
-        t = np.linspace(0, duration, samples_per_tone, False)
-        tone = amplitude * np.sin(2 * np.pi * freq * t)
-        
-        # Apply fade in/out to prevent clicks
-        fade_in = np.linspace(0, 1, fade_samples)
-        fade_out = np.linspace(1, 0, fade_samples)
-        
-        tone[:fade_samples] *= fade_in
-        tone[-fade_samples:] *= fade_out
-        
-        all_samples.append(tone)
-    
-    # Concatenate all tones
-    chime = np.concatenate(all_samples)
-    
-    # Import config values if not overridden
+    from .chime_bank import get_chime_bank, synthesize_chime
     from .config import PIP_LEADING_SILENCE, PIP_TRAILING_SILENCE
     
     # Use parameter overrides or fall back to config
     actual_leading_silence = leading_silence if leading_silence is not None else PIP_LEADING_SILENCE
     actual_trailing_silence = trailing_silence if trailing_silence is not None else PIP_TRAILING_SILENCE
     
-    # Add leading silence for Bluetooth wake-up time
-    # This prevents the beginning of the chime from being cut off
-    silence_samples = int(sample_rate * actual_leading_silence)
-    silence = np.zeros(silence_samples)
+    # Amplitude depends on the output device (louder for Bluetooth); the profile is cached per device
+    amplitude = get_chime_bank().device_profile().amplitude
     
-    # Add trailing silence to prevent end cutoff
-    trailing_silence_samples = int(sample_rate * actual_trailing_silence)
-    trailing_silence = np.zeros(trailing_silence_samples)
+    # Leading silence gives Bluetooth devices time to wake up so the chime isn't cut off;
+    # trailing silence prevents end cutoff
+    return synthesize_chime(
+        frequencies, duration, sample_rate,
+        actual_leading_silence, actual_trailing_silence, amplitude
+    )
+
+
+def get_chime(
+    frequencies: list,
+    duration: float = 0.1,
+    sample_rate: int = SAMPLE_RATE,
+    leading_silence: Optional[float] = None,
+    trailing_silence: Optional[float] = None
+) -> np.ndarray:
+    """Get a chime from the chime bank, synthesizing it only on first use.
     
-    # Combine: leading silence + chime + trailing silence
-    chime_with_buffer = np.concatenate([silence, chime, trailing_silence])
+    Same arguments as generate_chime(). The returned buffer is shared and read-only.
+    """
+    from .chime_bank import get_chime_bank
+    from .config import PIP_LEADING_SILENCE, PIP_TRAILING_SILENCE
     
-    # Convert to 16-bit integer
-    chime_int16 = (chime_with_buffer * 32767).astype(np.int16)
+    return get_chime_bank().chime(
+        frequencies, duration, sample_rate,
+        leading_silence if leading_silence is not None else PIP_LEADING_SILENCE,
+        trailing_silence if trailing_silence is not None else PIP_TRAILING_SILENCE
+    )
+
+
+async def play_feedback(samples: np.ndarray, sample_rate: int) -> None:
+    """Play a feedback sound, waiting without blocking the event loop when possible."""
+    from .output_engine import get_output_engine
     
-    return chime_int16
+    engine = get_output_engine()
+    if engine is None:
+        import sounddevice as sd
+        sd.play(samples, sample_rate)
+        sd.wait()
+        return
+    
+    await engine.wait_refresh()
+    await engine.play(samples, sample_rate).wait_async()
 
 
 async def play_chime_start(
@@ -625,16 +678,14 @@ async def play_chime_start(
         # Check if file exists
         if not audio_file.exists():
             # Fallback to programmatic generation if files don't exist
-            import sounddevice as sd
-            chime = generate_chime(
+            chime = get_chime(
                 [800, 1000], 
                 duration=0.1, 
                 sample_rate=sample_rate,
                 leading_silence=leading_silence,
                 trailing_silence=trailing_silence
             )
-            sd.play(chime, sample_rate)
-            sd.wait()
+            await play_feedback(chime, sample_rate)
         else:
             # Play pre-generated file using system audio player
             if sys.platform == 'darwin':  # macOS
@@ -655,16 +706,14 @@ async def play_chime_start(
                     play_obj.wait_done()
                 except ImportError:
                     # If simpleaudio not available, use sounddevice
-                    import sounddevice as sd
-                    chime = generate_chime(
+                    chime = get_chime(
                         [800, 1000], 
                         duration=0.1, 
                         sample_rate=sample_rate,
                         leading_silence=leading_silence,
                         trailing_silence=trailing_silence
                     )
-                    sd.play(chime, sample_rate)
-                    sd.wait()
+                    await play_feedback(chime, sample_rate)
         
         return True
     except Exception as e:
@@ -705,16 +754,14 @@ async def play_chime_end(
         # Check if file exists
         if not audio_file.exists():
             # Fallback to programmatic generation if files don't exist
-            import sounddevice as sd
-            chime = generate_chime(
+            chime = get_chime(
                 [1000, 800], 
                 duration=0.1, 
                 sample_rate=sample_rate,
                 leading_silence=leading_silence,
                 trailing_silence=trailing_silence
             )
-            sd.play(chime, sample_rate)
-            sd.wait()
+            await play_feedback(chime, sample_rate)
         else:
             # Play pre-generated file using system audio player
             if sys.platform == 'darwin':  # macOS
@@ -735,16 +782,14 @@ async def play_chime_end(
                     play_obj.wait_done()
                 except ImportError:
                     # If simpleaudio not available, use sounddevice
-                    import sounddevice as sd
-                    chime = generate_chime(
+                    chime = get_chime(
                         [1000, 800], 
                         duration=0.1, 
                         sample_rate=sample_rate,
                         leading_silence=leading_silence,
                         trailing_silence=trailing_silence
                     )
-                    sd.play(chime, sample_rate)
-                    sd.wait()
+                    await play_feedback(chime, sample_rate)
         
         return True
     except Exception as e:
@@ -766,6 +811,38 @@ async def cleanup(openai_clients: dict):
     except Exception as e:
         logger.error(f"Error closing HTTP clients: {e}")
     
+    # Close pooled per-endpoint clients shared by provider selection and failover
+    try:
+        from .connection_pool import client_registry
+        for base_url, stats in client_registry.get_stats().items():
+            logger.debug(
+                f"Connection stats for {base_url}: {stats['requests']} requests, "
+                f"{stats['new_connections']} new connections, {stats['reused_connections']} reused"
+            )
+        await client_registry.close_all()
+        logger.debug("Closed pooled HTTP clients")
+    except Exception as e:
+        logger.error(f"Error closing pooled HTTP clients: {e}")
+    
+    # Finish writing saved audio and transcriptions
+    try:
+        from .artifact_writer import get_artifact_writer
+        writer = get_artifact_writer()
+        writer.close()
+        stats = writer.get_stats()
+        if stats['submitted']:
+            logger.debug(f"Artifact writer: {stats['written']} files written, "
+                         f"{stats['inline_writes']} inline, max queue depth {stats['max_depth']}")
+    except Exception as e:
+        logger.error(f"Error flushing artifact writer: {e}")
+    
+    # Release the persistent output streams
+    try:
+        from .output_engine import close_output_engine
+        close_output_engine()
+    except Exception as e:
+        logger.error(f"Error closing output engine: {e}")
+    
     # Final garbage collection
     gc.collect()
     logger.info("Cleanup completed")
@@ -0,0 +1,184 @@
+"""
+Incremental transcription while the user is still talking.
+
+Normally the whole answer is transcribed after end of speech, so a long
+answer costs a long STT request at the worst possible moment.
+IncrementalTranscriber watches the recorder's VAD decisions and cuts the
+recording at short pauses; each completed segment is sent to the local
+Whisper endpoint in the background. At end of speech only the last
+segment is left to transcribe, and the partial transcripts are joined in
+order.
+
+Any failure makes finish() return None, and converse transcribes the whole
+recording the usual way.
+"""
+
+import asyncio
+import concurrent.futures
+import logging
+import time
+from typing import List, Optional
+
+import numpy as np
+
+from .audio_encode import encode_wav, upload_file
+from .resample import resample
+from .config import (
+    INCREMENTAL_STT_ENABLED,
+    INCREMENTAL_STT_MIN_SEGMENT_S,
+    INCREMENTAL_STT_PAUSE_MS,
+    SAMPLE_RATE,
+)
+
+logger = logging.getLogger("voice-mode")
+
+
+def _is_local_url(base_url: str) -> bool:
+    return "127.0.0.1" in base_url or "localhost" in base_url
+
+
+class IncrementalTranscriber:
+    """Transcribes pause-delimited segments of a recording as they complete."""
+
+    def __init__(
+        self,
+        client,
+        loop: asyncio.AbstractEventLoop,
+        model: str = "whisper-1",
+        sample_rate: int = SAMPLE_RATE,
+        pause_ms: int = INCREMENTAL_STT_PAUSE_MS,
+        min_segment: float = INCREMENTAL_STT_MIN_SEGMENT_S,
+        upload_rate: Optional[int] = None,
+        trimmer=None
+    ):
+        self.client = client
+        self.loop = loop
+        self.model = model
+        self.sample_rate = sample_rate
+        self.upload_rate = upload_rate or sample_rate
+        self.pause_samples = int(sample_rate * pause_ms / 1000)
+        self.min_segment_samples = int(sample_rate * min_segment)
+        # SilenceTrimmer that processes each chunk before this transcriber
+        self.trimmer = trimmer
+
+        self.samples = 0  # Samples seen, to check against the final recording
+        self.segments: List[concurrent.futures.Future] = []
+        self.final_segment_time = 0.0  # Seconds spent transcribing after end of speech
+
+        self._chunks: List[np.ndarray] = []
+        self._segment_samples = 0
+        self._silence_samples = 0
+        self._segment_has_speech = False
+
+    def process(self, chunk: np.ndarray, is_speech: bool):
+        """Take one recorded chunk and its VAD decision (recorder thread)."""
+        chunk = chunk.reshape(-1)
+        self.samples += len(chunk)
+        self._chunks.append(chunk)
+        self._segment_samples += len(chunk)
+
+        if is_speech:
+            self._segment_has_speech = True
+            self._silence_samples = 0
+            return
+        self._silence_samples += len(chunk)
+
+        if (self._segment_has_speech and self._silence_samples >= self.pause_samples
+                and self._segment_samples >= self.min_segment_samples):
+            self._submit(self._take_segment())
+
+    def _take_segment(self) -> np.ndarray:
+        segment = np.concatenate(self._chunks)
+        self._chunks = []
+        self._segment_samples = 0
+        self._segment_has_speech = False
+        if self.trimmer is not None:
+            # Drops the wait for speech and the final silence window
+            segment = self.trimmer.clip(segment)
+        return segment
+
+    def _submit(self, segment: np.ndarray):
+        index = len(self.segments)
+        logger.debug(f"Incremental STT: segment {index + 1} ({len(segment) / self.sample_rate:.1f}s) sent while recording")
+        self.segments.append(asyncio.run_coroutine_threadsafe(self._transcribe(segment), self.loop))
+
+    async def _transcribe(self, segment: np.ndarray) -> str:
+        transcription = await self.client.audio.transcriptions.create(
+            model=self.model,
+            file=upload_file(encode_wav(resample(segment, self.sample_rate, self.upload_rate), self.upload_rate), "wav"),
+            response_format="text"
+        )
+        return transcription.strip() if isinstance(transcription, str) else transcription.text.strip()
+
+    async def finish(self, audio: np.ndarray) -> Optional[str]:
+        """Transcribe the last segment and join it with the earlier ones.
+
+        Args:
+            audio: The final recording, used to check every sample was seen
+
+        Returns:
+            The stitched transcript, or None to fall back to a full transcription
+        """
+        if self.samples != len(audio):
+            logger.debug(f"Incremental STT: saw {self.samples} of {len(audio)} samples - not used")
+            self.cancel()
+            return None
+
+        start = time.perf_counter()
+        tail = None
+        # Trailing silence after the last cut needs no transcription
+        if self._chunks and (self._segment_has_speech or not self.segments):
+            tail = self._take_segment()
+        parts = [asyncio.wrap_future(future) for future in self.segments]
+        if tail is not None:
+            parts.append(asyncio.ensure_future(self._transcribe(tail)))
+
+        try:
+            texts = await asyncio.gather(*parts)
+        except Exception as e:
+            logger.warning(f"Incremental STT failed, transcribing the whole recording: {e}")
+            self.cancel()
+            return None
+        self.final_segment_time = time.perf_counter() - start
+
+        text = " ".join(t for t in texts if t)
+        logger.info(f"Incremental STT: {len(self.segments)} segment(s) transcribed while recording, "
+                    f"final segment {len(tail) / self.sample_rate if tail is not None else 0:.1f}s "
+                    f"took {self.final_segment_time:.2f}s")
+        return text or None
+
+    def cancel(self):
+        """Drop segments still being transcribed."""
+        for future in self.segments:
+            future.cancel()
+
+    def reset(self):
+        """Drop everything seen so far (the recording restarted)."""
+        self.cancel()
+        self.segments = []
+        self.samples = 0
+        self._chunks = []
+        self._segment_samples = 0
+        self._silence_samples = 0
+        self._segment_has_speech = False
+
+
+async def start_incremental_transcription(trimmer=None) -> Optional[IncrementalTranscriber]:
+    """Create a transcriber if incremental STT is on and the first STT endpoint is local.
+
+    Args:
+        trimmer: SilenceTrimmer to cut segments with, if any
+    """
+    if not INCREMENTAL_STT_ENABLED:
+        return None
+
+    from .config import OPENAI_API_KEY, STT_BASE_URLS, get_stt_upload_sample_rate
+    from .connection_pool import client_registry
+
+    if not STT_BASE_URLS or not _is_local_url(STT_BASE_URLS[0]):
+        logger.debug("Incremental STT needs a local Whisper endpoint first in STT_BASE_URLS")
+        return None
+
+    client = client_registry.get_client(STT_BASE_URLS[0], OPENAI_API_KEY or "dummy-key-for-local")
+    return IncrementalTranscriber(client, asyncio.get_running_loop(),
+                                  upload_rate=get_stt_upload_sample_rate(STT_BASE_URLS[0]), trimmer=trimmer)
@@ -0,0 +1,170 @@
+"""
+Open the microphone before TTS playback ends.
+
+Between speaking and listening, converse used to pause for a fixed 0.5s
+and then open a fresh input stream, a second or more of dead air per turn
+on some devices. ListenAhead opens the input stream while the last part of
+the response is still playing. Once playback and the listening chime end it
+measures how long the microphone takes to go quiet (the device-settle
+interval, instead of a fixed pause), and the recorder then reads from the
+already-open stream, so neither the response nor the chime is recorded.
+Frames captured before recording begins are used only for the settle
+measurement and are never recorded.
+"""
+
+import asyncio
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from typing import Deque, Optional
+
+import numpy as np
+
+from .config import (
+    CHANNELS,
+    LISTEN_OVERLAP_MS,
+    LISTEN_SETTLE_MAX_MS,
+    LISTEN_SETTLE_RMS,
+    SAMPLE_RATE,
+    VAD_CHUNK_DURATION_MS,
+)
+
+logger = logging.getLogger("voice-mode")
+
+# The fixed pause this replaces
+BASELINE_PAUSE = 0.5
+
+# Consecutive quiet frames that count as settled
+SETTLE_FRAMES = 3
+
+DEVICE_ERRORS = ('device unavailable', 'device disconnected', 'invalid device',
+                 'unanticipated host error', 'stream is stopped', 'portaudio error')
+
+
+class ListenAhead:
+    """An input stream opened ahead of recording."""
+
+    def __init__(self, sample_rate: int = SAMPLE_RATE):
+        self.sample_rate = sample_rate
+        self.blocksize = int(sample_rate * VAD_CHUNK_DURATION_MS / 1000)
+        self.queue: "queue.Queue[Optional[np.ndarray]]" = queue.Queue()
+        self.recording = threading.Event()
+        self.capture = None  # CaptureBuffer the callback writes into while recording
+        self.stream = None
+
+        self.open_time = 0.0  # Seconds spent opening the input device
+        self.opened_during_playback = False
+        self.settle_time = 0.0
+
+        self._levels: Deque[float] = deque(maxlen=SETTLE_FRAMES)
+        self._frames_seen = 0
+
+    def open(self, during_playback: bool = False):
+        """Open and start the input stream (no-op if already open)."""
+        if self.stream is not None:
+            return
+        import sounddevice as sd
+
+        start = time.perf_counter()
+        stream = sd.InputStream(
+            samplerate=self.sample_rate,
+            channels=CHANNELS,
+            dtype=np.int16,
+            blocksize=self.blocksize,
+            callback=self._callback
+        )
+        try:
+            stream.start()
+        except Exception:
+            stream.close()
+            raise
+        # Only a started stream counts as open, so a failed open can be retried
+        self.stream = stream
+        self.open_time = time.perf_counter() - start
+        self.opened_during_playback = during_playback
+        logger.debug(f"Microphone opened {'during playback ' if during_playback else ''}"
+                     f"in {self.open_time * 1000:.0f}ms")
+
+    def _callback(self, indata, frames, time_info, status):
+        if status:
+            logger.warning(f"Audio stream status: {status}")
+            if any(err in str(status).lower() for err in DEVICE_ERRORS):
+                self.queue.put(None)  # The recorder treats None as a device error
+                return
+        if self.recording.is_set():
+            self.queue.put(self.capture.append(indata) if self.capture is not None else indata.copy())
+        else:
+            self._levels.append(float(np.sqrt(np.mean(indata.astype(np.float32) ** 2))))
+            self._frames_seen += 1
+
+    async def open_near_end_of_playback(self, window: float = LISTEN_OVERLAP_MS / 1000, poll: float = 0.02):
+        """Open the microphone once no more than window seconds of playback are left.
+
+        Runs until the stream is open; cancel it when TTS finishes early. A
+        failed open is logged and left for the open() after playback to retry.
+        """
+        from .output_engine import get_output_engine
+
+        engine = get_output_engine()
+        if engine is None:
+            return
+        while self.stream is None:
+            remaining = engine.queued_seconds()
+            # None means audio is still arriving; 0 before anything is queued
+            if remaining is not None and 0 < remaining <= window:
+                try:
+                    self.open(during_playback=True)
+                except Exception as e:
+                    logger.warning(f"Could not open microphone during playback: {e}")
+                return
+            await asyncio.sleep(poll)
+
+    async def settle(self, max_wait: float = LISTEN_SETTLE_MAX_MS / 1000,
+                     quiet_rms: float = LISTEN_SETTLE_RMS) -> float:
+        """Wait until the microphone no longer hears playback.
+
+        Returns:
+            Measured settle time in seconds (at most max_wait)
+        """
+        start = time.perf_counter()
+        start_frames = self._frames_seen
+        while time.perf_counter() - start < max_wait:
+            fresh = self._frames_seen - start_frames
+            if fresh >= SETTLE_FRAMES and max(self._levels) < quiet_rms:
+                break
+            await asyncio.sleep(0.005)
+        self.settle_time = time.perf_counter() - start
+        return self.settle_time
+
+    @property
+    def saved_time(self) -> float:
+        """Dead air removed compared with the fixed pause plus opening the mic afterwards.
+
+        The chime plays between playback and recording either way, so its
+        length is not part of the difference.
+        """
+        hidden_open = self.open_time if self.opened_during_playback else 0.0
+        return max(0.0, BASELINE_PAUSE - self.settle_time + hidden_open)
+
+    def begin_recording(self, capture=None):
+        """Start queueing frames for the recorder.
+
+        Args:
+            capture: CaptureBuffer to write frames into; the queue then
+                carries views of the stored frames instead of copies
+        """
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.capture = capture
+        self.recording.set()
+
+    def close(self):
+        if self.stream is not None:
+            try:
+                self.stream.stop()
+                self.stream.close()
+            except Exception as e:
+                logger.debug(f"Error closing input stream: {e}")
+            self.stream = None
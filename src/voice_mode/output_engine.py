@@ -0,0 +1,377 @@
+"""
+Persistent audio output engine.
+
+Opening the output device costs tens of milliseconds on built-in speakers
+and hundreds on Bluetooth sinks, which is why chimes and TTS carry leading
+silence. The engine keeps one callback-driven output stream open per
+sample rate for the life of the server. Playback jobs (TTS audio, chimes,
+streaming TTS) are queued on it and played in order; between jobs the
+stream outputs silence so the device stays awake. A stream is reopened only
+when the default output device changes or the stream dies; a dead stream
+usually means its device went away, so PortAudio is reinitialized first.
+PortAudio only sees a newly connected device after reinitializing, so
+converse starts a device refresh at the start of each turn while nothing is
+playing. It runs in the background during TTS synthesis; playback waits for
+it before queueing, and the first job afterwards reports its cost as device
+open time.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+
+import numpy as np
+import sounddevice as sd
+
+logger = logging.getLogger("voice-mode")
+
+
+class PlaybackJob:
+    """Audio queued on the output engine.
+
+    Subclasses implement fill(), which the audio thread calls with the part
+    of the device buffer still to be filled.
+    """
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.cancelled = False
+        self.open_time = 0.0  # Seconds spent opening the device for this job
+
+    def fill(self, out: np.ndarray) -> Tuple[int, bool]:
+        """Write samples into out.
+
+        Returns:
+            (frames written, finished). A job that isn't finished must fill
+            all of out (with silence if it has no data yet).
+        """
+        raise NotImplementedError
+
+    def remaining_frames(self) -> Optional[int]:
+        """Frames left to play, or None if more audio may still arrive."""
+        return None
+
+    def cancel(self):
+        """Stop the job; the engine skips it from its next callback."""
+        self.cancelled = True
+        self.done.set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the job has played."""
+        return self.done.wait(timeout)
+
+    async def wait_async(self, poll: float = 0.01):
+        """Wait for the job without blocking the event loop."""
+        while not self.done.is_set():
+            await asyncio.sleep(poll)
+
+
+class BufferJob(PlaybackJob):
+    """Play a complete buffer."""
+
+    def __init__(self, samples: np.ndarray):
+        super().__init__()
+        if samples.ndim > 1:
+            # The engine plays mono; averaging int16 yields float64 on the
+            # int16 scale, so round it back rather than rescaling it
+            if samples.dtype == np.int16:
+                samples = samples.mean(axis=1).round().astype(np.int16)
+            else:
+                samples = samples.mean(axis=1)
+        if samples.dtype != np.int16:
+            samples = np.clip(samples * 32767.0, -32768, 32767).astype(np.int16)
+        self.samples = samples
+        self.position = 0
+
+    def remaining_frames(self) -> Optional[int]:
+        return len(self.samples) - self.position
+
+    def fill(self, out: np.ndarray) -> Tuple[int, bool]:
+        count = min(len(out), len(self.samples) - self.position)
+        out[:count] = self.samples[self.position:self.position + count]
+        self.position += count
+        return count, self.position >= len(self.samples)
+
+
+class _RateStream:
+    """One open device stream and its job queue."""
+
+    def __init__(self, sample_rate: int, device: Optional[int]):
+        self.sample_rate = sample_rate
+        self.device = device
+        self.jobs: Deque[PlaybackJob] = deque()
+        self.stream = None
+
+    def callback(self, outdata, frames, time_info, status):
+        if status:
+            logger.debug(f"Output engine status: {status}")
+        out = outdata.reshape(-1)
+        position = 0
+        while position < len(out):
+            if not self.jobs:
+                out[position:] = 0
+                return
+            job = self.jobs[0]
+            if job.cancelled:
+                self.jobs.popleft()
+                continue
+            written, finished = job.fill(out[position:])
+            position += written
+            if finished:
+                self.jobs.popleft()
+                job.done.set()
+            elif position < len(out):
+                out[position:] = 0
+                return
+
+    def alive(self) -> bool:
+        try:
+            return bool(getattr(self.stream, "active", True))
+        except Exception:
+            return False
+
+    def close(self):
+        for job in list(self.jobs):
+            job.cancel()
+        self.jobs.clear()
+        if self.stream is not None:
+            try:
+                self.stream.stop()
+                self.stream.close()
+            except Exception as e:
+                logger.debug(f"Error closing output stream: {e}")
+            self.stream = None
+
+
+def _default_output_device() -> Optional[int]:
+    try:
+        return sd.default.device[1]
+    except Exception:
+        return None
+
+
+def _default_output_name() -> Optional[str]:
+    # Indices are renumbered on reinitialization; names identify the device
+    try:
+        return sd.query_devices(kind='output')['name']
+    except Exception:
+        return None
+
+
+class OutputEngine:
+    """Owns long-lived output streams and plays queued jobs on them."""
+
+    def __init__(self):
+        # Reentrant: refresh_device() reopens streams while holding it
+        self._lock = threading.RLock()
+        self._streams: Dict[int, _RateStream] = {}
+        self._refresh: Optional[asyncio.Future] = None
+        self._refreshing_rates: Tuple[int, ...] = ()
+        self._refresh_time = 0.0  # Charged to the next job's open_time
+
+        # Session counters
+        self.opens = 0
+        self.open_seconds = 0.0
+        self.reinitializations = 0
+
+    @property
+    def is_open(self) -> bool:
+        """Whether any stream is open."""
+        return bool(self._streams)
+
+    def is_warm(self, sample_rate: int) -> bool:
+        """Whether a stream at this rate is already open on the current device."""
+        if sample_rate in self._refreshing_rates:
+            # Reopened by the refresh before any job can be queued
+            return True
+        rate_stream = self._streams.get(sample_rate)
+        return (rate_stream is not None and rate_stream.device == _default_output_device()
+                and rate_stream.alive())
+
+    def _ensure_stream(self, sample_rate: int) -> Tuple[_RateStream, float]:
+        """Get the stream for a rate, opening it if needed.
+
+        Returns:
+            (stream, seconds spent opening the device - 0.0 when already warm)
+        """
+        with self._lock:
+            device = _default_output_device()
+            rate_stream = self._streams.get(sample_rate)
+            if rate_stream is not None and (rate_stream.device != device or not rate_stream.alive()):
+                logger.info(f"Output device changed or stream stopped - reopening {sample_rate}Hz output")
+                if rate_stream.alive():
+                    rate_stream.close()
+                else:
+                    # A stream stops when its device goes away; PortAudio only
+                    # sees the new default device after reinitializing
+                    self._reinitialize()
+                    device = _default_output_device()
+                rate_stream = None
+            if rate_stream is not None:
+                return rate_stream, 0.0
+
+            start = time.perf_counter()
+            rate_stream = _RateStream(sample_rate, device)
+            rate_stream.stream = sd.OutputStream(
+                samplerate=sample_rate,
+                channels=1,
+                dtype='int16',
+                callback=rate_stream.callback
+            )
+            rate_stream.stream.start()
+            open_time = time.perf_counter() - start
+            self._streams[sample_rate] = rate_stream
+            self.opens += 1
+            self.open_seconds += open_time
+            logger.info(f"Opened {sample_rate}Hz output stream in {open_time * 1000:.0f}ms")
+            return rate_stream, open_time
+
+    def _reinitialize(self, invalidate_chimes: bool = True):
+        """Close every stream and reinitialize PortAudio (caller holds the lock)."""
+        for rate_stream in self._streams.values():
+            rate_stream.close()
+        self._streams.clear()
+        sd._terminate()
+        sd._initialize()
+        self.reinitializations += 1
+
+        if invalidate_chimes:
+            # The new device may need different chime levels
+            from .chime_bank import get_chime_bank
+            get_chime_bank().invalidate()
+
+    def refresh_device(self) -> bool:
+        """Pick up a default output device connected since PortAudio started.
+
+        PortAudio caches its device list, so a stream on the old device stays
+        alive after new headphones are connected. Reinitializing closes the
+        streams; those that were open are reopened on whatever the default
+        device now is, so the turn's first playback still finds them warm.
+        Skipped while audio is queued.
+
+        Returns:
+            Whether PortAudio was reinitialized
+        """
+        with self._lock:
+            if self.queued_seconds() != 0.0:
+                return False
+            start = time.perf_counter()
+            self._refreshing_rates = tuple(self._streams)
+            try:
+                old_device = _default_output_name()
+                self._reinitialize(invalidate_chimes=False)
+                new_device = _default_output_name()
+                if new_device != old_device:
+                    logger.info(f"Default output device changed from '{old_device}' to '{new_device}'")
+                    from .chime_bank import get_chime_bank
+                    get_chime_bank().invalidate()
+                for sample_rate in self._refreshing_rates:
+                    self._ensure_stream(sample_rate)
+            finally:
+                self._refreshing_rates = ()
+                self._refresh_time += time.perf_counter() - start
+            return True
+
+    def start_refresh(self):
+        """Run refresh_device() in the background (call from the event loop).
+
+        The refresh overlaps TTS synthesis instead of delaying it; playback
+        calls wait_refresh() before queueing.
+        """
+        if self._refresh is not None and not self._refresh.done():
+            return
+        self._refresh = asyncio.get_running_loop().run_in_executor(None, self.refresh_device)
+
+    async def wait_refresh(self):
+        """Wait for a background refresh so queueing never blocks the event loop."""
+        refresh = self._refresh
+        if refresh is None:
+            return
+        if refresh.get_loop() is not asyncio.get_running_loop():
+            # Started from an earlier loop; submit() waits on the lock instead
+            self._refresh = None
+            return
+        try:
+            await asyncio.shield(refresh)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Output device refresh failed: {e}")
+        if self._refresh is refresh:
+            self._refresh = None
+
+    def submit(self, job: PlaybackJob, sample_rate: int) -> PlaybackJob:
+        """Queue a job; it plays after the jobs already queued at this rate."""
+        with self._lock:
+            rate_stream, job.open_time = self._ensure_stream(sample_rate)
+            # A refresh since the last job reopened the device for this one
+            job.open_time += self._refresh_time
+            self._refresh_time = 0.0
+            rate_stream.jobs.append(job)
+        return job
+
+    def play(self, samples: np.ndarray, sample_rate: int) -> BufferJob:
+        """Queue a complete buffer (int16, or float in [-1, 1])."""
+        return self.submit(BufferJob(samples), sample_rate)
+
+    def queued_seconds(self) -> Optional[float]:
+        """Audio still to be played across all streams.
+
+        Returns:
+            Seconds, 0.0 when idle, or None while a job may still receive audio
+        """
+        total = 0.0
+        for rate_stream in list(self._streams.values()):
+            for job in list(rate_stream.jobs):
+                if job.done.is_set():
+                    continue
+                remaining = job.remaining_frames()
+                if remaining is None:
+                    return None
+                total += remaining / rate_stream.sample_rate
+        return total
+
+    def cancel_all(self) -> int:
+        """Stop whatever is playing and drop queued jobs, keeping the streams open.
+
+        Returns:
+            Number of jobs cancelled
+        """
+        cancelled = 0
+        with self._lock:
+            for rate_stream in self._streams.values():
+                for job in list(rate_stream.jobs):
+                    if not job.done.is_set():
+                        job.cancel()
+                        cancelled += 1
+        return cancelled
+
+    def close(self):
+        """Close every stream, cancelling queued jobs."""
+        with self._lock:
+            for rate_stream in self._streams.values():
+                rate_stream.close()
+            self._streams.clear()
+
+
+_output_engine: Optional[OutputEngine] = None
+
+
+def get_output_engine() -> Optional[OutputEngine]:
+    """Get the global output engine, or None if it is disabled."""
+    global _output_engine
+    from .config import OUTPUT_ENGINE_ENABLED
+    if not OUTPUT_ENGINE_ENABLED:
+        return None
+    if _output_engine is None:
+        _output_engine = OutputEngine()
+    return _output_engine
+
+
+def close_output_engine():
+    """Close the engine's streams (before PortAudio is reinitialized or on shutdown)."""
+    if _output_engine is not None:
+        _output_engine.close()
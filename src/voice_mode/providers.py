@@ -11,6 +11,7 @@ from openai import AsyncOpenAI
 
 from .config import TTS_VOICES, TTS_MODELS, TTS_BASE_URLS, OPENAI_API_KEY
 from .provider_discovery import provider_registry, EndpointInfo
+from .connection_pool import client_registry
 from .voice_preferences import get_preferred_voices
 
 logger = logging.getLogger("voice-mode")
@@ -56,9 +57,9 @@ async def get_tts_client_and_voice(
         selected_voice = voice or _select_voice_for_endpoint(endpoint_info)
         selected_model = model or _select_model_for_endpoint(endpoint_info)
         
-        client = AsyncOpenAI(
-            api_key=OPENAI_API_KEY or "dummy-key-for-local",
-            base_url=base_url
+        client = client_registry.get_client(
+            base_url,
+            OPENAI_API_KEY or "dummy-key-for-local"
         )
         
         logger.info(f"  • Selected endpoint: {base_url}")
@@ -92,7 +93,7 @@ async def get_tts_client_and_voice(
                 selected_model = _select_model_for_endpoint(endpoint_info, model)
                 
                 api_key = OPENAI_API_KEY if endpoint_info.provider_type == "openai" else (OPENAI_API_KEY or "dummy-key-for-local")
-                client = AsyncOpenAI(api_key=api_key, base_url=url)
+                client = client_registry.get_client(url, api_key)
                 
                 logger.info(f"  ✓ Selected endpoint: {url} ({endpoint_info.provider_type})")
                 logger.info(f"  ✓ Selected voice: {selected_voice}")
@@ -117,7 +118,7 @@ async def get_tts_client_and_voice(
                 selected_model = _select_model_for_endpoint(endpoint_info, model)
                 
                 api_key = OPENAI_API_KEY if endpoint_info.provider_type == "openai" else (OPENAI_API_KEY or "dummy-key-for-local")
-                client = AsyncOpenAI(api_key=api_key, base_url=url)
+                client = client_registry.get_client(url, api_key)
                 
                 logger.info(f"  ✓ Selected endpoint: {url} ({endpoint_info.provider_type})")
                 logger.info(f"  ✓ Selected voice: {selected_voice}")
@@ -137,7 +138,7 @@ async def get_tts_client_and_voice(
             selected_model = _select_model_for_endpoint(endpoint_info, model)
             
             api_key = OPENAI_API_KEY if endpoint_info.provider_type == "openai" else (OPENAI_API_KEY or "dummy-key-for-local")
-            client = AsyncOpenAI(api_key=api_key, base_url=url)
+            client = client_registry.get_client(url, api_key)
             
             logger.info(f"  ✓ Selected endpoint: {url} ({endpoint_info.provider_type})")
             logger.info(f"  ✓ Selected voice: {selected_voice}")
@@ -177,9 +178,9 @@ async def get_stt_client(
         
         selected_model = model or "whisper-1"  # Default STT model
         
-        client = AsyncOpenAI(
-            api_key=OPENAI_API_KEY or "dummy-key-for-local",
-            base_url=base_url
+        client = client_registry.get_client(
+            base_url,
+            OPENAI_API_KEY or "dummy-key-for-local"
         )
         
         return client, selected_model, endpoint_info
@@ -193,10 +194,7 @@ async def get_stt_client(
     selected_model = model or "whisper-1"
     
     api_key = OPENAI_API_KEY if endpoint_info.provider_type == "openai" else (OPENAI_API_KEY or "dummy-key-for-local")
-    client = AsyncOpenAI(
-        api_key=api_key,
-        base_url=endpoint_info.base_url
-    )
+    client = client_registry.get_client(endpoint_info.base_url, api_key)
     
     return client, selected_model, endpoint_info
 
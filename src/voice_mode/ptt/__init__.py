@@ -81,7 +81,8 @@ from .audio_tones import (
     ptt_stop_tone,
     ptt_cancel_tone,
     ptt_waiting_tone,
-    ptt_error_tone
+    ptt_error_tone,
+    get_ptt_tone
 )
 from .statistics import (
     PTTStatistics,
@@ -237,6 +238,7 @@ __all__ = [
     "ptt_cancel_tone",
     "ptt_waiting_tone",
     "ptt_error_tone",
+    "get_ptt_tone",
 
     # Statistics
     "PTTStatistics",
@@ -10,13 +10,7 @@ import numpy as np
 from typing import Optional
 from enum import Enum
 
-from voice_mode.ptt.audio_tones import (
-    ptt_start_tone,
-    ptt_stop_tone,
-    ptt_cancel_tone,
-    ptt_waiting_tone,
-    ptt_error_tone
-)
+from voice_mode.ptt.audio_tones import get_ptt_tone
 from voice_mode.ptt.logging import get_ptt_logger
 
 
@@ -66,15 +60,16 @@ class PTTAudioFeedback:
             self._pregenerate_tones()
 
     def _pregenerate_tones(self):
-        """Pre-generate all tones for faster playback."""
+        """Pre-generate all tones for faster playback.
+
+        Tones come from the shared chime bank, so re-enabling feedback or
+        returning to a previous volume doesn't synthesize them again.
+        """
         try:
             with self._cache_lock:
                 self._tone_cache = {
-                    PTTAudioEvent.WAITING: ptt_waiting_tone(self.volume, self.sample_rate),
-                    PTTAudioEvent.START: ptt_start_tone(self.volume, self.sample_rate),
-                    PTTAudioEvent.STOP: ptt_stop_tone(self.volume, self.sample_rate),
-                    PTTAudioEvent.CANCEL: ptt_cancel_tone(self.volume, self.sample_rate),
-                    PTTAudioEvent.ERROR: ptt_error_tone(self.volume, self.sample_rate),
+                    event: get_ptt_tone(event.value, self.volume, self.sample_rate)
+                    for event in PTTAudioEvent
                 }
 
             self.logger.log_event("audio_tones_pregenerated", {
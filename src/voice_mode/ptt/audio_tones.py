@@ -367,3 +367,36 @@ def ptt_error_tone(amplitude: float = 0.5, sample_rate: int = 44100) -> np.ndarr
     beep3 = generate_beep(300, 0.1, amplitude, sample_rate)
 
     return np.concatenate([beep1, gap, beep2, gap2, beep3])
+
+
+PTT_TONES = {
+    "start": ptt_start_tone,
+    "stop": ptt_stop_tone,
+    "cancel": ptt_cancel_tone,
+    "waiting": ptt_waiting_tone,
+    "error": ptt_error_tone,
+}
+
+
+def get_ptt_tone(name: str, amplitude: float = 0.5, sample_rate: int = 44100) -> np.ndarray:
+    """
+    Get a preset PTT tone from the shared chime bank.
+
+    Each (tone, amplitude, sample rate) is synthesized once; later calls
+    return the same read-only buffer.
+
+    Args:
+        name: Tone name ("start", "stop", "cancel", "waiting", "error")
+        amplitude: Volume 0.0-1.0
+        sample_rate: Sample rate
+
+    Returns:
+        Tone audio samples (int16, read-only)
+    """
+    from voice_mode.chime_bank import get_chime_bank
+
+    factory = PTT_TONES[name]
+    return get_chime_bank().get(
+        ("ptt", name, amplitude, sample_rate),
+        lambda: factory(amplitude, sample_rate)
+    )
@@ -86,6 +86,7 @@ class PTTController:
         )
         self._keyboard: Optional[KeyboardHandler] = None
         self._recorder = AsyncPTTRecorder(logger=self._logger)
+        self._recorder.max_duration = self._timeout
 
         # Callbacks
         self._on_recording_start = on_recording_start
@@ -109,6 +110,9 @@ class PTTController:
         # Hybrid mode state
         self._hybrid_silence_timeout = config.SILENCE_THRESHOLD_MS / 1000.0  # Convert ms to seconds
         self._hybrid_silence_task: Optional[asyncio.Task] = None
+        if self._mode == "hybrid":
+            # Run VAD on the recording so silence is measured from the last speech
+            self._recorder.vad_aggressiveness = config.VAD_AGGRESSIVENESS
 
         # Error recovery
         self._max_retries = 3
@@ -512,10 +516,18 @@ class PTTController:
         is reached, even if user is still holding the key.
 
         This provides automatic stop on silence while maintaining
-        the hold-to-talk physical control.
+        the hold-to-talk physical control. With VAD running on the
+        recording the timeout counts from the last speech; without it,
+        from the start of the recording.
         """
         try:
-            await asyncio.sleep(self._hybrid_silence_timeout)
+            remaining = self._hybrid_silence_timeout
+            while remaining > 0:
+                await asyncio.sleep(remaining)
+                silence = self._recorder.silence_duration
+                if silence is None:
+                    break
+                remaining = self._hybrid_silence_timeout - silence
 
             # If still recording after silence timeout, stop automatically
             if self.is_recording and self._mode == "hybrid":
@@ -13,6 +13,7 @@ from threading import Event, Lock
 import queue
 
 from voice_mode import config
+from voice_mode.capture_buffer import CaptureBuffer
 from .logging import get_ptt_logger, PTTLogger
 
 # Try to import sounddevice
@@ -65,11 +66,22 @@ class PTTRecorder:
 
         # Recording state
         self._is_recording = False
-        self._audio_chunks: list = []
+        # Each recording gets one buffer the callback writes into; stop() returns a view of it
+        self._capture: Optional[CaptureBuffer] = None
+        self.max_duration: float = config.PTT_TIMEOUT  # Sizes the capture buffer
         self._stream: Optional[sd.InputStream] = None
         self._stop_event = Event()
         self._lock = Lock()
 
+        # Optional StreamingEncoder fed each captured chunk (set per recording)
+        self.encoder = None
+
+        # VAD aggressiveness for hybrid mode's silence stop (None: no VAD)
+        self.vad_aggressiveness: Optional[int] = None
+        self._vad = None
+        self._vad_front_end = None
+        self._last_speech_time: Optional[float] = None
+
         # Timing
         self._start_time: Optional[float] = None
         self._duration: float = 0.0
@@ -86,6 +98,17 @@ class PTTRecorder:
             return time.time() - self._start_time
         return self._duration
 
+    @property
+    def silence_duration(self) -> Optional[float]:
+        """Seconds since speech was last heard (or since recording started).
+
+        Returns:
+            None when no VAD is running on this recording
+        """
+        if not self._is_recording or self._vad is None or not self._start_time:
+            return None
+        return time.time() - max(self._start_time, self._last_speech_time or 0.0)
+
     def start(self) -> bool:
         """Start recording audio.
 
@@ -107,11 +130,14 @@ class PTTRecorder:
                 return False
 
             try:
-                # Clear previous recording
-                self._audio_chunks = []
+                # Fresh buffer: the previous recording may still be in use as a view of the old one
+                self._capture = CaptureBuffer(
+                    int((self.max_duration + 1.0) * self.sample_rate), self.channels, dtype=self.dtype
+                )
                 self._stop_event.clear()
                 self._start_time = time.time()
                 self._duration = 0.0
+                self._start_vad()
 
                 # Create and start audio stream
                 self._stream = sd.InputStream(
@@ -175,8 +201,8 @@ class PTTRecorder:
                     self._duration = time.time() - self._start_time
                     self._start_time = None
 
-                # Combine audio chunks
-                if not self._audio_chunks:
+                # The recording is a view of the capture buffer
+                if not self._capture:
                     self._logger.log_event("recording_stopped", {
                         "duration_seconds": self._duration,
                         "samples": 0,
@@ -184,7 +210,7 @@ class PTTRecorder:
                     })
                     return np.array([], dtype=self.dtype)
 
-                audio_data = np.concatenate(self._audio_chunks, axis=0)
+                audio_data = self._capture.view()
 
                 self._logger.log_event("recording_stopped", {
                     "duration_seconds": self._duration,
@@ -197,7 +223,7 @@ class PTTRecorder:
             except Exception as e:
                 self._logger.log_error(e, {
                     "operation": "stop_recording",
-                    "chunks": len(self._audio_chunks)
+                    "samples": len(self._capture) if self._capture is not None else 0
                 })
                 return None
 
@@ -224,8 +250,8 @@ class PTTRecorder:
                 self._stop_event.set()
 
                 # Clear audio data
-                num_chunks = len(self._audio_chunks)
-                self._audio_chunks = []
+                num_samples = len(self._capture) if self._capture is not None else 0
+                self._capture = None
 
                 if self._start_time:
                     self._duration = time.time() - self._start_time
@@ -233,7 +259,7 @@ class PTTRecorder:
 
                 self._logger.log_event("recording_cancelled", {
                     "duration_seconds": self._duration,
-                    "chunks_discarded": num_chunks
+                    "samples_discarded": num_samples
                 })
 
             except Exception as e:
@@ -241,6 +267,22 @@ class PTTRecorder:
                     "operation": "cancel_recording"
                 })
 
+    def _start_vad(self) -> None:
+        """Set up per-chunk VAD for this recording if requested."""
+        self._vad = None
+        self._vad_front_end = None
+        self._last_speech_time = None
+        if self.vad_aggressiveness is None:
+            return
+        try:
+            import webrtcvad
+        except ImportError:
+            self._logger.log_event("vad_unavailable", {"reason": "webrtcvad not installed"})
+            return
+        from voice_mode.vad_frontend import VADFrontEnd
+        self._vad = webrtcvad.Vad(self.vad_aggressiveness)
+        self._vad_front_end = VADFrontEnd(self.sample_rate)
+
     def _audio_callback(self, indata, frames, time_info, status):
         """Callback for audio stream (called by sounddevice).
 
@@ -256,9 +298,20 @@ class PTTRecorder:
                 "frames": frames
             })
 
-        if self._is_recording:
-            # Store audio chunk
-            self._audio_chunks.append(indata.copy())
+        capture = self._capture
+        if self._is_recording and capture is not None:
+            # Store the block in place; chunk is a view of the stored audio
+            chunk = capture.append(indata)
+            if self.encoder is not None:
+                self.encoder.feed(chunk)
+            if self._vad is not None:
+                try:
+                    if self._vad_front_end.is_speech(self._vad, chunk):
+                        self._last_speech_time = time.time()
+                except Exception as e:
+                    # Treat as speech so a VAD fault never cuts the user off
+                    self._last_speech_time = time.time()
+                    self._logger.log_error(e, {"operation": "vad"})
 
 
 class AsyncPTTRecorder:
@@ -304,6 +357,38 @@ class AsyncPTTRecorder:
         """Get current recording duration."""
         return self._recorder.duration
 
+    @property
+    def encoder(self):
+        """StreamingEncoder fed each captured chunk, if any."""
+        return self._recorder.encoder
+
+    @encoder.setter
+    def encoder(self, encoder) -> None:
+        self._recorder.encoder = encoder
+
+    @property
+    def max_duration(self) -> float:
+        """Longest expected recording in seconds, used to size the capture buffer."""
+        return self._recorder.max_duration
+
+    @max_duration.setter
+    def max_duration(self, seconds: float) -> None:
+        self._recorder.max_duration = seconds
+
+    @property
+    def vad_aggressiveness(self) -> Optional[int]:
+        """VAD aggressiveness for hybrid mode's silence stop (None: no VAD)."""
+        return self._recorder.vad_aggressiveness
+
+    @vad_aggressiveness.setter
+    def vad_aggressiveness(self, aggressiveness: Optional[int]) -> None:
+        self._recorder.vad_aggressiveness = aggressiveness
+
+    @property
+    def silence_duration(self) -> Optional[float]:
+        """Seconds since speech was last heard, or None without VAD."""
+        return self._recorder.silence_duration
+
     async def start(self) -> bool:
         """Start recording (async).
 
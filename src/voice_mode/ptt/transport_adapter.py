@@ -170,7 +170,11 @@ def record_with_ptt(
     max_duration: float = 120.0,
     disable_silence_detection: bool = False,
     min_duration: float = 2.0,
-    vad_aggressiveness: int = 2
+    vad_aggressiveness: int = 2,
+    initial_audio: Optional[np.ndarray] = None,
+    mic=None,
+    encoder=None,
+    vad_listener=None
 ) -> Tuple[np.ndarray, bool]:
     """
     Record audio using PTT keyboard control.
@@ -196,6 +200,10 @@ def record_with_ptt(
         disable_silence_detection: If True, disables VAD in hybrid mode
         min_duration: Minimum recording duration in seconds
         vad_aggressiveness: VAD sensitivity (0-3) for hybrid mode
+        initial_audio: Speech already captured (by barge-in during TTS), prepended to the recording
+        mic: Accepted for interface compatibility; PTT opens its own stream on key press
+        encoder: StreamingEncoder fed each captured chunk, so the STT upload is encoded while recording
+        vad_listener: Accepted for interface compatibility; PTT recordings have no per-chunk VAD decisions
 
     Returns:
         Tuple of (audio_data, speech_detected):
@@ -248,6 +256,11 @@ def record_with_ptt(
         controller._on_recording_start = session.on_recording_start
         controller._on_recording_stop = session.on_recording_stop
         controller._on_recording_cancel = session.on_recording_cancel
+        if initial_audio is not None and len(initial_audio) and encoder is not None:
+            encoder.feed(initial_audio)
+        controller._recorder.encoder = encoder
+        if effective_mode == "hybrid":
+            controller._recorder.vad_aggressiveness = vad_aggressiveness
 
         # Enable controller
         if not controller.enable():
@@ -305,6 +318,8 @@ def record_with_ptt(
         # Get results
         audio_data = session.audio_data if session.audio_data is not None else np.array([], dtype='int16')
         speech_detected = session.speech_detected
+        if initial_audio is not None and len(initial_audio) and speech_detected:
+            audio_data = np.concatenate([initial_audio.reshape(-1), audio_data.reshape(-1)])
 
         # Log completion
         ptt_logger.log_event("transport_adapter_complete", {
@@ -350,7 +365,11 @@ def record_with_ptt_fallback(
     max_duration: float = 120.0,
     disable_silence_detection: bool = False,
     min_duration: float = 2.0,
-    vad_aggressiveness: int = 2
+    vad_aggressiveness: int = 2,
+    initial_audio: Optional[np.ndarray] = None,
+    mic=None,
+    encoder=None,
+    vad_listener=None
 ) -> Tuple[np.ndarray, bool]:
     """
     Attempt PTT recording with automatic fallback to standard recording.
@@ -363,12 +382,17 @@ def record_with_ptt_fallback(
         disable_silence_detection: Disable VAD
         min_duration: Minimum recording duration
         vad_aggressiveness: VAD sensitivity
+        initial_audio: Speech already captured during TTS
+        mic: Input stream opened during TTS playback (used by the standard recorder)
+        encoder: StreamingEncoder fed each captured chunk
+        vad_listener: Called with each chunk and its VAD decision (standard recorder only)
 
     Returns:
         Tuple of (audio_data, speech_detected)
     """
     try:
-        return record_with_ptt(max_duration, disable_silence_detection, min_duration, vad_aggressiveness)
+        return record_with_ptt(max_duration, disable_silence_detection, min_duration, vad_aggressiveness,
+                               initial_audio, mic, encoder, vad_listener)
     except Exception as e:
         logger.warning(f"PTT recording failed, falling back to standard recording: {e}")
 
@@ -380,7 +404,11 @@ def record_with_ptt_fallback(
             max_duration=max_duration,
             disable_silence_detection=disable_silence_detection,
             min_duration=min_duration,
-            vad_aggressiveness=vad_aggressiveness
+            vad_aggressiveness=vad_aggressiveness,
+            initial_audio=initial_audio,
+            mic=mic,
+            encoder=encoder,
+            vad_listener=vad_listener
         )
 
 
@@ -398,7 +426,8 @@ def get_recording_function(
 
     Returns:
         Recording function with signature:
-        (max_duration, disable_silence_detection, min_duration, vad_aggressiveness)
+        (max_duration, disable_silence_detection, min_duration, vad_aggressiveness,
+         initial_audio=None, mic=None, encoder=None, vad_listener=None)
         -> (audio_data, speech_detected)
 
     Example:
@@ -0,0 +1,136 @@
+"""
+Anti-aliased sample-rate conversion for STT uploads.
+
+Recordings are captured at SAMPLE_RATE (24 kHz) but Whisper works at
+16 kHz, so uploading the capture rate spends a third of the bytes on audio
+the server resamples away. resample() converts a whole recording with a
+polyphase FIR filter; PolyphaseResampler applies the same filter chunk by
+chunk, carrying the filter history between chunks, so a recording converted
+while it is captured is identical to one converted afterwards.
+
+The filter is the one scipy.signal.resample_poly designs by default (a
+Kaiser-windowed sinc with its cutoff at the lower Nyquist frequency), so
+both paths give the same samples.
+"""
+
+from math import gcd
+from typing import Tuple
+
+import numpy as np
+from scipy import signal
+
+from .audio_encode import to_int16
+
+# Outputs computed per step, bounding the size of each block
+_BLOCK = 4096
+
+
+def rate_factors(from_rate: int, to_rate: int) -> Tuple[int, int]:
+    """Reduced (up, down) factors converting from_rate to to_rate."""
+    divisor = gcd(from_rate, to_rate)
+    return to_rate // divisor, from_rate // divisor
+
+
+def design_filter(up: int, down: int) -> np.ndarray:
+    """Low-pass FIR used by resample_poly for these factors, scaled by up."""
+    max_rate = max(up, down)
+    half_len = 10 * max_rate
+    return signal.firwin(2 * half_len + 1, 1.0 / max_rate, window=("kaiser", 5.0)) * up
+
+
+def resample(samples: np.ndarray, from_rate: int, to_rate: int) -> np.ndarray:
+    """Convert mono samples to another rate.
+
+    Args:
+        samples: int16 (or float in [-1, 1]) samples
+        from_rate: Rate of samples
+        to_rate: Rate wanted
+
+    Returns:
+        int16 samples at to_rate
+    """
+    samples = to_int16(np.asarray(samples).reshape(-1))
+    if from_rate == to_rate or len(samples) == 0:
+        return samples
+    up, down = rate_factors(from_rate, to_rate)
+    return _round_int16(signal.resample_poly(samples.astype(np.float64), up, down, window=("kaiser", 5.0)))
+
+
+def _round_int16(samples: np.ndarray) -> np.ndarray:
+    return np.clip(np.round(samples), -32768, 32767).astype(np.int16)
+
+
+class PolyphaseResampler:
+    """Converts a stream of chunks with the same filter as resample()."""
+
+    def __init__(self, from_rate: int, to_rate: int):
+        self.from_rate = from_rate
+        self.to_rate = to_rate
+        self.up, self.down = rate_factors(from_rate, to_rate)
+
+        h = design_filter(self.up, self.down)
+        self.half_len = (len(h) - 1) // 2
+        # Row p holds the taps applied to x[n], x[n-1], ... for output phase p
+        self.taps = -(-len(h) // self.up)
+        padded = np.zeros(self.taps * self.up)
+        padded[:len(h)] = h
+        self._phases = padded.reshape(self.taps, self.up).T.copy()
+
+        self.samples_in = 0
+        self.samples_out = 0
+        # Zeros stand in for the samples before the stream started
+        self._history = np.zeros(self.taps - 1)
+        self._history_start = -(self.taps - 1)  # Input index of _history[0]
+
+    @property
+    def delay(self) -> int:
+        """Outputs held back by the filter's lookahead until later input arrives."""
+        return -(-(self.half_len + 1) // self.down) - 1
+
+    def process(self, chunk: np.ndarray) -> np.ndarray:
+        """Convert the next chunk; returns the int16 outputs it completes."""
+        chunk = np.asarray(chunk, dtype=np.float64).reshape(-1)
+        self.samples_in += len(chunk)
+        self._history = np.concatenate([self._history, chunk])
+        # Output m needs input up to (m * down + half_len) // up
+        return self._emit((self.samples_in * self.up - 1 - self.half_len) // self.down + 1)
+
+    def flush(self) -> np.ndarray:
+        """Convert what is left at the end of the stream."""
+        total = -(-self.samples_in * self.up // self.down)
+        needed = ((total - 1) * self.down + self.half_len) // self.up + 1
+        pad = needed - (self._history_start + len(self._history))
+        if pad > 0:
+            self._history = np.concatenate([self._history, np.zeros(pad)])
+        return self._emit(total)
+
+    def _emit(self, end: int) -> np.ndarray:
+        if len(self._history) < self.taps:
+            # Not a full window yet (small chunks); keep buffering
+            return np.zeros(0, dtype=np.int16)
+        outputs = []
+        # Window i holds _history[i:i + taps]; taps run newest-first, so reverse them
+        stride = self._history.strides[0]
+        windows = np.lib.stride_tricks.as_strided(
+            self._history, (len(self._history) - self.taps + 1, self.taps), (stride, stride), writeable=False
+        )
+        while self.samples_out < end:
+            count = min(end, self.samples_out + _BLOCK) - self.samples_out
+            block = np.empty(count)
+            # Every up-th output uses the same phase, on windows down inputs apart
+            for offset in range(min(self.up, count)):
+                t = (self.samples_out + offset) * self.down + self.half_len
+                first = t // self.up - self._history_start - (self.taps - 1)
+                n = len(range(offset, count, self.up))
+                block[offset::self.up] = windows[first:first + (n - 1) * self.down + 1:self.down] @ \
+                    self._phases[t % self.up, ::-1]
+            outputs.append(block)
+            self.samples_out += count
+
+        # Keep only the history the next output still needs
+        next_newest = (self.samples_out * self.down + self.half_len) // self.up
+        drop = next_newest - (self.taps - 1) - self._history_start
+        if drop > 0:
+            self._history = self._history[drop:]
+            self._history_start += drop
+        return _round_int16(np.concatenate(outputs)) if outputs else np.zeros(0, dtype=np.int16)
@@ -74,7 +74,7 @@ def main():
     else:
         logger.info("Event logging disabled")
     
-    # Run the server
+    # Run the server (the mcp lifespan closes pooled clients on shutdown)
     mcp.run(transport="stdio")
 
 if __name__ == "__main__":
@@ -0,0 +1,132 @@
+"""
+Trim the silence around speech before STT.
+
+A VAD recording starts with the wait for the user to begin talking and
+ends with the full SILENCE_THRESHOLD_MS of silence that stopped it. None of
+that needs uploading or decoding. SilenceTrimmer watches the recorder's VAD
+decisions and keeps the span from the first to the last speech chunk, plus
+a pad on either side so soft word onsets and endings are not clipped.
+
+When an upload is being encoded while recording, the trimmer feeds the
+encoder instead of the recorder: audio is held back until it is known to be
+inside the kept span, so the encoded upload matches the trimmed recording.
+Speculative and incremental STT, which transcribe before the recording
+ends, cut what they send with clip().
+"""
+
+import logging
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from .config import SAMPLE_RATE, STT_TRIM_PAD_MS
+
+logger = logging.getLogger("voice-mode")
+
+
+class SilenceTrimmer:
+    """Tracks where speech starts and ends in a recording."""
+
+    def __init__(self, sample_rate: int = SAMPLE_RATE, pad_ms: int = STT_TRIM_PAD_MS, encoder=None):
+        self.sample_rate = sample_rate
+        self.pad_samples = int(sample_rate * pad_ms / 1000)
+        self.encoder = encoder
+
+        self.samples = 0  # Samples seen, to check against the final recording
+        self.speech_start: Optional[int] = None  # First kept sample
+        self.speech_end = 0  # End of the last speech chunk
+
+        self._pending: List[Tuple[int, np.ndarray]] = []  # (start sample, audio) not yet fed
+        self._fed_end = 0
+
+    def process(self, chunk: np.ndarray, is_speech: bool):
+        """Take one recorded chunk and its VAD decision (recorder thread)."""
+        chunk = chunk.reshape(-1)
+        start = self.samples
+        self.samples += len(chunk)
+        self._pending.append((start, chunk))
+
+        if is_speech:
+            if self.speech_start is None:
+                self.speech_start = max(0, start - self.pad_samples)
+            self.speech_end = self.samples
+            self._feed_until(self.samples)
+        elif self.speech_start is not None:
+            self._feed_until(min(self.samples, self.speech_end + self.pad_samples))
+        else:
+            # Nothing before the leading pad can be kept
+            horizon = self.samples - self.pad_samples
+            self._pending = [(s, c) for s, c in self._pending if s + len(c) > horizon]
+
+    def reset(self):
+        """Forget what was seen (the recording restarted).
+
+        Audio already fed to the encoder is not part of the new recording, so
+        the encoding is aborted and the trimmer stops feeding it.
+        """
+        if self.encoder is not None:
+            self.encoder.abort()
+            self.encoder = None
+        self.samples = 0
+        self.speech_start = None
+        self.speech_end = 0
+        self._pending = []
+        self._fed_end = 0
+
+    def _feed_until(self, end: int):
+        """Feed pending audio from the first kept sample up to end."""
+        remaining = []
+        for start, chunk in self._pending:
+            lo = max(start, self.speech_start, self._fed_end)
+            hi = min(start + len(chunk), end)
+            if hi > lo and self.encoder is not None:
+                self.encoder.feed(chunk[lo - start:hi - start])
+            self._fed_end = max(self._fed_end, hi)
+            if start + len(chunk) > end:
+                remaining.append((start, chunk))
+        self._pending = remaining
+
+    def bounds(self) -> Optional[Tuple[int, int]]:
+        """Sample range to keep, or None if no speech was seen."""
+        if self.speech_start is None:
+            return None
+        return self.speech_start, min(self.samples, self.speech_end + self.pad_samples)
+
+    def clip(self, audio: np.ndarray) -> np.ndarray:
+        """Cut the latest audio down to the speech span seen so far.
+
+        Args:
+            audio: The end of the recording up to the last chunk processed
+
+        Returns:
+            A view of the part inside the kept span; audio is returned
+            unchanged if no speech was seen or it reaches back further
+            than the trimmer saw
+        """
+        bounds = self.bounds()
+        start = self.samples - len(audio)
+        if bounds is None or start < 0:
+            return audio
+        lo = min(max(bounds[0] - start, 0), len(audio))
+        hi = max(min(bounds[1] - start, len(audio)), lo)
+        return audio[lo:hi]
+
+    def trim(self, audio: np.ndarray) -> Tuple[np.ndarray, float]:
+        """Cut the recording down to the speech span.
+
+        Args:
+            audio: The final recording, used to check every sample was seen
+
+        Returns:
+            Tuple of (trimmed audio view, seconds trimmed); the recording is
+            returned unchanged if the trimmer did not see all of it
+        """
+        bounds = self.bounds()
+        if bounds is None or self.samples != len(audio):
+            logger.debug(f"Silence trim: saw {self.samples} of {len(audio)} samples - not trimmed")
+            return audio, 0.0
+        start, end = bounds
+        trimmed = (len(audio) - (end - start)) / self.sample_rate
+        logger.info(f"Silence trim: {start / self.sample_rate:.2f}s head, "
+                    f"{(len(audio) - end) / self.sample_rate:.2f}s tail removed before STT")
+        return audio[start:end], trimmed
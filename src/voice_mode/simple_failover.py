@@ -7,13 +7,117 @@ Connection refused errors are instant, so there's no performance penalty.
 
 import logging
 from typing import Optional, Tuple, Dict, Any
-from openai import AsyncOpenAI
 
-from .config import TTS_BASE_URLS, STT_BASE_URLS, OPENAI_API_KEY
+from .config import (
+    TTS_BASE_URLS, STT_BASE_URLS, OPENAI_API_KEY, STREAM_CHUNK_SIZE,
+    TTS_HEDGE_ENABLED, TTS_HEDGE_DELAY_MS, TTS_HEDGE_DEFAULT_DELAY_MS
+)
 from .provider_discovery import detect_provider_type
+from .connection_pool import client_registry
 
 logger = logging.getLogger("voice-mode")
 
+# Timeout profile for the failover clients (see connection_pool.TIMEOUT_PROFILES)
+FAILOVER_TIMEOUT_PROFILE = "failover"
+
+
+def _select_voice(voice: str, provider_type: str) -> str:
+    """Pick the voice to request from a provider."""
+    if provider_type == "openai":
+        # Map Kokoro voices to OpenAI equivalents, or use OpenAI default
+        openai_voices = ["alloy", "echo", "fable", "nova", "onyx", "shimmer"]
+        if voice in openai_voices:
+            return voice
+        # Map common Kokoro voices to OpenAI equivalents
+        voice_mapping = {
+            "af_sky": "nova",
+            "af_sarah": "nova", 
+            "af_alloy": "alloy",
+            "am_adam": "onyx",
+            "am_echo": "echo",
+            "am_onyx": "onyx",
+            "bm_fable": "fable"
+        }
+        selected_voice = voice_mapping.get(voice, "alloy")  # Default to alloy
+        logger.info(f"Mapped voice {voice} to {selected_voice} for OpenAI")
+        return selected_voice
+    return voice  # Use original voice for Kokoro
+
+
+def _get_api_key(provider_type: str) -> str:
+    return OPENAI_API_KEY if provider_type == "openai" else (OPENAI_API_KEY or "dummy-key-for-local")
+
+
+async def hedged_tts(
+    text: str,
+    voice: str,
+    model: str,
+    conversation_id: Optional[str] = None,
+    **kwargs
+) -> Tuple[bool, Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """
+    Hedged TTS - race the next endpoint if the preferred one is slow.
+    
+    The preferred endpoint is requested first; if it hasn't produced audio
+    within the hedge delay, the next endpoint is requested too and whichever
+    answers first is played.
+    
+    Returns:
+        Tuple of (success, metrics, config)
+    """
+    from .core import text_to_speech
+    from .tts_hedging import HedgeCandidate, HedgedSpeechClient
+    
+    candidates = []
+    for base_url in TTS_BASE_URLS:
+        provider_type = detect_provider_type(base_url)
+        candidates.append(HedgeCandidate(
+            base_url=base_url,
+            client=client_registry.get_client(
+                base_url, _get_api_key(provider_type), timeout_profile=FAILOVER_TIMEOUT_PROFILE
+            ),
+            voice=_select_voice(voice, provider_type)
+        ))
+    
+    hedged_client = HedgedSpeechClient(
+        candidates,
+        delay_ms=TTS_HEDGE_DELAY_MS,
+        default_delay_ms=TTS_HEDGE_DEFAULT_DELAY_MS,
+        chunk_size=STREAM_CHUNK_SIZE
+    )
+    preferred = candidates[0]
+    
+    try:
+        success, metrics = await text_to_speech(
+            text=text,
+            openai_clients={'tts': hedged_client},
+            tts_model=model,
+            tts_voice=preferred.voice,
+            tts_base_url=preferred.base_url,
+            conversation_id=conversation_id,
+            **kwargs
+        )
+    except Exception as e:
+        logger.error(f"Hedged TTS failed: {e}")
+        return False, None, {'error': str(e), 'tried_urls': TTS_BASE_URLS}
+    
+    if not success:
+        return False, None, {'error': 'All hedged TTS requests failed', 'tried_urls': TTS_BASE_URLS}
+    
+    # Cache hits never reach an endpoint; report the preferred one
+    winner = hedged_client.winner or preferred
+    if metrics is not None:
+        metrics['hedged'] = hedged_client.hedged
+    config = {
+        'base_url': winner.base_url,
+        'provider': detect_provider_type(winner.base_url),
+        'voice': winner.voice,
+        'model': model
+    }
+    logger.info(f"TTS succeeded with {winner.base_url} using voice {winner.voice}"
+                f"{' (hedged)' if hedged_client.hedged else ''}")
+    return True, metrics, config
+
 
 async def simple_tts_failover(
     text: str,
@@ -39,6 +143,10 @@ async def simple_tts_failover(
     conversation_logger = get_conversation_logger()
     conversation_id = conversation_logger.conversation_id
     
+    # Race endpoints instead of waiting out a slow preferred one
+    if TTS_HEDGE_ENABLED and len(TTS_BASE_URLS) > 1:
+        return await hedged_tts(text, voice, model, conversation_id=conversation_id, **kwargs)
+    
     # Try each TTS endpoint in order
     logger.info(f"simple_tts_failover: Starting with TTS_BASE_URLS = {TTS_BASE_URLS}")
     for base_url in TTS_BASE_URLS:
@@ -47,35 +155,13 @@ async def simple_tts_failover(
             
             # Create client for this endpoint
             provider_type = detect_provider_type(base_url)
-            api_key = OPENAI_API_KEY if provider_type == "openai" else (OPENAI_API_KEY or "dummy-key-for-local")
+            api_key = _get_api_key(provider_type)
             
             # Select appropriate voice for this provider
-            if provider_type == "openai":
-                # Map Kokoro voices to OpenAI equivalents, or use OpenAI default
-                openai_voices = ["alloy", "echo", "fable", "nova", "onyx", "shimmer"]
-                if voice in openai_voices:
-                    selected_voice = voice
-                else:
-                    # Map common Kokoro voices to OpenAI equivalents
-                    voice_mapping = {
-                        "af_sky": "nova",
-                        "af_sarah": "nova", 
-                        "af_alloy": "alloy",
-                        "am_adam": "onyx",
-                        "am_echo": "echo",
-                        "am_onyx": "onyx",
-                        "bm_fable": "fable"
-                    }
-                    selected_voice = voice_mapping.get(voice, "alloy")  # Default to alloy
-                    logger.info(f"Mapped voice {voice} to {selected_voice} for OpenAI")
-            else:
-                selected_voice = voice  # Use original voice for Kokoro
+            selected_voice = _select_voice(voice, provider_type)
             
-            client = AsyncOpenAI(
-                api_key=api_key,
-                base_url=base_url,
-                timeout=30.0  # Reasonable timeout
-            )
+            # Reuse the pooled client so warm connections survive across turns
+            client = client_registry.get_client(base_url, api_key, timeout_profile=FAILOVER_TIMEOUT_PROFILE)
             
             # Create clients dict for text_to_speech
             openai_clients = {'tts': client}
@@ -119,6 +205,87 @@ async def simple_tts_failover(
     return False, None, error_config
 
 
+async def simple_tts_synthesize(
+    text: str,
+    voice: str,
+    model: str,
+    instructions: Optional[str] = None,
+    initial_provider: Optional[str] = None,
+    speed: Optional[float] = None
+):
+    """
+    Synthesize speech into memory without playing it, with the same failover.
+    
+    Args:
+        initial_provider: Provider type ("openai", "kokoro") or base URL to try first
+    
+    Returns:
+        Tuple of (CachedAudio, config)
+    
+    Raises:
+        RuntimeError: If every endpoint failed
+    """
+    import time
+    from .audio_decode import decode_audio_bytes
+    from .config import SAMPLE_RATE, validate_audio_format
+    from .tts_cache import CachedAudio
+    
+    base_urls = list(TTS_BASE_URLS)
+    if initial_provider:
+        # Stable sort: the requested provider first, otherwise keep the configured order
+        base_urls.sort(key=lambda url: not (url == initial_provider or detect_provider_type(url) == initial_provider))
+    
+    last_error = None
+    for base_url in base_urls:
+        try:
+            provider_type = detect_provider_type(base_url)
+            selected_voice = _select_voice(voice, provider_type)
+            client = client_registry.get_client(
+                base_url, _get_api_key(provider_type), timeout_profile=FAILOVER_TIMEOUT_PROFILE
+            )
+            
+            # Raw PCM avoids a decode step where the provider supports it
+            audio_format = validate_audio_format("pcm", "openai" if "openai" in base_url else "kokoro", "tts")
+            request_params = {
+                "model": model,
+                "input": text,
+                "voice": selected_voice,
+                "response_format": audio_format
+            }
+            if instructions and model == "gpt-4o-mini-tts":
+                request_params["instructions"] = instructions
+            if speed is not None:
+                request_params["speed"] = speed
+            
+            start = time.perf_counter()
+            async with client.audio.speech.with_streaming_response.create(**request_params) as response:
+                content = await response.read()
+            decoded = decode_audio_bytes(content, audio_format, sample_rate=SAMPLE_RATE)
+            synthesis_time = time.perf_counter() - start
+            
+            audio = CachedAudio(
+                samples=decoded.pcm16(),
+                sample_rate=decoded.sample_rate,
+                channels=decoded.channels,
+                synthesis_time=synthesis_time
+            )
+            config = {
+                'base_url': base_url,
+                'provider': provider_type,
+                'voice': selected_voice,
+                'model': model
+            }
+            logger.info(f"Synthesized {audio.duration:.1f}s of speech with {base_url} in {synthesis_time:.2f}s")
+            return audio, config
+            
+        except Exception as e:
+            last_error = str(e)
+            logger.warning(f"TTS synthesis failed for {base_url}: {e}")
+            continue
+    
+    raise RuntimeError(f"All TTS endpoints failed. Last error: {last_error}")
+
+
 async def simple_stt_failover(
     audio_file,
     model: str = "whisper-1",
@@ -141,11 +308,7 @@ async def simple_stt_failover(
             provider_type = detect_provider_type(base_url)
             api_key = OPENAI_API_KEY if provider_type == "openai" else (OPENAI_API_KEY or "dummy-key-for-local")
             
-            client = AsyncOpenAI(
-                api_key=api_key,
-                base_url=base_url,
-                timeout=30.0
-            )
+            client = client_registry.get_client(base_url, api_key, timeout_profile=FAILOVER_TIMEOUT_PROFILE)
             
             # Try STT with this endpoint
             transcription = await client.audio.transcriptions.create(
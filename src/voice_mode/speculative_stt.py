@@ -0,0 +1,202 @@
+"""
+Speculative transcription during the end-of-speech silence window.
+
+The VAD recorder only stops after SILENCE_THRESHOLD_MS of silence, and STT
+normally starts after that. SpeculativeTranscriber watches the recorder's
+VAD decisions and, shortly after silence begins, starts transcribing the
+audio captured so far in the background. If the user starts talking again
+the speculation is cancelled and counted as wasted; if the recording ends
+without more speech its result is used directly, so STT runs inside the
+silence window instead of after it.
+
+Anything unexpected makes finish() return None, and converse transcribes
+the whole recording the usual way. Speculations are transcribed without
+saving or logging anything, since most may be thrown away; converse saves
+and logs the one result it uses.
+"""
+
+import asyncio
+import concurrent.futures
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .config import SAMPLE_RATE, SPECULATIVE_STT_DELAY_MS, SPECULATIVE_STT_ENABLED
+
+logger = logging.getLogger("voice-mode")
+
+
+class SpeculationStats:
+    """Session counters for speculative transcriptions."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.launched = 0
+        self.hits = 0  # Result used as the transcript
+        self.wasted = 0  # Cancelled because speech resumed
+        self.failures = 0  # Failed, empty or did not cover the recording
+        self.saved_seconds = 0.0  # STT time hidden inside the silence window
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Session speculation statistics."""
+        return {
+            'launched': self.launched,
+            'hits': self.hits,
+            'wasted': self.wasted,
+            'failures': self.failures,
+            'hit_rate': self.hits / self.launched if self.launched else 0.0,
+            'waste_rate': self.wasted / self.launched if self.launched else 0.0,
+            'saved_seconds': self.saved_seconds,
+        }
+
+
+_speculation_stats = SpeculationStats()
+
+
+def get_speculation_stats() -> SpeculationStats:
+    """Get the global speculation statistics."""
+    return _speculation_stats
+
+
+class SpeculativeTranscriber:
+    """Starts STT when silence begins and keeps the result if speech does not resume."""
+
+    def __init__(
+        self,
+        transcribe: Callable[[np.ndarray], Awaitable[Optional[str]]],
+        loop: asyncio.AbstractEventLoop,
+        sample_rate: int = SAMPLE_RATE,
+        delay_ms: int = SPECULATIVE_STT_DELAY_MS,
+        stats: Optional[SpeculationStats] = None,
+        trimmer=None
+    ):
+        self.transcribe = transcribe
+        self.loop = loop
+        self.sample_rate = sample_rate
+        self.delay_samples = int(sample_rate * delay_ms / 1000)
+        self.stats = stats if stats is not None else _speculation_stats
+        # SilenceTrimmer that processes each chunk before this transcriber
+        self.trimmer = trimmer
+
+        self.samples = 0  # Samples seen, to check against the final recording
+        self.future: Optional[concurrent.futures.Future] = None
+        self.launch_time = 0.0
+
+        self._chunks: List[np.ndarray] = []
+        self._silence_samples = 0
+        self._has_speech = False
+
+    def process(self, chunk: np.ndarray, is_speech: bool):
+        """Take one recorded chunk and its VAD decision (recorder thread)."""
+        chunk = chunk.reshape(-1)
+        self.samples += len(chunk)
+        self._chunks.append(chunk)
+
+        if is_speech:
+            if self.future is not None:
+                logger.debug("Speculative STT: speech resumed, discarding speculation")
+                self.future.cancel()
+                self.future = None
+                self.stats.wasted += 1
+            self._has_speech = True
+            self._silence_samples = 0
+            return
+        self._silence_samples += len(chunk)
+
+        if self._has_speech and self.future is None and self._silence_samples >= self.delay_samples:
+            audio = np.concatenate(self._chunks)
+            if self.trimmer is not None:
+                audio = self.trimmer.clip(audio)
+            self._launch(audio)
+
+    def _launch(self, audio: np.ndarray):
+        logger.debug(f"Speculative STT: transcribing {len(audio) / self.sample_rate:.1f}s at silence onset")
+        self.stats.launched += 1
+        self.launch_time = time.perf_counter()
+        self.future = asyncio.run_coroutine_threadsafe(self._run(audio), self.loop)
+
+    async def _run(self, audio: np.ndarray) -> Tuple[Optional[str], float]:
+        text = await self.transcribe(audio)
+        return text, time.perf_counter()
+
+    async def finish(self, audio: np.ndarray) -> Optional[str]:
+        """Use the speculative result if it still covers the recording.
+
+        Args:
+            audio: The final recording, used to check every sample was seen
+
+        Returns:
+            The transcript, or None to fall back to a full transcription
+        """
+        future, self.future = self.future, None
+        if future is None:
+            return None
+        if self.samples != len(audio):
+            logger.debug(f"Speculative STT: saw {self.samples} of {len(audio)} samples - not used")
+            future.cancel()
+            self.stats.failures += 1
+            return None
+
+        finish_start = time.perf_counter()
+        try:
+            text, done_time = await asyncio.wrap_future(future)
+        except Exception as e:
+            logger.warning(f"Speculative STT failed, transcribing the whole recording: {e}")
+            text = None
+        if not text:
+            self.stats.failures += 1
+            return None
+
+        saved = max(0.0, min(done_time, finish_start) - self.launch_time)
+        self.stats.hits += 1
+        self.stats.saved_seconds += saved
+        logger.info(f"Speculative STT hit: {saved:.2f}s of transcription hidden in the silence window")
+        return text
+
+    def cancel(self):
+        """Drop a speculation still in flight."""
+        if self.future is not None:
+            self.future.cancel()
+            self.future = None
+
+    def reset(self):
+        """Drop everything seen so far (the recording restarted)."""
+        self.cancel()
+        self.samples = 0
+        self._chunks = []
+        self._silence_samples = 0
+        self._has_speech = False
+
+
+async def transcribe_quietly(audio: np.ndarray) -> Optional[str]:
+    """Transcribe with endpoint failover, but without saving or logging the result."""
+    from .audio_encode import encode_wav, upload_file
+    from .config import get_stt_upload_sample_rate
+    from .resample import resample
+    from .simple_failover import simple_stt_failover
+
+    upload_rate = get_stt_upload_sample_rate(None)
+    return await simple_stt_failover(
+        audio_file=upload_file(encode_wav(resample(audio, SAMPLE_RATE, upload_rate), upload_rate), "wav"),
+        model="whisper-1"
+    )
+
+
+def start_speculative_transcription(
+    trimmer=None,
+    transcribe: Callable[[np.ndarray], Awaitable[Optional[str]]] = transcribe_quietly
+) -> Optional[SpeculativeTranscriber]:
+    """Create a speculative transcriber if speculative STT is on.
+
+    Args:
+        trimmer: SilenceTrimmer to cut the transcribed audio with, if any
+        transcribe: Coroutine function that transcribes a recording; it must
+            have no side effects, since speculations are often discarded
+    """
+    if not SPECULATIVE_STT_ENABLED:
+        return None
+    return SpeculativeTranscriber(transcribe, asyncio.get_running_loop(), trimmer=trimmer)
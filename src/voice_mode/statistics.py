@@ -32,6 +32,10 @@ class ConversationMetric:
     stt_processing: Optional[float] = None
     recording_duration: Optional[float] = None
     total_time: Optional[float] = None
+    tts_cache_saved: Optional[float] = None  # Synthesis time skipped by a TTS cache hit
+    tts_device_open: Optional[float] = None  # Time spent opening the output device
+    listen_saved: Optional[float] = None  # Dead air removed by opening the mic during playback
+    stt_trimmed: Optional[float] = None  # Silence cut from the recording before STT
     transport: Optional[str] = None
     voice_provider: Optional[str] = None
     voice_name: Optional[str] = None
@@ -151,6 +155,10 @@ class ConversationStatistics:
             stt_processing=timings.get('stt'),
             recording_duration=timings.get('record'),
             total_time=timings.get('total'),
+            tts_cache_saved=timings.get('cache_saved'),
+            tts_device_open=timings.get('device_open'),
+            listen_saved=timings.get('listen_saved'),
+            stt_trimmed=timings.get('trimmed'),
             transport=transport,
             voice_provider=voice_provider,
             voice_name=voice_name,
@@ -330,6 +338,100 @@ class ConversationStatistics:
                 for voice, count in sorted(stats.voices_used.items(), key=lambda x: x[1], reverse=True):
                     lines.append(f"  {voice}: {count} uses")
         
+        # TTS cache effectiveness
+        from .tts_cache import get_tts_cache
+        tts_cache = get_tts_cache()
+        if tts_cache:
+            cache_stats = tts_cache.get_stats()
+            if cache_stats['hits'] or cache_stats['misses']:
+                lines.append(f"\n💾 TTS CACHE")
+                lines.append("-" * 30)
+                lines.append(f"Hit Rate: {cache_stats['hit_rate'] * 100:.1f}% "
+                             f"({cache_stats['hits']} hits, {cache_stats['misses']} misses)")
+                lines.append(f"Synthesis Time Saved: {cache_stats['saved_seconds']:.1f}s")
+                lines.append(f"Entries: {cache_stats['entries']} "
+                             f"({cache_stats['size_bytes'] / (1024 * 1024):.1f} MB)")
+        
+        # Speculative TTS prefetch effectiveness
+        from .tts_prefetch import get_prefetch_store
+        prefetch_stats = get_prefetch_store().get_stats()
+        if prefetch_stats['requests']:
+            lines.append(f"\n⚡ TTS PREFETCH")
+            lines.append("-" * 30)
+            lines.append(f"Hit Rate: {prefetch_stats['hit_rate'] * 100:.1f}% "
+                         f"({prefetch_stats['hits']} hits, {prefetch_stats['misses']} misses)")
+            lines.append(f"Synthesis Time Saved: {prefetch_stats['saved_seconds']:.1f}s")
+            lines.append(f"Wasted: {prefetch_stats['wasted']} of {prefetch_stats['requests']} prefetches "
+                         f"({prefetch_stats['expired']} expired, {prefetch_stats['evicted']} evicted, "
+                         f"{prefetch_stats['failures']} failed)")
+        
+        # TTS hedging outcomes per endpoint
+        from .tts_hedging import get_hedge_stats
+        hedge_stats = {url: st for url, st in get_hedge_stats().get_stats().items() if st['races']}
+        if hedge_stats:
+            lines.append(f"\n🏁 TTS HEDGING")
+            lines.append("-" * 30)
+            for url, st in hedge_stats.items():
+                p95 = f"{st['p95_first_byte']:.2f}s" if st['p95_first_byte'] is not None else "n/a"
+                lines.append(f"{url}: {st['wins']}/{st['races']} wins "
+                             f"({st['hedge_wins']}/{st['hedges_fired']} as hedge), p95 first byte {p95}")
+        
+        # Persistent output stream reuse
+        from .output_engine import get_output_engine
+        engine = get_output_engine()
+        if engine is not None and engine.opens:
+            with self._lock:
+                cold_turns = sum(1 for m in self._metrics if m.tts_device_open)
+                warm_turns = sum(1 for m in self._metrics if m.tts_device_open == 0.0)
+            lines.append(f"\n🔈 OUTPUT ENGINE")
+            lines.append("-" * 30)
+            lines.append(f"Device Opens: {engine.opens} "
+                         f"({engine.open_seconds * 1000 / engine.opens:.0f}ms avg)")
+            lines.append(f"TTS Turns on Warm Stream: {warm_turns} of {warm_turns + cold_turns}")
+        
+        # Microphone opened during the tail of playback
+        with self._lock:
+            listen_saved = [m.listen_saved for m in self._metrics if m.listen_saved is not None]
+        if listen_saved:
+            lines.append(f"\n⏩ LISTEN OVERLAP")
+            lines.append("-" * 30)
+            lines.append(f"Dead Air Saved: {mean(listen_saved):.2f}s avg, {sum(listen_saved):.1f}s total "
+                         f"({len(listen_saved)} turns)")
+        
+        # Silence cut from recordings before STT
+        with self._lock:
+            stt_trimmed = [m.stt_trimmed for m in self._metrics if m.stt_trimmed is not None]
+        if stt_trimmed:
+            lines.append(f"\n✂️ SILENCE TRIM")
+            lines.append("-" * 30)
+            lines.append(f"Audio Not Uploaded: {mean(stt_trimmed):.2f}s avg, {sum(stt_trimmed):.1f}s total "
+                         f"({len(stt_trimmed)} turns)")
+        
+        # STT started at silence onset
+        from .speculative_stt import get_speculation_stats
+        speculation_stats = get_speculation_stats().get_stats()
+        if speculation_stats['launched']:
+            lines.append(f"\n🔮 SPECULATIVE STT")
+            lines.append("-" * 30)
+            lines.append(f"Hit Rate: {speculation_stats['hit_rate'] * 100:.1f}% "
+                         f"({speculation_stats['hits']} of {speculation_stats['launched']} speculations)")
+            lines.append(f"Waste Rate: {speculation_stats['waste_rate'] * 100:.1f}% "
+                         f"({speculation_stats['wasted']} discarded on resumed speech, "
+                         f"{speculation_stats['failures']} failed)")
+            lines.append(f"STT Time Hidden: {speculation_stats['saved_seconds']:.1f}s")
+        
+        # Background artifact writes (saved audio, debug files, transcriptions)
+        from .artifact_writer import get_artifact_writer
+        writer_stats = get_artifact_writer().get_stats()
+        if writer_stats['submitted']:
+            lines.append(f"\n🗂️ ARTIFACT WRITER")
+            lines.append("-" * 30)
+            lines.append(f"Files: {writer_stats['written']} written, {writer_stats['failed']} failed, "
+                         f"{writer_stats['inline_writes']} written inline")
+            lines.append(f"Queue Depth: {writer_stats['depth']} now, {writer_stats['max_depth']} max")
+            lines.append(f"Off-Turn Write Time: {writer_stats['write_seconds']:.2f}s "
+                         f"({writer_stats['bytes_written'] / (1024 * 1024):.1f} MB)")
+        
         # Recent interactions
         if recent:
             lines.append(f"\n📝 RECENT INTERACTIONS ({len(recent)} of {len(self._metrics)})")
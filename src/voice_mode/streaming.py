@@ -8,11 +8,11 @@ by playing audio chunks as they arrive from the TTS service.
 import asyncio
 import io
 import logging
+import re
 import time
-import queue
 import threading
-from typing import Optional, Tuple, AsyncIterator
-from dataclasses import dataclass
+from typing import Optional, Tuple, AsyncIterator, List
+from dataclasses import dataclass, field
 from pathlib import Path
 import numpy as np
 
@@ -23,9 +23,13 @@ from .config import (
     STREAM_CHUNK_SIZE,
     STREAM_BUFFER_MS,
     STREAM_MAX_BUFFER,
+    STREAM_PIPELINE_ENABLED,
+    STREAM_PIPELINE_MIN_CHARS,
+    STREAM_PIPELINE_CONCURRENCY,
     SAMPLE_RATE,
     logger
 )
+from .output_engine import PlaybackJob, get_output_engine
 from .utils import get_event_logger
 
 # Opus decoder support (optional)
@@ -37,6 +41,17 @@ except ImportError:
     logger.info("opuslib not available - Opus streaming will use fallback method")
 
 
+@dataclass
+class SegmentMetrics:
+    """Metrics for one segment of a sentence-pipelined TTS stream."""
+    index: int
+    chars: int
+    ttfa: float = 0.0  # Request start to first audio byte
+    generation_time: float = 0.0  # Request start to last audio byte
+    playback_wait: float = 0.0  # Time playback stalled waiting for this segment
+    bytes_received: int = 0
+
+
 @dataclass
 class StreamMetrics:
     """Metrics for streaming playback performance."""
@@ -46,7 +61,104 @@ class StreamMetrics:
     buffer_underruns: int = 0
     chunks_received: int = 0
     chunks_played: int = 0
+    backpressure_waits: int = 0  # Times the network reader waited for buffer space
+    backpressure_time: float = 0.0  # Total seconds the network reader waited
+    max_buffered: float = 0.0  # Peak buffered audio in seconds
+    decode_latency: float = 0.0  # First compressed byte to first decoded sample
+    device_open: float = 0.0  # Time spent opening the output device (0 when the stream was warm)
     audio_path: Optional[str] = None  # Path to saved audio file
+    pcm_data: Optional[bytes] = None  # Decoded 16-bit PCM, when capture was requested
+    sample_rate: int = SAMPLE_RATE  # Sample rate of pcm_data
+    segments: List[SegmentMetrics] = field(default_factory=list)  # Per-segment metrics when pipelined
+
+
+class AudioRingBuffer:
+    """Preallocated ring buffer of samples for the audio callback.
+    
+    Writes and reads copy whole slices (at most two copies each, when the
+    data wraps around the end of the buffer) under a lock that is held only
+    for the copy, so the PortAudio callback never touches individual samples.
+    """
+    
+    def __init__(self, capacity: int, dtype=np.float32):
+        self.capacity = max(1, int(capacity))
+        self._data = np.zeros(self.capacity, dtype=dtype)
+        self._read_pos = 0
+        self._count = 0
+        self._lock = threading.Lock()
+        self.dropped = 0  # Samples discarded on overflow
+    
+    @property
+    def available(self) -> int:
+        """Number of samples waiting to be played."""
+        return self._count
+    
+    @property
+    def free(self) -> int:
+        """Number of samples that can be written without overflowing."""
+        return self.capacity - self._count
+    
+    def write(self, samples: np.ndarray, overwrite: bool = True) -> int:
+        """Append samples.
+        
+        Args:
+            samples: Samples to append
+            overwrite: On overflow, drop the oldest buffered audio (True) or
+                write only what fits (False, for callers applying backpressure)
+        
+        Returns:
+            Number of samples written
+        """
+        samples = np.asarray(samples, dtype=self._data.dtype).reshape(-1)
+        n = len(samples)
+        if n == 0:
+            return 0
+        with self._lock:
+            if not overwrite:
+                n = min(n, self.capacity - self._count)
+                if n == 0:
+                    return 0
+                samples = samples[:n]
+            elif n > self.capacity:
+                # Only the newest audio fits
+                self.dropped += n - self.capacity
+                samples = samples[-self.capacity:]
+                n = self.capacity
+            overflow = self._count + n - self.capacity
+            if overflow > 0:
+                self._read_pos = (self._read_pos + overflow) % self.capacity
+                self._count -= overflow
+                self.dropped += overflow
+            
+            write_pos = (self._read_pos + self._count) % self.capacity
+            first = min(n, self.capacity - write_pos)
+            self._data[write_pos:write_pos + first] = samples[:first]
+            if first < n:
+                self._data[:n - first] = samples[first:]
+            self._count += n
+        return n
+    
+    def read_into(self, out: np.ndarray) -> int:
+        """Copy up to len(out) samples into out.
+        
+        Returns:
+            Number of samples copied; the rest of out is left untouched
+        """
+        with self._lock:
+            n = min(len(out), self._count)
+            first = min(n, self.capacity - self._read_pos)
+            out[:first] = self._data[self._read_pos:self._read_pos + first]
+            if first < n:
+                out[first:n] = self._data[:n - first]
+            self._read_pos = (self._read_pos + n) % self.capacity
+            self._count -= n
+        return n
+    
+    def clear(self):
+        """Discard all buffered samples."""
+        with self._lock:
+            self._read_pos = 0
+            self._count = 0
 
 
 class AudioStreamPlayer:
@@ -58,14 +170,15 @@ class AudioStreamPlayer:
         self.channels = channels
         self.metrics = StreamMetrics()
         
-        # Buffering
-        self.audio_queue = queue.Queue(maxsize=int(STREAM_MAX_BUFFER * sample_rate))
-        self.min_buffer_samples = int((STREAM_BUFFER_MS / 1000.0) * sample_rate)
+        # Buffering (interleaved samples for all channels)
+        self.buffer = AudioRingBuffer(int(STREAM_MAX_BUFFER * sample_rate) * channels)
+        self.min_buffer_samples = int((STREAM_BUFFER_MS / 1000.0) * sample_rate) * channels
         
         # State
         self.playing = False
         self.finished_downloading = False
         self.playback_started = False
+        self.playback_complete = threading.Event()
         self.start_time = time.perf_counter()
         
         # Partial data buffer for format-specific decoding
@@ -76,7 +189,6 @@ class AudioStreamPlayer:
         
         # Sounddevice stream
         self.stream = None
-        self._lock = threading.Lock()
         
     def _get_decoder(self):
         """Get appropriate decoder for the audio format."""
@@ -96,20 +208,25 @@ class AudioStreamPlayer:
             logger.debug(f"Sounddevice status: {status}")
             
         try:
-            # Fill output buffer from queue
-            for i in range(frames):
-                try:
-                    sample = self.audio_queue.get_nowait()
-                    outdata[i] = sample
-                except queue.Empty:
-                    # Buffer underrun
-                    outdata[i] = 0
-                    if self.playing:
-                        self.metrics.buffer_underruns += 1
-                        
+            if not self.playing:
+                outdata.fill(0)
+                return
+            
+            # Fill output buffer from the ring buffer (C-contiguous, so this is a view)
+            out = outdata.reshape(-1)
+            copied = self.buffer.read_into(out)
+            if copied < len(out):
+                out[copied:] = 0
+                if self.finished_downloading:
+                    # Everything has been played
+                    self.playing = False
+                    self.playback_complete.set()
+                else:
+                    # Buffer underrun while more audio is still arriving
+                    self.metrics.buffer_underruns += 1
+            
             # Track playback progress
-            if self.playing:
-                self.metrics.chunks_played += 1
+            self.metrics.chunks_played += 1
                 
         except Exception as e:
             logger.error(f"Error in audio callback: {e}")
@@ -150,7 +267,7 @@ class AudioStreamPlayer:
                 await self._queue_samples(samples)
                 
                 # Check if we should start playback
-                if not self.playback_started and self.audio_queue.qsize() >= self.min_buffer_samples:
+                if not self.playback_started and self.buffer.available >= self.min_buffer_samples:
                     self.playback_started = True
                     self.playing = True
                     self.metrics.ttfa = time.perf_counter() - self.start_time
@@ -203,23 +320,12 @@ class AudioStreamPlayer:
         return None
     
     async def _queue_samples(self, samples: np.ndarray):
-        """Add samples to the playback queue."""
-        for sample in samples:
-            try:
-                self.audio_queue.put_nowait(sample)
-            except queue.Full:
-                # Buffer overflow - drop oldest samples
-                try:
-                    self.audio_queue.get_nowait()
-                    self.audio_queue.put_nowait(sample)
-                except queue.Empty:
-                    pass
+        """Add samples to the playback buffer."""
+        # Overflow drops the oldest buffered samples
+        self.buffer.write(samples)
     
     async def finish(self):
         """Signal that downloading is complete."""
-        self.finished_downloading = True
-        self.metrics.generation_time = time.perf_counter() - self.start_time
-        
         # Process any remaining partial data
         if self.partial_data:
             # For formats like MP3, we might have a complete frame now
@@ -227,9 +333,18 @@ class AudioStreamPlayer:
             if samples is not None:
                 await self._queue_samples(samples)
         
-        # Wait for playback to complete
-        while not self.audio_queue.empty() or self.playing:
-            await asyncio.sleep(0.1)
+        self.finished_downloading = True
+        self.metrics.generation_time = time.perf_counter() - self.start_time
+        
+        # Short audio may never have reached the start threshold
+        if not self.playback_started and self.buffer.available:
+            self.playback_started = True
+            self.playing = True
+            self.metrics.ttfa = time.perf_counter() - self.start_time
+        
+        # Wait for the callback to drain the buffer
+        while self.playing and not self.playback_complete.is_set():
+            await asyncio.sleep(0.05)
             
         self.metrics.playback_time = time.perf_counter() - self.start_time
         
@@ -242,6 +357,160 @@ class AudioStreamPlayer:
         logger.debug("Audio stream stopped")
 
 
+class PCMOutputBuffer(PlaybackJob):
+    """Callback-driven int16 output fed from the event loop.
+    
+    Decoded audio is written into a bounded ring buffer that the audio thread
+    drains, so the event loop never blocks on the device. When the buffer is
+    full, write() yields to the event loop until playback frees space
+    (backpressure). Playback starts once STREAM_BUFFER_MS of audio is buffered.
+    
+    The buffer is played as a job on the persistent output engine; if the
+    engine is disabled it opens its own output stream.
+    """
+    
+    def __init__(self, metrics: StreamMetrics, start_time: float, sample_rate: int = SAMPLE_RATE):
+        super().__init__()
+        self.metrics = metrics
+        self.start_time = start_time
+        self.sample_rate = sample_rate
+        self.buffer = AudioRingBuffer(int(STREAM_MAX_BUFFER * sample_rate), dtype=np.int16)
+        self.prebuffer_samples = min(int((STREAM_BUFFER_MS / 1000.0) * sample_rate), self.buffer.capacity)
+        self.playback_started = threading.Event()
+        self.finished_writing = False
+        self.audio_start_time = None
+        self.stream = None
+        
+        # How long to wait for the callback to free space when the buffer is full
+        self.backpressure_poll = 0.02
+    
+    def fill(self, out: np.ndarray) -> Tuple[int, bool]:
+        """Drain the ring buffer into the device (runs on the audio thread)."""
+        if not self.playback_started.is_set():
+            # Still prebuffering
+            out.fill(0)
+            return len(out), False
+        copied = self.buffer.read_into(out)
+        if copied and self.audio_start_time is None:
+            self.audio_start_time = time.perf_counter()
+        if copied < len(out):
+            if self.finished_writing:
+                return copied, True
+            out[copied:] = 0
+            self.metrics.buffer_underruns += 1
+        return len(out), False
+    
+    def remaining_frames(self) -> Optional[int]:
+        """Buffered frames once all audio has been written, None before that."""
+        return self.buffer.available if self.finished_writing else None
+    
+    def _callback(self, outdata, frames, time_info, status):
+        """Stream callback used when playing without the output engine."""
+        if status:
+            logger.debug(f"Sounddevice status: {status}")
+        out = outdata.reshape(-1)
+        if self.done.is_set():
+            out.fill(0)
+            return
+        written, finished = self.fill(out)
+        if finished:
+            out[written:] = 0
+            self.done.set()
+    
+    async def open(self):
+        """Queue on the output engine, or open a dedicated output stream."""
+        engine = get_output_engine()
+        if engine is not None:
+            await engine.wait_refresh()
+            engine.submit(self, self.sample_rate)
+            self.metrics.device_open = self.open_time
+            return
+        
+        open_start = time.perf_counter()
+        self.stream = sd.OutputStream(
+            samplerate=self.sample_rate,
+            channels=1,
+            dtype='int16',
+            callback=self._callback
+        )
+        self.stream.start()
+        self.open_time = self.metrics.device_open = time.perf_counter() - open_start
+    
+    def start_playback(self):
+        """Let the callback start playing buffered audio."""
+        if not self.playback_started.is_set():
+            self.metrics.ttfa = time.perf_counter() - self.start_time
+            self.playback_started.set()
+            logger.info(f"Playback started - TTFA: {self.metrics.ttfa:.3f}s")
+    
+    async def write(self, samples: np.ndarray):
+        """Queue samples for playback, waiting while the buffer is full.
+        
+        Returns immediately once the job has been cancelled (e.g. by barge-in).
+        """
+        if self.cancelled:
+            return
+        offset = self.buffer.write(samples, overwrite=False)
+        while offset < len(samples) and not self.cancelled:
+            self.start_playback()  # A full buffer is always enough to start
+            self.metrics.backpressure_waits += 1
+            wait_start = time.perf_counter()
+            await asyncio.sleep(self.backpressure_poll)
+            self.metrics.backpressure_time += time.perf_counter() - wait_start
+            offset += self.buffer.write(samples[offset:], overwrite=False)
+        self.metrics.max_buffered = max(self.metrics.max_buffered, self.buffer.available / self.sample_rate)
+        
+        if self.buffer.available >= self.prebuffer_samples:
+            self.start_playback()
+    
+    async def finish(self):
+        """Play out whatever is left, without blocking the loop."""
+        self.finished_writing = True
+        if self.buffer.available:
+            self.start_playback()
+        else:
+            # Nothing (more) to play; let the callback finish the job
+            self.playback_started.set()
+        
+        remaining = self.buffer.available / self.sample_rate
+        deadline = time.perf_counter() + remaining + 2.0
+        while not self.done.is_set() and time.perf_counter() < deadline:
+            await asyncio.sleep(min(0.05, max(remaining, 0.01)))
+        if not self.done.is_set():
+            self.cancel()
+        if self.stream:
+            await asyncio.get_running_loop().run_in_executor(None, self.stream.stop)
+    
+    def close(self):
+        """Stop playback (if still queued) and close any dedicated stream."""
+        if not self.done.is_set():
+            self.cancel()
+        if self.stream:
+            self.stream.close()
+
+
+def _save_pcm_audio(audio_data: bytes, audio_dir: Path, conversation_id: Optional[str]) -> Optional[str]:
+    """Save streamed 16-bit mono PCM as a WAV file.
+    
+    Returns:
+        Path of the saved file, or None if nothing was saved
+    """
+    if not audio_data:
+        return None
+    try:
+        from .audio_encode import encode_wav
+        from .core import save_debug_file
+        
+        # PCM needs WAV headers to be playable; they're added on the writer thread
+        audio_path = save_debug_file(lambda: encode_wav(audio_data, SAMPLE_RATE), "tts", "wav", audio_dir, True, conversation_id)
+        if audio_path:
+            logger.info(f"TTS audio saved to: {audio_path}")
+        return audio_path
+    except Exception as e:
+        logger.error(f"Failed to save TTS audio: {e}")
+        return None
+
+
 async def stream_pcm_audio(
     text: str,
     openai_client,
@@ -249,38 +518,26 @@ async def stream_pcm_audio(
     debug: bool = False,
     save_audio: bool = False,
     audio_dir: Optional[Path] = None,
-    conversation_id: Optional[str] = None
+    conversation_id: Optional[str] = None,
+    capture_pcm: bool = False
 ) -> Tuple[bool, StreamMetrics]:
     """Stream PCM audio with true HTTP streaming for minimal latency.
     
     Uses the OpenAI SDK's streaming response with iter_bytes() for real-time playback.
+    Network reads feed a PCMOutputBuffer drained by the audio thread, so
+    receiving and playback are decoupled and the event loop never blocks.
+    With capture_pcm, the played audio is returned in metrics.pcm_data.
     """
     metrics = StreamMetrics()
     start_time = time.perf_counter()
-    stream = None
     first_chunk_time = None
-    save_buffer = io.BytesIO() if save_audio else None
+    save_buffer = io.BytesIO() if save_audio or capture_pcm else None
+    
+    # PCM parameters: 16-bit, mono, 24kHz (standard for TTS)
+    output = PCMOutputBuffer(metrics, start_time)
     
     try:
-        # Setup sounddevice stream for PCM playback
-        # PCM parameters: 16-bit, mono, 24kHz (standard for TTS)
-        audio_started = False
-        audio_start_time = None
-        
-        def audio_callback(outdata, frames, time_info, status):
-            """Callback to track when audio actually starts playing."""
-            nonlocal audio_started, audio_start_time
-            if not audio_started and frames > 0:
-                audio_started = True
-                audio_start_time = time.perf_counter()
-        
-        stream = sd.OutputStream(
-            samplerate=SAMPLE_RATE,  # Standard TTS sample rate (24kHz)
-            channels=1,
-            dtype='int16'  # PCM is 16-bit integers
-            # Note: Can't use callback and write() together
-        )
-        stream.start()
+        await output.open()
         
         # Log TTS playback start when we start the stream
         event_logger = get_event_logger()
@@ -297,6 +554,7 @@ async def stream_pcm_audio(
         ) as response:
             chunk_count = 0
             bytes_received = 0
+            leftover = b''
             
             # Stream chunks as they arrive
             async for chunk in response.iter_bytes(chunk_size=STREAM_CHUNK_SIZE):
@@ -312,16 +570,17 @@ async def stream_pcm_audio(
                         if event_logger:
                             event_logger.log_event(event_logger.TTS_FIRST_AUDIO)
                     
-                    # Convert bytes to numpy array for sounddevice
-                    # PCM data is already in the right format
-                    audio_array = np.frombuffer(chunk, dtype=np.int16)
+                    # Convert bytes to samples, carrying an odd trailing byte to the next chunk
+                    data = leftover + chunk
+                    usable = len(data) - (len(data) % 2)
+                    leftover = data[usable:]
                     
-                    # Play the chunk immediately
-                    stream.write(audio_array)
+                    # Queue for the audio thread, waiting while the buffer is full
+                    await output.write(np.frombuffer(data, dtype=np.int16, count=usable // 2))
                     
                     # Save chunk if enabled
                     if save_buffer:
-                        save_buffer.write(chunk)
+                        save_buffer.write(data[:usable])
                     
                     chunk_count += 1
                     bytes_received += len(chunk)
@@ -329,62 +588,37 @@ async def stream_pcm_audio(
                     metrics.chunks_played = chunk_count
                     
                     if debug and chunk_count % 10 == 0:
-                        logger.debug(f"Streamed {chunk_count} chunks, {bytes_received} bytes")
+                        logger.debug(f"Streamed {chunk_count} chunks, {bytes_received} bytes, "
+                                     f"buffered {output.buffer.available / SAMPLE_RATE:.2f}s")
+        
+        metrics.generation_time = time.perf_counter() - start_time
         
         # Wait for playback to finish
-        stream.stop()
+        await output.finish()
         
         # Log TTS playback end
         if event_logger:
             event_logger.log_event(event_logger.TTS_PLAYBACK_END)
         
-        end_time = time.perf_counter()
-        metrics.generation_time = first_chunk_time - start_time if first_chunk_time else 0
-        metrics.playback_time = end_time - start_time
+        metrics.playback_time = time.perf_counter() - start_time
         
-        # Calculate true TTFA based on actual audio playback or chunk receipt
-        if debug and audio_start_time:
-            # Use actual playback start time when available
-            metrics.ttfa = audio_start_time - start_time
+        # Prefer the moment the device actually received audio
+        if debug and output.audio_start_time:
+            metrics.ttfa = output.audio_start_time - start_time
             logger.info(f"True TTFA (audio started): {metrics.ttfa:.3f}s")
-        elif first_chunk_time:
-            # Fall back to first chunk time
-            metrics.ttfa = first_chunk_time - start_time
-            logger.info(f"TTFA (first chunk): {metrics.ttfa:.3f}s")
         
         logger.info(f"Streaming complete - TTFA: {metrics.ttfa:.3f}s, "
                    f"Total: {metrics.playback_time:.3f}s, "
-                   f"Chunks: {metrics.chunks_received}")
+                   f"Chunks: {metrics.chunks_received}, "
+                   f"Underruns: {metrics.buffer_underruns}, "
+                   f"Backpressure: {metrics.backpressure_waits} waits ({metrics.backpressure_time:.2f}s)")
+        
+        if capture_pcm:
+            metrics.pcm_data = save_buffer.getvalue()
         
         # Save audio if enabled
         if save_audio and save_buffer and audio_dir:
-            try:
-                from .core import save_debug_file
-                save_buffer.seek(0)
-                audio_data = save_buffer.read()
-                # PCM format needs special handling - save as WAV
-                if audio_data:
-                    # For PCM, we need to save as WAV with proper headers
-                    import wave
-                    import tempfile
-                    with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp_wav:
-                        with wave.open(tmp_wav.name, 'wb') as wav_file:
-                            wav_file.setnchannels(1)
-                            wav_file.setsampwidth(2)  # 16-bit
-                            wav_file.setframerate(SAMPLE_RATE)
-                            wav_file.writeframes(audio_data)
-                        # Read back the WAV file
-                        with open(tmp_wav.name, 'rb') as f:
-                            wav_data = f.read()
-                        import os
-                        os.unlink(tmp_wav.name)
-                        audio_path = save_debug_file(wav_data, "tts", "wav", audio_dir, True, conversation_id)
-                        if audio_path:
-                            logger.info(f"TTS audio saved to: {audio_path}")
-                            # Store audio path in metrics for the caller
-                            metrics.audio_path = audio_path
-            except Exception as e:
-                logger.error(f"Failed to save TTS audio: {e}")
+            metrics.audio_path = _save_pcm_audio(save_buffer.getvalue(), audio_dir, conversation_id)
         
         return True, metrics
         
@@ -393,8 +627,230 @@ async def stream_pcm_audio(
         return False, metrics
         
     finally:
-        if stream:
-            stream.close()
+        output.close()
+
+
+# Sentence ends (optionally followed by closing quotes/brackets) and clause breaks
+_SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?…])["\'”’)\]]*\s+')
+_CLAUSE_BOUNDARY = re.compile(r'(?<=[,;:—–])\s+')
+
+# Keep the first segment short so it is synthesized and playing quickly
+PIPELINE_FIRST_SEGMENT_CHARS = 120
+PIPELINE_MAX_SEGMENT_CHARS = 400
+
+
+def split_into_segments(
+    text: str,
+    first_segment_chars: int = PIPELINE_FIRST_SEGMENT_CHARS,
+    max_segment_chars: int = PIPELINE_MAX_SEGMENT_CHARS
+) -> List[str]:
+    """Split text at sentence and clause boundaries for pipelined synthesis.
+    
+    Sentences longer than the segment limit are split further at clause
+    boundaries (never inside words). Short sentences are packed together so
+    later segments don't cost more requests than necessary.
+    
+    Args:
+        text: Text to split
+        first_segment_chars: Target maximum length of the first segment
+        max_segment_chars: Target maximum length of later segments
+        
+    Returns:
+        List of non-empty segments that together contain all of the text
+    """
+    pieces = []
+    for sentence in _SENTENCE_BOUNDARY.split(text.strip()):
+        sentence = sentence.strip()
+        if not sentence:
+            continue
+        limit = first_segment_chars if not pieces else max_segment_chars
+        if len(sentence) > limit:
+            pieces.extend(c.strip() for c in _CLAUSE_BOUNDARY.split(sentence) if c.strip())
+        else:
+            pieces.append(sentence)
+    
+    segments = []
+    current = ""
+    for piece in pieces:
+        limit = first_segment_chars if not segments else max_segment_chars
+        if current and len(current) + 1 + len(piece) > limit:
+            segments.append(current)
+            current = piece
+        else:
+            current = f"{current} {piece}" if current else piece
+    if current:
+        segments.append(current)
+    return segments
+
+
+async def stream_tts_pipelined(
+    text: str,
+    openai_client,
+    request_params: dict,
+    segments: Optional[List[str]] = None,
+    max_concurrency: int = STREAM_PIPELINE_CONCURRENCY,
+    debug: bool = False,
+    save_audio: bool = False,
+    audio_dir: Optional[Path] = None,
+    conversation_id: Optional[str] = None,
+    capture_pcm: bool = False
+) -> Tuple[bool, StreamMetrics]:
+    """Synthesize a long message segment by segment and play it gaplessly.
+    
+    The first segment is requested immediately and later segments are
+    requested concurrently (at most max_concurrency in flight against the
+    endpoint), so TTFA depends on the first sentence rather than the whole
+    message. Audio is played strictly in segment order through one
+    PCMOutputBuffer; PCM segments play as their chunks arrive, other formats are
+    decoded once each segment has been received.
+    
+    Args:
+        text: Full text being spoken
+        openai_client: OpenAI client instance
+        request_params: Parameters for TTS request ('input' is replaced per segment)
+        segments: Pre-split segments (defaults to split_into_segments(text))
+        max_concurrency: Maximum concurrent segment requests
+        debug: Enable debug logging
+        save_audio: Save the played audio as WAV
+        audio_dir: Directory for saved audio
+        conversation_id: Conversation ID for saved audio filenames
+        capture_pcm: Return the played 16-bit PCM in metrics.pcm_data
+        
+    Returns:
+        Tuple of (success, metrics)
+    """
+    from .audio_decode import decode_audio_bytes
+    
+    format = request_params.get('response_format', 'pcm')
+    segments = segments or split_into_segments(text)
+    logger.info(f"Pipelined TTS: {len(segments)} segments, format: {format}, concurrency: {max_concurrency}")
+    
+    metrics = StreamMetrics()
+    metrics.segments = [SegmentMetrics(index=i, chars=len(seg)) for i, seg in enumerate(segments)]
+    start_time = time.perf_counter()
+    last_byte_time = start_time
+    pcm_buffer = io.BytesIO() if save_audio or capture_pcm else None
+    
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    queues = [asyncio.Queue() for _ in segments]
+    
+    async def fetch_segment(index: int):
+        """Download one segment, forwarding chunks to its queue in order."""
+        nonlocal last_byte_time
+        seg_metrics = metrics.segments[index]
+        try:
+            async with semaphore:
+                request_start = time.perf_counter()
+                params = dict(request_params, input=segments[index])
+                async with openai_client.audio.speech.with_streaming_response.create(**params) as response:
+                    async for chunk in response.iter_bytes(chunk_size=STREAM_CHUNK_SIZE):
+                        if chunk:
+                            if not seg_metrics.bytes_received:
+                                seg_metrics.ttfa = time.perf_counter() - request_start
+                            seg_metrics.bytes_received += len(chunk)
+                            queues[index].put_nowait(chunk)
+                seg_metrics.generation_time = time.perf_counter() - request_start
+                last_byte_time = max(last_byte_time, time.perf_counter())
+            queues[index].put_nowait(None)
+        except Exception as e:
+            queues[index].put_nowait(e)
+    
+    event_logger = get_event_logger()
+    output = PCMOutputBuffer(metrics, start_time)
+    tasks = []
+    
+    async def play(samples: np.ndarray):
+        """Queue samples for playback without blocking the event loop."""
+        nonlocal first_audio_time
+        if first_audio_time is None:
+            first_audio_time = time.perf_counter()
+            logger.info(f"Pipelined TTS first audio after {first_audio_time - start_time:.3f}s")
+            if event_logger:
+                event_logger.log_event(event_logger.TTS_FIRST_AUDIO)
+        await output.write(samples)
+        if pcm_buffer:
+            pcm_buffer.write(samples.tobytes())
+        metrics.chunks_played += 1
+    
+    first_audio_time = None
+    try:
+        await output.open()
+        if event_logger:
+            event_logger.log_event(event_logger.TTS_PLAYBACK_START)
+        
+        tasks = [asyncio.create_task(fetch_segment(i)) for i in range(len(segments))]
+        
+        for index, segment_queue in enumerate(queues):
+            seg_metrics = metrics.segments[index]
+            wait_start = time.perf_counter()
+            leftover = b''
+            encoded = []
+            waiting = True
+            while True:
+                item = await segment_queue.get()
+                if waiting:
+                    seg_metrics.playback_wait = time.perf_counter() - wait_start
+                    waiting = False
+                if item is None:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                metrics.chunks_received += 1
+                
+                if format == 'pcm':
+                    # Play as it arrives, carrying any odd byte to the next chunk
+                    data = leftover + item
+                    usable = len(data) - (len(data) % 2)
+                    leftover = data[usable:]
+                    if usable:
+                        await play(np.frombuffer(data, dtype=np.int16, count=usable // 2))
+                else:
+                    encoded.append(item)
+            
+            if encoded:
+                # ffmpeg runs off the event loop so the other segments keep downloading
+                data = b''.join(encoded)
+                decoded = await asyncio.get_running_loop().run_in_executor(
+                    None, lambda: decode_audio_bytes(data, format, sample_rate=SAMPLE_RATE)
+                )
+                if decoded.sample_rate != SAMPLE_RATE:
+                    raise ValueError(f"Unsupported {format} segment: {decoded.sample_rate}Hz")
+                # Segments are played on one mono stream
+                await play(decoded.pcm16(mono=True))
+            
+            if debug:
+                logger.debug(f"Segment {index + 1}/{len(segments)}: ttfa {seg_metrics.ttfa:.3f}s, "
+                             f"gen {seg_metrics.generation_time:.3f}s, waited {seg_metrics.playback_wait:.3f}s")
+        
+        # Let the device drain the remaining audio
+        await output.finish()
+        
+        if event_logger:
+            event_logger.log_event(event_logger.TTS_PLAYBACK_END)
+        
+        metrics.generation_time = last_byte_time - start_time
+        metrics.playback_time = time.perf_counter() - start_time
+        stalls = sum(1 for seg in metrics.segments[1:] if seg.playback_wait > 0.05)
+        logger.info(f"Pipelined TTS complete - TTFA: {metrics.ttfa:.3f}s, "
+                    f"Total: {metrics.playback_time:.3f}s, Segments: {len(segments)}, Stalls: {stalls}")
+        
+        if pcm_buffer:
+            if capture_pcm:
+                metrics.pcm_data = pcm_buffer.getvalue()
+            if save_audio and audio_dir:
+                metrics.audio_path = _save_pcm_audio(pcm_buffer.getvalue(), audio_dir, conversation_id)
+        
+        return True, metrics
+        
+    except Exception as e:
+        logger.error(f"Pipelined streaming failed: {e}")
+        return False, metrics
+        
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        output.close()
 
 
 async def stream_tts_audio(
@@ -404,7 +860,8 @@ async def stream_tts_audio(
     debug: bool = False,
     save_audio: bool = False,
     audio_dir: Optional[Path] = None,
-    conversation_id: Optional[str] = None
+    conversation_id: Optional[str] = None,
+    capture_pcm: bool = False
 ) -> Tuple[bool, StreamMetrics]:
     """Stream TTS audio with progressive playback.
     
@@ -413,6 +870,7 @@ async def stream_tts_audio(
         openai_client: OpenAI client instance
         request_params: Parameters for TTS request
         debug: Enable debug logging
+        capture_pcm: Return the decoded 16-bit PCM in metrics.pcm_data
         
     Returns:
         Tuple of (success, metrics)
@@ -420,6 +878,22 @@ async def stream_tts_audio(
     format = request_params.get('response_format', 'pcm')
     logger.info(f"Starting streaming TTS with format: {format}")
     
+    # Long messages: synthesize sentence by sentence so the first one plays sooner
+    if STREAM_PIPELINE_ENABLED and len(text) >= STREAM_PIPELINE_MIN_CHARS:
+        segments = split_into_segments(text)
+        if len(segments) > 1:
+            return await stream_tts_pipelined(
+                text=text,
+                openai_client=openai_client,
+                request_params=request_params,
+                segments=segments,
+                debug=debug,
+                save_audio=save_audio,
+                audio_dir=audio_dir,
+                conversation_id=conversation_id,
+                capture_pcm=capture_pcm
+            )
+    
     # PCM is best for streaming (no decoding needed)
     # For other formats, we may need buffering
     if format == 'pcm':
@@ -430,7 +904,8 @@ async def stream_tts_audio(
             debug=debug,
             save_audio=save_audio,
             audio_dir=audio_dir,
-            conversation_id=conversation_id
+            conversation_id=conversation_id,
+            capture_pcm=capture_pcm
         )
     else:
         # Use buffered streaming for formats that need decoding
@@ -441,11 +916,12 @@ async def stream_tts_audio(
             debug=debug,
             save_audio=save_audio,
             audio_dir=audio_dir,
-            conversation_id=conversation_id
+            conversation_id=conversation_id,
+            capture_pcm=capture_pcm
         )
 
 
-# Fallback for complex formats - buffer and decode complete file
+# Compressed formats - decode incrementally while downloading
 async def stream_with_buffering(
     text: str,
     openai_client,
@@ -454,34 +930,55 @@ async def stream_with_buffering(
     debug: bool = False,
     save_audio: bool = False,
     audio_dir: Optional[Path] = None,
-    conversation_id: Optional[str] = None
+    conversation_id: Optional[str] = None,
+    capture_pcm: bool = False
 ) -> Tuple[bool, StreamMetrics]:
-    """Fallback streaming that buffers enough data to decode reliably.
+    """Stream compressed audio (MP3, Opus, AAC, ...) through an incremental decoder.
     
-    This is used for formats like MP3, Opus, etc where frame boundaries are critical.
-    For Opus, we download the complete audio before playing.
+    Compressed chunks are fed to one long-lived ffmpeg process as they arrive
+    and its PCM output is played as soon as each frame is decoded, so playback
+    starts after the first few frames rather than after the whole response.
     """
+    from .audio_decode import StreamingDecoder
+    
     format = request_params.get('response_format', 'pcm')
-    logger.info(f"Using buffered streaming for format: {format}")
+    logger.info(f"Using incremental decoder for format: {format}")
     
-    metrics = StreamMetrics()
+    metrics = StreamMetrics(sample_rate=sample_rate)
     start_time = time.perf_counter()
     
-    # Buffer for accumulating chunks
-    buffer = io.BytesIO()
-    # Separate buffer for saving complete audio
+    # Buffer for saving the original compressed audio
     save_buffer = io.BytesIO() if save_audio else None
-    audio_started = False
-    stream = None
+    # Decoded PCM for the caller, if requested
+    pcm_buffer = io.BytesIO() if capture_pcm else None
+    
+    decoder = StreamingDecoder(format, sample_rate)
+    output = PCMOutputBuffer(metrics, start_time, sample_rate)
+    first_chunk_time = None
+    pump = None
+    
+    async def play_decoded():
+        """Move decoded PCM from ffmpeg to the output buffer."""
+        while True:
+            samples = await decoder.read()
+            if samples is None:
+                break
+            if metrics.decode_latency == 0.0 and first_chunk_time is not None:
+                metrics.decode_latency = time.perf_counter() - first_chunk_time
+                logger.debug(f"First {format} frame decoded after {metrics.decode_latency:.3f}s")
+            await output.write(samples)
+            metrics.chunks_played += 1
+            if pcm_buffer:
+                pcm_buffer.write(samples.tobytes())
     
     try:
-        # Setup sounddevice stream
-        stream = sd.OutputStream(
-            samplerate=sample_rate,
-            channels=1,
-            dtype='float32'
-        )
-        stream.start()
+        await decoder.start()
+        await output.open()
+        pump = asyncio.create_task(play_decoded())
+        
+        event_logger = get_event_logger()
+        if event_logger:
+            event_logger.log_event(event_logger.TTS_PLAYBACK_START)
         
         # Don't add stream parameter - Kokoro defaults to true, OpenAI doesn't support it
         
@@ -489,86 +986,65 @@ async def stream_with_buffering(
         async with openai_client.audio.speech.with_streaming_response.create(
             **request_params
         ) as response:
-            first_chunk_time = None
-            
             # Stream chunks as they arrive
             async for chunk in response.iter_bytes(chunk_size=STREAM_CHUNK_SIZE):
                 if chunk:
-                    # Track first chunk for TTFA
                     if first_chunk_time is None:
                         first_chunk_time = time.perf_counter()
-                        metrics.ttfa = first_chunk_time - start_time
-                        logger.info(f"First chunk received - TTFA: {metrics.ttfa:.3f}s")
+                        logger.info(f"First chunk received after {first_chunk_time - start_time:.3f}s")
+                        if event_logger:
+                            event_logger.log_event(event_logger.TTS_FIRST_AUDIO)
                     
-                    buffer.write(chunk)
                     metrics.chunks_received += 1
                     
                     # Also accumulate in save buffer if saving is enabled
                     if save_buffer:
                         save_buffer.write(chunk)
                     
-                    # Try to decode when we have enough data (e.g., 32KB)
-                    if buffer.tell() > 32768 and not audio_started:
-                        buffer.seek(0)
-                        try:
-                            # Attempt to decode what we have
-                            audio = AudioSegment.from_file(buffer, format=format)
-                            samples = np.array(audio.get_array_of_samples()).astype(np.float32) / 32768.0
-                            
-                            # Start playback
-                            metrics.ttfa = time.perf_counter() - start_time
-                            audio_started = True
-                            logger.info(f"Buffered streaming started - TTFA: {metrics.ttfa:.3f}s")
-                            
-                            # Play audio
-                            stream.write(samples)
-                            metrics.chunks_played += len(samples) // 1024
-                            
-                            # Reset buffer for next batch
-                            buffer = io.BytesIO()
-                            
-                        except Exception as e:
-                            # Not enough valid data yet
-                            buffer.seek(0, io.SEEK_END)
-        
-        # Process any remaining data
-        if buffer.tell() > 0:
-            buffer.seek(0)
-            try:
-                audio = AudioSegment.from_file(buffer, format=format)
-                samples = np.array(audio.get_array_of_samples()).astype(np.float32) / 32768.0
-                
-                if not audio_started:
-                    metrics.ttfa = time.perf_counter() - start_time
+                    # Waits if the decoder (and so playback) is behind
+                    await decoder.feed(chunk)
                     
-                stream.write(samples)
-                metrics.chunks_played += len(samples) // 1024
-                
-            except Exception as e:
-                logger.error(f"Failed to decode final buffer: {e}")
+                    # Surface decoder failures without waiting for the whole download
+                    if pump.done():
+                        pump.result()
         
+        await decoder.close_input()
+        await pump
         metrics.generation_time = time.perf_counter() - start_time
-        metrics.playback_time = metrics.generation_time  # Approximate
+        
+        await output.finish()
+        
+        if event_logger:
+            event_logger.log_event(event_logger.TTS_PLAYBACK_END)
+        
+        metrics.playback_time = time.perf_counter() - start_time
+        if pcm_buffer:
+            metrics.pcm_data = pcm_buffer.getvalue()
+        
+        logger.info(f"Streaming complete - TTFA: {metrics.ttfa:.3f}s, "
+                    f"Decode latency: {metrics.decode_latency:.3f}s, "
+                    f"Total: {metrics.playback_time:.3f}s, "
+                    f"Underruns: {metrics.buffer_underruns}")
         
         # Save audio if enabled
         if save_audio and save_buffer and audio_dir:
             try:
                 from .core import save_debug_file
-                save_buffer.seek(0)
-                audio_data = save_buffer.read()
-                audio_path = save_debug_file(audio_data, "tts", format, audio_dir, True, conversation_id)
+                audio_path = save_debug_file(save_buffer.getvalue(), "tts", format, audio_dir, True, conversation_id)
                 if audio_path:
                     logger.info(f"TTS audio saved to: {audio_path}")
+                    metrics.audio_path = audio_path
             except Exception as e:
                 logger.error(f"Failed to save TTS audio: {e}")
         
         return True, metrics
         
     except Exception as e:
-        logger.error(f"Buffered streaming failed: {e}")
+        logger.error(f"Incremental streaming failed: {e}")
         return False, metrics
         
     finally:
-        if stream:
-            stream.stop()
-            stream.close()
\ No newline at end of file
+        if pump and not pump.done():
+            pump.cancel()
+        await decoder.close()
+        output.close()
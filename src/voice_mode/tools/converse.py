@@ -12,7 +12,6 @@ from datetime import datetime
 import numpy as np
 import sounddevice as sd
 from scipy.io.wavfile import write
-from pydub import AudioSegment
 from openai import AsyncOpenAI
 import httpx
 
@@ -56,7 +55,9 @@ from voice_mode.config import (
     INITIAL_SILENCE_GRACE_PERIOD,
     DEFAULT_LISTEN_DURATION,
     TTS_VOICES,
-    TTS_MODELS
+    TTS_MODELS,
+    BARGE_IN_ENABLED,
+    LISTEN_OVERLAP_ENABLED
 )
 import voice_mode.config
 from voice_mode.providers import (
@@ -67,6 +68,8 @@ from voice_mode.providers import (
     select_best_voice
 )
 from voice_mode.provider_discovery import provider_registry
+from voice_mode.connection_pool import client_registry
+from voice_mode.output_engine import close_output_engine, get_output_engine
 from voice_mode.core import (
     get_openai_clients,
     text_to_speech,
@@ -119,6 +122,12 @@ async def warmup_provider(
     Returns:
         True if warmup succeeded, False otherwise
     """
+    from voice_mode.config import SIMPLE_FAILOVER
+    from voice_mode.simple_failover import FAILOVER_TIMEOUT_PROFILE
+
+    # Warm the pool the requests will actually use
+    timeout_profile = FAILOVER_TIMEOUT_PROFILE if SIMPLE_FAILOVER else "default"
+
     try:
         logger.debug(f"Pre-warming {service} connection to {provider_type} ({base_url})")
 
@@ -131,7 +140,11 @@ async def warmup_provider(
                 model=None
             )
 
-            # Connection is now established (pooled in httpx client)
+            # Open a keep-alive connection in the shared client pool so the
+            # first turn doesn't pay the TCP/TLS handshake
+            if not await client_registry.warm(endpoint_info.base_url, client.api_key, timeout_profile):
+                return False
+
             logger.info(f"✓ Pre-warmed TTS connection to {provider_type}")
             return True
 
@@ -142,6 +155,9 @@ async def warmup_provider(
                 model=None
             )
 
+            if not await client_registry.warm(endpoint_info.base_url, client.api_key, timeout_profile):
+                return False
+
             logger.info(f"✓ Pre-warmed STT connection to {provider_type}")
             return True
 
@@ -331,10 +347,35 @@ async def text_to_speech_with_failover(
     """
     Text to speech with automatic failover to next available endpoint.
     
+    Audio prefetched by prefetch_speech with the same parameters is played
+    without another synthesis request.
+    
     Returns:
         Tuple of (success, tts_metrics, tts_config)
     """
     from ..config import SIMPLE_FAILOVER
+    from ..tts_prefetch import get_prefetch_store, make_prefetch_key
+    
+    # Play speculatively prefetched audio if the agent asked for this utterance ahead of time
+    request_start = time.perf_counter()
+    prefetched = await get_prefetch_store().take(
+        make_prefetch_key(message, voice, initial_provider, model, instructions, speed)
+    )
+    if prefetched is not None:
+        from ..core import play_cached_audio
+        audio, prefetch_config = prefetched
+        logger.info(f"✓ TTS prefetch hit - skipping synthesis (saves ~{audio.synthesis_time:.1f}s)")
+        tts_metrics = {
+            'prefetch_hit': True,
+            # Reported like a cache hit: synthesis time the turn didn't spend
+            'cache_hit': True,
+            'cache_saved': audio.synthesis_time,
+            'generation': time.perf_counter() - request_start
+        }
+        success = await play_cached_audio(audio, tts_metrics, request_start)
+        if success:
+            return True, tts_metrics, prefetch_config
+        logger.warning("Prefetched audio playback failed, synthesizing again")
 
     # Use simple failover if enabled
     if SIMPLE_FAILOVER:
@@ -352,6 +393,27 @@ async def text_to_speech_with_failover(
             speed=speed
         )
     
+    # Race endpoints instead of walking them in order; an explicitly requested provider is honoured as-is
+    from ..config import TTS_HEDGE_ENABLED, TTS_BASE_URLS as HEDGE_BASE_URLS
+    if TTS_HEDGE_ENABLED and len(HEDGE_BASE_URLS) > 1:
+        if initial_provider:
+            logger.info(f"TTS hedging skipped: provider {initial_provider} was requested")
+        else:
+            from ..simple_failover import hedged_tts
+            return await hedged_tts(
+                message,
+                voice or TTS_VOICES[0],
+                model or TTS_MODELS[0],
+                conversation_id=get_conversation_logger().conversation_id,
+                instructions=instructions,
+                audio_format=audio_format,
+                debug=DEBUG,
+                debug_dir=DEBUG_DIR if DEBUG else None,
+                save_audio=SAVE_AUDIO,
+                audio_dir=AUDIO_DIR if SAVE_AUDIO else None,
+                speed=speed
+            )
+    
     # Original implementation with health checks
     from voice_mode.provider_discovery import provider_registry
     
@@ -487,21 +549,79 @@ async def text_to_speech_with_failover(
     return False, None, error_config
 
 
-async def speech_to_text(audio_data: np.ndarray, save_audio: bool = False, audio_dir: Optional[Path] = None, transport: str = "local") -> Optional[str]:
+async def speech_to_text(audio_data: np.ndarray, save_audio: bool = False, audio_dir: Optional[Path] = None, transport: str = "local", upload=None) -> Optional[str]:
     """Convert audio to text with automatic failover"""
     # Use the new failover implementation
-    return await speech_to_text_with_failover(audio_data, save_audio, audio_dir, transport)
+    return await speech_to_text_with_failover(audio_data, save_audio, audio_dir, transport, upload)
+
+
+async def start_upload_encoder():
+    """Start encoding the STT upload while recording, when it will be compressed.
+
+    Predicts the upload format from the first STT endpoint the way
+    _speech_to_text_internal chooses it. Returns None when the upload will be
+    WAV (simple failover, or truly local Whisper) or encoding can't start.
+    """
+    from voice_mode.config import (
+        SIMPLE_FAILOVER, STT_BASE_URLS, STT_AUDIO_FORMAT, STT_STREAMING_ENCODE,
+        get_stt_upload_sample_rate, validate_audio_format
+    )
+    if not STT_STREAMING_ENCODE or SIMPLE_FAILOVER or not STT_BASE_URLS:
+        return None
+
+    base_url = STT_BASE_URLS[0]
+    if "127.0.0.1" in base_url or "localhost" in base_url:
+        from voice_mode.utils.services.common import service_locality
+        from voice_mode.config import WHISPER_PORT
+        # An uncached lookup scans processes; keep it off the event loop
+        status, _ = await asyncio.get_running_loop().run_in_executor(None, service_locality.get, WHISPER_PORT)
+        if status == "local":
+            return None
+        provider = "whisper-local"
+    else:
+        provider = "openai-whisper"
+
+    export_format = validate_audio_format(STT_AUDIO_FORMAT, provider, "stt")
+    if export_format == "wav":
+        return None
+
+    from voice_mode.audio_encode import AudioEncodeError, StreamingEncoder
+    try:
+        return StreamingEncoder(export_format, SAMPLE_RATE, get_stt_upload_sample_rate(base_url))
+    except (AudioEncodeError, OSError) as e:
+        logger.debug(f"Not encoding while recording: {e}")
+        return None
+
+
+class VADListenerGroup:
+    """Passes each recorded chunk and its VAD decision to several listeners."""
+
+    def __init__(self, listeners):
+        self.listeners = listeners
+
+    def __call__(self, chunk: np.ndarray, is_speech: bool):
+        for listener in self.listeners:
+            listener.process(chunk, is_speech)
+
+    def reset(self):
+        """Tell every listener the recording restarted."""
+        for listener in self.listeners:
+            listener.reset()
 
 
 async def speech_to_text_with_failover(
     audio_data: np.ndarray, 
     save_audio: bool = False, 
     audio_dir: Optional[Path] = None,
-    transport: str = "local"
+    transport: str = "local",
+    upload=None
 ) -> Optional[str]:
     """
     Speech to text with automatic failover to next available endpoint.
     
+    Args:
+        upload: EncodedAudio produced while recording, used when it matches the upload format
+    
     Returns:
         Transcribed text or None if all endpoints fail
     """
@@ -509,55 +629,26 @@ async def speech_to_text_with_failover(
     
     # Use simple failover if enabled
     if SIMPLE_FAILOVER:
-        import tempfile
-        from voice_mode.conversation_logger import get_conversation_logger
-        from voice_mode.core import save_debug_file, get_debug_filename
+        from voice_mode.audio_encode import encode_wav, upload_file
+        from voice_mode.config import get_stt_upload_sample_rate
+        from voice_mode.resample import resample
+        from ..simple_failover import simple_stt_failover
         
-        # Determine if we should save the file permanently or use a temp file
+        # Save the recording as captured; the upload is built separately
         if save_audio and audio_dir:
-            # Save directly to final location
-            conversation_logger = get_conversation_logger()
-            conversation_id = conversation_logger.conversation_id
-            
-            # Create year/month directory structure
-            now = datetime.now()
-            year_dir = audio_dir / str(now.year)
-            month_dir = year_dir / f"{now.month:02d}"
-            month_dir.mkdir(parents=True, exist_ok=True)
+            from voice_mode.conversation_logger import get_conversation_logger
+            from voice_mode.core import save_debug_file
             
-            # Generate filename and path
-            filename = get_debug_filename("stt", "wav", conversation_id)
-            wav_file_path = month_dir / filename
-            
-            # Write audio data directly to final location
-            write(str(wav_file_path), SAMPLE_RATE, audio_data)
+            conversation_id = get_conversation_logger().conversation_id
+            wav_file_path = save_debug_file(encode_wav(audio_data, SAMPLE_RATE), "stt", "wav", audio_dir, True, conversation_id)
             logger.info(f"STT audio saved to: {wav_file_path}")
-            
-            # Use the saved file for STT
-            with open(wav_file_path, 'rb') as audio_file:
-                from ..simple_failover import simple_stt_failover
-                result = await simple_stt_failover(
-                    audio_file=audio_file,
-                    model="whisper-1"
-                )
-            # Don't delete - it's our saved audio file
-        else:
-            # Use temporary file that will be deleted
-            with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp_file:
-                write(tmp_file.name, SAMPLE_RATE, audio_data)
-                tmp_file.flush()
-                
-                with open(tmp_file.name, 'rb') as audio_file:
-                    from ..simple_failover import simple_stt_failover
-                    result = await simple_stt_failover(
-                        audio_file=audio_file,
-                        model="whisper-1"
-                    )
-                
-                # Clean up temp file
-                os.unlink(tmp_file.name)
         
-        return result
+        # Upload from memory. Every endpoint gets the same file, so the default upload rate applies
+        upload_rate = get_stt_upload_sample_rate(None)
+        return await simple_stt_failover(
+            audio_file=upload_file(encode_wav(resample(audio_data, SAMPLE_RATE, upload_rate), upload_rate), "wav"),
+            model="whisper-1"
+        )
     
     # Original implementation with health checks
     from voice_mode.provider_discovery import provider_registry
@@ -602,7 +693,8 @@ async def speech_to_text_with_failover(
                 stt_config, 
                 openai_clients,
                 save_audio, 
-                audio_dir
+                audio_dir,
+                upload
             )
             
             if result:
@@ -628,7 +720,8 @@ async def _speech_to_text_internal(
     stt_config: dict,
     openai_clients: dict,
     save_audio: bool = False,
-    audio_dir: Optional[Path] = None
+    audio_dir: Optional[Path] = None,
+    upload=None
 ) -> Optional[str]:
     """Internal speech to text implementation (extracted from original speech_to_text)"""
     logger.info(f"STT: Converting speech to text, audio data shape: {audio_data.shape}")
@@ -637,11 +730,10 @@ async def _speech_to_text_internal(
         logger.debug(f"STT config - Model: {stt_config['model']}, Base URL: {stt_config['base_url']}")
         logger.debug(f"Audio stats - Min: {audio_data.min()}, Max: {audio_data.max()}, Mean: {audio_data.mean():.2f}")
     
-    wav_file = None
-    export_file = None
     export_format = None
+    locality_port = None
     try:
-        import tempfile
+        from voice_mode.audio_encode import AudioEncodeError, encode_audio, encode_wav, upload_file
         
         # Check if input is silent
         if np.abs(audio_data).max() < 0.001:
@@ -653,19 +745,15 @@ async def _speech_to_text_internal(
             logger.debug(f"Converting audio from {audio_data.dtype} to int16")
             audio_data = (audio_data * 32767).astype(np.int16)
         
-        # Save as WAV file temporarily
-        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as wav_file_obj:
-            wav_file = wav_file_obj.name
-            logger.debug(f"Writing audio to WAV file: {wav_file}")
-            write(wav_file, SAMPLE_RATE, audio_data)
+        # WAV encoding for saved copies happens on the artifact writer thread
+        recorded = audio_data
         
         # Save debug file for original recording
         if DEBUG:
             try:
-                with open(wav_file, 'rb') as f:
-                    debug_path = save_debug_file(f.read(), "stt-input", "wav", DEBUG_DIR, DEBUG)
-                    if debug_path:
-                        logger.info(f"STT debug recording saved to: {debug_path}")
+                debug_path = save_debug_file(lambda: encode_wav(recorded, SAMPLE_RATE), "stt-input", "wav", DEBUG_DIR, DEBUG)
+                if debug_path:
+                    logger.info(f"STT debug recording saved to: {debug_path}")
             except Exception as e:
                 logger.error(f"Failed to save debug WAV: {e}")
         
@@ -675,18 +763,18 @@ async def _speech_to_text_internal(
         # Save audio file if audio saving is enabled
         if save_audio and audio_dir:
             try:
-                with open(wav_file, 'rb') as f:
-                    # Get conversation ID from logger
-                    conversation_logger = get_conversation_logger()
-                    conversation_id = conversation_logger.conversation_id
-                    audio_path = save_debug_file(f.read(), "stt", "wav", audio_dir, True, conversation_id)
-                    if audio_path:
-                        logger.info(f"STT audio saved to: {audio_path}")
+                # Get conversation ID from logger
+                conversation_logger = get_conversation_logger()
+                conversation_id = conversation_logger.conversation_id
+                audio_path = save_debug_file(lambda: encode_wav(recorded, SAMPLE_RATE), "stt", "wav", audio_dir, True, conversation_id)
+                if audio_path:
+                    logger.info(f"STT audio saved to: {audio_path}")
             except Exception as e:
                 logger.error(f"Failed to save audio WAV: {e}")
         
         # Import config for audio format
-        from ..config import STT_AUDIO_FORMAT, validate_audio_format, get_format_export_params
+        from ..config import STT_AUDIO_FORMAT, get_stt_upload_sample_rate, validate_audio_format
+        from voice_mode.resample import resample
         
         # Determine provider from base URL (simple heuristic)
         provider = stt_config.get('provider', 'openai-whisper')
@@ -698,64 +786,69 @@ async def _speech_to_text_internal(
         skip_conversion = False
         if provider == "whisper-local":
             # Check if whisper is truly local (not SSH-forwarded)
-            from voice_mode.utils.services.common import check_service_status
+            from voice_mode.utils.services.common import service_locality
             from voice_mode.config import WHISPER_PORT
-            status, _ = check_service_status(WHISPER_PORT)
+            locality_port = WHISPER_PORT
+            # An uncached lookup scans processes; keep it off the event loop
+            status, _ = await asyncio.get_running_loop().run_in_executor(None, service_locality.get, WHISPER_PORT)
             if status == "local":
                 skip_conversion = True
                 logger.info("Detected truly local whisper - skipping audio conversion, using WAV directly")
         
+        # Whisper works at 16 kHz; resampling here shrinks the upload and spares the server a resample
+        upload_rate = get_stt_upload_sample_rate(stt_config.get('base_url'))
+        if upload_rate != SAMPLE_RATE:
+            logger.debug(f"STT upload resampled {SAMPLE_RATE} Hz → {upload_rate} Hz")
+        
         if skip_conversion:
             # Use WAV directly for local whisper
-            upload_file = wav_file
             export_format = "wav"
-            logger.debug("Using WAV file directly for local whisper upload")
+            upload_bytes = encode_wav(resample(audio_data, SAMPLE_RATE, upload_rate), upload_rate)
+            logger.debug("Using WAV directly for local whisper upload")
         else:
             # Validate format for provider
             export_format = validate_audio_format(STT_AUDIO_FORMAT, provider, "stt")
             
-            # Convert WAV to target format for upload
-            logger.debug(f"Converting WAV to {export_format.upper()} for upload...")
-            conversion_start = time.perf_counter()
-            try:
-                audio = AudioSegment.from_wav(wav_file)
-                logger.debug(f"Audio loaded - Duration: {len(audio)}ms, Channels: {audio.channels}, Frame rate: {audio.frame_rate}")
-                
-                # Get export parameters for the format
-                export_params = get_format_export_params(export_format)
-                
-                with tempfile.NamedTemporaryFile(suffix=f'.{export_format}', delete=False) as export_file_obj:
-                    export_file = export_file_obj.name
-                    audio.export(export_file, **export_params)
-                    upload_file = export_file
+            if (upload is not None and upload.format == export_format and upload.samples == len(audio_data)
+                    and upload.sample_rate == upload_rate):
+                # Already encoded while recording
+                upload_bytes = upload.data
+                logger.info(f"Using {export_format.upper()} encoded while recording ({len(upload_bytes)} bytes)")
+            else:
+                # Encode in memory (compressed formats are piped through ffmpeg)
+                logger.debug(f"Encoding {export_format.upper()} for upload...")
+                conversion_start = time.perf_counter()
+                try:
+                    loop = asyncio.get_running_loop()
+                    upload_bytes = await loop.run_in_executor(
+                        None, lambda: encode_audio(resample(audio_data, SAMPLE_RATE, upload_rate), export_format, upload_rate)
+                    )
                     conversion_time = time.perf_counter() - conversion_start
-                    logger.info(f"Audio conversion: WAV → {export_format.upper()} took {conversion_time:.3f}s")
-                    logger.debug(f"{export_format.upper()} created for STT upload: {upload_file}")
-            except Exception as e:
-                if "ffmpeg" in str(e).lower() or "avconv" in str(e).lower():
-                    logger.error(f"Audio conversion failed - FFmpeg may not be installed: {e}")
-                    from voice_mode.utils.ffmpeg_check import get_install_instructions
-                    logger.error(f"\n{get_install_instructions()}")
-                    raise RuntimeError("FFmpeg is required but not found. Please install FFmpeg and try again.") from e
-                else:
-                    raise
+                    logger.info(f"Audio conversion: PCM → {export_format.upper()} took {conversion_time:.3f}s")
+                except AudioEncodeError as e:
+                    if "ffmpeg" in str(e).lower():
+                        logger.error(f"Audio conversion failed - FFmpeg may not be installed: {e}")
+                        from voice_mode.utils.ffmpeg_check import get_install_instructions
+                        logger.error(f"\n{get_install_instructions()}")
+                        raise RuntimeError("FFmpeg is required but not found. Please install FFmpeg and try again.") from e
+                    else:
+                        raise
         
         # Save debug file for upload version
         if DEBUG:
             try:
-                with open(upload_file, 'rb') as f:
-                    debug_path = save_debug_file(f.read(), "stt-upload", export_format, DEBUG_DIR, DEBUG)
-                    if debug_path:
-                        logger.info(f"Upload audio saved to: {debug_path}")
+                debug_path = save_debug_file(upload_bytes, "stt-upload", export_format, DEBUG_DIR, DEBUG)
+                if debug_path:
+                    logger.info(f"Upload audio saved to: {debug_path}")
             except Exception as e:
                 logger.error(f"Failed to save debug {export_format.upper()}: {e}")
         
         # Get file size for logging
-        file_size = os.path.getsize(upload_file)
+        file_size = len(upload_bytes)
         logger.debug(f"Uploading {file_size} bytes to STT API...")
         
         # Perform STT based on configuration
-        with open(upload_file, 'rb') as audio_file:
+        with upload_file(upload_bytes, export_format) as audio_file:
             # Use client from config
             if 'client' in stt_config:
                 stt_client = stt_config['client']
@@ -820,6 +913,10 @@ async def _speech_to_text_internal(
                     
     except Exception as e:
         logger.error(f"STT failed: {e}")
+        if locality_port is not None:
+            # The service may have moved (restarted, or now forwarded) - look it up again next time
+            from voice_mode.utils.services.common import service_locality
+            service_locality.invalidate(locality_port)
         logger.error(f"STT config when error occurred - Model: {stt_config.get('model', 'unknown')}, Base URL: {stt_config.get('base_url', 'unknown')}")
         
         # Check for authentication errors
@@ -840,22 +937,6 @@ async def _speech_to_text_internal(
                 logger.error("   For local-only usage, ensure Whisper is running and configured.")
         
         return None
-    finally:
-        # Clean up temporary files
-        if wav_file and os.path.exists(wav_file):
-            try:
-                os.unlink(wav_file)
-                logger.debug(f"Cleaned up WAV file: {wav_file}")
-            except Exception as e:
-                logger.error(f"Failed to clean up WAV file: {e}")
-        
-        if export_file and os.path.exists(export_file):
-            try:
-                os.unlink(export_file)
-                export_format = export_format if 'export_format' in locals() else 'audio'
-                logger.debug(f"Cleaned up {export_format.upper()} file: {export_file}")
-            except Exception as e:
-                logger.error(f"Failed to clean up {export_format.upper() if 'export_format' in locals() else 'audio'} file: {e}")
 
 
 async def play_audio_feedback(
@@ -972,9 +1053,14 @@ def record_audio(duration: float) -> np.ndarray:
                 except:
                     old_device_name = 'Previous device'
                 
+                close_output_engine()
                 sd._terminate()
                 sd._initialize()
                 
+                # The default output may have changed too; re-probe it for chimes
+                from voice_mode.chime_bank import get_chime_bank
+                get_chime_bank().invalidate()
+                
                 # Get new default device info
                 try:
                     new_device = sd.query_devices(kind='input')
@@ -1023,7 +1109,7 @@ def record_audio(duration: float) -> np.ndarray:
             sys.stderr = original_stderr
 
 
-def record_audio_with_silence_detection(max_duration: float, disable_silence_detection: bool = False, min_duration: float = 0.0, vad_aggressiveness: Optional[int] = None) -> Tuple[np.ndarray, bool]:
+def record_audio_with_silence_detection(max_duration: float, disable_silence_detection: bool = False, min_duration: float = 0.0, vad_aggressiveness: Optional[int] = None, initial_audio: Optional[np.ndarray] = None, mic=None, encoder=None, vad_listener=None) -> Tuple[np.ndarray, bool]:
     """Record audio from microphone with automatic silence detection.
     
     Uses WebRTC VAD to detect when the user stops speaking and automatically
@@ -1034,6 +1120,12 @@ def record_audio_with_silence_detection(max_duration: float, disable_silence_det
         disable_silence_detection: If True, disables silence detection and uses fixed duration recording
         min_duration: Minimum recording duration before silence detection can stop (default: 0.0)
         vad_aggressiveness: VAD aggressiveness level (0-3). If None, uses VAD_AGGRESSIVENESS from config
+        initial_audio: Speech already captured (by barge-in during TTS); recording continues from it
+            with speech already detected
+        mic: ListenAhead input stream opened during TTS playback; read instead of opening a new stream
+        encoder: StreamingEncoder fed each captured chunk, so the STT upload is encoded while recording
+        vad_listener: Called with each recorded chunk and its VAD decision (chunk, is_speech); its
+            reset(), if it has one, is called when the recording restarts on a new device
         
     Returns:
         Tuple of (audio_data, speech_detected):
@@ -1043,10 +1135,15 @@ def record_audio_with_silence_detection(max_duration: float, disable_silence_det
     
     logger.info(f"record_audio_with_silence_detection called - VAD_AVAILABLE={VAD_AVAILABLE}, DISABLE_SILENCE_DETECTION={DISABLE_SILENCE_DETECTION}, min_duration={min_duration}")
     
+    def with_initial_audio(recording: np.ndarray) -> np.ndarray:
+        if initial_audio is None or len(initial_audio) == 0:
+            return recording
+        return np.concatenate([initial_audio.reshape(-1), recording.reshape(-1)])
+    
     if not VAD_AVAILABLE:
         logger.warning("webrtcvad not available, falling back to fixed duration recording")
         # For fallback, assume speech is present since we can't detect
-        return (record_audio(max_duration), True)
+        return (with_initial_audio(record_audio(max_duration)), True)
     
     if DISABLE_SILENCE_DETECTION or disable_silence_detection:
         if disable_silence_detection:
@@ -1054,7 +1151,7 @@ def record_audio_with_silence_detection(max_duration: float, disable_silence_det
         else:
             logger.info("Silence detection disabled globally via VOICEMODE_DISABLE_SILENCE_DETECTION")
         # For fallback, assume speech is present since we can't detect
-        return (record_audio(max_duration), True)
+        return (with_initial_audio(record_audio(max_duration)), True)
     
     logger.info(f"🎤 Recording with silence detection (max {max_duration}s)...")
     
@@ -1067,19 +1164,34 @@ def record_audio_with_silence_detection(max_duration: float, disable_silence_det
         chunk_samples = int(SAMPLE_RATE * VAD_CHUNK_DURATION_MS / 1000)
         chunk_duration_s = VAD_CHUNK_DURATION_MS / 1000
         
-        # WebRTC VAD only supports 8000, 16000, or 32000 Hz
-        # We'll tell VAD we're using 16kHz even though we're recording at 24kHz
-        # This requires adjusting our chunk size to match what VAD expects
-        vad_sample_rate = 16000
-        vad_chunk_samples = int(vad_sample_rate * VAD_CHUNK_DURATION_MS / 1000)
+        # WebRTC VAD does not accept 24kHz; the front end resamples the stream to 16kHz
+        from voice_mode.vad_frontend import VADFrontEnd
+        vad_front_end = VADFrontEnd(SAMPLE_RATE, VAD_CHUNK_DURATION_MS)
+        vad_sample_rate = vad_front_end.vad_rate
         
         # Recording state
-        chunks = []
+        # The audio callback writes straight into one buffer sized for max_duration
+        from voice_mode.capture_buffer import CaptureBuffer
+        initial_samples = len(initial_audio) if initial_audio is not None else 0
+        capture = CaptureBuffer(int(max_duration * SAMPLE_RATE) + initial_samples + chunk_samples, CHANNELS)
+        recorded_samples = 0  # Samples the loop has processed; the callback may run ahead
         silence_duration_ms = 0
         recording_duration = 0
         speech_detected = False
         stop_recording = False
         
+        if initial_audio is not None and len(initial_audio):
+            # The user barged in during TTS; continue their utterance
+            initial_flat = capture.append(initial_audio).reshape(-1)
+            recorded_samples = len(initial_flat)
+            if encoder is not None:
+                encoder.feed(initial_flat)
+            if vad_listener is not None:
+                vad_listener(initial_flat, True)
+            recording_duration = len(initial_flat) / SAMPLE_RATE
+            speech_detected = True
+            logger.info(f"🎤 Continuing barge-in speech ({recording_duration:.1f}s already captured)")
+        
         # Use a queue for thread-safe communication
         import queue
         audio_queue = queue.Queue()
@@ -1117,19 +1229,31 @@ def record_audio_with_silence_detection(max_duration: float, disable_silence_det
                     # Signal that we should stop recording due to device error
                     audio_queue.put(None)  # Sentinel value to indicate error
                     return
-            # Put the audio data in the queue for processing
-            audio_queue.put(indata.copy())
+            # Store the block and queue a view of it for processing
+            audio_queue.put(capture.append(indata))
         
         try:
-            # Create continuous input stream
-            with sd.InputStream(samplerate=SAMPLE_RATE,
-                               channels=CHANNELS,
-                               dtype=np.int16,
-                               callback=audio_callback,
-                               blocksize=chunk_samples):
+            if mic is not None:
+                # The microphone was opened during TTS playback; start taking its frames
+                import contextlib
+                audio_queue = mic.queue
+                mic.begin_recording(capture)
+                input_stream = contextlib.nullcontext()
+            else:
+                # Create continuous input stream
+                input_stream = sd.InputStream(samplerate=SAMPLE_RATE,
+                                              channels=CHANNELS,
+                                              dtype=np.int16,
+                                              callback=audio_callback,
+                                              blocksize=chunk_samples)
+            with input_stream:
                 
                 logger.debug("Started continuous audio stream")
                 
+                # recording_duration only grows per chunk; if the stream stops
+                # delivering frames (e.g. a mic that never started), give up on wall-clock time
+                wall_deadline = time.perf_counter() + (max_duration - recording_duration) + 1.0
+                
                 while recording_duration < max_duration and not stop_recording:
                     try:
                         # Get audio chunk from queue with timeout
@@ -1141,23 +1265,15 @@ def record_audio_with_silence_detection(max_duration: float, disable_silence_det
                             # Raise an exception to trigger recovery logic
                             raise sd.PortAudioError("Audio device disconnected or unavailable")
                         
-                        # Flatten for consistency
-                        chunk_flat = chunk.flatten()
-                        chunks.append(chunk_flat)
-                        
-                        # For VAD, we need to downsample from 24kHz to 16kHz
-                        # Use scipy's resample for proper downsampling
-                        from scipy import signal
-                        # Calculate the number of samples we need after resampling
-                        resampled_length = int(len(chunk_flat) * vad_sample_rate / SAMPLE_RATE)
-                        vad_chunk = signal.resample(chunk_flat, resampled_length)
-                        # Take exactly the number of samples VAD expects
-                        vad_chunk = vad_chunk[:vad_chunk_samples].astype(np.int16)
-                        chunk_bytes = vad_chunk.tobytes()
+                        # Already stored in the capture buffer; flatten the view without copying
+                        chunk_flat = chunk.reshape(-1)
+                        recorded_samples += len(chunk_flat)
+                        if encoder is not None:
+                            encoder.feed(chunk_flat)
                         
                         # Check if chunk contains speech
                         try:
-                            is_speech = vad.is_speech(chunk_bytes, vad_sample_rate)
+                            is_speech = vad_front_end.is_speech(vad, chunk_flat)
                             if VAD_DEBUG:
                                 # Log VAD decision every 500ms for less spam
                                 if int(recording_duration * 1000) % 500 == 0:
@@ -1167,6 +1283,13 @@ def record_audio_with_silence_detection(max_duration: float, disable_silence_det
                             logger.warning(f"VAD error: {vad_e}, treating as speech")
                             is_speech = True
                         
+                        if vad_listener is not None:
+                            try:
+                                vad_listener(chunk_flat, is_speech)
+                            except Exception as listener_e:
+                                logger.warning(f"VAD listener error: {listener_e}")
+                                vad_listener = None
+                        
                         # State machine for speech detection
                         if not speech_detected:
                             # WAITING_FOR_SPEECH state
@@ -1208,14 +1331,17 @@ def record_audio_with_silence_detection(max_duration: float, disable_silence_det
                             
                     except queue.Empty:
                         # No audio data available, continue waiting
+                        if time.perf_counter() > wall_deadline:
+                            logger.warning(f"No audio from the input stream - stopping after {max_duration:.0f}s")
+                            break
                         continue
                     except Exception as e:
                         logger.error(f"Error processing audio chunk: {e}")
                         break
             
-            # Concatenate all chunks
-            if chunks:
-                full_recording = np.concatenate(chunks)
+            # The recording is a view of the capture buffer, up to the last chunk processed
+            if recorded_samples:
+                full_recording = capture.view(recorded_samples // CHANNELS).reshape(-1)
                 
                 if not speech_detected:
                     logger.info(f"✓ Recording completed ({recording_duration:.1f}s) - No speech detected")
@@ -1259,9 +1385,14 @@ def record_audio_with_silence_detection(max_duration: float, disable_silence_det
                     except:
                         old_device_name = 'Previous device'
                     
+                    close_output_engine()
                     sd._terminate()
                     sd._initialize()
                     
+                    # The default output may have changed too; re-probe it for chimes
+                    from voice_mode.chime_bank import get_chime_bank
+                    get_chime_bank().invalidate()
+                    
                     # Get new default device info
                     try:
                         new_device = sd.query_devices(kind='input')
@@ -1275,8 +1406,15 @@ def record_audio_with_silence_detection(max_duration: float, disable_silence_det
                     time_module.sleep(0.5)
                     
                     # Try recording again with the new device (recursive call in sync context)
+                    # Audio captured so far is not part of the retried recording: the partial
+                    # upload encoding is discarded and the listeners start over
                     logger.info("Retrying recording with new audio device...")
-                    return record_audio_with_silence_detection(max_duration, disable_silence_detection, min_duration, vad_aggressiveness)
+                    if encoder is not None:
+                        encoder.abort()
+                    if vad_listener is not None and hasattr(vad_listener, "reset"):
+                        vad_listener.reset()
+                    return record_audio_with_silence_detection(max_duration, disable_silence_detection, min_duration, vad_aggressiveness, initial_audio,
+                                                               vad_listener=vad_listener)
                     
                 except Exception as reinit_error:
                     logger.error(f"Failed to reinitialize audio: {reinit_error}")
@@ -1288,7 +1426,7 @@ def record_audio_with_silence_detection(max_duration: float, disable_silence_det
             
             logger.info("Falling back to fixed duration recording")
             # For fallback, assume speech is present since we can't detect
-            return (record_audio(max_duration), True)
+            return (with_initial_audio(record_audio(max_duration)), True)
             
         finally:
             # Restore stdio
@@ -1303,7 +1441,7 @@ def record_audio_with_silence_detection(max_duration: float, disable_silence_det
         logger.error(f"VAD initialization failed: {e}")
         logger.info("Falling back to fixed duration recording")
         # For fallback, assume speech is present since we can't detect
-        return (record_audio(max_duration), True)
+        return (with_initial_audio(record_audio(max_duration)), True)
 
 
 async def check_livekit_available() -> bool:
@@ -1478,6 +1616,63 @@ async def livekit_converse(message: str, room_name: str = "", timeout: float = 6
         return f"LiveKit error: {str(e)}"
 
 
+@mcp.tool()
+async def prefetch_speech(
+    message: str,
+    voice: Optional[str] = None,
+    tts_provider: Optional[Literal["openai", "kokoro"]] = None,
+    tts_model: Optional[str] = None,
+    tts_instructions: Optional[str] = None,
+    speed: Optional[float] = None
+) -> str:
+    """Synthesize your next utterance in the background so converse can play it instantly.
+    
+    Call this when you already know what you will say next (e.g. while another tool
+    call runs), then call converse with the SAME message and voice parameters.
+    Prefetched audio is kept in memory for a short time (CHATTA_TTS_PREFETCH_TTL).
+    
+    Args:
+        message: The exact message you will pass to converse
+        voice: Same as converse's voice parameter
+        tts_provider: Same as converse's tts_provider parameter
+        tts_model: Same as converse's tts_model parameter
+        tts_instructions: Same as converse's tts_instructions parameter
+        speed: Same as converse's speed parameter
+    
+    Returns:
+        Confirmation that synthesis was scheduled
+    """
+    from voice_mode.simple_failover import simple_tts_synthesize
+    from voice_mode.tts_prefetch import get_prefetch_store, make_prefetch_key
+    
+    if not message or not message.strip():
+        return "❌ Error: message cannot be empty"
+    
+    if speed is not None and isinstance(speed, str):
+        try:
+            speed = float(speed)
+        except ValueError:
+            return f"❌ Error: speed must be a number (got '{speed}')"
+    if speed is not None and not (0.25 <= speed <= 4.0):
+        return f"❌ Error: speed must be between 0.25 and 4.0 (got {speed})"
+    
+    key = make_prefetch_key(message, voice, tts_provider, tts_model, tts_instructions, speed)
+    store = get_prefetch_store()
+    scheduled = store.schedule(key, lambda: simple_tts_synthesize(
+        text=message,
+        voice=voice or TTS_VOICES[0],
+        model=tts_model or TTS_MODELS[0],
+        instructions=tts_instructions,
+        initial_provider=tts_provider,
+        speed=speed
+    ))
+    
+    if not scheduled:
+        return "✓ Already prefetched - call converse with the same message"
+    logger.info(f"Prefetching speech: '{message[:50]}{'...' if len(message) > 50 else ''}'")
+    return "✓ Prefetching speech - call converse with the same message to play it"
+
+
 @mcp.tool()
 async def converse(
     message: str,
@@ -1732,10 +1927,16 @@ async def converse(
     await startup_initialization()
     
     # Refresh audio device cache to pick up any device changes (AirPods, etc.)
-    # This takes ~1ms and ensures we use the current default device
+    # This takes ~1ms and ensures we use the current default device. The output
+    # engine reopens its streams on the refreshed device in the background while
+    # TTS is synthesized; it is left alone while a previous turn's audio is still playing
     import sounddevice as sd
-    sd._terminate()
-    sd._initialize()
+    output_engine = get_output_engine()
+    if output_engine is None or not output_engine.is_open:
+        sd._terminate()
+        sd._initialize()
+    else:
+        output_engine.start_refresh()
     
     # Get event logger and start session
     event_logger = get_event_logger()
@@ -1815,6 +2016,10 @@ async def converse(
                         timing_parts.append(f"tts_gen {tts_metrics['generation']:.1f}s")
                     if 'playback' in tts_metrics:
                         timing_parts.append(f"tts_play {tts_metrics['playback']:.1f}s")
+                    if 'device_open' in tts_metrics:
+                        timing_parts.append(f"device_open {tts_metrics['device_open']:.2f}s")
+                    if tts_metrics.get('cache_hit'):
+                        timing_parts.append(f"cache_saved {tts_metrics.get('cache_saved', 0):.1f}s")
                     timing_str = ", ".join(timing_parts)
                 
                 result = f"✓ Message spoken successfully{timing_info}" if success else "✗ Failed to speak message"
@@ -1920,6 +2125,14 @@ async def converse(
         elif transport == "local":
             # Local microphone approach with timing
             timings = {}
+            barge_in = None
+            barge_in_audio = None
+            tts_interrupted = False
+            listen_ahead = None
+            upload_encoder = None
+            incremental = None
+            speculative = None
+            trimmer = None
             try:
                 async with audio_operation_lock:
                     # Speak the message
@@ -1935,7 +2148,7 @@ async def converse(
                         }
                         tts_config = {'provider': 'no-op', 'voice': 'none'}
                     else:
-                        tts_success, tts_metrics, tts_config = await text_to_speech_with_failover(
+                        tts_call = text_to_speech_with_failover(
                             message=message,
                             voice=voice,
                             model=tts_model,
@@ -1944,12 +2157,58 @@ async def converse(
                             initial_provider=tts_provider,
                             speed=speed
                         )
+                        # Barge-in needs the VAD recorder to continue the user's speech; PTT has its own trigger
+                        if BARGE_IN_ENABLED and not PTT_ENABLED and VAD_AVAILABLE:
+                            from voice_mode.barge_in import start_barge_in_monitor
+                            barge_in = start_barge_in_monitor()
+                        # Open the microphone during the last part of playback (VAD recorder only)
+                        mic_opener = None
+                        if (LISTEN_OVERLAP_ENABLED and not PTT_ENABLED and VAD_AVAILABLE
+                                and not (DISABLE_SILENCE_DETECTION or disable_silence_detection)):
+                            from voice_mode.listen_ahead import ListenAhead
+                            listen_ahead = ListenAhead()
+                            # The barge-in monitor already holds an input stream and some
+                            # backends refuse a second one; the mic then opens after playback
+                            if barge_in is None:
+                                mic_opener = asyncio.create_task(listen_ahead.open_near_end_of_playback())
+                        try:
+                            if barge_in:
+                                try:
+                                    tts_result, tts_interrupted = await barge_in.run_interruptible(tts_call)
+                                finally:
+                                    barge_in_audio = barge_in.stop()
+                                # The monitor can fire in the same loop iteration as TTS finishes;
+                                # the user is still talking, so treat it as an interruption too
+                                tts_interrupted = tts_interrupted or barge_in.triggered.is_set()
+                                if tts_result is None:
+                                    tts_success = True
+                                    tts_metrics = {'playback': barge_in.interrupted_after or 0.0}
+                                    tts_config = None
+                                else:
+                                    tts_success, tts_metrics, tts_config = tts_result
+                            else:
+                                tts_success, tts_metrics, tts_config = await tts_call
+                        finally:
+                            if mic_opener:
+                                mic_opener.cancel()
+                    
+                    if tts_interrupted:
+                        timings['barge_in'] = barge_in.interrupted_after or 0.0
+                        if event_logger:
+                            event_logger.log_event(event_logger.TTS_BARGE_IN, {
+                                "interrupted_after": timings['barge_in'],
+                                "captured_samples": len(barge_in_audio) if barge_in_audio is not None else 0
+                            })
                     
                     # Add TTS sub-metrics
                     if tts_metrics:
                         timings['ttfa'] = tts_metrics.get('ttfa', 0)
                         timings['tts_gen'] = tts_metrics.get('generation', 0)
                         timings['tts_play'] = tts_metrics.get('playback', 0)
+                        if 'device_open' in tts_metrics:
+                            timings['device_open'] = tts_metrics['device_open']
+                        if tts_metrics.get('cache_hit'):
+                            timings['cache_saved'] = tts_metrics.get('cache_saved', 0)
                     timings['tts_total'] = time.perf_counter() - tts_start
                     
                     # Log TTS immediately after it completes
@@ -1963,6 +2222,12 @@ async def converse(
                                 tts_timing_parts.append(f"gen {timings['tts_gen']:.1f}s")
                             if 'tts_play' in timings:
                                 tts_timing_parts.append(f"play {timings['tts_play']:.1f}s")
+                            if 'device_open' in timings:
+                                tts_timing_parts.append(f"device_open {timings['device_open']:.2f}s")
+                            if 'cache_saved' in timings:
+                                tts_timing_parts.append(f"cache_saved {timings['cache_saved']:.1f}s")
+                            if 'barge_in' in timings:
+                                tts_timing_parts.append(f"barge_in {timings['barge_in']:.1f}s")
                             tts_timing_str = ", ".join(tts_timing_parts) if tts_timing_parts else None
                             
                             conversation_logger = get_conversation_logger()
@@ -1981,7 +2246,9 @@ async def converse(
                                 time_to_first_audio=timings.get('ttfa') if timings else None,
                                 generation_time=timings.get('tts_gen') if timings else None,
                                 playback_time=timings.get('tts_play') if timings else None,
-                                total_turnaround_time=timings.get('total') if timings else None
+                                total_turnaround_time=timings.get('total') if timings else None,
+                                interrupted=tts_interrupted or None,
+                                interrupted_after=timings.get('barge_in')
                             )
                         except Exception as e:
                             logger.error(f"Failed to log TTS to JSONL: {e}")
@@ -1999,8 +2266,14 @@ async def converse(
                             result = "Error: Could not speak message. All TTS providers failed. Check that local services are running or set OPENAI_API_KEY for cloud fallback."
                         return result
                     
-                    # Brief pause before listening
-                    await asyncio.sleep(0.5)
+                    # Brief pause before listening (the user is already talking after a barge-in).
+                    # With the microphone opened during playback, the settle wait after the chime replaces it
+                    if tts_interrupted:
+                        if listen_ahead:
+                            listen_ahead.close()
+                            listen_ahead = None
+                    elif not listen_ahead:
+                        await asyncio.sleep(0.5)
 
                     # Determine if we should play converse audio feedback
                     # Disable converse feedback when PTT is enabled, as PTT has its own feedback
@@ -2009,8 +2282,8 @@ async def converse(
                         logger.debug("PTT mode is active - disabling converse audio feedback (PTT provides own feedback)")
                         should_play_converse_feedback = False
 
-                    # Play "listening" feedback sound (only if not in PTT mode)
-                    if should_play_converse_feedback:
+                    # Play "listening" feedback sound (only if not in PTT mode, and not over the user after a barge-in)
+                    if should_play_converse_feedback and not tts_interrupted:
                         await play_audio_feedback(
                             "listening",
                             openai_clients,
@@ -2020,6 +2293,20 @@ async def converse(
                             pip_trailing_silence=pip_trailing_silence
                         )
                     
+                    if listen_ahead:
+                        # Wait only as long as the microphone still hears playback or the chime
+                        try:
+                            listen_ahead.open()
+                            settle_time = await listen_ahead.settle()
+                            timings['listen_saved'] = listen_ahead.saved_time
+                            logger.debug(f"Device settled in {settle_time * 1000:.0f}ms "
+                                         f"(mic opened {'during' if listen_ahead.opened_during_playback else 'after'} playback)")
+                        except Exception as e:
+                            logger.warning(f"Could not open microphone early: {e}")
+                            listen_ahead.close()
+                            listen_ahead = None
+                            await asyncio.sleep(0.5)
+                    
                     # Record response
                     logger.info(f"🎤 Listening for {listen_duration} seconds...")
                     
@@ -2029,15 +2316,70 @@ async def converse(
                     
                     record_start = time.perf_counter()
 
+                    # Compressed STT uploads are encoded as the audio is captured
+                    upload_encoder = await start_upload_encoder()
+                    
+                    # The wait for speech and the trailing silence are cut before STT
+                    from voice_mode.config import STT_TRIM_SILENCE
+                    if (STT_TRIM_SILENCE and VAD_AVAILABLE and not PTT_ENABLED
+                            and not (DISABLE_SILENCE_DETECTION or disable_silence_detection)):
+                        from voice_mode.silence_trim import SilenceTrimmer
+                        # The trimmer feeds the upload encoder only the audio it keeps
+                        trimmer = SilenceTrimmer(encoder=upload_encoder)
+                        recorder_encoder = None
+                    else:
+                        recorder_encoder = upload_encoder
+
+                    # Long answers are transcribed in segments while the user talks
+                    from voice_mode.incremental_stt import start_incremental_transcription
+                    incremental = await start_incremental_transcription(trimmer)
+
+                    # STT starts speculatively as soon as the user goes quiet
+                    from voice_mode.speculative_stt import start_speculative_transcription
+                    speculative = start_speculative_transcription(trimmer)
+
+                    # The trimmer goes first so the transcribers can clip with its bounds
+                    vad_listeners = [t for t in (trimmer, incremental, speculative) if t is not None]
+                    vad_listener = VADListenerGroup(vad_listeners) if vad_listeners else None
+
                     # Get appropriate recording function based on PTT_ENABLED
                     recording_function = get_recording_function(ptt_enabled=PTT_ENABLED)
                     recording_method = "PTT" if PTT_ENABLED else "VAD"
 
                     logger.debug(f"About to call recording function ({recording_method}) with duration={listen_duration}, disable_silence_detection={disable_silence_detection}, min_duration={min_listen_duration}, vad_aggressiveness={vad_aggressiveness}")
-                    audio_data, speech_detected = await asyncio.get_event_loop().run_in_executor(
-                        None, recording_function, listen_duration, disable_silence_detection, min_listen_duration, vad_aggressiveness
-                    )
+                    if tts_interrupted:
+                        # Hand the speech captured during TTS to the recorder
+                        audio_data, speech_detected = await asyncio.get_event_loop().run_in_executor(
+                            None, lambda: record_audio_with_silence_detection(
+                                listen_duration, disable_silence_detection, min_listen_duration, vad_aggressiveness,
+                                initial_audio=barge_in_audio, encoder=recorder_encoder, vad_listener=vad_listener
+                            )
+                        )
+                    elif listen_ahead:
+                        # Record from the microphone stream opened during playback
+                        audio_data, speech_detected = await asyncio.get_event_loop().run_in_executor(
+                            None, lambda: record_audio_with_silence_detection(
+                                listen_duration, disable_silence_detection, min_listen_duration, vad_aggressiveness,
+                                mic=listen_ahead, encoder=recorder_encoder, vad_listener=vad_listener
+                            )
+                        )
+                    else:
+                        audio_data, speech_detected = await asyncio.get_event_loop().run_in_executor(
+                            None, lambda: recording_function(
+                                listen_duration, disable_silence_detection, min_listen_duration, vad_aggressiveness,
+                                encoder=recorder_encoder, vad_listener=vad_listener
+                            )
+                        )
                     timings['record'] = time.perf_counter() - record_start
+                    upload = None
+                    if upload_encoder is not None:
+                        if speech_detected and len(audio_data):
+                            upload = await asyncio.get_event_loop().run_in_executor(None, upload_encoder.finish)
+                        else:
+                            upload_encoder.abort()
+                        upload_encoder = None
+                    if listen_ahead:
+                        listen_ahead.close()
                     logger.debug(f"Recording completed via {recording_method}: {len(audio_data)} samples, speech_detected={speech_detected}")
                     
                     # Log recording end
@@ -2085,7 +2427,36 @@ async def converse(
                             event_logger.log_event(event_logger.STT_START)
                         
                         stt_start = time.perf_counter()
-                        response_text = await speech_to_text(audio_data, SAVE_AUDIO, AUDIO_DIR if SAVE_AUDIO else None, transport)
+                        response_text = None
+                        if speculative is not None:
+                            response_text = await speculative.finish(audio_data)
+                            speculative = None
+                        if incremental is not None:
+                            if response_text:
+                                incremental.cancel()
+                            else:
+                                response_text = await incremental.finish(audio_data)
+                            incremental = None
+                        if response_text and SAVE_AUDIO and AUDIO_DIR:
+                            # speech_to_text is skipped, so save the recording here
+                            from voice_mode.audio_encode import encode_wav
+                            recorded = audio_data
+                            save_debug_file(lambda: encode_wav(recorded, SAMPLE_RATE), "stt", "wav", AUDIO_DIR, True,
+                                            get_conversation_logger().conversation_id)
+                        if response_text and SAVE_TRANSCRIPTIONS:
+                            # Likewise its transcription save; the exchange is logged below
+                            stt_config = await get_stt_config()
+                            save_transcription(response_text, prefix="stt", metadata={
+                                "type": "stt",
+                                "model": stt_config.get('model', 'unknown'),
+                                "provider": stt_config.get('provider', 'unknown'),
+                                "timestamp": datetime.now().isoformat()
+                            })
+                        if not response_text:
+                            stt_audio = audio_data
+                            if trimmer is not None:
+                                stt_audio, timings['trimmed'] = trimmer.trim(audio_data)
+                            response_text = await speech_to_text(stt_audio, SAVE_AUDIO, AUDIO_DIR if SAVE_AUDIO else None, transport, upload)
                         timings['stt'] = time.perf_counter() - stt_start
                     
                     # Log STT complete
@@ -2103,6 +2474,10 @@ async def converse(
                             stt_timing_parts.append(f"record {timings['record']:.1f}s")
                         if 'stt' in timings:
                             stt_timing_parts.append(f"stt {timings['stt']:.1f}s")
+                        if 'listen_saved' in timings:
+                            stt_timing_parts.append(f"listen_saved {timings['listen_saved']:.2f}s")
+                        if timings.get('trimmed'):
+                            stt_timing_parts.append(f"trimmed {timings['trimmed']:.1f}s")
                         stt_timing_str = ", ".join(stt_timing_parts) if stt_timing_parts else None
                         
                         conversation_logger = get_conversation_logger()
@@ -2125,7 +2500,8 @@ async def converse(
                             },
                             # Add timing metrics
                             transcription_time=timings.get('stt'),
-                            total_turnaround_time=None  # Will be calculated and added later
+                            total_turnaround_time=None,  # Will be calculated and added later
+                            barge_in=True if tts_interrupted else None
                         )
                     except Exception as e:
                         logger.error(f"Failed to log STT to JSONL: {e}")
@@ -2145,12 +2521,22 @@ async def converse(
                     tts_timing_parts.append(f"gen {timings['tts_gen']:.1f}s")
                 if 'tts_play' in timings:
                     tts_timing_parts.append(f"play {timings['tts_play']:.1f}s")
+                if 'device_open' in timings:
+                    tts_timing_parts.append(f"device_open {timings['device_open']:.2f}s")
+                if 'cache_saved' in timings:
+                    tts_timing_parts.append(f"cache_saved {timings['cache_saved']:.1f}s")
+                if 'barge_in' in timings:
+                    tts_timing_parts.append(f"barge_in {timings['barge_in']:.1f}s")
                 
                 # STT timings
                 if 'record' in timings:
                     stt_timing_parts.append(f"record {timings['record']:.1f}s")
                 if 'stt' in timings:
                     stt_timing_parts.append(f"stt {timings['stt']:.1f}s")
+                if 'listen_saved' in timings:
+                    stt_timing_parts.append(f"listen_saved {timings['listen_saved']:.2f}s")
+                if timings.get('trimmed'):
+                    stt_timing_parts.append(f"trimmed {timings['trimmed']:.1f}s")
                 
                 tts_timing_str = ", ".join(tts_timing_parts) if tts_timing_parts else None
                 stt_timing_str = ", ".join(stt_timing_parts) if stt_timing_parts else None
@@ -2226,6 +2612,16 @@ async def converse(
                 result = f"Error: {str(e)}"
                 return result
             
+            finally:
+                if listen_ahead:
+                    listen_ahead.close()
+                if upload_encoder is not None:
+                    upload_encoder.abort()
+                if incremental is not None:
+                    incremental.cancel()
+                if speculative is not None:
+                    speculative.cancel()
+            
         else:
             result = f"Unknown transport: {transport}"
             return result
@@ -50,5 +50,26 @@ async def voice_mode_info() -> str:
         info.append(f"  Model: {model}")
     except Exception as e:
         info.append(f"\nError getting default TTS: {e}")
-    
+
+    # Connection reuse counters for the shared client pool
+    from voice_mode.connection_pool import client_registry
+    pool_stats = client_registry.get_stats()
+    if pool_stats:
+        info.append(f"\nHTTP Connection Pools:")
+        for url, stats in pool_stats.items():
+            info.append(f"  {url}: {stats['requests']} requests, "
+                        f"{stats['new_connections']} new connections, "
+                        f"{stats['reused_connections']} reused")
+
+    # Local-vs-forwarded lookups made on the STT path
+    from voice_mode.utils.services.common import service_locality
+    locality_stats = service_locality.get_stats()
+    if locality_stats['lookups']:
+        info.append(f"\nService Locality Cache:")
+        info.append(f"  {locality_stats['lookups']} lookups, "
+                    f"{locality_stats['hit_rate']:.0%} hit rate, "
+                    f"{locality_stats['invalidations']} invalidations")
+        info.append(f"  Uncached lookup cost: {locality_stats['avg_lookup_ms']:.0f}ms avg "
+                    f"({locality_stats['lookup_seconds']:.2f}s total)")
+
     return "\n".join(info)
\ No newline at end of file
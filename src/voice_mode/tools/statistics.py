@@ -7,6 +7,10 @@ from datetime import datetime
 
 from ..server import mcp
 from ..statistics import get_statistics_tracker, track_conversation
+from ..speculative_stt import get_speculation_stats
+from ..tts_cache import get_tts_cache
+from ..tts_hedging import get_hedge_stats
+from ..tts_prefetch import get_prefetch_store
 from ..config import logger
 
 
@@ -20,6 +24,7 @@ async def voice_statistics() -> str:
     - Average turnaround times (TTFA, TTS, STT)
     - Min/max performance metrics
     - Provider usage statistics
+    - TTS cache hit rate and synthesis time saved
     - Recent interaction history
     
     Returns:
@@ -108,6 +113,13 @@ async def voice_statistics_reset() -> str:
         
         tracker.clear_statistics()
         
+        tts_cache = get_tts_cache()
+        if tts_cache:
+            tts_cache.reset_stats()
+        get_hedge_stats().reset()
+        get_prefetch_store().reset_stats()
+        get_speculation_stats().reset()
+        
         logger.info("Voice conversation statistics reset")
         
         result = []
@@ -201,6 +213,8 @@ async def voice_statistics_recent(limit: int = 10) -> str:
                     timing_parts.append(f"TTS-gen: {metric.tts_generation:.1f}s")
                 if metric.tts_playback:
                     timing_parts.append(f"TTS-play: {metric.tts_playback:.1f}s")
+                if metric.tts_cache_saved:
+                    timing_parts.append(f"TTS cached (saved {metric.tts_cache_saved:.1f}s)")
                 if metric.stt_processing:
                     timing_parts.append(f"STT: {metric.stt_processing:.1f}s")
                 if metric.total_time:
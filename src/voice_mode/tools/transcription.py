@@ -0,0 +1,58 @@
+"""Batch transcription tool for saved and imported audio."""
+
+import logging
+from typing import Optional, Union
+
+from voice_mode.server import mcp
+from voice_mode.config import AUDIO_DIR, BATCH_STT_CONCURRENCY
+from voice_mode.batch_stt import transcribe_batch
+
+logger = logging.getLogger("voice-mode")
+
+
+@mcp.tool()
+async def batch_transcribe(
+    path: Optional[str] = None,
+    output: Optional[str] = None,
+    checkpoint: Optional[str] = None,
+    concurrency: Union[int, str] = BATCH_STT_CONCURRENCY,
+    model: Optional[str] = None
+) -> str:
+    """Transcribe a directory or glob of audio files into the exchanges log.
+
+    Requests are spread over every healthy STT endpoint, with at most
+    `concurrency` in flight at once. Results are appended in the exchanges
+    JSONL format, in the dated exchanges file for the day each recording
+    was made, so they show up in the exchanges CLI and browser. Files
+    finished by an earlier run (per the checkpoint file) are skipped, so an
+    interrupted batch can simply be run again.
+
+    Args:
+        path: Directory (searched recursively), file or glob (default: saved audio directory)
+        output: Single JSONL file to append every result to instead (date-based exchanges views don't read it)
+        checkpoint: Checkpoint file (default: output file + ".checkpoint", or logs/conversations/batch_transcription.checkpoint)
+        concurrency: Maximum transcriptions in flight across all endpoints
+        model: STT model to request (default: the endpoint's model)
+
+    Returns:
+        File counts, failures and throughput in audio-seconds per wall-second
+    """
+    if isinstance(concurrency, str):
+        try:
+            concurrency = int(concurrency)
+        except ValueError:
+            return f"❌ Error: concurrency must be a number (got '{concurrency}')"
+    if concurrency < 1:
+        return f"❌ Error: concurrency must be at least 1 (got {concurrency})"
+
+    target = path or str(AUDIO_DIR)
+    try:
+        report = await transcribe_batch(target, output=output, checkpoint=checkpoint,
+                                        concurrency=concurrency, model=model)
+    except Exception as e:
+        logger.error(f"Batch transcription of {target} failed: {e}")
+        return f"❌ Error: batch transcription failed: {e}"
+
+    if report.files == 0:
+        return f"No audio files found in {target}"
+    return f"Batch transcription of {target}\n{report.format()}"
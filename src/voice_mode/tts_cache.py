@@ -0,0 +1,311 @@
+"""
+Content-addressed on-disk cache for synthesized speech.
+
+Agents repeat many identical utterances ("Got it", "Let me check", error
+prompts). Each TTS request is hashed on everything that affects the audio
+and the decoded 16-bit PCM is stored under the cache directory, so a repeat
+can be played back without any network round trip.
+
+Entries are evicted least-recently-used first once the cache grows past its
+size limit, and entries that have not been used within the age limit are
+dropped entirely.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+import numpy as np
+
+logger = logging.getLogger("voice-mode")
+
+
+def make_cache_key(
+    text: str,
+    voice: str,
+    model: str,
+    speed: Optional[float],
+    instructions: Optional[str],
+    audio_format: str,
+    provider: str
+) -> str:
+    """Build the content hash for a TTS request.
+
+    Args:
+        text: Text being spoken
+        voice: TTS voice
+        model: TTS model
+        speed: Speech rate, or None for the provider default
+        instructions: Tone instructions sent with the request, if any
+        audio_format: Response format requested from the provider
+        provider: Endpoint type (e.g. "openai", "kokoro")
+
+    Returns:
+        Hex digest identifying the synthesized audio
+    """
+    payload = json.dumps(
+        [text, voice, model, speed, instructions or None, audio_format, provider],
+        ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CachedAudio:
+    """Decoded audio served from the cache."""
+    samples: np.ndarray  # int16, shape (frames,) or (frames, channels)
+    sample_rate: int
+    channels: int
+    synthesis_time: float  # Seconds the original request took before audio could start
+
+    @property
+    def duration(self) -> float:
+        """Audio duration in seconds."""
+        return len(self.samples) / self.sample_rate if self.sample_rate else 0.0
+
+
+class TTSCache:
+    """LRU cache of decoded TTS audio stored as raw PCM files.
+
+    Each entry is a ``<key>.pcm`` file with a ``<key>.json`` sidecar holding
+    the sample rate, channel count and original synthesis time. The PCM file's
+    modification time doubles as the last-access time for LRU ordering.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_bytes: int,
+        max_age_seconds: float,
+        max_text_length: int = 500
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self.max_text_length = max_text_length
+        self._lock = threading.Lock()
+
+        # Session counters
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self.saved_seconds = 0.0
+
+    def _paths(self, key: str):
+        return self.cache_dir / f"{key}.pcm", self.cache_dir / f"{key}.json"
+
+    def is_cacheable(self, text: str) -> bool:
+        """Check whether an utterance is short enough to be worth caching."""
+        return bool(text) and len(text) <= self.max_text_length
+
+    def get(self, key: str) -> Optional[CachedAudio]:
+        """Look up cached audio, counting the hit or miss.
+
+        Args:
+            key: Key from make_cache_key()
+
+        Returns:
+            CachedAudio on a hit, None on a miss
+        """
+        pcm_path, meta_path = self._paths(key)
+        with self._lock:
+            try:
+                stat = pcm_path.stat()
+                if self.max_age_seconds and time.time() - stat.st_mtime > self.max_age_seconds:
+                    self._remove(key)
+                    self.misses += 1
+                    return None
+
+                meta = json.loads(meta_path.read_text())
+                samples = np.fromfile(pcm_path, dtype=np.int16)
+                channels = int(meta.get("channels", 1))
+                if channels > 1:
+                    samples = samples.reshape((-1, channels))
+                cached = CachedAudio(
+                    samples=samples,
+                    sample_rate=int(meta["sample_rate"]),
+                    channels=channels,
+                    synthesis_time=float(meta.get("synthesis_time", 0.0))
+                )
+
+                # Mark as recently used for LRU ordering
+                os.utime(pcm_path)
+            except FileNotFoundError:
+                self.misses += 1
+                return None
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"Discarding unreadable TTS cache entry {key[:12]}: {e}")
+                self._remove(key)
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self.saved_seconds += cached.synthesis_time
+            logger.debug(f"TTS cache hit {key[:12]} ({cached.duration:.1f}s audio)")
+            return cached
+
+    def put(
+        self,
+        key: str,
+        pcm: Union[bytes, np.ndarray],
+        sample_rate: int,
+        synthesis_time: float,
+        channels: int = 1
+    ) -> bool:
+        """Store decoded audio and evict old entries if over the size limit.
+
+        Args:
+            key: Key from make_cache_key()
+            pcm: 16-bit PCM as raw bytes or an int16 array
+            sample_rate: Sample rate of the audio
+            synthesis_time: Seconds the request took before audio could start
+            channels: Number of interleaved channels
+
+        Returns:
+            True if the entry was written
+        """
+        data = pcm.astype(np.int16, copy=False).tobytes() if isinstance(pcm, np.ndarray) else bytes(pcm)
+        if not data:
+            return False
+
+        pcm_path, meta_path = self._paths(key)
+        meta = {
+            "sample_rate": sample_rate,
+            "channels": channels,
+            "synthesis_time": round(synthesis_time, 3),
+            "created": time.time(),
+        }
+        with self._lock:
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                # Write the sidecar first; the PCM file appearing marks the entry complete
+                tmp_meta = meta_path.with_suffix(".json.tmp")
+                tmp_meta.write_text(json.dumps(meta))
+                os.replace(tmp_meta, meta_path)
+
+                tmp_pcm = pcm_path.with_suffix(".pcm.tmp")
+                tmp_pcm.write_bytes(data)
+                os.replace(tmp_pcm, pcm_path)
+            except OSError as e:
+                logger.warning(f"Failed to write TTS cache entry: {e}")
+                return False
+
+            self.stores += 1
+            logger.debug(f"TTS cache stored {key[:12]} ({len(data)} bytes)")
+            self._evict()
+            return True
+
+    def _remove(self, key: str) -> None:
+        for path in self._paths(key):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.debug(f"Failed to remove TTS cache file {path}: {e}")
+
+    def _evict(self) -> int:
+        """Drop expired entries, then least recently used ones until under the size limit."""
+        try:
+            entries = []
+            for pcm_path in self.cache_dir.glob("*.pcm"):
+                stat = pcm_path.stat()
+                entries.append((stat.st_mtime, stat.st_size, pcm_path.stem))
+        except OSError as e:
+            logger.debug(f"Failed to scan TTS cache: {e}")
+            return 0
+
+        entries.sort()
+        now = time.time()
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for mtime, size, key in entries:
+            expired = self.max_age_seconds and now - mtime > self.max_age_seconds
+            if not expired and total <= self.max_bytes:
+                break
+            self._remove(key)
+            total -= size
+            removed += 1
+
+        if removed:
+            self.evictions += removed
+            logger.debug(f"TTS cache evicted {removed} entries ({total} bytes remain)")
+        return removed
+
+    def evict(self) -> int:
+        """Run eviction now.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            return self._evict()
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        with self._lock:
+            for pcm_path in self.cache_dir.glob("*.pcm"):
+                self._remove(pcm_path.stem)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters and current disk usage."""
+        with self._lock:
+            entries = 0
+            size_bytes = 0
+            try:
+                for pcm_path in self.cache_dir.glob("*.pcm"):
+                    entries += 1
+                    size_bytes += pcm_path.stat().st_size
+            except OSError:
+                pass
+
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "saved_seconds": self.saved_seconds,
+                "stores": self.stores,
+                "evictions": self.evictions,
+                "entries": entries,
+                "size_bytes": size_bytes,
+            }
+
+    def reset_stats(self) -> None:
+        """Reset the session counters without touching cached entries."""
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.stores = 0
+            self.evictions = 0
+            self.saved_seconds = 0.0
+
+
+# Global TTS cache instance
+_tts_cache: Optional[TTSCache] = None
+
+
+def get_tts_cache() -> Optional[TTSCache]:
+    """Get the global TTS cache, or None if caching is disabled."""
+    global _tts_cache
+    from .config import (
+        TTS_CACHE_ENABLED, TTS_CACHE_DIR, TTS_CACHE_MAX_MB,
+        TTS_CACHE_MAX_AGE_DAYS, TTS_CACHE_MAX_TEXT_LENGTH
+    )
+    if not TTS_CACHE_ENABLED:
+        return None
+    if _tts_cache is None:
+        _tts_cache = TTSCache(
+            cache_dir=TTS_CACHE_DIR,
+            max_bytes=int(TTS_CACHE_MAX_MB * 1024 * 1024),
+            max_age_seconds=TTS_CACHE_MAX_AGE_DAYS * 86400,
+            max_text_length=TTS_CACHE_MAX_TEXT_LENGTH
+        )
+    return _tts_cache
@@ -0,0 +1,328 @@
+"""
+Hedged TTS requests across endpoints.
+
+Walking TTS_BASE_URLS strictly in order means a slow-but-alive local
+server makes every turn slow, and a hung one costs the full request
+timeout before the next endpoint is tried. With hedging, the preferred
+endpoint is requested first and, if it hasn't produced its first audio
+bytes within the hedge delay, the next endpoint is raced against it.
+Whichever produces audio first is played and the other request is
+cancelled.
+
+The hedge delay is either fixed or learned from the preferred endpoint's
+recent time-to-first-byte (p95), so the second request is only sent when
+the first is genuinely slower than usual.
+"""
+
+import asyncio
+import logging
+import sys
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from .config import validate_audio_format
+
+logger = logging.getLogger("voice-mode")
+
+# Time-to-first-byte samples kept per endpoint for the learned delay
+LATENCY_WINDOW = 50
+# Samples needed before the learned delay replaces the default
+MIN_LATENCY_SAMPLES = 5
+
+
+@dataclass
+class HedgeCandidate:
+    """A TTS endpoint that can take part in a race."""
+    base_url: str
+    client: Any
+    voice: str
+
+    @property
+    def provider(self) -> str:
+        # Same heuristic text_to_speech uses to pick formats
+        return "openai" if "openai" in self.base_url else "kokoro"
+
+
+@dataclass
+class EndpointHedgeStats:
+    """Race outcomes for one endpoint."""
+    races: int = 0  # Races this endpoint took part in
+    wins: int = 0
+    hedges_fired: int = 0  # Times it was started as the hedge
+    hedge_wins: int = 0  # Wins when started as the hedge
+    cancelled: int = 0  # Times it lost and its request was cancelled
+    failures: int = 0
+    first_byte: deque = field(default_factory=lambda: deque(maxlen=LATENCY_WINDOW))
+
+    def p95(self) -> Optional[float]:
+        """95th percentile time-to-first-byte, or None with too few samples."""
+        if len(self.first_byte) < MIN_LATENCY_SAMPLES:
+            return None
+        ordered = sorted(self.first_byte)
+        return ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))]
+
+
+class HedgeStats:
+    """Per-endpoint hedge statistics and the learned hedge delay."""
+
+    def __init__(self):
+        self._endpoints: Dict[str, EndpointHedgeStats] = {}
+
+    def endpoint(self, base_url: str) -> EndpointHedgeStats:
+        if base_url not in self._endpoints:
+            self._endpoints[base_url] = EndpointHedgeStats()
+        return self._endpoints[base_url]
+
+    def hedge_delay(self, base_url: str, fixed_ms: Optional[float], default_ms: float) -> float:
+        """Seconds to wait on an endpoint before firing the hedge.
+
+        Args:
+            base_url: Endpoint being waited on
+            fixed_ms: Configured delay, or None to learn it from the endpoint's p95
+            default_ms: Delay used until enough samples have been collected
+        """
+        if fixed_ms is not None:
+            return fixed_ms / 1000.0
+        p95 = self.endpoint(base_url).p95()
+        return p95 if p95 is not None else default_ms / 1000.0
+
+    def record_first_byte(self, base_url: str, latency: float):
+        self.endpoint(base_url).first_byte.append(latency)
+
+    def record_race(self, started: List[str], winner: Optional[str], failed: List[str]):
+        """Record the outcome of one race.
+
+        Args:
+            started: Endpoints that were requested, preferred first
+            winner: Endpoint whose audio was played, or None if all failed
+            failed: Endpoints whose request errored
+        """
+        for position, base_url in enumerate(started):
+            stats = self.endpoint(base_url)
+            stats.races += 1
+            if position > 0:
+                stats.hedges_fired += 1
+            if base_url == winner:
+                stats.wins += 1
+                if position > 0:
+                    stats.hedge_wins += 1
+            elif base_url in failed:
+                stats.failures += 1
+            else:
+                stats.cancelled += 1
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-endpoint statistics for reporting."""
+        result = {}
+        for base_url, stats in self._endpoints.items():
+            result[base_url] = {
+                'races': stats.races,
+                'wins': stats.wins,
+                'hedges_fired': stats.hedges_fired,
+                'hedge_wins': stats.hedge_wins,
+                'cancelled': stats.cancelled,
+                'failures': stats.failures,
+                'p95_first_byte': stats.p95(),
+            }
+        return result
+
+    def log_summary(self):
+        for base_url, stats in self.get_stats().items():
+            if not stats['races']:
+                continue
+            p95 = f"{stats['p95_first_byte']:.3f}s" if stats['p95_first_byte'] is not None else "n/a"
+            logger.info(f"TTS hedge stats {base_url}: {stats['wins']}/{stats['races']} wins, "
+                        f"{stats['hedge_wins']}/{stats['hedges_fired']} hedge wins, "
+                        f"{stats['cancelled']} cancelled, {stats['failures']} failed, p95 first byte {p95}")
+
+    def reset(self):
+        self._endpoints.clear()
+
+
+_hedge_stats = HedgeStats()
+
+
+def get_hedge_stats() -> HedgeStats:
+    """Get the global hedge statistics."""
+    return _hedge_stats
+
+
+class _OpenedStream:
+    """A streaming response whose first chunk has already arrived."""
+
+    def __init__(self, context, response, chunks: AsyncIterator[bytes], first_chunk: bytes):
+        self.context = context
+        self.response = response
+        self.chunks = chunks
+        self.first_chunk = first_chunk
+
+    async def iter_bytes(self, chunk_size: Optional[int] = None) -> AsyncIterator[bytes]:
+        if self.first_chunk:
+            yield self.first_chunk
+        async for chunk in self.chunks:
+            yield chunk
+
+    async def read(self) -> bytes:
+        return b"".join([chunk async for chunk in self.iter_bytes()])
+
+    async def aclose(self, *exc_info):
+        await self.context.__aexit__(*(exc_info or (None, None, None)))
+
+
+async def _open_stream(candidate: HedgeCandidate, params: dict, chunk_size: int) -> _OpenedStream:
+    """Send the request and wait for its first audio bytes."""
+    context = candidate.client.audio.speech.with_streaming_response.create(**params)
+    response = await context.__aenter__()
+    try:
+        chunks = response.iter_bytes(chunk_size=chunk_size)
+        try:
+            first_chunk = await chunks.__anext__()
+        except StopAsyncIteration:
+            first_chunk = b""
+    except BaseException:
+        await context.__aexit__(*sys.exc_info())
+        raise
+    return _OpenedStream(context, response, chunks, first_chunk)
+
+
+class _HedgedRequest:
+    """Async context manager returned by HedgedSpeechClient's create()."""
+
+    def __init__(self, client: "HedgedSpeechClient", params: dict):
+        self.client = client
+        self.params = params
+        self.stream: Optional[_OpenedStream] = None
+
+    async def __aenter__(self) -> _OpenedStream:
+        self.stream = await self.client._open(self.params)
+        return self.stream
+
+    async def __aexit__(self, *exc_info):
+        if self.stream:
+            await self.stream.aclose(*exc_info)
+
+
+class HedgedSpeechClient:
+    """Stands in for an OpenAI client, racing TTS requests across endpoints.
+
+    Only ``audio.speech.with_streaming_response.create`` is provided, which
+    is all text_to_speech uses. The first request of an utterance is raced;
+    the winner is then pinned so later segment requests go straight to it.
+    Segments requested while that race is still running wait for it rather
+    than racing on their own, so one utterance is spoken by one endpoint.
+    """
+
+    def __init__(
+        self,
+        candidates: List[HedgeCandidate],
+        stats: Optional[HedgeStats] = None,
+        delay_ms: Optional[float] = None,
+        default_delay_ms: float = 600,
+        chunk_size: int = 4096
+    ):
+        self.candidates = candidates
+        self.stats = stats or get_hedge_stats()
+        self.delay_ms = delay_ms
+        self.default_delay_ms = default_delay_ms
+        self.chunk_size = chunk_size
+        self.winner: Optional[HedgeCandidate] = None
+        self.hedged = False  # Whether a hedge request was fired
+        # Pipelined segments wait for the first race instead of starting their own
+        self._race_lock = asyncio.Lock()
+        self.audio = SimpleNamespace(speech=SimpleNamespace(
+            with_streaming_response=SimpleNamespace(create=self._create)
+        ))
+
+    @property
+    def served_by(self) -> Optional[str]:
+        """Base URL of the endpoint whose audio was played."""
+        return self.winner.base_url if self.winner else None
+
+    def _create(self, **params) -> _HedgedRequest:
+        return _HedgedRequest(self, params)
+
+    def _params_for(self, candidate: HedgeCandidate, params: dict) -> dict:
+        return {**params, "voice": candidate.voice}
+
+    async def _timed_open(self, candidate: HedgeCandidate, params: dict) -> _OpenedStream:
+        start = time.perf_counter()
+        stream = await _open_stream(candidate, self._params_for(candidate, params), self.chunk_size)
+        self.stats.record_first_byte(candidate.base_url, time.perf_counter() - start)
+        return stream
+
+    async def _open(self, params: dict) -> _OpenedStream:
+        if self.winner is None:
+            async with self._race_lock:
+                if self.winner is None:
+                    return await self._race(params)
+        return await self._timed_open(self.winner, params)
+
+    async def _race(self, params: dict) -> _OpenedStream:
+        # Only race endpoints that can serve the same format
+        audio_format = params.get("response_format")
+        queue = [c for c in self.candidates
+                 if not audio_format or validate_audio_format(audio_format, c.provider, "tts") == audio_format]
+        if not queue:
+            queue = self.candidates[:1]
+
+        pending: Dict[asyncio.Task, HedgeCandidate] = {}
+        started: List[str] = []
+        failed: List[str] = []
+        last_error: Optional[BaseException] = None
+        winner_stream: Optional[_OpenedStream] = None
+
+        def launch():
+            candidate = queue.pop(0)
+            if started:
+                self.hedged = True
+                logger.info(f"TTS hedge: no audio yet, also requesting {candidate.base_url}")
+            started.append(candidate.base_url)
+            pending[asyncio.create_task(self._timed_open(candidate, params))] = candidate
+
+        launch()
+        try:
+            while winner_stream is None:
+                timeout = None
+                if queue:
+                    # Wait on the endpoint started most recently
+                    timeout = self.stats.hedge_delay(started[-1], self.delay_ms, self.default_delay_ms)
+                done, _ = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+
+                if not done:
+                    launch()
+                    continue
+
+                for task in done:
+                    candidate = pending.pop(task)
+                    if task.exception() is not None:
+                        last_error = task.exception()
+                        failed.append(candidate.base_url)
+                        logger.warning(f"TTS hedge: {candidate.base_url} failed: {last_error}")
+                    elif winner_stream is None:
+                        winner_stream = task.result()
+                        self.winner = candidate
+                    else:
+                        # Finished in the same instant as the winner
+                        await task.result().aclose()
+
+                if winner_stream is None and not pending:
+                    if not queue:
+                        raise last_error
+                    # Fail over immediately rather than waiting out the delay
+                    launch()
+        finally:
+            for task in pending:
+                task.cancel()
+            for result in await asyncio.gather(*pending, return_exceptions=True):
+                if isinstance(result, _OpenedStream):
+                    await result.aclose()
+            self.stats.record_race(started, self.served_by, failed)
+            if len(started) > 1 or failed:
+                logger.info(f"TTS hedge: {self.served_by or 'no endpoint'} won "
+                            f"({len(started)} requested, {len(failed)} failed)")
+                self.stats.log_summary()
+
+        return winner_stream
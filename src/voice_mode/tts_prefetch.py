@@ -0,0 +1,211 @@
+"""
+Speculative TTS prefetch.
+
+An agent often knows its next utterance before it calls ``converse`` (for
+example while another tool call runs). The ``prefetch_speech`` tool
+synthesizes that text in the background into a short-lived in-memory slot;
+a later ``converse`` with the same message and voice parameters plays the
+prefetched audio instead of waiting for synthesis.
+
+Slots expire after a TTL and the store is capped in memory, dropping the
+oldest slots first. Prefetches that are never used are counted as wasted.
+A prefetch that is still synthesizing is waited for only up to a limit;
+after that converse synthesizes the message itself.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from .tts_cache import CachedAudio
+
+logger = logging.getLogger("voice-mode")
+
+
+def make_prefetch_key(
+    message: str,
+    voice: Optional[str] = None,
+    tts_provider: Optional[str] = None,
+    tts_model: Optional[str] = None,
+    tts_instructions: Optional[str] = None,
+    speed: Optional[float] = None
+) -> Tuple:
+    """Key a prefetch on the converse parameters that affect the audio."""
+    return (message.strip(), voice, tts_provider, tts_model, tts_instructions or None, speed)
+
+
+@dataclass
+class PrefetchSlot:
+    """A prefetched utterance, either still synthesizing or ready."""
+    key: Tuple
+    created: float = field(default_factory=time.monotonic)
+    task: Optional[asyncio.Task] = None
+    audio: Optional[CachedAudio] = None
+    config: Optional[Dict[str, Any]] = None
+
+    @property
+    def size_bytes(self) -> int:
+        return self.audio.samples.nbytes if self.audio is not None else 0
+
+
+class TTSPrefetchStore:
+    """In-memory slots of speculatively synthesized speech."""
+
+    def __init__(self, ttl: float, max_bytes: int, wait: float = 10.0):
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.wait = wait
+        self._slots: Dict[Tuple, PrefetchSlot] = {}
+
+        # Session counters (a miss is a lookup that found other utterances prefetched)
+        self.requests = 0
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evicted = 0
+        self.failures = 0
+        self.saved_seconds = 0.0
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    @property
+    def size_bytes(self) -> int:
+        return sum(slot.size_bytes for slot in self._slots.values())
+
+    def schedule(
+        self,
+        key: Tuple,
+        synthesize: Callable[[], Awaitable[Tuple[CachedAudio, Dict[str, Any]]]]
+    ) -> bool:
+        """Start synthesizing into a slot in the background.
+
+        Args:
+            key: Key from make_prefetch_key()
+            synthesize: Coroutine function returning (CachedAudio, config)
+
+        Returns:
+            False if the utterance is already prefetched or in progress
+        """
+        self._expire()
+        if key in self._slots:
+            return False
+
+        slot = PrefetchSlot(key=key)
+        slot.task = asyncio.create_task(self._fill(slot, synthesize))
+        self._slots[key] = slot
+        self.requests += 1
+        return True
+
+    async def _fill(self, slot: PrefetchSlot, synthesize) -> None:
+        try:
+            slot.audio, slot.config = await synthesize()
+        except Exception as e:
+            logger.warning(f"TTS prefetch failed: {e}")
+            self.failures += 1
+            self._slots.pop(slot.key, None)
+            return
+        # Expiry counts from when the audio became ready
+        slot.created = time.monotonic()
+        self._enforce_cap()
+
+    async def take(self, key: Tuple) -> Optional[Tuple[CachedAudio, Dict[str, Any]]]:
+        """Claim a prefetched utterance, waiting if it is still synthesizing.
+
+        Returns:
+            (CachedAudio, config) on a hit, None on a miss
+        """
+        self._expire()
+        slot = self._slots.get(key)
+        if slot is None:
+            # Only a miss if something was prefetched, just not this utterance
+            if self._slots:
+                self.misses += 1
+            return None
+
+        if slot.audio is None and slot.task is not None:
+            # Still synthesizing - finishing it is usually faster than starting over
+            try:
+                await asyncio.wait_for(asyncio.shield(slot.task), self.wait)
+            except asyncio.TimeoutError:
+                logger.warning(f"TTS prefetch not ready after {self.wait:.0f}s - synthesizing normally")
+                slot.task.cancel()
+            except asyncio.CancelledError:
+                # clear() cancelled the prefetch; only propagate our own cancellation
+                if not slot.task.cancelled():
+                    raise
+        self._slots.pop(key, None)
+
+        if slot.audio is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.saved_seconds += slot.audio.synthesis_time
+        return slot.audio, slot.config
+
+    def _expire(self) -> None:
+        now = time.monotonic()
+        for key, slot in list(self._slots.items()):
+            if slot.audio is not None and now - slot.created > self.ttl:
+                del self._slots[key]
+                self.expired += 1
+                logger.debug(f"TTS prefetch expired unused: '{key[0][:40]}'")
+
+    def _enforce_cap(self) -> None:
+        ready = sorted((s for s in self._slots.values() if s.audio is not None), key=lambda s: s.created)
+        total = sum(slot.size_bytes for slot in ready)
+        for slot in ready:
+            if total <= self.max_bytes:
+                break
+            del self._slots[slot.key]
+            total -= slot.size_bytes
+            self.evicted += 1
+            logger.debug(f"TTS prefetch evicted for memory: '{slot.key[0][:40]}'")
+
+    def clear(self) -> None:
+        """Drop every slot, cancelling synthesis still in progress."""
+        for slot in self._slots.values():
+            if slot.task is not None and not slot.task.done():
+                slot.task.cancel()
+        self._slots.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Session prefetch statistics."""
+        lookups = self.hits + self.misses
+        return {
+            'requests': self.requests,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'wasted': self.expired + self.evicted + self.failures,
+            'expired': self.expired,
+            'evicted': self.evicted,
+            'failures': self.failures,
+            'saved_seconds': self.saved_seconds,
+            'slots': len(self._slots),
+            'size_bytes': self.size_bytes,
+        }
+
+    def reset_stats(self) -> None:
+        self.requests = self.hits = self.misses = 0
+        self.expired = self.evicted = self.failures = 0
+        self.saved_seconds = 0.0
+
+
+_prefetch_store: Optional[TTSPrefetchStore] = None
+
+
+def get_prefetch_store() -> TTSPrefetchStore:
+    """Get the global prefetch store."""
+    global _prefetch_store
+    if _prefetch_store is None:
+        from .config import TTS_PREFETCH_TTL, TTS_PREFETCH_MAX_MB, TTS_PREFETCH_WAIT
+        _prefetch_store = TTSPrefetchStore(
+            ttl=TTS_PREFETCH_TTL,
+            max_bytes=int(TTS_PREFETCH_MAX_MB * 1024 * 1024),
+            wait=TTS_PREFETCH_WAIT
+        )
+    return _prefetch_store
@@ -48,6 +48,7 @@ class EventLogger:
     TTS_PLAYBACK_START = "TTS_PLAYBACK_START"
     TTS_PLAYBACK_END = "TTS_PLAYBACK_END"
     TTS_ERROR = "TTS_ERROR"
+    TTS_BARGE_IN = "TTS_BARGE_IN"
     
     # Recording Events
     RECORDING_START = "RECORDING_START"
@@ -1,17 +1,105 @@
 """Common utilities for service management tools."""
 
+import os
 import psutil
 import socket
-from typing import Optional, Tuple
+import sys
+import threading
+import time
+from typing import Any, Dict, Iterator, Optional, Set, Tuple
 import logging
 
 logger = logging.getLogger("voice-mode")
 
 
+# Kernel socket tables, parsed by the Linux fast path
+PROC_NET_TCP = ("/proc/net/tcp", "/proc/net/tcp6")
+TCP_LISTEN = "0A"
+
+# Port forwards, not actual services
+SSH_PROCESS_NAMES = ('ssh', 'sshd')
+
+
 def find_process_by_port(port: int) -> Optional[psutil.Process]:
     """Find a process listening on the specified port.
     
     Returns None if port is only accessible via SSH forwarding or other non-local means.
+    On Linux the socket tables in /proc are read directly; elsewhere (or if
+    /proc can't be read) every process is checked with psutil.
+    """
+    if sys.platform.startswith("linux"):
+        try:
+            return _find_process_by_port_proc(port)
+        except OSError as e:
+            logger.debug(f"/proc lookup for port {port} failed, using psutil: {e}")
+    return _find_process_by_port_psutil(port)
+
+
+def _listen_inodes(port: int, net_files: Tuple[str, ...] = PROC_NET_TCP) -> Set[int]:
+    """Socket inodes listening on port, from /proc/net/tcp and tcp6."""
+    inodes = set()
+    found_table = False
+    for path in net_files:
+        try:
+            with open(path) as f:
+                lines = f.readlines()[1:]
+        except FileNotFoundError:
+            continue  # No IPv6
+        found_table = True
+        for line in lines:
+            # sl local_address rem_address st tx:rx tr:when retrnsmt uid timeout inode
+            fields = line.split()
+            if len(fields) < 10 or fields[3] != TCP_LISTEN:
+                continue
+            if int(fields[1].rsplit(":", 1)[1], 16) == port:
+                inode = int(fields[9])
+                if inode:
+                    inodes.add(inode)
+    if not found_table:
+        raise FileNotFoundError(f"No socket tables at {', '.join(net_files)}")
+    return inodes
+
+
+def _pids_for_inodes(inodes: Set[int]) -> Iterator[int]:
+    """PIDs holding a file descriptor for any of the socket inodes."""
+    targets = {f"socket:[{inode}]" for inode in inodes}
+    for entry in os.scandir("/proc"):
+        if not entry.name.isdigit():
+            continue
+        try:
+            for fd in os.scandir(f"/proc/{entry.name}/fd"):
+                try:
+                    if os.readlink(fd.path) in targets:
+                        yield int(entry.name)
+                        break
+                except OSError:
+                    continue  # fd closed while scanning
+        except OSError:
+            continue  # Exited, or another user's process
+
+
+def _find_process_by_port_proc(port: int) -> Optional[psutil.Process]:
+    """Linux fast path: resolve the LISTEN socket's inode, then its owner."""
+    inodes = _listen_inodes(port)
+    if not inodes:
+        return None
+    for pid in _pids_for_inodes(inodes):
+        try:
+            proc = psutil.Process(pid)
+            if proc.name().lower() in SSH_PROCESS_NAMES:
+                continue
+            _ = proc.create_time()
+            return proc
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            continue
+    return None
+
+
+def _find_process_by_port_psutil(port: int) -> Optional[psutil.Process]:
+    """Find a process listening on the specified port by checking every process's connections.
+    
+    Portable fallback for the /proc lookup. Returns None if port is only
+    accessible via SSH forwarding or other non-local means.
     """
     try:
         for proc in psutil.process_iter(['pid', 'name']):
@@ -22,7 +110,7 @@ def find_process_by_port(port: int) -> Optional[psutil.Process]:
                 
                 # Skip SSH processes - these are port forwards, not actual services
                 proc_name = proc.name().lower()
-                if proc_name in ['ssh', 'sshd']:
+                if proc_name in SSH_PROCESS_NAMES:
                     continue
                     
                 for conn in proc.net_connections():
@@ -77,4 +165,76 @@ def check_service_status(port: int) -> Tuple[str, Optional[psutil.Process]]:
         return ("forwarded", None)
     
     # Not accessible at all
-    return ("not_available", None)
\ No newline at end of file
+    return ("not_available", None)
+
+
+class ServiceLocalityCache:
+    """Caches check_service_status results per port.
+
+    check_service_status scans every process on the machine, which can take
+    hundreds of milliseconds on a busy host. Whether a service is local or
+    forwarded rarely changes, so results are reused for ttl seconds and
+    dropped early when a request to the service fails.
+    """
+
+    def __init__(self, ttl: Optional[float] = None):
+        if ttl is None:
+            from voice_mode.config import SERVICE_LOCALITY_TTL
+            ttl = SERVICE_LOCALITY_TTL
+        self.ttl = ttl
+        self._entries: Dict[int, Tuple[float, str, Optional[psutil.Process]]] = {}
+        self._lock = threading.Lock()
+
+        # Session counters
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.lookup_seconds = 0.0  # Time spent in uncached lookups
+
+    def get(self, port: int) -> Tuple[str, Optional[psutil.Process]]:
+        """Return check_service_status(port), reusing a fresh cached result."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(port)
+            if entry is not None and now - entry[0] < self.ttl:
+                self.hits += 1
+                return entry[1], entry[2]
+
+        start = time.perf_counter()
+        status, proc = check_service_status(port)
+        elapsed = time.perf_counter() - start
+
+        with self._lock:
+            self.misses += 1
+            self.lookup_seconds += elapsed
+            if self.ttl > 0:
+                self._entries[port] = (time.monotonic(), status, proc)
+        logger.debug(f"Service on port {port} is {status} (lookup took {elapsed * 1000:.0f}ms)")
+        return status, proc
+
+    def invalidate(self, port: Optional[int] = None):
+        """Drop the cached result for port (or every port)."""
+        with self._lock:
+            if port is None:
+                dropped = len(self._entries)
+                self._entries.clear()
+            else:
+                dropped = 1 if self._entries.pop(port, None) else 0
+            self.invalidations += dropped
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'lookups': lookups,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'invalidations': self.invalidations,
+                'lookup_seconds': self.lookup_seconds,
+                'avg_lookup_ms': self.lookup_seconds / self.misses * 1000 if self.misses else 0.0,
+            }
+
+
+# Global cache consulted on the STT hot path
+service_locality = ServiceLocalityCache()
@@ -0,0 +1,66 @@
+"""
+Streaming input stage for WebRTC VAD.
+
+WebRTC VAD only accepts 10, 20 or 30 ms frames at 8, 16, 32 or 48 kHz, but
+the microphone is captured at SAMPLE_RATE (24 kHz). Resampling each chunk on
+its own (an FFT resample of a 30 ms block) rings at the block edges and
+costs an FFT per chunk. VADFrontEnd instead runs the capture through one
+PolyphaseResampler for the whole recording, so the anti-aliasing filter
+carries its state across chunks (24 kHz -> 16 kHz is an exact 3:2), and
+cuts the result into VAD frames.
+
+The recorder, hybrid push-to-talk, barge-in and the adaptive silence
+detector all feed their audio through it.
+"""
+
+from typing import List
+
+import numpy as np
+
+from .audio_encode import to_int16
+from .config import SAMPLE_RATE, VAD_CHUNK_DURATION_MS
+from .resample import PolyphaseResampler
+
+VAD_SAMPLE_RATE = 16000  # WebRTC VAD supports 8/16/32/48kHz
+VAD_SUPPORTED_RATES = (8000, 16000, 32000, 48000)
+
+
+class VADFrontEnd:
+    """Resamples captured chunks and frames them for WebRTC VAD."""
+
+    def __init__(self, input_rate: int = SAMPLE_RATE, frame_ms: int = VAD_CHUNK_DURATION_MS):
+        self.input_rate = input_rate
+        # Supported rates are used as they are; anything else goes to 16 kHz
+        self.vad_rate = input_rate if input_rate in VAD_SUPPORTED_RATES else VAD_SAMPLE_RATE
+        self.frame_samples = self.vad_rate * frame_ms // 1000
+
+        self._resampler = PolyphaseResampler(input_rate, self.vad_rate) if self.vad_rate != input_rate else None
+        # Zeros stand in for the outputs the filter lookahead holds back, so
+        # each frame completes with the input chunk covering the same time
+        delay = self._resampler.delay if self._resampler is not None else 0
+        self._buffer = np.zeros(delay, dtype=np.int16)
+        self._last_decision = False
+
+    def process(self, chunk: np.ndarray) -> List[bytes]:
+        """Take the next captured chunk; returns the VAD frames it completes."""
+        samples = to_int16(np.asarray(chunk).reshape(-1))
+        if self._resampler is not None:
+            samples = self._resampler.process(samples)
+        buffer = np.concatenate([self._buffer, samples]) if len(self._buffer) else samples
+
+        count = len(buffer) // self.frame_samples
+        frames = [buffer[i * self.frame_samples:(i + 1) * self.frame_samples].tobytes() for i in range(count)]
+        self._buffer = buffer[count * self.frame_samples:].copy()
+        return frames
+
+    def is_speech(self, vad, chunk: np.ndarray) -> bool:
+        """VAD decision for a captured chunk.
+
+        A chunk is speech if any frame it completes is. A chunk too short to
+        complete a frame keeps the previous decision. Errors from the VAD are
+        raised to the caller.
+        """
+        frames = self.process(chunk)
+        if frames:
+            self._last_decision = any(vad.is_speech(frame, self.vad_rate) for frame in frames)
+        return self._last_decision
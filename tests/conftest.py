@@ -358,6 +358,46 @@ def temp_session_file(tmp_path):
     # Cleanup happens automatically with tmp_path
 
 
+@pytest.fixture(autouse=True)
+def isolated_tts_cache(tmp_path, monkeypatch):
+    """Keep the TTS audio cache out of the user's real cache directory"""
+    from voice_mode import tts_cache
+    monkeypatch.setattr(tts_cache, "_tts_cache", tts_cache.TTSCache(
+        cache_dir=tmp_path / "tts_cache",
+        max_bytes=10 * 1024 * 1024,
+        max_age_seconds=86400
+    ))
+    yield
+
+
+@pytest.fixture(autouse=True)
+def isolated_output_engine(monkeypatch):
+    """Give each test its own output engine so no stream outlives the test"""
+    from voice_mode import output_engine
+    engine = output_engine.OutputEngine()
+    monkeypatch.setattr(output_engine, "_output_engine", engine)
+    yield engine
+    engine.close()
+
+
+@pytest.fixture(autouse=True)
+def inline_artifact_writer(monkeypatch):
+    """Write saved audio and transcriptions inline so tests can check them right away"""
+    from voice_mode import artifact_writer
+    writer = artifact_writer.ArtifactWriter(enabled=False)
+    monkeypatch.setattr(artifact_writer, "_artifact_writer", writer)
+    yield writer
+
+
+@pytest.fixture(autouse=True)
+def isolated_service_locality(monkeypatch):
+    """Don't let a cached local/forwarded lookup leak between tests"""
+    from voice_mode.utils.services import common
+    cache = common.ServiceLocalityCache(ttl=60)
+    monkeypatch.setattr(common, "service_locality", cache)
+    yield cache
+
+
 # ==================== Integration Test Fixtures ====================
 
 @pytest.fixture
@@ -347,9 +347,10 @@ async def test_recorder_lifecycle():
     assert result is False
 
     # Add mock audio data
-    recorder._recorder._audio_chunks = [
+    for chunk in [
         np.array([1, 2, 3, 4, 5], dtype='int16')
-    ]
+    ]:
+        recorder._recorder._audio_callback(chunk, len(chunk), None, None)
 
     # Stop and get data
     audio_data = await recorder.stop()
@@ -448,9 +449,10 @@ async def test_component_integration():
     assert controller.current_state == PTTState.RECORDING
 
     # Add audio data
-    controller._recorder._recorder._audio_chunks = [
+    for chunk in [
         np.array([1, 2, 3], dtype='int16')
-    ]
+    ]:
+        controller._recorder._recorder._audio_callback(chunk, len(chunk), None, None)
 
     # Simulate key release
     await asyncio.sleep(0.1)  # Ensure minimum duration
@@ -198,9 +198,10 @@ class TestFullRecordingCycles:
         assert controller.current_state == PTTState.RECORDING
 
         # Add some audio data
-        controller._recorder._recorder._audio_chunks = [
+        for chunk in [
             np.array([1, 2, 3, 4, 5], dtype='int16')
-        ]
+        ]:
+            controller._recorder._recorder._audio_callback(chunk, len(chunk), None, None)
 
         # Wait minimum duration
         await asyncio.sleep(0.15)
@@ -238,9 +239,10 @@ class TestFullRecordingCycles:
         assert controller._toggle_active
 
         # Add audio data
-        controller._recorder._recorder._audio_chunks = [
+        for chunk in [
             np.array([1, 2, 3], dtype='int16')
-        ]
+        ]:
+            controller._recorder._recorder._audio_callback(chunk, len(chunk), None, None)
 
         # Second press - stop
         controller._on_key_press()
@@ -274,9 +276,10 @@ class TestFullRecordingCycles:
         assert controller.is_recording
 
         # Add audio data
-        controller._recorder._recorder._audio_chunks = [
+        for chunk in [
             np.array([1, 2, 3, 4], dtype='int16')
-        ]
+        ]:
+            controller._recorder._recorder._audio_callback(chunk, len(chunk), None, None)
 
         # Wait for silence timeout
         await asyncio.sleep(0.15)
@@ -666,9 +669,10 @@ class TestEndToEndWorkflows:
         event = await controller.wait_for_event(timeout=0.1)
         await controller._handle_start_recording(event)
 
-        controller._recorder._recorder._audio_chunks = [
+        for chunk in [
             np.array([1, 2, 3], dtype='int16')
-        ]
+        ]:
+            controller._recorder._recorder._audio_callback(chunk, len(chunk), None, None)
 
         await asyncio.sleep(0.06)
         controller._on_key_release()
@@ -681,9 +685,10 @@ class TestEndToEndWorkflows:
         event = await controller.wait_for_event(timeout=0.1)
         await controller._handle_start_recording(event)
 
-        controller._recorder._recorder._audio_chunks = [
+        for chunk in [
             np.array([4, 5, 6], dtype='int16')
-        ]
+        ]:
+            controller._recorder._recorder._audio_callback(chunk, len(chunk), None, None)
 
         await asyncio.sleep(0.06)
         controller._on_key_release()
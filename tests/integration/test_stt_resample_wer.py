@@ -0,0 +1,100 @@
+"""WER regression check for 16 kHz STT uploads.
+
+Synthesizes a fixed set of sentences with the local Kokoro service, then
+transcribes each one with the local Whisper service uploaded at the 24 kHz
+capture rate and resampled to 16 kHz. Resampling must not make recognition
+worse. The comparison is skipped unless both services are running.
+"""
+
+import asyncio
+import re
+import socket
+
+import numpy as np
+import pytest
+
+from voice_mode.audio_encode import encode_wav, upload_file
+from voice_mode.config import KOKORO_PORT, SAMPLE_RATE, WHISPER_PORT
+from voice_mode.resample import resample
+
+WER_SENTENCES = [
+    "The quick brown fox jumps over the lazy dog.",
+    "Please schedule the meeting for Thursday at three thirty in the afternoon.",
+    "She sells sea shells by the sea shore.",
+    "Set a timer for fifteen minutes and remind me to check the oven.",
+    "The invoice total came to four hundred and twenty six dollars.",
+    "Could you open the pull request and run the test suite again?",
+]
+
+# Allowed WER increase over the 24 kHz upload, for decoder nondeterminism
+WER_TOLERANCE = 0.02
+
+
+def _listening(port):
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as probe:
+        probe.settimeout(0.5)
+        return probe.connect_ex(("127.0.0.1", port)) == 0
+
+
+needs_services = pytest.mark.skipif(
+    not (_listening(KOKORO_PORT) and _listening(WHISPER_PORT)),
+    reason="needs local Kokoro and Whisper services",
+)
+
+
+def _words(text):
+    return re.sub(r"[^a-z0-9' ]", " ", text.lower()).split()
+
+
+def word_error_rate(reference, hypothesis):
+    """Word-level edit distance divided by the reference length."""
+    ref, hyp = _words(reference), _words(hypothesis)
+    row = list(range(len(hyp) + 1))
+    for i, ref_word in enumerate(ref, 1):
+        prev, row[0] = row[0], i
+        for j, hyp_word in enumerate(hyp, 1):
+            prev, row[j] = row[j], min(row[j] + 1, row[j - 1] + 1, prev + (ref_word != hyp_word))
+    return row[-1] / max(1, len(ref))
+
+
+@pytest.fixture(scope="module")
+def wer_fixture():
+    """(sentence, 24 kHz int16 speech) pairs synthesized once per run."""
+    from openai import OpenAI
+
+    client = OpenAI(base_url=f"http://127.0.0.1:{KOKORO_PORT}/v1", api_key="dummy-key-for-local")
+    pairs = []
+    for sentence in WER_SENTENCES:
+        pcm = client.audio.speech.create(model="tts-1", voice="af_sky", input=sentence, response_format="pcm")
+        pairs.append((sentence, np.frombuffer(pcm.content, dtype=np.int16)))
+    return pairs
+
+
+async def _corpus_wer(pairs, upload_rate):
+    from openai import AsyncOpenAI
+
+    client = AsyncOpenAI(base_url=f"http://127.0.0.1:{WHISPER_PORT}/v1", api_key="dummy-key-for-local")
+    errors = 0.0
+    for sentence, speech in pairs:
+        audio = resample(speech, SAMPLE_RATE, upload_rate)
+        text = await client.audio.transcriptions.create(
+            model="whisper-1",
+            file=upload_file(encode_wav(audio, upload_rate), "wav"),
+            response_format="text"
+        )
+        errors += word_error_rate(sentence, text if isinstance(text, str) else text.text)
+    return errors / len(pairs)
+
+
+def test_word_error_rate():
+    assert word_error_rate("set a timer", "Set a timer.") == 0.0
+    assert word_error_rate("set a timer", "set the timer") == pytest.approx(1 / 3)
+    assert word_error_rate("set a timer", "") == 1.0
+
+
+@needs_services
+def test_16khz_upload_does_not_regress_wer(wer_fixture):
+    baseline = asyncio.run(_corpus_wer(wer_fixture, SAMPLE_RATE))
+    resampled = asyncio.run(_corpus_wer(wer_fixture, 16000))
+    print(f"WER at {SAMPLE_RATE} Hz: {baseline:.3f}, at 16000 Hz: {resampled:.3f}")
+    assert resampled <= baseline + WER_TOLERANCE
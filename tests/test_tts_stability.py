@@ -187,6 +187,10 @@ class TestTTSStability:
         test_data = b"test audio data"
         debug_path = save_debug_file(test_data, "test", "mp3", debug_dir, debug=True)
         
+        # Files are written in the background
+        from voice_mode.artifact_writer import get_artifact_writer
+        assert get_artifact_writer().flush(timeout=5)
+        
         assert debug_path is not None
         assert Path(debug_path).exists()
         assert Path(debug_path).read_bytes() == test_data
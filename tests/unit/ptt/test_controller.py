@@ -8,7 +8,7 @@ keyboard handling, state management, and event processing.
 import pytest
 import asyncio
 import numpy as np
-from unittest.mock import Mock, AsyncMock, patch, MagicMock
+from unittest.mock import Mock, AsyncMock, patch, MagicMock, PropertyMock
 from voice_mode.ptt import (
     PTTController,
     PTTState,
@@ -1348,6 +1348,36 @@ class TestPTTControllerHybridMode:
         config.PTT_MODE = original_mode
         config.SILENCE_THRESHOLD_MS = original_silence
 
+    @pytest.mark.asyncio
+    async def test_hybrid_mode_silence_counts_from_last_speech(self, ptt_logger):
+        """Test that speech during recording postpones the hybrid auto-stop"""
+        import voice_mode.config as config
+        from voice_mode.ptt.recorder import AsyncPTTRecorder
+        original_mode = config.PTT_MODE
+        config.PTT_MODE = "hybrid"
+
+        controller = PTTController(logger=ptt_logger)
+        controller._hybrid_silence_timeout = 0.1
+        controller.enable()
+        assert controller._recorder.vad_aggressiveness == config.VAD_AGGRESSIVENESS
+
+        # Speech was heard 20ms before the first check, so 80ms more silence is needed
+        with patch.object(AsyncPTTRecorder, "silence_duration", new_callable=PropertyMock,
+                          side_effect=[0.02, 0.1]):
+            controller._on_key_press()
+            event = await controller.wait_for_event(timeout=0.1)
+            await controller._handle_start_recording(event)
+
+            await asyncio.sleep(0.13)
+            silence_events = [e for e in ptt_logger.events if e.event_type == "hybrid_silence_detected"]
+            assert silence_events == []
+
+            await asyncio.sleep(0.12)
+            silence_events = [e for e in ptt_logger.events if e.event_type == "hybrid_silence_detected"]
+            assert len(silence_events) == 1
+
+        config.PTT_MODE = original_mode
+
     @pytest.mark.asyncio
     async def test_hybrid_mode_manual_stop_on_release(self, ptt_logger):
         """Test that hybrid mode can be stopped manually by releasing key"""
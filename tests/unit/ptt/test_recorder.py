@@ -118,10 +118,11 @@ class TestPTTRecorder:
         recorder.start()
 
         # Simulate some audio data
-        recorder._audio_chunks = [
+        for chunk in [
             np.array([1, 2, 3], dtype='int16'),
             np.array([4, 5, 6], dtype='int16')
-        ]
+        ]:
+            recorder._audio_callback(chunk, len(chunk), None, None)
 
         audio_data = recorder.stop()
 
@@ -176,14 +177,15 @@ class TestPTTRecorder:
         recorder.start()
 
         # Simulate some audio data
-        recorder._audio_chunks = [
+        for chunk in [
             np.array([1, 2, 3], dtype='int16')
-        ]
+        ]:
+            recorder._audio_callback(chunk, len(chunk), None, None)
 
         recorder.cancel()
 
         assert recorder.is_recording is False
-        assert len(recorder._audio_chunks) == 0
+        assert recorder._capture is None
 
         # Verify stream was stopped and closed
         stream = mock_sounddevice.InputStream.return_value
@@ -231,8 +233,38 @@ class TestPTTRecorder:
         audio_data = np.array([1, 2, 3, 4, 5], dtype='int16')
         recorder._audio_callback(audio_data, 5, None, None)
 
-        assert len(recorder._audio_chunks) == 1
-        np.testing.assert_array_equal(recorder._audio_chunks[0], audio_data)
+        assert len(recorder._capture) == 5
+        np.testing.assert_array_equal(recorder._capture.view(), audio_data)
+
+    def test_stop_returns_view_of_preallocated_buffer(self, mock_sounddevice):
+        """Test callbacks write into one buffer and stop does not copy it"""
+        recorder = PTTRecorder()
+        recorder.max_duration = 1.0
+        recorder.start()
+        capture = recorder._capture
+        assert capture.capacity >= 16000
+
+        block = np.ones((480, 1), dtype='int16')
+        for _ in range(10):
+            recorder._audio_callback(block, 480, None, None)
+        audio_data = recorder.stop()
+
+        assert audio_data.shape == (4800,)
+        assert np.shares_memory(audio_data, capture._data)
+        assert capture.allocations == 1
+
+    def test_new_recording_does_not_overwrite_previous_audio(self, mock_sounddevice):
+        """Test each recording gets its own buffer"""
+        recorder = PTTRecorder()
+        recorder.start()
+        recorder._audio_callback(np.full((480, 1), 1, dtype='int16'), 480, None, None)
+        first = recorder.stop()
+
+        recorder.start()
+        recorder._audio_callback(np.full((480, 1), 2, dtype='int16'), 480, None, None)
+        recorder.stop()
+
+        assert (first == 1).all()
 
     def test_audio_callback_with_status(self, mock_sounddevice, ptt_logger):
         """Test audio callback logs status"""
@@ -276,6 +308,35 @@ class TestPTTRecorder:
 
         assert recorder.duration == 0.0
 
+    def test_no_silence_duration_without_vad(self, mock_sounddevice):
+        """Test silence is only tracked when VAD is requested"""
+        recorder = PTTRecorder()
+        recorder.start()
+
+        assert recorder.silence_duration is None
+
+    def test_silence_duration_counts_from_last_speech(self, mock_sounddevice):
+        """Test VAD decisions on each chunk move the silence start"""
+        import time
+
+        recorder = PTTRecorder()
+        recorder.vad_aggressiveness = 2
+        recorder.start()
+        recorder._vad_front_end = MagicMock()
+        chunk = np.zeros((480, 1), dtype='int16')
+
+        time.sleep(0.05)
+        assert recorder.silence_duration >= 0.05
+
+        recorder._vad_front_end.is_speech.return_value = True
+        recorder._audio_callback(chunk, 480, None, None)
+        assert recorder.silence_duration < 0.05
+
+        recorder._vad_front_end.is_speech.return_value = False
+        recorder._audio_callback(chunk, 480, None, None)
+        time.sleep(0.02)
+        assert 0.02 <= recorder.silence_duration < 0.05
+
 
 class TestAsyncPTTRecorder:
     """Tests for AsyncPTTRecorder class"""
@@ -305,9 +366,10 @@ class TestAsyncPTTRecorder:
         await recorder.start()
 
         # Add some audio data
-        recorder._recorder._audio_chunks = [
+        for chunk in [
             np.array([1, 2, 3], dtype='int16')
-        ]
+        ]:
+            recorder._recorder._audio_callback(chunk, len(chunk), None, None)
 
         audio_data = await recorder.stop()
 
@@ -392,10 +454,11 @@ class TestRecorderIntegration:
         assert recorder.is_recording is True
 
         # Simulate audio data
-        recorder._recorder._audio_chunks = [
+        for chunk in [
             np.array([1, 2, 3], dtype='int16'),
             np.array([4, 5, 6], dtype='int16')
-        ]
+        ]:
+            recorder._recorder._audio_callback(chunk, len(chunk), None, None)
 
         # Stop and get data
         audio_data = await recorder.stop()
@@ -411,15 +474,16 @@ class TestRecorderIntegration:
         await recorder.start()
 
         # Add audio data
-        recorder._recorder._audio_chunks = [
+        for chunk in [
             np.array([1, 2, 3, 4, 5], dtype='int16')
-        ]
+        ]:
+            recorder._recorder._audio_callback(chunk, len(chunk), None, None)
 
         # Cancel
         await recorder.cancel()
 
         # Data should be discarded
-        assert len(recorder._recorder._audio_chunks) == 0
+        assert recorder._recorder._capture is None
         assert recorder.is_recording is False
 
     @pytest.mark.asyncio
@@ -429,12 +493,14 @@ class TestRecorderIntegration:
 
         # First session
         await recorder.start()
-        recorder._recorder._audio_chunks = [np.array([1, 2, 3], dtype='int16')]
+        for chunk in [np.array([1, 2, 3], dtype='int16')]:
+            recorder._recorder._audio_callback(chunk, len(chunk), None, None)
         data1 = await recorder.stop()
 
         # Second session
         await recorder.start()
-        recorder._recorder._audio_chunks = [np.array([4, 5, 6], dtype='int16')]
+        for chunk in [np.array([4, 5, 6], dtype='int16')]:
+            recorder._recorder._audio_callback(chunk, len(chunk), None, None)
         data2 = await recorder.stop()
 
         # Both sessions should work independently
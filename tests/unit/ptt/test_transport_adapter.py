@@ -397,7 +397,11 @@ class TestRecordWithPTTFallback:
             max_duration=45.0,
             disable_silence_detection=True,
             min_duration=3.0,
-            vad_aggressiveness=1
+            vad_aggressiveness=1,
+            initial_audio=None,
+            mic=None,
+            encoder=None,
+            vad_listener=None
         )
 
 
@@ -0,0 +1,111 @@
+"""Tests for the background artifact writer."""
+
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+from voice_mode.artifact_writer import ArtifactWriter
+
+
+class TestArtifactWriter:
+    """Test background writes, backpressure and flushing."""
+
+    def test_writes_happen_on_worker_thread(self, tmp_path):
+        writer = ArtifactWriter(max_queue=8)
+        threads = []
+
+        def encode():
+            threads.append(threading.current_thread().name)
+            return b"audio"
+
+        path = writer.submit(tmp_path / "2025" / "01" / "tts.wav", encode)
+        writer.submit(tmp_path / "transcript.txt", "Assistant: hello")
+        assert writer.flush(timeout=5)
+
+        assert path.read_bytes() == b"audio"
+        assert (tmp_path / "transcript.txt").read_text() == "Assistant: hello"
+        assert threads == ["artifact-writer"]
+        stats = writer.get_stats()
+        assert stats['written'] == 2
+        assert stats['depth'] == 0
+        assert stats['bytes_written'] == len(b"audio") + len("Assistant: hello")
+        writer.close()
+
+    def test_full_queue_writes_inline(self, tmp_path):
+        writer = ArtifactWriter(max_queue=1)
+        release = threading.Event()
+        started = threading.Event()
+
+        def slow():
+            started.set()
+            release.wait(5)
+            return b"slow"
+
+        writer.submit(tmp_path / "a", slow)
+        assert started.wait(5)
+        writer.submit(tmp_path / "b", b"queued")
+        writer.submit(tmp_path / "c", b"inline")
+
+        # Written by the caller while the worker is busy
+        assert (tmp_path / "c").read_bytes() == b"inline"
+        assert writer.get_stats()['inline_writes'] == 1
+        assert writer.get_stats()['max_depth'] == 1
+
+        release.set()
+        writer.close()
+        assert (tmp_path / "a").read_bytes() == b"slow"
+        assert (tmp_path / "b").read_bytes() == b"queued"
+
+    def test_close_flushes_pending_writes(self, tmp_path):
+        writer = ArtifactWriter(max_queue=64)
+        for i in range(20):
+            writer.submit(tmp_path / f"{i}.bin", lambda i=i: bytes([i]) * 1000)
+        writer.close()
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == sorted(f"{i}.bin" for i in range(20))
+
+    def test_failed_write_is_counted(self, tmp_path):
+        writer = ArtifactWriter()
+
+        def broken():
+            raise ValueError("encoder failed")
+
+        writer.submit(tmp_path / "broken.wav", broken)
+        writer.submit(tmp_path / "ok.wav", b"ok")
+        writer.close()
+
+        assert writer.get_stats()['failed'] == 1
+        assert (tmp_path / "ok.wav").exists()
+
+    def test_disabled_writer_writes_inline(self, tmp_path):
+        writer = ArtifactWriter(enabled=False)
+        writer.submit(tmp_path / "now.txt", "now")
+        assert (tmp_path / "now.txt").read_text() == "now"
+
+
+class TestSaveHelpers:
+    """Test the existing save helpers go through the writer."""
+
+    def test_save_debug_file(self, tmp_path):
+        from voice_mode.artifact_writer import get_artifact_writer
+        from voice_mode.core import save_debug_file
+
+        path = save_debug_file(lambda: b"wav bytes", "stt", "wav", tmp_path, debug=True, conversation_id="conv_1")
+        assert get_artifact_writer().flush(timeout=5)
+
+        assert Path(path).read_bytes() == b"wav bytes"
+        assert Path(path).parent.parent.parent == tmp_path
+        assert save_debug_file(b"x", "stt", "wav", tmp_path, debug=False) is None
+
+    def test_save_transcription(self, tmp_path):
+        from voice_mode import config
+        from voice_mode.artifact_writer import get_artifact_writer
+
+        with patch.object(config, "SAVE_TRANSCRIPTIONS", True), \
+             patch.object(config, "TRANSCRIPTIONS_DIR", tmp_path):
+            path = config.save_transcription("User: hi", prefix="stt", metadata={"type": "stt"})
+        assert get_artifact_writer().flush(timeout=5)
+
+        content = path.read_text()
+        assert "type: stt" in content
+        assert content.endswith("User: hi")
@@ -0,0 +1,120 @@
+"""Tests for in-memory decoding of buffered TTS responses."""
+
+import io
+import shutil
+import struct
+import subprocess
+import wave
+
+import numpy as np
+import pytest
+
+from voice_mode import audio_decode
+from voice_mode.audio_decode import AudioDecodeError, decode_audio_bytes
+
+needs_ffmpeg = pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not installed")
+
+
+def _tone(seconds=0.2, sample_rate=24000):
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    return (np.sin(2 * np.pi * 440 * t) * 12000).astype(np.int16)
+
+
+def _wav_bytes(samples, sample_rate=24000, channels=1):
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wav_file:
+        wav_file.setnchannels(channels)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(samples.tobytes())
+    return buf.getvalue()
+
+
+class TestRawFormats:
+    """PCM and WAV are decoded with numpy, without ffmpeg."""
+
+    def test_pcm(self):
+        pcm = _tone()
+        decoded = decode_audio_bytes(pcm.tobytes(), "pcm", sample_rate=24000)
+        assert decoded.samples.dtype == np.float32
+        assert decoded.sample_rate == 24000
+        np.testing.assert_allclose(decoded.samples, pcm / 32768.0, atol=1e-6)
+
+    def test_pcm_odd_length_is_truncated(self):
+        decoded = decode_audio_bytes(_tone().tobytes() + b"\x01", "pcm")
+        assert len(decoded.samples) == len(_tone())
+
+    def test_leading_silence_in_same_buffer(self):
+        pcm = _tone()
+        decoded = decode_audio_bytes(pcm.tobytes(), "pcm", sample_rate=24000, leading_silence=0.1)
+        assert decoded.leading_frames == 2400
+        assert len(decoded.samples) == 2400 + len(pcm)
+        assert not decoded.samples[:2400].any()
+        np.testing.assert_array_equal(decoded.pcm16(), pcm)
+
+    def test_wav(self):
+        pcm = _tone(sample_rate=22050)
+        decoded = decode_audio_bytes(_wav_bytes(pcm, 22050), "wav")
+        assert decoded.sample_rate == 22050
+        np.testing.assert_array_equal(decoded.pcm16(), pcm)
+
+    def test_stereo_wav(self):
+        stereo = np.stack([_tone(), -_tone()], axis=1)
+        decoded = decode_audio_bytes(_wav_bytes(stereo, channels=2), "wav", leading_silence=0.05)
+        assert decoded.channels == 2
+        assert decoded.samples.shape == (1200 + len(stereo), 2)
+        np.testing.assert_array_equal(decoded.pcm16(), stereo)
+
+    def test_streamed_wav_with_placeholder_size(self):
+        pcm = _tone()
+        data = bytearray(_wav_bytes(pcm))
+        data_offset = data.index(b"data")
+        struct.pack_into("<I", data, data_offset + 4, 0xFFFFFFFF)
+        decoded = decode_audio_bytes(bytes(data), "wav")
+        np.testing.assert_array_equal(decoded.pcm16(), pcm)
+
+    def test_invalid_wav_raises(self):
+        with pytest.raises(AudioDecodeError):
+            decode_audio_bytes(b"not a wav file at all", "wav")
+
+    def test_empty_response_raises(self):
+        with pytest.raises(AudioDecodeError):
+            decode_audio_bytes(b"", "pcm")
+
+
+class TestCompressedFormats:
+    """Compressed formats go through one ffmpeg pipe."""
+
+    def test_missing_ffmpeg_raises(self, monkeypatch):
+        monkeypatch.setattr(audio_decode.shutil, "which", lambda name: None)
+        with pytest.raises(AudioDecodeError, match="ffmpeg"):
+            decode_audio_bytes(b"\xff\xfb" * 100, "mp3")
+
+    @needs_ffmpeg
+    def test_mp3_round_trip(self):
+        wav = _wav_bytes(_tone(seconds=0.5))
+        mp3 = subprocess.run(
+            ["ffmpeg", "-loglevel", "error", "-f", "wav", "-i", "pipe:0", "-f", "mp3", "pipe:1"],
+            input=wav, capture_output=True, check=True
+        ).stdout
+
+        decoded = decode_audio_bytes(mp3, "mp3", sample_rate=24000)
+        assert decoded.sample_rate == 24000
+        assert decoded.channels == 1
+        assert abs(decoded.duration - 0.5) < 0.1
+        assert np.abs(decoded.samples).max() > 0.1
+
+    @needs_ffmpeg
+    def test_compressed_stereo_keeps_channels(self):
+        tone = _tone(seconds=0.5)
+        stereo = np.column_stack([tone, tone // 2]).reshape(-1)
+        wav = _wav_bytes(stereo, channels=2)
+        mp3 = subprocess.run(
+            ["ffmpeg", "-loglevel", "error", "-f", "wav", "-i", "pipe:0", "-f", "mp3", "pipe:1"],
+            input=wav, capture_output=True, check=True
+        ).stdout
+
+        decoded = decode_audio_bytes(mp3, "mp3", sample_rate=24000)
+        assert decoded.channels == 2
+        assert decoded.samples.shape[1] == 2
+        assert decoded.pcm16(mono=True).ndim == 1
@@ -0,0 +1,253 @@
+"""Tests for in-memory encoding of STT uploads."""
+
+import io
+import shutil
+import threading
+import wave
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pytest
+
+from voice_mode.audio_decode import decode_audio_bytes
+from voice_mode.resample import resample
+from voice_mode.audio_encode import (
+    AudioEncodeError,
+    EncodedAudio,
+    StreamingEncoder,
+    encode_audio,
+    encode_wav,
+    upload_file,
+)
+
+needs_ffmpeg = pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not installed")
+
+
+def _tone(seconds=0.5, sample_rate=24000):
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    return (np.sin(2 * np.pi * 440 * t) * 12000).astype(np.int16)
+
+
+class TestEncodeWav:
+    """Test in-memory WAV encoding."""
+
+    def test_round_trip(self):
+        samples = (np.arange(2400) - 1200).astype(np.int16)
+        with wave.open(io.BytesIO(encode_wav(samples, 24000)), 'rb') as wav_file:
+            assert wav_file.getframerate() == 24000
+            assert wav_file.getnchannels() == 1
+            assert wav_file.getsampwidth() == 2
+            decoded = np.frombuffer(wav_file.readframes(wav_file.getnframes()), dtype=np.int16)
+        np.testing.assert_array_equal(decoded, samples)
+
+    def test_float_and_bytes_input(self):
+        as_float = encode_wav(np.full(100, 0.5, dtype=np.float32), 16000)
+        as_bytes = encode_wav(np.full(100, 16383, dtype=np.int16).tobytes(), 16000)
+        assert as_float == as_bytes
+
+
+class TestEncodeAudio:
+    """Test compressed encoding through an ffmpeg pipe."""
+
+    def test_wav_does_not_need_ffmpeg(self):
+        with patch("voice_mode.audio_encode.shutil.which", return_value=None):
+            data = encode_audio(_tone(), "wav", 24000)
+        assert data[:4] == b"RIFF"
+
+    @needs_ffmpeg
+    @pytest.mark.parametrize("format", ["mp3", "flac"])
+    def test_compressed_round_trip(self, format):
+        samples = _tone()
+        data = encode_audio(samples, format, 24000)
+        decoded = decode_audio_bytes(data, format, sample_rate=24000)
+        # Codec padding may add a few frames
+        assert abs(len(decoded.samples) - len(samples)) < 2400
+        assert np.abs(decoded.samples).max() > 0.2
+
+    def test_missing_ffmpeg(self):
+        with patch("voice_mode.audio_encode.shutil.which", return_value=None):
+            with pytest.raises(AudioEncodeError, match="ffmpeg"):
+                encode_audio(_tone(), "mp3", 24000)
+
+    def test_unsupported_format(self):
+        with pytest.raises(AudioEncodeError, match="Unsupported"):
+            encode_audio(_tone(), "pcm", 24000)
+
+    def test_upload_file_carries_extension(self):
+        file = upload_file(b"data", "opus")
+        assert file.name == "audio.opus"
+        assert file.read() == b"data"
+
+
+@needs_ffmpeg
+class TestStreamingEncoder:
+    """Test encoding chunks as they are captured."""
+
+    def test_matches_whole_recording(self):
+        samples = _tone(seconds=1.0)
+        encoder = StreamingEncoder("mp3", 24000)
+        for chunk in np.array_split(samples, 33):  # 30ms VAD chunks
+            encoder.feed(chunk.reshape(-1, 1))
+        upload = encoder.finish()
+
+        assert upload.format == "mp3"
+        assert upload.samples == len(samples)
+        decoded = decode_audio_bytes(upload.data, "mp3", sample_rate=24000)
+        assert abs(len(decoded.samples) - len(samples)) < 2400
+        assert np.abs(decoded.samples).max() > 0.2
+        # Nothing is accepted after finishing
+        encoder.feed(samples)
+        assert encoder.samples == len(samples)
+
+    def test_abort(self):
+        encoder = StreamingEncoder("mp3", 24000)
+        encoder.feed(_tone())
+        encoder.abort()
+        assert encoder.process.poll() is not None
+        assert encoder.finish() is None
+
+    def test_ptt_recorder_feeds_encoder(self):
+        from voice_mode.capture_buffer import CaptureBuffer
+        from voice_mode.ptt.recorder import PTTRecorder
+
+        recorder = PTTRecorder()
+        recorder.encoder = MagicMock()
+        recorder._is_recording = True
+        recorder._capture = CaptureBuffer(480)
+        frame = np.ones((480, 1), dtype=np.int16)
+        recorder._audio_callback(frame, 480, None, None)
+
+        fed = recorder.encoder.feed.call_args[0][0]
+        np.testing.assert_array_equal(fed, frame)
+
+
+class TestSpeechToTextUpload:
+    """Test the STT path uploads from memory."""
+
+    @pytest.mark.asyncio
+    async def test_no_temporary_files(self):
+        from voice_mode.tools import converse
+
+        uploads = []
+
+        async def create(model, file, response_format):
+            uploads.append((file.name, file.read()))
+            return "hello there"
+
+        client = MagicMock()
+        client.audio.transcriptions.create = AsyncMock(side_effect=create)
+        stt_config = {'client': client, 'model': 'whisper-1', 'base_url': 'http://127.0.0.1:2022/v1',
+                      'provider': 'whisper-local'}
+
+        with patch("tempfile.NamedTemporaryFile", side_effect=AssertionError("temp file used")), \
+             patch("voice_mode.utils.services.common.check_service_status", return_value=("local", "")):
+            text = await converse._speech_to_text_internal(_tone(), stt_config, {})
+
+        assert text == "hello there"
+        name, body = uploads[0]
+        assert name == "audio.wav"
+        # Uploaded at Whisper's 16 kHz rather than the capture rate
+        assert body == encode_wav(resample(_tone(), converse.SAMPLE_RATE, 16000), 16000)
+
+    def _remote_config(self, client):
+        return {'client': client, 'model': 'whisper-1', 'base_url': 'https://api.openai.com/v1',
+                'provider': 'openai-whisper'}
+
+    def _client(self, uploads):
+        async def create(model, file, response_format):
+            uploads.append((file.name, file.read()))
+            return "hello there"
+
+        client = MagicMock()
+        client.audio.transcriptions.create = AsyncMock(side_effect=create)
+        return client
+
+    @pytest.mark.asyncio
+    async def test_uses_upload_encoded_while_recording(self):
+        from voice_mode.tools import converse
+
+        uploads = []
+        audio = _tone()
+        upload = EncodedAudio(b"encoded during recording", "mp3", len(audio), 16000)
+
+        with patch("voice_mode.config.STT_AUDIO_FORMAT", "mp3"), \
+             patch("voice_mode.audio_encode.encode_audio", side_effect=AssertionError("encoded again")):
+            text = await converse._speech_to_text_internal(audio, self._remote_config(self._client(uploads)), {},
+                                                           upload=upload)
+
+        assert text == "hello there"
+        assert uploads == [("audio.mp3", b"encoded during recording")]
+
+    @pytest.mark.asyncio
+    async def test_mismatched_upload_is_reencoded(self):
+        from voice_mode.tools import converse
+
+        uploads = []
+        audio = _tone()
+        # Fewer samples than the final recording (e.g. a fixed-duration fallback)
+        upload = EncodedAudio(b"partial", "mp3", len(audio) - 480)
+
+        with patch("voice_mode.config.STT_AUDIO_FORMAT", "mp3"), \
+             patch("voice_mode.audio_encode.encode_audio", return_value=b"fresh") as encode:
+            await converse._speech_to_text_internal(audio, self._remote_config(self._client(uploads)), {},
+                                                    upload=upload)
+
+        encode.assert_called_once()
+        assert uploads == [("audio.mp3", b"fresh")]
+
+    @pytest.mark.asyncio
+    async def test_no_encoder_for_wav_uploads(self):
+        from voice_mode.tools import converse
+
+        with patch("voice_mode.config.SIMPLE_FAILOVER", True):
+            assert await converse.start_upload_encoder() is None
+        with patch("voice_mode.config.SIMPLE_FAILOVER", False), \
+             patch("voice_mode.config.STT_BASE_URLS", ["http://127.0.0.1:2022/v1"]), \
+             patch("voice_mode.utils.services.common.check_service_status", return_value=("local", None)):
+            assert await converse.start_upload_encoder() is None
+
+    @pytest.mark.asyncio
+    async def test_locality_lookup_runs_off_the_event_loop(self):
+        from voice_mode.tools import converse
+
+        threads = []
+
+        def lookup(port):
+            threads.append(threading.current_thread())
+            return ("local", None)
+
+        with patch("voice_mode.config.SIMPLE_FAILOVER", False), \
+             patch("voice_mode.config.STT_BASE_URLS", ["http://127.0.0.1:2022/v1"]), \
+             patch("voice_mode.utils.services.common.check_service_status", side_effect=lookup):
+            assert await converse.start_upload_encoder() is None
+
+        assert threads and threads[0] is not threading.current_thread()
+
+    @pytest.mark.asyncio
+    async def test_failed_save_still_transcribes(self, tmp_path):
+        from voice_mode.tools import converse
+
+        failover = AsyncMock(return_value={"text": "hello there"})
+        with patch("voice_mode.config.SIMPLE_FAILOVER", True), \
+             patch("voice_mode.core.save_debug_file", return_value=None), \
+             patch("voice_mode.simple_failover.simple_stt_failover", failover):
+            result = await converse.speech_to_text_with_failover(_tone(), save_audio=True, audio_dir=tmp_path)
+
+        assert result == {"text": "hello there"}
+        assert failover.await_args.kwargs["audio_file"].name == "audio.wav"
+
+    @pytest.mark.asyncio
+    async def test_saving_does_not_change_the_upload(self, tmp_path):
+        from voice_mode.tools import converse
+
+        audio = _tone()
+        failover = AsyncMock(return_value={"text": "hello there"})
+        with patch("voice_mode.config.SIMPLE_FAILOVER", True), \
+             patch("voice_mode.core.save_debug_file", return_value=None) as save, \
+             patch("voice_mode.simple_failover.simple_stt_failover", failover):
+            await converse.speech_to_text_with_failover(audio, save_audio=True, audio_dir=tmp_path)
+
+        # The original recording is saved; the upload is resampled like any other
+        assert save.call_args.args[0] == encode_wav(audio, converse.SAMPLE_RATE)
+        upload = failover.await_args.kwargs["audio_file"].read()
+        assert upload == encode_wav(resample(audio, converse.SAMPLE_RATE, 16000), 16000)
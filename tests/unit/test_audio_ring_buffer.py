@@ -0,0 +1,112 @@
+"""Tests for the ring-buffer backed AudioStreamPlayer."""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from voice_mode.streaming import AudioRingBuffer, AudioStreamPlayer
+
+
+class TestAudioRingBuffer:
+    """Test slice-based writes and reads."""
+
+    def test_write_then_read(self):
+        ring = AudioRingBuffer(8)
+        ring.write(np.arange(5, dtype=np.float32))
+        out = np.zeros(3, dtype=np.float32)
+        assert ring.read_into(out) == 3
+        np.testing.assert_array_equal(out, [0, 1, 2])
+        assert ring.available == 2
+
+    def test_wraparound(self):
+        ring = AudioRingBuffer(8)
+        ring.write(np.arange(6, dtype=np.float32))
+        ring.read_into(np.zeros(5, dtype=np.float32))
+        ring.write(np.arange(10, 16, dtype=np.float32))
+
+        out = np.zeros(10, dtype=np.float32)
+        assert ring.read_into(out) == 7
+        np.testing.assert_array_equal(out[:7], [5, 10, 11, 12, 13, 14, 15])
+
+    def test_overflow_drops_oldest(self):
+        ring = AudioRingBuffer(4)
+        ring.write(np.arange(3, dtype=np.float32))
+        ring.write(np.arange(3, 6, dtype=np.float32))
+        assert ring.available == 4
+        assert ring.dropped == 2
+
+        out = np.zeros(4, dtype=np.float32)
+        ring.read_into(out)
+        np.testing.assert_array_equal(out, [2, 3, 4, 5])
+
+    def test_write_without_overwrite_stops_when_full(self):
+        ring = AudioRingBuffer(4, dtype=np.int16)
+        assert ring.write(np.arange(3, dtype=np.int16), overwrite=False) == 3
+        assert ring.write(np.arange(3, 6, dtype=np.int16), overwrite=False) == 1
+        assert ring.free == 0
+        assert ring.dropped == 0
+
+        out = np.zeros(4, dtype=np.int16)
+        ring.read_into(out)
+        np.testing.assert_array_equal(out, [0, 1, 2, 3])
+
+    def test_oversized_write_keeps_newest(self):
+        ring = AudioRingBuffer(4)
+        ring.write(np.arange(10, dtype=np.float32))
+        out = np.zeros(4, dtype=np.float32)
+        ring.read_into(out)
+        np.testing.assert_array_equal(out, [6, 7, 8, 9])
+
+
+class TestAudioStreamPlayerCallback:
+    """Test the PortAudio callback against the ring buffer."""
+
+    def _player(self):
+        player = AudioStreamPlayer("pcm", sample_rate=1000)
+        player.min_buffer_samples = 100
+        return player
+
+    @pytest.mark.asyncio
+    async def test_playback_starts_after_min_buffer(self):
+        player = self._player()
+        assert not await player.add_chunk((np.ones(50, dtype=np.int16) * 1000).tobytes())
+        assert not player.playback_started
+        await player.add_chunk((np.ones(60, dtype=np.int16) * 1000).tobytes())
+        assert player.playback_started
+        assert player.buffer.available == 110
+
+    @pytest.mark.asyncio
+    async def test_callback_fills_and_counts_underruns(self):
+        player = self._player()
+        await player.add_chunk((np.ones(150, dtype=np.int16) * 16384).tobytes())
+
+        outdata = np.full((100, 1), 9.0, dtype=np.float32)
+        player._audio_callback(outdata, 100, None, None)
+        np.testing.assert_allclose(outdata, 0.5)
+        assert player.metrics.buffer_underruns == 0
+
+        player._audio_callback(outdata, 100, None, None)
+        np.testing.assert_allclose(outdata[:50], 0.5)
+        assert not outdata[50:].any()
+        assert player.metrics.buffer_underruns == 1
+        assert player.metrics.chunks_played == 2
+
+    @pytest.mark.asyncio
+    async def test_finish_waits_for_drain(self):
+        player = self._player()
+        await player.add_chunk(np.ones(120, dtype=np.int16).tobytes())
+
+        async def drain():
+            outdata = np.zeros((64, 1), dtype=np.float32)
+            while player.playing:
+                player._audio_callback(outdata, 64, None, None)
+                await asyncio.sleep(0.01)
+
+        drainer = asyncio.create_task(drain())
+        await asyncio.wait_for(player.finish(), timeout=2)
+        await drainer
+
+        assert player.playback_complete.is_set()
+        assert player.buffer.available == 0
+        assert player.metrics.buffer_underruns == 0
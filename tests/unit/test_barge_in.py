@@ -0,0 +1,147 @@
+"""Tests for barge-in during TTS playback."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from voice_mode.barge_in import BargeInMonitor
+from voice_mode.output_engine import PlaybackJob
+
+FRAME = 720  # 30ms at 24kHz
+
+
+def _monitor(min_speech_ms=90, preroll_ms=60):
+    monitor = BargeInMonitor(min_speech_ms=min_speech_ms, preroll_ms=preroll_ms)
+    # Frames whose middle sample is nonzero count as speech (the edges carry
+    # the resampling filter's tail from the neighbouring frames)
+    monitor.vad = MagicMock()
+    monitor.vad.is_speech.side_effect = lambda frame, rate: np.frombuffer(frame, dtype=np.int16)[240] != 0
+    return monitor
+
+
+def _frame(value):
+    return np.full(FRAME, value, dtype=np.int16)
+
+
+class EndlessJob(PlaybackJob):
+    def fill(self, out):
+        out.fill(1)
+        return len(out), False
+
+
+class TestBargeInMonitor:
+    """Test VAD triggering and captured speech."""
+
+    def test_short_noise_does_not_interrupt(self):
+        monitor = _monitor()
+        for value in (0, 500, 500, 0, 500, 0):
+            assert not monitor.process(_frame(value))
+        assert not monitor.triggered.is_set()
+        assert monitor.stop() is None
+
+    def test_sustained_speech_interrupts_and_keeps_audio(self, isolated_output_engine):
+        job = EndlessJob()
+        isolated_output_engine._streams[24000] = MagicMock(jobs=[job])
+        monitor = _monitor()
+        monitor.started_at = time.perf_counter()
+
+        frames = [0, 0, 1, 2, 3]  # Two frames of silence, then speech
+        results = [monitor.process(_frame(value)) for value in frames]
+        monitor.process(_frame(4))  # After the trigger everything is kept
+
+        assert results == [False, False, False, False, True]
+        assert monitor.token.is_cancelled()
+        assert job.cancelled
+        assert monitor.interrupted_after is not None
+
+        captured = monitor.stop()
+        # 90ms of speech + 60ms pre-roll = 5 frames of history, then the frame after the trigger
+        values = captured.reshape(-1, FRAME)[:, 0].tolist()
+        assert values == [0, 0, 1, 2, 3, 4]
+
+    def test_real_vad_ignores_silence(self):
+        monitor = BargeInMonitor(min_speech_ms=30)
+        for _ in range(10):
+            assert not monitor.process(np.zeros(FRAME, dtype=np.int16))
+
+
+class TestRunInterruptible:
+    """Test the TTS task is cancelled on barge-in."""
+
+    @pytest.mark.asyncio
+    async def test_completes_without_interruption(self):
+        monitor = _monitor()
+
+        async def speak():
+            await asyncio.sleep(0.01)
+            return "spoken"
+
+        assert await monitor.run_interruptible(speak()) == ("spoken", False)
+
+    @pytest.mark.asyncio
+    async def test_interruption_cancels_tts(self):
+        monitor = _monitor(min_speech_ms=30)
+        cancelled = asyncio.Event()
+
+        async def speak():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        def talk():
+            time.sleep(0.05)
+            monitor.process(_frame(100))
+
+        threading.Thread(target=talk).start()
+        result = await asyncio.wait_for(monitor.run_interruptible(speak()), timeout=2)
+
+        assert result == (None, True)
+        assert cancelled.is_set()
+
+
+class FakeInputStream:
+    """Feeds silent frames to the recorder callback."""
+
+    def __init__(self, samplerate, channels, dtype, callback, blocksize):
+        self.callback = callback
+        self.blocksize = blocksize
+        self._running = False
+
+    def __enter__(self):
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self):
+        while self._running:
+            self.callback(np.zeros((self.blocksize, 1), dtype=np.int16), self.blocksize, None, None)
+            time.sleep(0.001)
+
+    def __exit__(self, *exc):
+        self._running = False
+        self._thread.join()
+
+
+class TestRecordingHandoff:
+    """Test the recorder continues from barge-in audio."""
+
+    def test_recording_starts_with_captured_speech(self):
+        from voice_mode.tools import converse
+
+        captured = np.arange(1, 7201, dtype=np.int16)
+        with patch.object(converse.sd, "InputStream", FakeInputStream):
+            audio, speech_detected = converse.record_audio_with_silence_detection(
+                5.0, initial_audio=captured
+            )
+
+        assert speech_detected
+        np.testing.assert_array_equal(audio[:len(captured)], captured)
+        # Stopped on trailing silence rather than running to max_duration
+        assert len(audio) < 5.0 * converse.SAMPLE_RATE
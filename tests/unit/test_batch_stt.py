@@ -0,0 +1,193 @@
+"""Tests for batch transcription of saved audio."""
+
+import asyncio
+import os
+import wave
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pytest
+
+from voice_mode import batch_stt
+from voice_mode.batch_stt import (
+    BatchReport,
+    TranscriptionCheckpoint,
+    _Endpoint,
+    find_audio_files,
+    transcribe_batch,
+)
+from voice_mode.exchanges.models import Exchange
+
+RATE = 16000
+
+
+def _wav(path: Path, seconds: float = 1.0) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with wave.open(str(path), "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(RATE)
+        wav_file.writeframes(np.zeros(int(RATE * seconds), dtype=np.int16).tobytes())
+    return path
+
+
+def _endpoint(url, calls, fail=None, delay=0.0):
+    async def create(model, file, response_format):
+        calls.append((url, Path(file.name).stem))
+        if delay:
+            await asyncio.sleep(delay)
+        if fail is not None:
+            raise fail
+        return f"text of {Path(file.name).stem}\n"
+
+    client = MagicMock()
+    client.audio.transcriptions.create = AsyncMock(side_effect=create)
+    return _Endpoint(url, client, "whisper-1", "whisper")
+
+
+def _registry():
+    registry = MagicMock()
+    registry.mark_unhealthy = AsyncMock()
+    registry.registry = {"stt": {}}
+    return registry
+
+
+async def _run(tmp_path, endpoints, registry=None, **kwargs):
+    with patch.object(batch_stt, "_healthy_endpoints", AsyncMock(return_value=endpoints)), \
+         patch("voice_mode.provider_discovery.provider_registry", registry or _registry()):
+        return await transcribe_batch(str(tmp_path / "audio"), output=tmp_path / "out.jsonl", **kwargs)
+
+
+class TestFindAudioFiles:
+    """Test directory and glob discovery."""
+
+    def test_directory_is_searched_recursively(self, tmp_path):
+        a = _wav(tmp_path / "a.wav")
+        b = _wav(tmp_path / "sub" / "b.wav")
+        _wav(tmp_path / "reply_tts.wav")
+        (tmp_path / "notes.txt").write_text("not audio")
+
+        assert find_audio_files(str(tmp_path)) == [a, b]
+
+    def test_glob(self, tmp_path):
+        a = _wav(tmp_path / "one" / "a.wav")
+        _wav(tmp_path / "two" / "b.wav")
+
+        assert find_audio_files(str(tmp_path / "one" / "*.wav")) == [a]
+
+
+class TestTranscribeBatch:
+    """Test the endpoint pool, checkpointing and output."""
+
+    @pytest.mark.asyncio
+    async def test_results_are_readable_exchanges(self, tmp_path):
+        _wav(tmp_path / "audio" / "a.wav", seconds=2.0)
+        calls = []
+
+        report = await _run(tmp_path, [_endpoint("http://127.0.0.1:2022/v1", calls)])
+
+        assert report.transcribed == 1
+        exchange = Exchange.from_jsonl((tmp_path / "out.jsonl").read_text().strip())
+        assert exchange.is_stt
+        assert exchange.text == "text of a"
+        assert exchange.duration_ms == 2000
+        assert exchange.metadata.transport == "batch"
+        assert exchange.metadata.provider == "whisper-local"
+
+    @pytest.mark.asyncio
+    async def test_default_output_is_the_recording_day(self, tmp_path):
+        from voice_mode.exchanges.reader import ExchangeReader
+
+        recorded = datetime(2025, 3, 14, 9, 30)
+        audio = _wav(tmp_path / "audio" / "a.wav")
+        os.utime(audio, (recorded.timestamp(), recorded.timestamp()))
+
+        with patch.object(batch_stt, "_healthy_endpoints",
+                          AsyncMock(return_value=[_endpoint("http://a/v1", [])])), \
+             patch("voice_mode.provider_discovery.provider_registry", _registry()), \
+             patch.object(batch_stt, "BASE_DIR", str(tmp_path)):
+            report = await transcribe_batch(str(tmp_path / "audio"))
+
+        assert report.transcribed == 1
+        exchanges = list(ExchangeReader(tmp_path).read_date(recorded.date()))
+        assert [e.text for e in exchanges] == ["text of a"]
+        assert (tmp_path / "logs" / "conversations" / "batch_transcription.checkpoint").exists()
+
+    @pytest.mark.asyncio
+    async def test_work_is_spread_over_endpoints(self, tmp_path):
+        for i in range(8):
+            _wav(tmp_path / "audio" / f"{i}.wav")
+        calls = []
+        endpoints = [_endpoint("http://a/v1", calls, delay=0.01), _endpoint("http://b/v1", calls, delay=0.01)]
+
+        report = await _run(tmp_path, endpoints, concurrency=4)
+
+        assert report.transcribed == 8
+        assert report.by_endpoint["http://a/v1"] > 0
+        assert report.by_endpoint["http://b/v1"] > 0
+        assert len((tmp_path / "out.jsonl").read_text().splitlines()) == 8
+
+    @pytest.mark.asyncio
+    async def test_failed_endpoint_fails_over(self, tmp_path):
+        for i in range(3):
+            _wav(tmp_path / "audio" / f"{i}.wav")
+        calls = []
+        registry = _registry()
+        registry.registry["stt"]["http://down/v1"] = MagicMock(healthy=False)
+        endpoints = [_endpoint("http://down/v1", calls, fail=ConnectionError("refused")),
+                     _endpoint("http://up/v1", calls)]
+
+        report = await _run(tmp_path, endpoints, registry=registry, concurrency=1)
+
+        assert report.transcribed == 3
+        assert report.by_endpoint == {"http://up/v1": 3}
+        registry.mark_unhealthy.assert_awaited_once_with("stt", "http://down/v1", "refused")
+        # Once marked unhealthy the endpoint is not tried again
+        assert sum(1 for url, _ in calls if url == "http://down/v1") == 1
+
+    @pytest.mark.asyncio
+    async def test_resumes_from_checkpoint(self, tmp_path):
+        _wav(tmp_path / "audio" / "a.wav")
+        calls = []
+        endpoint = _endpoint("http://a/v1", calls)
+        await _run(tmp_path, [endpoint])
+        _wav(tmp_path / "audio" / "b.wav")
+
+        report = await _run(tmp_path, [endpoint])
+
+        assert report.files == 2
+        assert report.skipped == 1
+        assert report.transcribed == 1
+        assert [name for _, name in calls] == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_failures_are_retried_on_the_next_run(self, tmp_path):
+        _wav(tmp_path / "audio" / "a.wav")
+        registry = _registry()
+        registry.registry["stt"]["http://a/v1"] = MagicMock(healthy=False)
+
+        report = await _run(tmp_path, [_endpoint("http://a/v1", [], fail=ConnectionError("refused"))],
+                            registry=registry)
+
+        assert report.failed == 1
+        assert not TranscriptionCheckpoint(tmp_path / "out.jsonl.checkpoint").is_done(tmp_path / "audio" / "a.wav")
+
+    @pytest.mark.asyncio
+    async def test_no_endpoints_is_an_error(self, tmp_path):
+        _wav(tmp_path / "audio" / "a.wav")
+        with pytest.raises(RuntimeError):
+            await _run(tmp_path, [])
+
+
+class TestBatchReport:
+    """Test throughput reporting."""
+
+    def test_throughput_is_audio_seconds_per_wall_second(self):
+        report = BatchReport(files=4, transcribed=4, audio_seconds=120.0, wall_seconds=10.0)
+        assert report.throughput == 12.0
+        assert "12.0 audio-seconds per second" in report.format()
+
+    def test_empty_run(self):
+        assert BatchReport().throughput == 0.0
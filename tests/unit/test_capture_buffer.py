@@ -0,0 +1,69 @@
+"""Tests for the preallocated recording buffer."""
+
+import threading
+
+import numpy as np
+
+from voice_mode.capture_buffer import CaptureBuffer
+
+
+class TestCaptureBuffer:
+    """Test in-place writes, growth and zero-copy views."""
+
+    def test_blocks_are_written_in_place(self):
+        capture = CaptureBuffer(1000)
+        stored = capture.append(np.arange(10, dtype=np.int16).reshape(-1, 1))
+        capture.append(np.arange(10, 15, dtype=np.int16))
+
+        assert len(capture) == 15
+        assert np.shares_memory(stored, capture._data)
+        np.testing.assert_array_equal(capture.view(), np.arange(15))
+        assert capture.allocations == 1
+
+    def test_view_is_not_a_copy(self):
+        capture = CaptureBuffer(100)
+        capture.append(np.ones(50, dtype=np.int16))
+        view = capture.view()
+
+        assert view.shape == (50,)
+        assert np.shares_memory(view, capture._data)
+        assert len(capture.view(20)) == 20
+
+    def test_grows_when_recording_runs_long(self):
+        capture = CaptureBuffer(100)
+        early = capture.append(np.full(80, 1, dtype=np.int16))
+        capture.append(np.full(80, 2, dtype=np.int16))
+
+        assert capture.allocations == 2
+        assert capture.capacity >= 200
+        np.testing.assert_array_equal(capture.view(), [1] * 80 + [2] * 80)
+        # Views handed out before the growth still hold their audio
+        assert (early == 1).all()
+
+    def test_multichannel_views_keep_frames(self):
+        capture = CaptureBuffer(10, channels=2)
+        capture.append(np.array([[1, 2], [3, 4]], dtype=np.int16))
+
+        np.testing.assert_array_equal(capture.view(), [[1, 2], [3, 4]])
+
+    def test_concurrent_views_only_see_written_audio(self):
+        capture = CaptureBuffer(64)
+        block = np.full(32, 7, dtype=np.int16)
+        done = threading.Event()
+        bad = []
+
+        def writer():
+            for _ in range(2000):
+                capture.append(block)
+            done.set()
+
+        thread = threading.Thread(target=writer)
+        thread.start()
+        while not done.is_set():
+            view = capture.view()
+            if len(view) and not (view == 7).all():
+                bad.append(len(view))
+        thread.join()
+
+        assert bad == []
+        assert len(capture) == 64000
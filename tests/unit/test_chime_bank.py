@@ -0,0 +1,111 @@
+"""Tests for the precomputed chime bank and output device profile cache."""
+
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from voice_mode import chime_bank
+from voice_mode.chime_bank import ChimeBank, synthesize_chime
+
+
+def _reference_chime(frequencies, duration, sample_rate, leading, trailing, amplitude):
+    """The per-call chime synthesis the bank replaces."""
+    samples_per_tone = int(sample_rate * duration)
+    fade_samples = int(sample_rate * 0.01)
+    tones = []
+    for freq in frequencies:
+        t = np.linspace(0, duration, samples_per_tone, False)
+        tone = amplitude * np.sin(2 * np.pi * freq * t)
+        tone[:fade_samples] *= np.linspace(0, 1, fade_samples)
+        tone[-fade_samples:] *= np.linspace(1, 0, fade_samples)
+        tones.append(tone)
+    chime = np.concatenate([np.zeros(int(sample_rate * leading)), *tones, np.zeros(int(sample_rate * trailing))])
+    return (chime * 32767).astype(np.int16)
+
+
+def _fake_sd(name="MacBook Pro Speakers", device=-1):
+    sd = MagicMock()
+    sd.default.device = [None, device]
+    sd.query_devices.return_value = {'name': name}
+    return sd
+
+
+class TestSynthesizeChime:
+    """Test chime synthesis matches the original generator."""
+
+    def test_matches_reference(self):
+        args = ([800, 1000], 0.1, 24000, 0.25, 0.1, 0.075)
+        expected = _reference_chime(*args)
+        chime = synthesize_chime(*args)
+        assert chime.dtype == np.int16
+        assert len(chime) == len(expected)
+        assert np.abs(chime.astype(np.int32) - expected).max() <= 1
+
+    def test_silence_padding(self):
+        chime = synthesize_chime([800], 0.1, 1000, 0.5, 0.2, 0.1)
+        assert len(chime) == 500 + 100 + 200
+        assert not chime[:500].any()
+        assert not chime[600:].any()
+
+
+class TestChimeBank:
+    """Test caching and device-change invalidation."""
+
+    def test_chime_is_synthesized_once(self):
+        bank = ChimeBank()
+        with patch.dict("sys.modules", sounddevice=_fake_sd()):
+            first = bank.chime([800, 1000], 0.1, 24000, 0.1, 0.1)
+            second = bank.chime([800, 1000], 0.1, 24000, 0.1, 0.1)
+
+        assert first is second
+        assert not first.flags.writeable
+        assert bank.hits == 1 and bank.misses == 1
+
+    def test_device_profile_is_probed_once_per_device(self):
+        bank = ChimeBank()
+        sd = _fake_sd("AirPods Pro")
+        with patch.dict("sys.modules", sounddevice=sd):
+            profile = bank.device_profile()
+            bank.device_profile()
+
+        assert profile.bluetooth
+        assert profile.amplitude == chime_bank.BLUETOOTH_AMPLITUDE
+        assert sd.query_devices.call_count == 1
+
+    def test_device_change_invalidates_buffers(self):
+        bank = ChimeBank()
+        sd = _fake_sd("MacBook Pro Speakers", device=1)
+        with patch.dict("sys.modules", sounddevice=sd):
+            speaker = bank.chime([800], 0.1, 24000, 0.0, 0.0)
+
+            sd.default.device = [None, 3]
+            sd.query_devices.return_value = {'name': 'Bluetooth Headphones'}
+            headphones = bank.chime([800], 0.1, 24000, 0.0, 0.0)
+
+        assert bank.invalidations == 1
+        assert np.abs(headphones).max() > np.abs(speaker).max()
+
+    def test_unknown_device_uses_default_amplitude(self):
+        bank = ChimeBank()
+        sd = _fake_sd()
+        sd.query_devices.side_effect = RuntimeError("no devices")
+        with patch.dict("sys.modules", sounddevice=sd):
+            assert bank.device_profile().amplitude == chime_bank.DEFAULT_AMPLITUDE
+
+
+class TestPTTTones:
+    """Test PTT tones come from the bank."""
+
+    def test_ptt_tone_is_cached(self):
+        from voice_mode.ptt.audio_tones import get_ptt_tone, ptt_start_tone
+
+        tone = get_ptt_tone("start", 0.5, 44100)
+        assert get_ptt_tone("start", 0.5, 44100) is tone
+        np.testing.assert_array_equal(tone, ptt_start_tone(0.5, 44100))
+
+    def test_unknown_tone(self):
+        from voice_mode.ptt.audio_tones import get_ptt_tone
+
+        with pytest.raises(KeyError):
+            get_ptt_tone("fanfare")
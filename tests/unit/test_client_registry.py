@@ -0,0 +1,161 @@
+"""Tests for the shared per-endpoint AsyncOpenAI client registry."""
+
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+
+from voice_mode.connection_pool import TIMEOUT_PROFILES, OpenAIClientRegistry, _limits_for_endpoint
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b'{"data": []}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_server():
+    """Run a keep-alive HTTP server on a random local port."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/v1"
+    server.shutdown()
+    server.server_close()
+
+
+class TestClientRegistry:
+    """Test client caching and connection reuse accounting."""
+
+    def test_same_key_returns_same_client(self):
+        registry = OpenAIClientRegistry()
+        a = registry.get_client("http://127.0.0.1:8880/v1", "key")
+        b = registry.get_client("http://127.0.0.1:8880/v1", "key")
+        assert a is b
+
+        stats = registry.get_stats()["http://127.0.0.1:8880/v1"]
+        assert stats["clients_created"] == 1
+        assert stats["client_reuses"] == 1
+
+    def test_different_keys_get_different_clients(self):
+        registry = OpenAIClientRegistry()
+        base = registry.get_client("http://127.0.0.1:8880/v1", "key")
+        assert registry.get_client("http://127.0.0.1:8880/v1", "other-key") is not base
+        assert registry.get_client("http://127.0.0.1:8880/v1", "key", "custom") is not base
+        assert registry.get_client("https://api.openai.com/v1", "key") is not base
+
+    def test_pool_sizes_per_endpoint(self):
+        local = _limits_for_endpoint("http://127.0.0.1:8880/v1")
+        remote = _limits_for_endpoint("https://api.openai.com/v1")
+        assert local.max_keepalive_connections < remote.max_keepalive_connections
+        # Keep-alive must outlive the gap between conversation turns
+        assert remote.keepalive_expiry > 5.0
+
+    def test_default_timeout_allows_long_requests(self):
+        # Long STT uploads and slow local TTS need the openai SDK's 600s read timeout
+        assert TIMEOUT_PROFILES["default"].read >= 600.0
+
+    def test_failover_timeout_is_short(self):
+        # A hung local server must not hold up failover to the next endpoint
+        assert TIMEOUT_PROFILES["failover"].read <= 30.0
+
+    def test_profiles_get_separate_clients(self):
+        registry = OpenAIClientRegistry()
+
+        default = registry.get_client("http://127.0.0.1:8880/v1", "key")
+        failover = registry.get_client("http://127.0.0.1:8880/v1", "key", timeout_profile="failover")
+
+        assert default is not failover
+        assert failover._client.timeout.read == TIMEOUT_PROFILES["failover"].read
+
+    def test_new_event_loop_gets_fresh_client(self):
+        registry = OpenAIClientRegistry()
+
+        async def get():
+            return registry.get_client("http://127.0.0.1:8880/v1", "key")
+
+        first = asyncio.run(get())
+        second = asyncio.run(get())
+        assert first is not second
+        # The first loop's client was closed as that loop shut down
+        assert first._client.is_closed
+
+    def test_client_from_idle_loop_is_closed_by_close_all(self):
+        registry = OpenAIClientRegistry()
+
+        async def get():
+            return registry.get_client("http://127.0.0.1:8880/v1", "key")
+
+        loop = asyncio.new_event_loop()
+        try:
+            first = loop.run_until_complete(get())
+
+            async def replace_and_close():
+                second = await get()
+                await registry.close_all()
+                return second
+
+            second = asyncio.run(replace_and_close())
+            assert first is not second
+            assert first._client.is_closed
+            assert second._client.is_closed
+        finally:
+            # Let the cancelled closer task finish on its own loop
+            loop.run_until_complete(asyncio.sleep(0))
+            loop.close()
+
+    def test_warm_connection_is_reused(self, local_server):
+        registry = OpenAIClientRegistry()
+
+        async def run():
+            assert await registry.warm(local_server, "key")
+            client = registry.get_client(local_server, "key")
+            await client.models.list()
+            await registry.close_all()
+
+        asyncio.run(run())
+
+        stats = registry.get_stats()[local_server]
+        assert stats["requests"] == 2
+        assert stats["new_connections"] == 1
+        assert stats["reused_connections"] == 1
+
+    def test_close_all_closes_clients(self):
+        registry = OpenAIClientRegistry()
+
+        async def run():
+            client = registry.get_client("http://127.0.0.1:8880/v1", "key")
+            await registry.close_all()
+            return client
+
+        client = asyncio.run(run())
+        assert client._client.is_closed
+
+    def test_server_lifespan_closes_clients_on_its_loop(self):
+        from voice_mode import _lifespan
+
+        registry = OpenAIClientRegistry()
+
+        async def cleanup(openai_clients):
+            await registry.close_all()
+
+        async def run():
+            async with _lifespan(None):
+                client = registry.get_client("http://127.0.0.1:8880/v1", "key")
+            return client
+
+        with patch("voice_mode.core.cleanup", cleanup):
+            client = asyncio.run(run())
+        assert client._client.is_closed
@@ -0,0 +1,206 @@
+"""Tests for transcribing segments while the user is still talking."""
+
+import asyncio
+import io
+import queue
+import wave
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pytest
+
+from voice_mode.incremental_stt import IncrementalTranscriber
+
+RATE = 24000
+CHUNK = 720  # 30ms
+
+
+def _chunks(seconds, level):
+    return [np.full(CHUNK, level, dtype=np.int16) for _ in range(int(seconds * RATE / CHUNK))]
+
+
+def _client(calls, fail_on=None):
+    async def create(model, file, response_format):
+        index = len(calls)
+        calls.append(file.read())
+        if fail_on == index:
+            raise ConnectionError("whisper went away")
+        return f"part{index + 1} "
+
+    client = MagicMock()
+    client.audio.transcriptions.create = AsyncMock(side_effect=create)
+    return client
+
+
+async def _record(transcriber, chunks, speech_level=1000):
+    """Feed chunks from a worker thread, as the recorder does."""
+    def run():
+        for chunk in chunks:
+            transcriber.process(chunk, bool(chunk[0] >= speech_level))
+    await asyncio.get_running_loop().run_in_executor(None, run)
+    return np.concatenate(chunks)
+
+
+class TestIncrementalTranscriber:
+    """Test segmentation at pauses and stitching."""
+
+    @pytest.mark.asyncio
+    async def test_segments_sent_while_recording(self):
+        calls = []
+        transcriber = IncrementalTranscriber(_client(calls), asyncio.get_running_loop(), sample_rate=RATE,
+                                             pause_ms=300, min_segment=2.0)
+        audio = await _record(transcriber, _chunks(2.5, 1000) + _chunks(0.4, 0) + _chunks(2.5, 1000)
+                              + _chunks(0.4, 0) + _chunks(1.0, 1000) + _chunks(0.2, 0))
+        await asyncio.sleep(0.05)
+
+        # Two segments were cut at the pauses before the recording ended
+        assert len(transcriber.segments) == 2
+        assert len(calls) == 2
+
+        text = await transcriber.finish(audio)
+        assert text == "part1 part2 part3"
+        assert len(calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_short_pause_or_segment_is_not_cut(self):
+        calls = []
+        transcriber = IncrementalTranscriber(_client(calls), asyncio.get_running_loop(), sample_rate=RATE,
+                                             pause_ms=300, min_segment=3.0)
+        # A pause too short, then a long pause after too little speech
+        audio = await _record(transcriber, _chunks(0.5, 1000) + _chunks(0.1, 0) + _chunks(0.5, 1000)
+                              + _chunks(1.0, 0))
+
+        assert transcriber.segments == []
+        assert await transcriber.finish(audio) == "part1"
+
+    @pytest.mark.asyncio
+    async def test_unseen_audio_falls_back(self):
+        transcriber = IncrementalTranscriber(_client([]), asyncio.get_running_loop(), sample_rate=RATE)
+        audio = await _record(transcriber, _chunks(1.0, 1000))
+        # e.g. the recorder fell back to a fixed-duration recording
+        assert await transcriber.finish(np.concatenate([audio, audio])) is None
+
+    @pytest.mark.asyncio
+    async def test_failed_segment_falls_back(self):
+        calls = []
+        transcriber = IncrementalTranscriber(_client(calls, fail_on=0), asyncio.get_running_loop(),
+                                             sample_rate=RATE, pause_ms=300, min_segment=2.0)
+        audio = await _record(transcriber, _chunks(2.5, 1000) + _chunks(0.4, 0) + _chunks(1.0, 1000))
+        assert await transcriber.finish(audio) is None
+
+    @pytest.mark.asyncio
+    async def test_trailing_silence_is_not_transcribed(self):
+        calls = []
+        transcriber = IncrementalTranscriber(_client(calls), asyncio.get_running_loop(), sample_rate=RATE,
+                                             pause_ms=300, min_segment=2.0)
+        # End-of-speech silence completes the last segment before recording stops
+        audio = await _record(transcriber, _chunks(2.5, 1000) + _chunks(1.0, 0))
+
+        assert await transcriber.finish(audio) == "part1"
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_trimmer_cuts_leading_and_trailing_silence(self):
+        from types import SimpleNamespace
+        from voice_mode.silence_trim import SilenceTrimmer
+
+        calls = []
+        trimmer = SilenceTrimmer(sample_rate=RATE, pad_ms=300)
+        transcriber = IncrementalTranscriber(_client(calls), asyncio.get_running_loop(), sample_rate=RATE,
+                                             pause_ms=300, min_segment=2.0, trimmer=trimmer)
+
+        def process(chunk, is_speech):
+            # The trimmer sees each chunk first, as in converse
+            trimmer.process(chunk, is_speech)
+            transcriber.process(chunk, is_speech)
+
+        first, last = _chunks(2.5, 1000), _chunks(1.0, 1000)
+        pause = _chunks(0.4, 0)
+        audio = await _record(SimpleNamespace(process=process),
+                              _chunks(1.0, 0) + first + pause + last + _chunks(1.0, 0))
+        assert await transcriber.finish(audio) == "part1 part2"
+
+        def samples(wav):
+            with wave.open(io.BytesIO(wav)) as f:
+                return f.getnframes()
+
+        pad = int(0.3 * RATE)
+        # The first segment is cut at the 300ms pause; the rest of the pause leads the last one
+        assert samples(calls[0]) == pad + len(first) * CHUNK + pad
+        assert samples(calls[1]) == (len(pause) - 10) * CHUNK + len(last) * CHUNK + pad
+
+
+class TestRecorderVadListener:
+    """Test the VAD recorder reports each chunk with its decision."""
+
+    def test_listener_sees_every_recorded_chunk(self):
+        from voice_mode.tools import converse
+
+        t = np.arange(CHUNK) / RATE
+        speech = (np.sin(2 * np.pi * 300 * t) * 8000).astype(np.int16)
+        frames = queue.Queue()
+
+        def begin_recording(capture):
+            # The open stream's callback writes into the recorder's buffer and queues views
+            for chunk in [speech] * 30 + [np.zeros(CHUNK, dtype=np.int16)] * 60:
+                frames.put(capture.append(chunk.reshape(-1, 1)))
+        mic = MagicMock(queue=frames, begin_recording=begin_recording)
+
+        seen = []
+        audio, speech_detected = converse.record_audio_with_silence_detection(
+            10.0, mic=mic, vad_listener=lambda chunk, is_speech: seen.append((len(chunk), is_speech))
+        )
+
+        assert speech_detected
+        assert sum(n for n, _ in seen) == len(audio)
+        assert any(is_speech for _, is_speech in seen)
+        assert not seen[-1][1]
+
+    def test_device_retry_restarts_listeners(self):
+        import sounddevice
+        from unittest.mock import patch
+        from voice_mode.silence_trim import SilenceTrimmer
+        from voice_mode.tools import converse
+
+        t = np.arange(CHUNK) / RATE
+        speech = (np.sin(2 * np.pi * 300 * t) * 8000).astype(np.int16)
+        silence = np.zeros(CHUNK, dtype=np.int16)
+        opens = []
+
+        class Stream:
+            """The first device is gone; the new default device works."""
+
+            def __init__(self, callback, **kwargs):
+                opens.append(self)
+                if len(opens) == 1:
+                    raise sounddevice.PortAudioError("Device unavailable")
+                self.callback = callback
+
+            def __enter__(self):
+                for chunk in [speech] * 20 + [silence] * 60:
+                    self.callback(chunk.reshape(-1, 1), CHUNK, None, None)
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+        fake_sd = MagicMock(InputStream=Stream, PortAudioError=sounddevice.PortAudioError)
+        encoder = MagicMock()
+        trimmer = SilenceTrimmer(sample_rate=RATE, encoder=encoder)
+        listener = converse.VADListenerGroup([trimmer])
+
+        with patch.object(converse, "sd", fake_sd), patch.object(converse, "close_output_engine"), \
+             patch("time.sleep"):
+            # Barge-in speech reaches the listeners before the input stream is opened
+            audio, speech_detected = converse.record_audio_with_silence_detection(
+                10.0, initial_audio=np.tile(speech, 10), vad_listener=listener
+            )
+
+        assert speech_detected
+        assert len(opens) == 2
+        # The encoding of the failed attempt is discarded, and the listeners saw the retry once
+        encoder.abort.assert_called_once()
+        assert trimmer.encoder is None
+        assert trimmer.samples == len(audio)
+        trimmed, seconds = trimmer.trim(audio)
+        assert 0 < len(trimmed) < len(audio)
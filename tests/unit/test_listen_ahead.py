@@ -0,0 +1,165 @@
+"""Tests for opening the microphone during the tail of TTS playback."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from voice_mode.listen_ahead import BASELINE_PAUSE, ListenAhead
+from voice_mode.output_engine import BufferJob
+
+
+class FakeInputStream:
+    """Calls the input callback from a thread with frames from a level function."""
+
+    instances = []
+
+    def __init__(self, samplerate, channels, dtype, callback, blocksize):
+        self.callback = callback
+        self.blocksize = blocksize
+        self.level = lambda: 0
+        self._running = False
+        FakeInputStream.instances.append(self)
+
+    def start(self):
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while self._running:
+            frame = np.full((self.blocksize, 1), self.level(), dtype=np.int16)
+            self.callback(frame, self.blocksize, None, None)
+            time.sleep(0.002)
+
+    def stop(self):
+        self._running = False
+        self._thread.join()
+
+    def close(self):
+        pass
+
+    # The recorder uses the stream as a context manager when it opens its own
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+@pytest.fixture
+def fake_mic():
+    FakeInputStream.instances = []
+    sd = MagicMock(InputStream=FakeInputStream)
+    with patch.dict("sys.modules", sounddevice=sd):
+        yield FakeInputStream.instances
+
+
+class TestListenAhead:
+    """Test early open, settle measurement and hand-off."""
+
+    @pytest.mark.asyncio
+    async def test_opens_when_playback_tail_is_reached(self, fake_mic, isolated_output_engine):
+        job = BufferJob(np.ones(24000, dtype=np.int16))
+        isolated_output_engine._streams[24000] = MagicMock(jobs=[job], sample_rate=24000)
+        mic = ListenAhead()
+        opener = asyncio.create_task(mic.open_near_end_of_playback(window=0.5, poll=0.005))
+
+        await asyncio.sleep(0.03)
+        assert mic.stream is None  # 1s of audio left
+
+        job.position = 24000 - 6000  # 0.25s left
+        await asyncio.wait_for(opener, timeout=1)
+        assert mic.stream is not None
+        assert mic.opened_during_playback
+        mic.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_start_is_not_left_open(self, fake_mic, isolated_output_engine):
+        job = BufferJob(np.ones(6000, dtype=np.int16))
+        isolated_output_engine._streams[24000] = MagicMock(jobs=[job], sample_rate=24000)
+        mic = ListenAhead()
+
+        with patch.object(FakeInputStream, "start", side_effect=OSError("device busy")):
+            await asyncio.wait_for(mic.open_near_end_of_playback(window=0.5, poll=0.005), timeout=1)
+        assert mic.stream is None
+
+        # The open after playback tries again
+        mic.open()
+        assert mic.stream is not None
+        mic.close()
+
+    @pytest.mark.asyncio
+    async def test_streaming_job_does_not_open_early(self, isolated_output_engine):
+        from voice_mode.streaming import PCMOutputBuffer, StreamMetrics
+
+        output = PCMOutputBuffer(StreamMetrics(), time.perf_counter())
+        isolated_output_engine._streams[24000] = MagicMock(jobs=[output], sample_rate=24000)
+        assert isolated_output_engine.queued_seconds() is None  # More audio may arrive
+        output.finished_writing = True
+        assert isolated_output_engine.queued_seconds() == 0.0
+
+    @pytest.mark.asyncio
+    async def test_settle_waits_for_echo_to_decay(self, fake_mic):
+        mic = ListenAhead()
+        mic.open()
+        echo_until = time.perf_counter() + 0.1
+        fake_mic[0].level = lambda: 3000 if time.perf_counter() < echo_until else 10
+
+        settle = await mic.settle(max_wait=1.0, quiet_rms=300)
+        mic.close()
+
+        assert 0.08 <= settle < 0.5
+        # Opened after playback, so only the shortened pause counts
+        assert mic.saved_time == pytest.approx(BASELINE_PAUSE - settle)
+
+    @pytest.mark.asyncio
+    async def test_settle_is_capped(self, fake_mic):
+        mic = ListenAhead()
+        mic.open()
+        fake_mic[0].level = lambda: 5000  # Never quiet
+
+        settle = await mic.settle(max_wait=0.05, quiet_rms=300)
+        mic.close()
+
+        assert settle == pytest.approx(0.05, abs=0.03)
+
+    def test_recorder_reads_from_open_stream(self, fake_mic):
+        from voice_mode.tools import converse
+
+        mic = ListenAhead()
+        mic.open()
+        fake_mic[0].level = lambda: 2000
+        time.sleep(0.02)  # Frames before recording begins are not recorded
+        fake_mic[0].level = lambda: 0
+        started = time.perf_counter()
+
+        with patch.object(converse.sd, "InputStream", side_effect=AssertionError("reopened")):
+            audio, speech_detected = converse.record_audio_with_silence_detection(
+                5.0, initial_audio=np.full(7200, 1000, dtype=np.int16), mic=mic
+            )
+        mic.close()
+
+        assert speech_detected
+        assert len(fake_mic) == 1
+        assert audio[:7200].min() == 1000
+        assert not audio[7200:].any()
+        assert time.perf_counter() - started < 5.0
+
+    def test_recorder_gives_up_on_a_silent_stream(self, fake_mic):
+        from voice_mode.tools import converse
+
+        # An open stream whose callback never delivers frames
+        mic = ListenAhead()
+        mic.stream = MagicMock()
+        started = time.perf_counter()
+
+        audio, speech_detected = converse.record_audio_with_silence_detection(0.2, mic=mic)
+
+        assert not speech_detected
+        assert len(audio) == 0
+        assert time.perf_counter() - started < 3.0
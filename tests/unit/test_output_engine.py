@@ -0,0 +1,256 @@
+"""Tests for the persistent output stream engine."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from voice_mode import output_engine
+from voice_mode.output_engine import OutputEngine
+
+
+class FakeCallbackStream:
+    """Calls the stream callback from a background thread like PortAudio does."""
+
+    def __init__(self, samplerate, channels, dtype, callback, blocksize=256, interval=0.001):
+        self.samplerate = samplerate
+        self.callback = callback
+        self.blocksize = blocksize
+        self.interval = interval
+        self.played = []
+        self.active = False
+        self._thread = None
+
+    def start(self):
+        self.active = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while self.active:
+            outdata = np.full((self.blocksize, 1), 12345, dtype=np.int16)
+            self.callback(outdata, self.blocksize, None, None)
+            self.played.append(outdata[:, 0].copy())
+            time.sleep(self.interval)
+
+    def stop(self):
+        self.active = False
+        if self._thread:
+            self._thread.join()
+
+    def close(self):
+        self.stop()
+
+
+@pytest.fixture
+def fake_sd():
+    streams = []
+
+    def make_stream(**kwargs):
+        streams.append(FakeCallbackStream(**kwargs))
+        return streams[-1]
+
+    sd = MagicMock(OutputStream=make_stream)
+    sd.default.device = [None, 1]
+    with patch.object(output_engine, "sd", sd):
+        yield sd, streams
+
+
+class TestOutputEngine:
+    """Test stream reuse, ordering and device changes."""
+
+    def test_stream_is_opened_once(self, fake_sd):
+        sd, streams = fake_sd
+        engine = OutputEngine()
+
+        first = engine.play(np.full(300, 1, dtype=np.int16), 24000)
+        assert first.wait(timeout=2)
+        assert engine.is_warm(24000)
+        second = engine.play(np.full(300, 2, dtype=np.int16), 24000)
+        assert second.wait(timeout=2)
+        engine.close()
+
+        assert len(streams) == 1
+        assert engine.opens == 1
+        assert first.open_time > 0
+        assert second.open_time == 0.0
+
+    def test_jobs_play_in_order_with_silence_between(self, fake_sd):
+        sd, streams = fake_sd
+        engine = OutputEngine()
+
+        jobs = [engine.play(np.full(500, value, dtype=np.int16), 16000) for value in (1, 2, 3)]
+        assert all(job.wait(timeout=2) for job in jobs)
+        time.sleep(0.01)
+        engine.close()
+
+        played = np.concatenate(streams[0].played)
+        # Idle blocks are silent, never left with stale data
+        assert 12345 not in played
+        audible = played[played != 0]
+        assert list(dict.fromkeys(audible.tolist())) == [1, 2, 3]
+        assert len(audible) == 1500
+
+    def test_float_buffers_are_converted(self, fake_sd):
+        sd, streams = fake_sd
+        engine = OutputEngine()
+
+        job = engine.play(np.full((200, 2), 0.5, dtype=np.float32), 24000)
+        assert job.wait(timeout=2)
+        engine.close()
+
+        played = np.concatenate(streams[0].played)
+        assert set(played[played != 0].tolist()) == {16383}
+
+    def test_stereo_int16_buffers_are_downmixed(self, fake_sd):
+        sd, streams = fake_sd
+        engine = OutputEngine()
+
+        job = engine.play(np.array([[1000, 1000], [-2000, -2000]] * 100, dtype=np.int16), 24000)
+        assert job.wait(timeout=2)
+        engine.close()
+
+        played = np.concatenate(streams[0].played)
+        assert set(played[played != 0].tolist()) == {1000, -2000}
+
+    def test_device_change_reopens_stream(self, fake_sd):
+        sd, streams = fake_sd
+        engine = OutputEngine()
+
+        assert engine.play(np.ones(100, dtype=np.int16), 24000).wait(timeout=2)
+        sd.default.device = [None, 4]
+        assert not engine.is_warm(24000)
+        job = engine.play(np.ones(100, dtype=np.int16), 24000)
+        assert job.wait(timeout=2)
+        engine.close()
+
+        assert len(streams) == 2
+        assert not streams[0].active
+        assert job.open_time > 0
+
+    def test_dead_stream_reinitializes_portaudio(self, fake_sd):
+        sd, streams = fake_sd
+        engine = OutputEngine()
+
+        assert engine.play(np.ones(100, dtype=np.int16), 24000).wait(timeout=2)
+        assert engine.is_open
+        # The device went away and PortAudio stopped the stream
+        streams[0].stop()
+        with patch("voice_mode.chime_bank.get_chime_bank") as get_chime_bank:
+            job = engine.play(np.ones(100, dtype=np.int16), 24000)
+        assert job.wait(timeout=2)
+        engine.close()
+
+        assert len(streams) == 2
+        sd._terminate.assert_called_once()
+        sd._initialize.assert_called_once()
+        get_chime_bank.return_value.invalidate.assert_called_once()
+        assert engine.reinitializations == 1
+
+    def test_device_change_on_live_stream_keeps_portaudio(self, fake_sd):
+        sd, streams = fake_sd
+        engine = OutputEngine()
+
+        assert engine.play(np.ones(100, dtype=np.int16), 24000).wait(timeout=2)
+        sd.default.device = [None, 4]
+        assert engine.play(np.ones(100, dtype=np.int16), 24000).wait(timeout=2)
+        engine.close()
+
+        sd._terminate.assert_not_called()
+        assert engine.reinitializations == 0
+
+    def test_refresh_reopens_on_new_default_device(self, fake_sd):
+        sd, streams = fake_sd
+        sd.query_devices.side_effect = [{'name': 'MacBook Speakers'}, {'name': 'AirPods'}]
+        engine = OutputEngine()
+
+        assert engine.play(np.ones(100, dtype=np.int16), 24000).wait(timeout=2)
+        with patch("voice_mode.chime_bank.get_chime_bank") as get_chime_bank:
+            assert engine.refresh_device()
+        job = engine.play(np.ones(100, dtype=np.int16), 24000)
+        assert job.wait(timeout=2)
+        engine.close()
+
+        sd._terminate.assert_called_once()
+        get_chime_bank.return_value.invalidate.assert_called_once()
+        # Reopened during the refresh, and the next playback pays for it
+        assert len(streams) == 2
+        assert engine.opens == 2
+        assert job.open_time > 0
+
+    @pytest.mark.asyncio
+    async def test_background_refresh_is_awaited_before_queueing(self, fake_sd):
+        sd, streams = fake_sd
+        engine = OutputEngine()
+        assert engine.play(np.ones(100, dtype=np.int16), 24000).wait(timeout=2)
+
+        sd._initialize.side_effect = lambda: time.sleep(0.05)
+        engine.start_refresh()
+        # Streams being reopened by the refresh count as warm
+        assert engine.is_warm(24000)
+        await engine.wait_refresh()
+        job = engine.play(np.ones(100, dtype=np.int16), 24000)
+        assert job.wait(timeout=2)
+        engine.close()
+
+        assert engine.reinitializations == 1
+        assert job.open_time >= 0.05
+
+    def test_refresh_skipped_while_playing(self, fake_sd):
+        sd, streams = fake_sd
+        engine = OutputEngine()
+        job = engine.play(np.ones(24000 * 10, dtype=np.int16), 24000)
+
+        assert not engine.refresh_device()
+        engine.close()
+
+        sd._terminate.assert_not_called()
+        assert job.cancelled
+
+    def test_close_cancels_queued_jobs(self, fake_sd):
+        engine = OutputEngine()
+        job = engine.play(np.ones(24000 * 10, dtype=np.int16), 24000)
+        engine.close()
+
+        assert job.cancelled
+        assert job.wait(timeout=0)
+
+    def test_disabled_engine(self):
+        with patch("voice_mode.config.OUTPUT_ENGINE_ENABLED", False):
+            assert output_engine.get_output_engine() is None
+
+
+class TestPlaySamples:
+    """Test core playback reports device open time."""
+
+    @pytest.mark.asyncio
+    async def test_warm_stream_skips_device_open(self, fake_sd, isolated_output_engine):
+        from voice_mode.core import output_needs_warmup, play_samples
+
+        assert output_needs_warmup(24000)
+        assert await play_samples(np.ones(100, dtype=np.int16), 24000) > 0
+        assert not output_needs_warmup(24000)
+        assert await play_samples(np.ones(100, dtype=np.int16), 24000) == 0.0
+        assert isolated_output_engine.opens == 1
+
+    @pytest.mark.asyncio
+    async def test_event_loop_runs_during_playback(self, fake_sd, isolated_output_engine):
+        from voice_mode.core import play_samples
+
+        # Stands in for the task that opens the mic near the end of playback
+        ran_during_playback = asyncio.Event()
+
+        async def other_task():
+            ran_during_playback.set()
+
+        playback = asyncio.create_task(play_samples(np.ones(256 * 20, dtype=np.int16), 24000))
+        task = asyncio.create_task(other_task())
+        await asyncio.sleep(0)
+        assert not playback.done()
+        await asyncio.wait_for(playback, timeout=2)
+
+        assert ran_during_playback.is_set()
+        await task
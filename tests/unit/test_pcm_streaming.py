@@ -0,0 +1,129 @@
+"""Tests for callback-driven PCM streaming with backpressure."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from voice_mode import output_engine, streaming
+from voice_mode.streaming import stream_pcm_audio
+
+
+class FakeCallbackStream:
+    """Calls the stream callback from a background thread like PortAudio does."""
+
+    def __init__(self, samplerate, channels, dtype, callback, blocksize=480, speedup=4.0):
+        self.callback = callback
+        self.blocksize = blocksize
+        self.interval = blocksize / samplerate / speedup
+        self.played = []
+        self._running = False
+        self._thread = None
+
+    def start(self):
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while self._running:
+            outdata = np.empty((self.blocksize, 1), dtype=np.int16)
+            self.callback(outdata, self.blocksize, None, None)
+            self.played.append(outdata[:, 0].copy())
+            time.sleep(self.interval)
+
+    def stop(self):
+        self._running = False
+        if self._thread:
+            self._thread.join()
+
+    def close(self):
+        self.stop()
+
+
+def _fake_client(pcm: bytes, chunk_bytes: int = 4096):
+    class Response:
+        async def iter_bytes(self, chunk_size=None):
+            for start in range(0, len(pcm), chunk_bytes):
+                yield pcm[start:start + chunk_bytes]
+                await asyncio.sleep(0)
+
+    class Context:
+        async def __aenter__(self):
+            return Response()
+
+        async def __aexit__(self, *exc):
+            pass
+
+    client = MagicMock()
+    client.audio.speech.with_streaming_response.create = lambda **params: Context()
+    return client
+
+
+class TestPCMStreaming:
+    """Test that network reads and playback are decoupled."""
+
+    @pytest.mark.asyncio
+    async def test_backpressure_without_blocking_event_loop(self):
+        samples = (np.arange(12000) % 1000 + 1).astype(np.int16)
+        created = {}
+
+        def make_stream(**kwargs):
+            created["stream"] = FakeCallbackStream(**kwargs)
+            return created["stream"]
+
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        ticker_task = asyncio.create_task(ticker())
+        with patch.object(output_engine, "sd", MagicMock(OutputStream=make_stream)), \
+             patch.object(streaming, "STREAM_MAX_BUFFER", 0.05):
+            success, metrics = await stream_pcm_audio(
+                text="test",
+                openai_client=_fake_client(samples.tobytes()),
+                request_params={"response_format": "pcm"},
+                capture_pcm=True
+            )
+        ticker_task.cancel()
+
+        assert success
+        assert metrics.backpressure_waits > 0
+        assert metrics.backpressure_time > 0
+        assert metrics.max_buffered <= 0.05 + 1e-9
+        assert metrics.pcm_data == samples.tobytes()
+        # The event loop kept running while the reader waited for buffer space
+        assert ticks > metrics.backpressure_waits // 2
+
+        played = np.concatenate(created["stream"].played)
+        played = played[played != 0]
+        np.testing.assert_array_equal(played, samples)
+
+    @pytest.mark.asyncio
+    async def test_odd_chunk_sizes_are_realigned(self):
+        samples = (np.arange(3000) % 500 + 1).astype(np.int16)
+        created = {}
+
+        def make_stream(**kwargs):
+            created["stream"] = FakeCallbackStream(**kwargs)
+            return created["stream"]
+
+        with patch.object(output_engine, "sd", MagicMock(OutputStream=make_stream)):
+            success, metrics = await stream_pcm_audio(
+                text="test",
+                openai_client=_fake_client(samples.tobytes(), chunk_bytes=1001),
+                request_params={"response_format": "pcm"},
+                capture_pcm=True
+            )
+
+        assert success
+        assert metrics.pcm_data == samples.tobytes()
+        played = np.concatenate(created["stream"].played)
+        np.testing.assert_array_equal(played[played != 0], samples)
@@ -0,0 +1,115 @@
+"""Tests for resampling STT uploads to 16 kHz."""
+
+import shutil
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from scipy import signal
+
+from voice_mode.resample import PolyphaseResampler, resample
+
+
+def _tone(freq, seconds=1.0, sample_rate=24000, amplitude=10000):
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    return (np.sin(2 * np.pi * freq * t) * amplitude).astype(np.int16)
+
+
+def _rms(samples):
+    return np.sqrt(np.mean(samples.astype(np.float64) ** 2))
+
+
+class TestResample:
+    """Test the filter keeps speech and rejects what would alias."""
+
+    def test_matches_resample_poly(self):
+        samples = np.random.default_rng(0).normal(0, 3000, 24001).astype(np.int16)
+        expected = signal.resample_poly(samples.astype(np.float64), 2, 3)
+        converted = resample(samples, 24000, 16000)
+        assert len(converted) == 16001
+        assert np.abs(converted - expected).max() <= 0.5 + 1e-6
+
+    def test_speech_band_is_kept(self):
+        for freq in (300, 1000, 3000, 6000):
+            converted = resample(_tone(freq), 24000, 16000)[200:-200]
+            assert _rms(converted) == pytest.approx(_rms(_tone(freq)), rel=0.02)
+
+    def test_content_above_new_nyquist_is_removed(self):
+        # A 10 kHz tone would fold to 6 kHz without the anti-aliasing filter
+        converted = resample(_tone(10000), 24000, 16000)[200:-200]
+        assert _rms(converted) < 0.01 * _rms(_tone(10000))
+
+    def test_same_rate_passes_through(self):
+        samples = _tone(440)
+        assert np.shares_memory(resample(samples, 24000, 24000), samples)
+
+
+class TestPolyphaseResampler:
+    """Test chunked conversion is identical to converting the whole recording."""
+
+    @pytest.mark.parametrize("rates", [(24000, 16000), (16000, 24000), (44100, 16000)])
+    def test_chunked_matches_whole(self, rates):
+        from_rate, to_rate = rates
+        rng = np.random.default_rng(1)
+        samples = rng.normal(0, 3000, from_rate // 2 + 7).astype(np.int16)
+
+        resampler = PolyphaseResampler(from_rate, to_rate)
+        out, i = [], 0
+        while i < len(samples):
+            step = int(rng.integers(1, 1500))
+            out.append(resampler.process(samples[i:i + step]))
+            i += step
+        out.append(resampler.flush())
+
+        np.testing.assert_array_equal(np.concatenate(out), resample(samples, from_rate, to_rate))
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7])
+    def test_small_chunks_match_whole(self, chunk_size):
+        # Recorder callbacks without a fixed blocksize can deliver tiny blocks
+        samples = np.random.default_rng(2).normal(0, 3000, 4801).astype(np.int16)
+
+        resampler = PolyphaseResampler(48000, 16000)
+        out = [resampler.process(samples[i:i + chunk_size]) for i in range(0, len(samples), chunk_size)]
+        out.append(resampler.flush())
+
+        np.testing.assert_array_equal(np.concatenate(out), resample(samples, 48000, 16000))
+
+    def test_history_stays_bounded(self):
+        resampler = PolyphaseResampler(24000, 16000)
+        for _ in range(500):
+            resampler.process(np.zeros(720, dtype=np.int16))
+        assert len(resampler._history) < resampler.taps + 720
+
+
+class TestUploadRate:
+    """Test the upload rate is configurable per endpoint."""
+
+    def test_default_and_overrides(self):
+        from voice_mode import config
+
+        overrides = {"https://api.openai.com/v1": 24000, "http://gpu-box:2022/v1": 0}
+        with patch.object(config, "STT_UPLOAD_SAMPLE_RATE", 16000), \
+             patch.object(config, "STT_UPLOAD_SAMPLE_RATES", overrides):
+            assert config.get_stt_upload_sample_rate("http://127.0.0.1:2022/v1") == 16000
+            assert config.get_stt_upload_sample_rate("https://api.openai.com/v1/") == 24000
+            # 0 keeps the capture rate
+            assert config.get_stt_upload_sample_rate("http://gpu-box:2022/v1") == config.SAMPLE_RATE
+        with patch.object(config, "STT_UPLOAD_SAMPLE_RATE", 0):
+            assert config.get_stt_upload_sample_rate(None) == config.SAMPLE_RATE
+
+    @pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not installed")
+    def test_streaming_encoder_resamples(self):
+        from voice_mode.audio_decode import decode_audio_bytes
+        from voice_mode.audio_encode import StreamingEncoder
+
+        samples = _tone(440)
+        encoder = StreamingEncoder("flac", 24000, upload_rate=16000)
+        for chunk in np.array_split(samples, 33):
+            encoder.feed(chunk)
+        upload = encoder.finish()
+
+        assert upload.sample_rate == 16000
+        assert upload.samples == len(samples)
+        decoded = decode_audio_bytes(upload.data, "flac", sample_rate=16000)
+        np.testing.assert_array_equal(np.round(decoded.samples * 32768).astype(np.int16),
+                                      resample(samples, 24000, 16000))
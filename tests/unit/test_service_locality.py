@@ -0,0 +1,158 @@
+"""Tests for local-vs-forwarded service lookups."""
+
+import os
+import socket
+import sys
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pytest
+
+from voice_mode.utils.services import common
+from voice_mode.utils.services.common import ServiceLocalityCache
+
+
+class TestServiceLocalityCache:
+    """Test TTL reuse, invalidation and counters."""
+
+    def test_reuses_result_within_ttl(self):
+        cache = ServiceLocalityCache(ttl=60)
+        with patch.object(common, "check_service_status", return_value=("local", None)) as check:
+            assert cache.get(2022) == ("local", None)
+            assert cache.get(2022) == ("local", None)
+            assert cache.get(2022) == ("local", None)
+
+        assert check.call_count == 1
+        stats = cache.get_stats()
+        assert stats['hits'] == 2
+        assert stats['misses'] == 1
+        assert stats['hit_rate'] == pytest.approx(2 / 3)
+
+    def test_expired_entry_is_looked_up_again(self):
+        cache = ServiceLocalityCache(ttl=60)
+        with patch.object(common, "check_service_status", side_effect=[("local", None), ("forwarded", None)]), \
+             patch.object(common.time, "monotonic", side_effect=[0.0, 0.0, 61.0, 61.0]):
+            assert cache.get(2022)[0] == "local"
+            assert cache.get(2022)[0] == "forwarded"
+        assert cache.get_stats()['misses'] == 2
+
+    def test_invalidate(self):
+        cache = ServiceLocalityCache(ttl=60)
+        with patch.object(common, "check_service_status", side_effect=[("local", None), ("forwarded", None)]):
+            cache.get(2022)
+            cache.invalidate(2022)
+            assert cache.get(2022)[0] == "forwarded"
+        assert cache.get_stats()['invalidations'] == 1
+
+    def test_zero_ttl_disables_caching(self):
+        cache = ServiceLocalityCache(ttl=0)
+        with patch.object(common, "check_service_status", return_value=("local", None)) as check:
+            cache.get(2022)
+            cache.get(2022)
+        assert check.call_count == 2
+
+
+class TestSpeechToTextLocality:
+    """Test the STT path consults the cache and drops it on failure."""
+
+    def _stt_config(self, client):
+        return {'client': client, 'model': 'whisper-1', 'base_url': 'http://127.0.0.1:2022/v1',
+                'provider': 'whisper-local'}
+
+    @pytest.mark.asyncio
+    async def test_lookup_is_cached_across_turns(self, isolated_service_locality):
+        from voice_mode.tools import converse
+
+        client = MagicMock()
+        client.audio.transcriptions.create = AsyncMock(return_value="hello")
+        audio = np.full(1600, 1000, dtype=np.int16)
+
+        with patch.object(common, "check_service_status", return_value=("local", None)) as check:
+            for _ in range(3):
+                assert await converse._speech_to_text_internal(audio, self._stt_config(client), {}) == "hello"
+
+        assert check.call_count == 1
+        assert isolated_service_locality.get_stats()['hits'] == 2
+
+    @pytest.mark.asyncio
+    async def test_lookup_runs_off_the_event_loop(self, isolated_service_locality):
+        from voice_mode.tools import converse
+
+        client = MagicMock()
+        client.audio.transcriptions.create = AsyncMock(return_value="hello")
+        audio = np.full(1600, 1000, dtype=np.int16)
+        loop_thread = threading.get_ident()
+        lookup_threads = []
+
+        def check(*args, **kwargs):
+            lookup_threads.append(threading.get_ident())
+            return "local", None
+
+        with patch.object(common, "check_service_status", side_effect=check):
+            assert await converse._speech_to_text_internal(audio, self._stt_config(client), {}) == "hello"
+
+        assert lookup_threads and loop_thread not in lookup_threads
+
+    @pytest.mark.asyncio
+    async def test_failure_invalidates(self, isolated_service_locality):
+        from voice_mode.tools import converse
+
+        client = MagicMock()
+        client.audio.transcriptions.create = AsyncMock(side_effect=ConnectionError("refused"))
+        audio = np.full(1600, 1000, dtype=np.int16)
+
+        with patch.object(common, "check_service_status", return_value=("local", None)) as check:
+            assert await converse._speech_to_text_internal(audio, self._stt_config(client), {}) is None
+            assert await converse._speech_to_text_internal(audio, self._stt_config(client), {}) is None
+
+        assert check.call_count == 2
+        assert isolated_service_locality.get_stats()['invalidations'] == 2
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="/proc socket tables are Linux-only")
+class TestProcPortLookup:
+    """Test the /proc fast path for port-to-process lookups."""
+
+    def test_parses_listen_entries(self, tmp_path):
+        tcp = tmp_path / "tcp"
+        tcp.write_text(
+            "  sl  local_address rem_address   st tx_queue rx_queue tr tm->when retrnsmt   uid  timeout inode\n"
+            "   0: 0100007F:07E6 00000000:0000 0A 00000000:00000000 00:00000000 00000000  1000        0 4242 1\n"
+            "   1: 0100007F:07E6 0100007F:9C40 01 00000000:00000000 00:00000000 00000000  1000        0 4343 1\n"
+            "   2: 00000000:22B0 00000000:0000 0A 00000000:00000000 00:00000000 00000000  1000        0 4444 1\n"
+        )
+        tcp6 = tmp_path / "tcp6"
+        tcp6.write_text(
+            "  sl  local_address                         remote_address                        st\n"
+            "   0: 00000000000000000000000000000000:07E6 00000000000000000000000000000000:0000 0A "
+            "00000000:00000000 00:00000000 00000000  1000        0 4545 1\n"
+        )
+        files = (str(tcp), str(tcp6))
+
+        assert common._listen_inodes(2022, files) == {4242, 4545}  # Established sockets are skipped
+        assert common._listen_inodes(8880, files) == {4444}
+        assert common._listen_inodes(7880, files) == set()
+
+    def test_finds_own_listening_socket(self):
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as server:
+            server.bind(("127.0.0.1", 0))
+            server.listen()
+            port = server.getsockname()[1]
+
+            proc = common.find_process_by_port(port)
+
+        assert proc is not None
+        assert proc.pid == os.getpid()
+
+    def test_unused_port(self):
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as probe:
+            probe.bind(("127.0.0.1", 0))
+            port = probe.getsockname()[1]
+        assert common.find_process_by_port(port) is None
+
+    def test_falls_back_to_psutil_without_proc(self):
+        with patch.object(common, "_listen_inodes", side_effect=FileNotFoundError("no /proc")), \
+             patch.object(common, "_find_process_by_port_psutil", return_value="scanned") as scan:
+            assert common.find_process_by_port(2022) == "scanned"
+        scan.assert_called_once_with(2022)
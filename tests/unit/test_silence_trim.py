@@ -0,0 +1,120 @@
+"""Tests for trimming silence around speech before STT."""
+
+import shutil
+
+import numpy as np
+import pytest
+
+from voice_mode.silence_trim import SilenceTrimmer
+
+RATE = 24000
+CHUNK = 720  # 30ms
+
+
+def _chunks(seconds, level):
+    return [np.full(CHUNK, level, dtype=np.int16) for _ in range(int(seconds * RATE / CHUNK))]
+
+
+def _record(trimmer, chunks, speech_level=1000):
+    for chunk in chunks:
+        trimmer.process(chunk, bool(chunk[0] >= speech_level))
+    return np.concatenate(chunks)
+
+
+class _Collector:
+    def __init__(self):
+        self.fed = []
+
+    def feed(self, chunk):
+        self.fed.append(chunk.copy())
+
+
+class TestSilenceTrimmer:
+    """Test the kept span and the audio fed to the upload encoder."""
+
+    def test_trims_head_and_tail_with_pad(self):
+        trimmer = SilenceTrimmer(sample_rate=RATE, pad_ms=90)
+        audio = _record(trimmer, _chunks(1.5, 0) + _chunks(1.2, 1000) + _chunks(1.05, 0))
+
+        trimmed, seconds = trimmer.trim(audio)
+
+        pad = int(RATE * 0.09)
+        assert len(trimmed) == int(1.2 * RATE) + 2 * pad
+        assert seconds == pytest.approx((len(audio) - len(trimmed)) / RATE)
+        assert np.shares_memory(trimmed, audio)
+        # Only the pads are silence
+        assert (trimmed[:pad] == 0).all() and (trimmed[pad:-pad] == 1000).all() and (trimmed[-pad:] == 0).all()
+
+    def test_pause_inside_speech_is_kept(self):
+        trimmer = SilenceTrimmer(sample_rate=RATE, pad_ms=60)
+        audio = _record(trimmer, _chunks(0.6, 1000) + _chunks(0.9, 0) + _chunks(0.6, 1000) + _chunks(0.3, 0))
+
+        trimmed, _ = trimmer.trim(audio)
+        assert len(trimmed) == len(audio) - (int(0.3 * RATE) - int(0.06 * RATE))
+
+    def test_encoder_receives_exactly_the_kept_audio(self):
+        encoder = _Collector()
+        trimmer = SilenceTrimmer(sample_rate=RATE, pad_ms=100, encoder=encoder)
+        # Pad not a multiple of the chunk size, speech resuming after the tail pad
+        audio = _record(trimmer, _chunks(1.0, 0) + _chunks(0.6, 1000) + _chunks(0.6, 0) + _chunks(0.6, 1000)
+                        + _chunks(1.0, 0))
+
+        trimmed, _ = trimmer.trim(audio)
+        np.testing.assert_array_equal(np.concatenate(encoder.fed), trimmed)
+
+    def test_leading_silence_is_not_buffered(self):
+        trimmer = SilenceTrimmer(sample_rate=RATE, pad_ms=100)
+        _record(trimmer, _chunks(10.0, 0))
+        assert sum(len(c) for _, c in trimmer._pending) <= int(0.1 * RATE) + CHUNK
+
+    def test_unseen_or_speechless_audio_is_unchanged(self):
+        trimmer = SilenceTrimmer(sample_rate=RATE)
+        audio = _record(trimmer, _chunks(1.0, 0))
+        assert trimmer.trim(audio) == (audio, 0.0)
+
+        trimmer = SilenceTrimmer(sample_rate=RATE)
+        audio = _record(trimmer, _chunks(1.0, 1000) + _chunks(1.0, 0))
+        doubled = np.concatenate([audio, audio])
+        assert trimmer.trim(doubled)[0] is doubled
+
+    def test_clip_cuts_audio_ending_at_the_latest_chunk(self):
+        trimmer = SilenceTrimmer(sample_rate=RATE, pad_ms=90)
+        audio = _record(trimmer, _chunks(1.5, 0) + _chunks(1.2, 1000) + _chunks(1.05, 0))
+        pad = int(RATE * 0.09)
+
+        np.testing.assert_array_equal(trimmer.clip(audio), trimmer.trim(audio)[0])
+        # Only the end of the recording: the tail silence past the pad goes
+        assert len(trimmer.clip(audio[-int(2 * RATE):])) == int(2 * RATE) - (int(1.05 * RATE) - pad)
+        # Longer than what was seen: left alone
+        longer = np.concatenate([audio, audio])
+        assert trimmer.clip(longer) is longer
+
+    @pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not installed")
+    def test_streaming_upload_matches_trimmed_recording(self):
+        from voice_mode.audio_encode import StreamingEncoder
+
+        encoder = StreamingEncoder("mp3", RATE)
+        trimmer = SilenceTrimmer(sample_rate=RATE, encoder=encoder)
+        audio = _record(trimmer, _chunks(1.0, 0) + _chunks(1.0, 1000) + _chunks(1.0, 0))
+        upload = encoder.finish()
+
+        trimmed, _ = trimmer.trim(audio)
+        assert upload.samples == len(trimmed)
+
+    def test_reset_starts_over_and_drops_the_encoding(self):
+        class Encoder(_Collector):
+            aborted = False
+
+            def abort(self):
+                self.aborted = True
+
+        encoder = Encoder()
+        trimmer = SilenceTrimmer(sample_rate=RATE, pad_ms=90, encoder=encoder)
+        _record(trimmer, _chunks(0.5, 1000))
+        trimmer.reset()
+        audio = _record(trimmer, _chunks(0.6, 0) + _chunks(0.3, 1000))
+
+        assert encoder.aborted
+        assert trimmer.encoder is None
+        trimmed, seconds = trimmer.trim(audio)
+        assert len(trimmed) == int(0.39 * RATE)
@@ -0,0 +1,156 @@
+"""Tests for starting STT at silence onset."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+import pytest
+
+from voice_mode.speculative_stt import SpeculationStats, SpeculativeTranscriber, transcribe_quietly
+
+RATE = 24000
+CHUNK = 720  # 30ms
+
+
+def _chunks(seconds, level):
+    return [np.full(CHUNK, level, dtype=np.int16) for _ in range(int(seconds * RATE / CHUNK))]
+
+
+def _transcribe(calls, result="hello there", delay=0.0, error=None):
+    async def transcribe(audio):
+        calls.append(len(audio))
+        await asyncio.sleep(delay)
+        if error:
+            raise error
+        return result
+    return transcribe
+
+
+async def _record(transcriber, chunks, speech_level=1000):
+    """Feed chunks from a worker thread, as the recorder does."""
+    def run():
+        for chunk in chunks:
+            transcriber.process(chunk, bool(chunk[0] >= speech_level))
+    await asyncio.get_running_loop().run_in_executor(None, run)
+    return np.concatenate(chunks)
+
+
+class TestSpeculativeTranscriber:
+    """Test launching, discarding and using speculations."""
+
+    def _transcriber(self, transcribe, stats):
+        return SpeculativeTranscriber(transcribe, asyncio.get_running_loop(), sample_rate=RATE,
+                                      delay_ms=150, stats=stats)
+
+    @pytest.mark.asyncio
+    async def test_result_used_when_silence_continues(self):
+        calls, stats = [], SpeculationStats()
+        transcriber = self._transcriber(_transcribe(calls), stats)
+        audio = await _record(transcriber, _chunks(1.0, 1000) + _chunks(1.0, 0))
+        await asyncio.sleep(0.05)
+
+        # Launched once, early in the silence, on the audio captured so far
+        assert len(calls) == 1
+        assert calls[0] < len(audio)
+
+        assert await transcriber.finish(audio) == "hello there"
+        assert stats.get_stats()['hits'] == 1
+        assert stats.get_stats()['hit_rate'] == 1.0
+        assert stats.saved_seconds > 0
+
+    @pytest.mark.asyncio
+    async def test_resumed_speech_discards_speculation(self):
+        calls, stats = [], SpeculationStats()
+        transcriber = self._transcriber(_transcribe(calls, delay=0.5), stats)
+        audio = await _record(transcriber, _chunks(0.5, 1000) + _chunks(0.3, 0) + _chunks(0.5, 1000)
+                              + _chunks(0.5, 0))
+
+        # A second speculation covers the speech after the pause
+        assert await transcriber.finish(audio) == "hello there"
+        assert stats.launched == 2
+        assert stats.wasted == 1
+        assert stats.hits == 1
+        assert stats.get_stats()['waste_rate'] == 0.5
+
+    @pytest.mark.asyncio
+    async def test_trimmer_cuts_the_wait_for_speech(self):
+        from types import SimpleNamespace
+        from voice_mode.silence_trim import SilenceTrimmer
+
+        calls = []
+        trimmer = SilenceTrimmer(sample_rate=RATE, pad_ms=300)
+        transcriber = SpeculativeTranscriber(_transcribe(calls), asyncio.get_running_loop(), sample_rate=RATE,
+                                             delay_ms=150, stats=SpeculationStats(), trimmer=trimmer)
+
+        def process(chunk, is_speech):
+            # The trimmer sees each chunk first, as in converse
+            trimmer.process(chunk, is_speech)
+            transcriber.process(chunk, is_speech)
+
+        speech = _chunks(1.0, 1000)
+        await _record(SimpleNamespace(process=process), _chunks(1.0, 0) + speech + _chunks(1.0, 0))
+        await asyncio.sleep(0.05)
+
+        # Leading pad, the speech, and the silence up to the launch
+        assert calls == [len(speech) * CHUNK + int(0.3 * RATE) + int(0.15 * RATE)]
+
+    @pytest.mark.asyncio
+    async def test_short_silence_does_not_launch(self):
+        calls, stats = [], SpeculationStats()
+        transcriber = self._transcriber(_transcribe(calls), stats)
+        audio = await _record(transcriber, _chunks(0.5, 1000) + _chunks(0.09, 0) + _chunks(0.5, 1000))
+
+        assert await transcriber.finish(audio) is None
+        assert calls == []
+        assert stats.launched == 0
+
+    @pytest.mark.asyncio
+    async def test_no_speech_does_not_launch(self):
+        calls = []
+        transcriber = self._transcriber(_transcribe(calls), SpeculationStats())
+        audio = await _record(transcriber, _chunks(1.0, 0))
+        assert await transcriber.finish(audio) is None
+        assert calls == []
+
+    @pytest.mark.asyncio
+    async def test_unseen_audio_falls_back(self):
+        stats = SpeculationStats()
+        transcriber = self._transcriber(_transcribe([]), stats)
+        audio = await _record(transcriber, _chunks(0.5, 1000) + _chunks(0.5, 0))
+        # e.g. the recorder fell back to a fixed-duration recording
+        assert await transcriber.finish(np.concatenate([audio, audio])) is None
+        assert stats.failures == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_speculation_falls_back(self):
+        stats = SpeculationStats()
+        transcriber = self._transcriber(_transcribe([], error=ConnectionError("whisper went away")), stats)
+        audio = await _record(transcriber, _chunks(0.5, 1000) + _chunks(0.5, 0))
+        assert await transcriber.finish(audio) is None
+        assert stats.failures == 1
+        assert stats.hits == 0
+
+    @pytest.mark.asyncio
+    async def test_cancel(self):
+        calls = []
+        transcriber = self._transcriber(_transcribe(calls, delay=5.0), SpeculationStats())
+        await _record(transcriber, _chunks(0.5, 1000) + _chunks(0.5, 0))
+        future = transcriber.future
+        transcriber.cancel()
+        await asyncio.sleep(0.01)
+        assert future.cancelled()
+
+
+class TestTranscribeQuietly:
+    """Test speculations leave no transcripts or exchanges behind."""
+
+    @pytest.mark.asyncio
+    async def test_nothing_is_saved_or_logged(self):
+        with patch("voice_mode.simple_failover.simple_stt_failover", AsyncMock(return_value="hello")) as stt, \
+             patch("voice_mode.config.save_transcription") as save, \
+             patch("voice_mode.conversation_logger.get_conversation_logger") as get_logger:
+            assert await transcribe_quietly(np.full(RATE, 1000, dtype=np.int16)) == "hello"
+
+        stt.assert_awaited_once()
+        save.assert_not_called()
+        get_logger.assert_not_called()
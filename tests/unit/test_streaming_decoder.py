@@ -0,0 +1,168 @@
+"""Tests for incremental decoding of compressed TTS streams."""
+
+import asyncio
+import shutil
+import subprocess
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from voice_mode import output_engine
+from voice_mode.audio_decode import AudioDecodeError, StreamingDecoder
+from voice_mode.streaming import stream_with_buffering
+
+
+class FakeCallbackStream:
+    """Calls the stream callback from a background thread like PortAudio does."""
+
+    def __init__(self, samplerate, channels, dtype, callback, blocksize=480, speedup=4.0):
+        self.callback = callback
+        self.blocksize = blocksize
+        self.interval = blocksize / samplerate / speedup
+        self.played = []
+        self._running = False
+        self._thread = None
+
+    def start(self):
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while self._running:
+            outdata = np.empty((self.blocksize, 1), dtype=np.int16)
+            self.callback(outdata, self.blocksize, None, None)
+            self.played.append(outdata[:, 0].copy())
+            time.sleep(self.interval)
+
+    def stop(self):
+        self._running = False
+        if self._thread:
+            self._thread.join()
+
+    def close(self):
+        self.stop()
+
+
+def _fake_client(pcm: bytes, chunk_bytes: int = 4096):
+    class Response:
+        async def iter_bytes(self, chunk_size=None):
+            for start in range(0, len(pcm), chunk_bytes):
+                yield pcm[start:start + chunk_bytes]
+                await asyncio.sleep(0)
+
+    class Context:
+        async def __aenter__(self):
+            return Response()
+
+        async def __aexit__(self, *exc):
+            pass
+
+    client = MagicMock()
+    client.audio.speech.with_streaming_response.create = lambda **params: Context()
+    return client
+
+
+pytestmark = pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not installed")
+
+
+def _encode_tone(format: str = "mp3", seconds: float = 1.0, sample_rate: int = 24000) -> bytes:
+    """Encode a 440 Hz tone with ffmpeg."""
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    pcm = (np.sin(2 * np.pi * 440 * t) * 12000).astype(np.int16)
+    container = {"mp3": "mp3", "opus": "ogg"}[format]
+    result = subprocess.run(
+        ["ffmpeg", "-hide_banner", "-loglevel", "error",
+         "-f", "s16le", "-ar", str(sample_rate), "-ac", "1", "-i", "pipe:0",
+         "-f", container, "pipe:1"],
+        input=pcm.tobytes(), capture_output=True, check=True
+    )
+    return result.stdout
+
+
+class TestStreamingDecoder:
+    """Test the long-lived ffmpeg decoder."""
+
+    @pytest.mark.asyncio
+    async def test_decodes_before_input_is_closed(self):
+        data = _encode_tone(seconds=2.0)
+        decoder = StreamingDecoder("mp3", 24000)
+        await decoder.start()
+        try:
+            # Feed only the first half; audio should come out without closing stdin
+            await decoder.feed(data[:len(data) // 2])
+            samples = await asyncio.wait_for(decoder.read(), timeout=5)
+            assert samples is not None and len(samples) > 0
+            assert samples.dtype == np.int16
+        finally:
+            await decoder.close()
+
+    @pytest.mark.asyncio
+    async def test_full_stream_round_trip(self):
+        data = _encode_tone(seconds=1.0)
+        decoder = StreamingDecoder("mp3", 24000)
+        await decoder.start()
+
+        async def feed():
+            for start in range(0, len(data), 1000):
+                await decoder.feed(data[start:start + 1000])
+            await decoder.close_input()
+
+        feeder = asyncio.create_task(feed())
+        chunks = []
+        while (samples := await decoder.read()) is not None:
+            chunks.append(samples)
+        await feeder
+        await decoder.close()
+
+        total = sum(len(c) for c in chunks)
+        # mp3 adds encoder padding; allow some slack around one second
+        assert 24000 <= total <= 24000 + 4000
+        assert len(chunks) > 1
+
+    @pytest.mark.asyncio
+    async def test_invalid_data_raises(self):
+        decoder = StreamingDecoder("mp3", 24000)
+        await decoder.start()
+        try:
+            with pytest.raises(AudioDecodeError):
+                await decoder.feed(b"not audio at all" * 64)
+                await decoder.close_input()
+                while await decoder.read() is not None:
+                    pass
+        finally:
+            await decoder.close()
+
+
+class TestStreamWithBuffering:
+    """Test compressed streams are played while downloading."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("format", ["mp3", "opus"])
+    async def test_plays_decoded_stream(self, format):
+        data = _encode_tone(format, seconds=0.5)
+        created = {}
+
+        def make_stream(**kwargs):
+            created["stream"] = FakeCallbackStream(**kwargs)
+            return created["stream"]
+
+        with patch.object(output_engine, "sd", MagicMock(OutputStream=make_stream)):
+            success, metrics = await stream_with_buffering(
+                text="test",
+                openai_client=_fake_client(data, chunk_bytes=512),
+                request_params={"response_format": format},
+                capture_pcm=True
+            )
+
+        assert success
+        assert metrics.decode_latency > 0
+        assert metrics.ttfa > 0
+        pcm = np.frombuffer(metrics.pcm_data, dtype=np.int16)
+        assert len(pcm) >= 0.45 * 24000
+        assert np.abs(pcm).max() > 5000
+        played = np.concatenate(created["stream"].played)
+        assert np.count_nonzero(played) > 0.4 * 24000
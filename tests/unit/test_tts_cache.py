@@ -0,0 +1,118 @@
+"""Tests for the content-addressed TTS audio cache."""
+
+import os
+import time
+
+import numpy as np
+
+from voice_mode.tts_cache import TTSCache, make_cache_key
+
+
+def _key(text="Got it", **overrides):
+    params = dict(voice="af_sky", model="tts-1", speed=None, instructions=None,
+                  audio_format="pcm", provider="kokoro")
+    params.update(overrides)
+    return make_cache_key(text, **params)
+
+
+def _tone(seconds=0.1, sample_rate=24000):
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    return (np.sin(2 * np.pi * 440 * t) * 10000).astype(np.int16)
+
+
+class TestCacheKey:
+    """Test that every request parameter affecting the audio changes the key."""
+
+    def test_same_request_same_key(self):
+        assert _key() == _key()
+
+    def test_each_parameter_changes_key(self):
+        base = _key()
+        assert _key("Let me check") != base
+        assert _key(voice="alloy") != base
+        assert _key(model="tts-1-hd") != base
+        assert _key(speed=1.5) != base
+        assert _key(instructions="Speak cheerfully") != base
+        assert _key(audio_format="mp3") != base
+        assert _key(provider="openai") != base
+
+
+class TestTTSCache:
+    """Test storage, lookup, eviction and statistics."""
+
+    def test_round_trip(self, tmp_path):
+        cache = TTSCache(tmp_path, max_bytes=1024 * 1024, max_age_seconds=3600)
+        samples = _tone()
+        assert cache.put(_key(), samples, 24000, synthesis_time=0.8)
+
+        cached = cache.get(_key())
+        assert cached is not None
+        np.testing.assert_array_equal(cached.samples, samples)
+        assert cached.sample_rate == 24000
+        assert cached.synthesis_time == 0.8
+        assert cached.duration == len(samples) / 24000
+
+    def test_raw_bytes_and_stereo(self, tmp_path):
+        cache = TTSCache(tmp_path, max_bytes=1024 * 1024, max_age_seconds=3600)
+        stereo = np.stack([_tone(), _tone()], axis=1)
+        cache.put(_key(), stereo.tobytes(), 24000, 0.5, channels=2)
+
+        cached = cache.get(_key())
+        assert cached.samples.shape == stereo.shape
+
+    def test_miss_and_hit_stats(self, tmp_path):
+        cache = TTSCache(tmp_path, max_bytes=1024 * 1024, max_age_seconds=3600)
+        assert cache.get(_key()) is None
+        cache.put(_key(), _tone(), 24000, synthesis_time=1.2)
+        cache.get(_key())
+        cache.get(_key())
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+        assert abs(stats["hit_rate"] - 2 / 3) < 1e-9
+        assert abs(stats["saved_seconds"] - 2.4) < 1e-9
+        assert stats["entries"] == 1
+
+    def test_lru_eviction_by_size(self, tmp_path):
+        entry_bytes = len(_tone().tobytes())
+        cache = TTSCache(tmp_path, max_bytes=entry_bytes * 2, max_age_seconds=3600)
+
+        cache.put(_key("one"), _tone(), 24000, 0.5)
+        cache.put(_key("two"), _tone(), 24000, 0.5)
+        # Age the entries so access order is unambiguous, then touch "one"
+        for i, text in enumerate(["one", "two"]):
+            past = time.time() - 100 + i
+            os.utime(tmp_path / f"{_key(text)}.pcm", (past, past))
+        assert cache.get(_key("one")) is not None
+
+        cache.put(_key("three"), _tone(), 24000, 0.5)
+
+        assert cache.get(_key("two")) is None
+        assert cache.get(_key("one")) is not None
+        assert cache.get(_key("three")) is not None
+        assert not (tmp_path / f"{_key('two')}.json").exists()
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_expired_entries_are_dropped(self, tmp_path):
+        cache = TTSCache(tmp_path, max_bytes=1024 * 1024, max_age_seconds=60)
+        cache.put(_key(), _tone(), 24000, 0.5)
+        past = time.time() - 120
+        os.utime(tmp_path / f"{_key()}.pcm", (past, past))
+
+        assert cache.get(_key()) is None
+        assert not (tmp_path / f"{_key()}.pcm").exists()
+
+    def test_corrupt_entry_is_discarded(self, tmp_path):
+        cache = TTSCache(tmp_path, max_bytes=1024 * 1024, max_age_seconds=3600)
+        cache.put(_key(), _tone(), 24000, 0.5)
+        (tmp_path / f"{_key()}.json").write_text("not json")
+
+        assert cache.get(_key()) is None
+        assert not (tmp_path / f"{_key()}.pcm").exists()
+
+    def test_long_text_not_cacheable(self, tmp_path):
+        cache = TTSCache(tmp_path, max_bytes=1024 * 1024, max_age_seconds=3600, max_text_length=20)
+        assert cache.is_cacheable("Got it")
+        assert not cache.is_cacheable("x" * 21)
+        assert not cache.is_cacheable("")
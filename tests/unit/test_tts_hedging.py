@@ -0,0 +1,176 @@
+"""Tests for hedged TTS requests across endpoints."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from voice_mode.tts_hedging import HedgeCandidate, HedgedSpeechClient, HedgeStats
+
+
+class FakeEndpoint:
+    """OpenAI-style client whose first audio bytes arrive after a delay."""
+
+    def __init__(self, name, first_byte_delay, fail=False):
+        self.name = name
+        self.first_byte_delay = first_byte_delay
+        self.fail = fail
+        self.requests = []
+        self.cancelled = False
+        self.closed = 0
+        self.audio = MagicMock()
+        self.audio.speech.with_streaming_response.create = self._create
+
+    def _create(self, **params):
+        endpoint = self
+        endpoint.requests.append(params)
+
+        class Response:
+            async def iter_bytes(self, chunk_size=None):
+                try:
+                    await asyncio.sleep(endpoint.first_byte_delay)
+                except asyncio.CancelledError:
+                    endpoint.cancelled = True
+                    raise
+                if endpoint.fail:
+                    raise ConnectionError(f"{endpoint.name} is down")
+                yield endpoint.name.encode()
+                yield b"-rest"
+
+        class Context:
+            async def __aenter__(self):
+                return Response()
+
+            async def __aexit__(self, *exc):
+                endpoint.closed += 1
+
+        return Context()
+
+
+def _client(endpoints, delay_ms=20, stats=None):
+    candidates = [HedgeCandidate(base_url=e.name, client=e, voice=f"{e.name}-voice") for e in endpoints]
+    return HedgedSpeechClient(candidates, stats=stats or HedgeStats(), delay_ms=delay_ms)
+
+
+async def _speak(client, **params):
+    async with client.audio.speech.with_streaming_response.create(**params) as response:
+        return b"".join([chunk async for chunk in response.iter_bytes()])
+
+
+class TestHedgedSpeechClient:
+    """Test racing, cancellation and statistics."""
+
+    @pytest.mark.asyncio
+    async def test_fast_preferred_endpoint_is_not_hedged(self):
+        local, cloud = FakeEndpoint("local", 0.0), FakeEndpoint("cloud", 0.0)
+        client = _client([local, cloud])
+
+        assert await _speak(client, input="hi", voice="af_sky") == b"local-rest"
+        assert not client.hedged
+        assert cloud.requests == []
+        assert local.requests[0]["voice"] == "local-voice"
+
+    @pytest.mark.asyncio
+    async def test_slow_endpoint_loses_to_hedge(self):
+        local, cloud = FakeEndpoint("local", 1.0), FakeEndpoint("cloud", 0.0)
+        stats = HedgeStats()
+        client = _client([local, cloud], stats=stats)
+
+        audio = await asyncio.wait_for(_speak(client, input="hi"), timeout=0.5)
+
+        assert audio == b"cloud-rest"
+        assert client.hedged
+        assert client.served_by == "cloud"
+        assert local.cancelled
+        assert local.closed == 1
+        summary = stats.get_stats()
+        assert summary["cloud"]["hedge_wins"] == 1
+        assert summary["local"]["cancelled"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failure_fails_over_without_waiting(self):
+        local, cloud = FakeEndpoint("local", 0.0, fail=True), FakeEndpoint("cloud", 0.0)
+        client = _client([local, cloud], delay_ms=5000)
+
+        audio = await asyncio.wait_for(_speak(client, input="hi"), timeout=1)
+
+        assert audio == b"cloud-rest"
+        assert client.stats.get_stats()["local"]["failures"] == 1
+
+    @pytest.mark.asyncio
+    async def test_all_endpoints_failing_raises(self):
+        client = _client([FakeEndpoint("a", 0.0, fail=True), FakeEndpoint("b", 0.0, fail=True)])
+        with pytest.raises(ConnectionError):
+            await _speak(client, input="hi")
+        assert client.served_by is None
+
+    @pytest.mark.asyncio
+    async def test_winner_is_pinned_for_later_segments(self):
+        local, cloud = FakeEndpoint("local", 1.0), FakeEndpoint("cloud", 0.0)
+        client = _client([local, cloud])
+        await asyncio.wait_for(_speak(client, input="One."), timeout=0.5)
+        await _speak(client, input="Two.")
+
+        assert [r["input"] for r in cloud.requests] == ["One.", "Two."]
+        assert len(local.requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_segments_share_the_first_race(self):
+        # Pipelined segments must not each race and end up on different endpoints
+        local, cloud = FakeEndpoint("local", 1.0), FakeEndpoint("cloud", 0.0)
+        client = _client([local, cloud])
+        await asyncio.wait_for(asyncio.gather(
+            _speak(client, input="One."), _speak(client, input="Two.")
+        ), timeout=0.5)
+
+        assert sorted(r["input"] for r in cloud.requests) == ["One.", "Two."]
+        assert len(local.requests) == 1
+        assert client.stats.get_stats()["cloud"]["races"] == 1
+
+    @pytest.mark.asyncio
+    async def test_format_unsupported_by_endpoint_is_skipped(self):
+        # Kokoro can't produce AAC, so it must not serve an AAC request
+        kokoro = FakeEndpoint("http://127.0.0.1:8880/v1", 0.0)
+        openai = FakeEndpoint("https://api.openai.com/v1", 0.0)
+        client = _client([kokoro, openai])
+
+        await _speak(client, input="hi", response_format="aac")
+
+        assert kokoro.requests == []
+        assert client.served_by == "https://api.openai.com/v1"
+
+
+class TestHedgeDelay:
+    """Test fixed and learned hedge delays."""
+
+    def test_fixed_delay(self):
+        assert HedgeStats().hedge_delay("local", 250, 600) == 0.25
+
+    def test_default_until_enough_samples(self):
+        stats = HedgeStats()
+        stats.record_first_byte("local", 0.1)
+        assert stats.hedge_delay("local", None, 600) == 0.6
+
+    def test_learned_p95(self):
+        stats = HedgeStats()
+        for latency in [0.1] * 19 + [0.9]:
+            stats.record_first_byte("local", latency)
+        assert stats.hedge_delay("local", None, 600) == pytest.approx(0.9)
+
+
+class TestHedgedFailoverPath:
+    """Test hedging is used outside simple failover too."""
+
+    @pytest.mark.asyncio
+    async def test_full_failover_path_hedges(self):
+        from voice_mode.tools.converse import text_to_speech_with_failover
+
+        hedged = AsyncMock(return_value=(True, {}, {'base_url': 'cloud'}))
+        with patch("voice_mode.config.SIMPLE_FAILOVER", False), \
+             patch("voice_mode.config.TTS_HEDGE_ENABLED", True), \
+             patch("voice_mode.config.TTS_BASE_URLS", ["local", "cloud"]), \
+             patch("voice_mode.simple_failover.hedged_tts", hedged):
+            success, _, config = await text_to_speech_with_failover("Hello.", voice="af_sky")
+
+        assert success and config['base_url'] == 'cloud'
+        assert hedged.await_args.args[:2] == ("Hello.", "af_sky")
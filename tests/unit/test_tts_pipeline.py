@@ -0,0 +1,192 @@
+"""Tests for sentence-pipelined TTS streaming."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from voice_mode import output_engine
+from voice_mode.streaming import split_into_segments, stream_tts_pipelined
+
+
+class FakeOutputStream:
+    """Calls the stream callback from a background thread and records what it played."""
+
+    def __init__(self, blocksize=480, interval=0.002):
+        self.blocksize = blocksize
+        self.interval = interval
+        self.callback = None
+        self.writes = []
+        self._running = False
+        self._thread = None
+
+    def __call__(self, samplerate, channels, dtype, callback, **kwargs):
+        self.callback = callback
+        return self
+
+    def start(self):
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while self._running:
+            outdata = np.empty((self.blocksize, 1), dtype=np.int16)
+            self.callback(outdata, self.blocksize, None, None)
+            played = outdata[:, 0]
+            # Drop the silence the engine plays between jobs
+            self.writes.append(played[played != 0].copy())
+            time.sleep(self.interval)
+
+    def stop(self):
+        self._running = False
+        if self._thread:
+            self._thread.join()
+
+    def close(self):
+        self.stop()
+
+
+class FakeSpeechClient:
+    """OpenAI-style client that returns constant-valued PCM per segment."""
+
+    def __init__(self, segments, delays, chunk_bytes=4000):
+        self.segments = segments
+        self.delays = delays
+        self.chunk_bytes = chunk_bytes
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.audio = MagicMock()
+        self.audio.speech.with_streaming_response.create = self._create
+
+    def _create(self, **params):
+        index = self.segments.index(params["input"])
+        client = self
+
+        class Response:
+            async def iter_bytes(self, chunk_size=None):
+                pcm = np.full(4000, index + 1, dtype=np.int16).tobytes()
+                await asyncio.sleep(client.delays[index])
+                for start in range(0, len(pcm), client.chunk_bytes):
+                    yield pcm[start:start + client.chunk_bytes]
+
+        class Context:
+            async def __aenter__(self):
+                client.in_flight += 1
+                client.max_in_flight = max(client.max_in_flight, client.in_flight)
+                return Response()
+
+            async def __aexit__(self, *exc):
+                client.in_flight -= 1
+
+        return Context()
+
+
+class TestSplitIntoSegments:
+    """Test sentence/clause segmentation."""
+
+    def test_short_text_is_one_segment(self):
+        assert split_into_segments("Got it.") == ["Got it."]
+
+    def test_first_segment_is_first_sentence(self):
+        text = "Sure, I can help with that. " + "Here is a longer explanation of the change. " * 5
+        segments = split_into_segments(text, first_segment_chars=60, max_segment_chars=200)
+        assert segments[0] == "Sure, I can help with that."
+        assert all(len(seg) <= 200 for seg in segments)
+        assert " ".join(segments) == " ".join(text.split())
+
+    def test_long_sentence_splits_at_clauses(self):
+        text = "First clause here, second clause here; third clause here: and the rest of it"
+        segments = split_into_segments(text, first_segment_chars=25, max_segment_chars=40)
+        assert segments[0] == "First clause here,"
+        assert " ".join(segments) == text
+
+    def test_no_empty_segments(self):
+        assert split_into_segments("  Hello!   World?  ") == ["Hello! World?"]
+
+
+class TestPipelinedStreaming:
+    """Test ordered, concurrent segment playback."""
+
+    @pytest.mark.asyncio
+    async def test_segments_play_in_order(self):
+        segments = ["One.", "Two.", "Three."]
+        # Later segments finish before earlier ones; playback must still be in order
+        client = FakeSpeechClient(segments, delays=[0.05, 0.0, 0.0])
+        output = FakeOutputStream()
+
+        with patch.object(output_engine, "sd", MagicMock(OutputStream=output)):
+            success, metrics = await stream_tts_pipelined(
+                text=" ".join(segments),
+                openai_client=client,
+                request_params={"model": "tts-1", "voice": "alloy", "response_format": "pcm"},
+                segments=segments,
+                max_concurrency=2,
+                capture_pcm=True
+            )
+
+        assert success
+        played = np.concatenate(output.writes)
+        assert list(dict.fromkeys(played.tolist())) == [1, 2, 3]
+        assert len(played) == 3 * 4000
+        assert metrics.pcm_data == played.tobytes()
+        assert [seg.index for seg in metrics.segments] == [0, 1, 2]
+        assert all(seg.bytes_received == 8000 for seg in metrics.segments)
+        assert metrics.ttfa > 0
+        assert client.max_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_segment_failure_reports_failure(self):
+        segments = ["One.", "Two."]
+        client = FakeSpeechClient(segments, delays=[0.0, 0.0])
+        original = client._create
+
+        def failing_create(**params):
+            if params["input"] == "Two.":
+                raise RuntimeError("endpoint error")
+            return original(**params)
+
+        client.audio.speech.with_streaming_response.create = failing_create
+        output = FakeOutputStream()
+
+        with patch.object(output_engine, "sd", MagicMock(OutputStream=output)):
+            success, metrics = await stream_tts_pipelined(
+                text="One. Two.",
+                openai_client=client,
+                request_params={"response_format": "pcm"},
+                segments=segments
+            )
+
+        assert not success
+
+    @pytest.mark.asyncio
+    async def test_compressed_segments_decode_off_the_event_loop(self):
+        from voice_mode.audio_decode import DecodedAudio
+
+        segments = ["One.", "Two."]
+        client = FakeSpeechClient(segments, delays=[0.0, 0.0])
+        output = FakeOutputStream()
+        threads = []
+
+        def decode(data, format, sample_rate):
+            threads.append(threading.current_thread())
+            samples = np.frombuffer(data, dtype=np.int16).astype(np.float32) / 32768.0
+            return DecodedAudio(samples=samples, sample_rate=sample_rate, channels=1)
+
+        with patch.object(output_engine, "sd", MagicMock(OutputStream=output)), \
+             patch("voice_mode.audio_decode.decode_audio_bytes", decode):
+            success, metrics = await stream_tts_pipelined(
+                text="One. Two.",
+                openai_client=client,
+                request_params={"response_format": "mp3"},
+                segments=segments,
+                capture_pcm=True
+            )
+
+        assert success
+        assert len(threads) == 2
+        assert threading.current_thread() not in threads
+        assert len(metrics.pcm_data) == 2 * 8000
@@ -0,0 +1,152 @@
+"""Tests for speculative TTS prefetch."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+import pytest
+
+from voice_mode.tts_cache import CachedAudio
+from voice_mode.tts_prefetch import TTSPrefetchStore, get_prefetch_store, make_prefetch_key
+
+
+def _audio(frames=2400, synthesis_time=0.8):
+    return CachedAudio(
+        samples=np.ones(frames, dtype=np.int16),
+        sample_rate=24000,
+        channels=1,
+        synthesis_time=synthesis_time
+    )
+
+
+def _synth(audio=None, delay=0.0, fail=False):
+    async def synthesize():
+        await asyncio.sleep(delay)
+        if fail:
+            raise RuntimeError("endpoint down")
+        return audio or _audio(), {'base_url': 'http://127.0.0.1:8880/v1', 'voice': 'af_sky'}
+    return synthesize
+
+
+class TestTTSPrefetchStore:
+    """Test slots, TTL, memory cap and metrics."""
+
+    @pytest.mark.asyncio
+    async def test_prefetched_audio_is_served_once(self):
+        store = TTSPrefetchStore(ttl=60, max_bytes=1 << 20)
+        key = make_prefetch_key("Done, the tests pass.", voice="af_sky")
+        assert store.schedule(key, _synth())
+        assert not store.schedule(key, _synth())
+        await asyncio.sleep(0.01)
+
+        audio, config = await store.take(key)
+        assert audio.duration == pytest.approx(0.1)
+        assert config['voice'] == 'af_sky'
+        assert await store.take(key) is None
+
+        stats = store.get_stats()
+        assert stats['hits'] == 1
+        assert stats['saved_seconds'] == pytest.approx(0.8)
+
+    @pytest.mark.asyncio
+    async def test_take_waits_for_synthesis_in_progress(self):
+        store = TTSPrefetchStore(ttl=60, max_bytes=1 << 20)
+        key = make_prefetch_key("Still working on it.")
+        store.schedule(key, _synth(delay=0.05))
+
+        result = await asyncio.wait_for(store.take(key), timeout=1)
+        assert result is not None
+
+    @pytest.mark.asyncio
+    async def test_stalled_synthesis_is_a_miss(self):
+        store = TTSPrefetchStore(ttl=60, max_bytes=1 << 20, wait=0.05)
+        key = make_prefetch_key("Stuck on a hung endpoint.")
+        store.schedule(key, _synth(delay=10))
+        slot = store._slots[key]
+
+        assert await asyncio.wait_for(store.take(key), timeout=1) is None
+        await asyncio.sleep(0.01)
+        assert slot.task.cancelled()
+        assert store.get_stats()['misses'] == 1
+
+    @pytest.mark.asyncio
+    async def test_cleared_synthesis_is_a_miss(self):
+        store = TTSPrefetchStore(ttl=60, max_bytes=1 << 20)
+        key = make_prefetch_key("Cancelled before it finished.")
+        store.schedule(key, _synth(delay=10))
+
+        take = asyncio.create_task(store.take(key))
+        await asyncio.sleep(0.01)
+        store.clear()
+
+        assert await asyncio.wait_for(take, timeout=1) is None
+
+    @pytest.mark.asyncio
+    async def test_different_parameters_miss(self):
+        store = TTSPrefetchStore(ttl=60, max_bytes=1 << 20)
+        assert await store.take(make_prefetch_key("Hello")) is None
+        assert store.get_stats()['misses'] == 0  # Nothing was prefetched
+
+        store.schedule(make_prefetch_key("Hello", voice="af_sky"), _synth())
+        await asyncio.sleep(0.01)
+        assert await store.take(make_prefetch_key("Hello", voice="nova")) is None
+        assert store.get_stats()['misses'] == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_slots_are_wasted(self):
+        store = TTSPrefetchStore(ttl=0.01, max_bytes=1 << 20)
+        key = make_prefetch_key("Too late.")
+        store.schedule(key, _synth())
+        await asyncio.sleep(0.05)
+
+        assert await store.take(key) is None
+        stats = store.get_stats()
+        assert stats['expired'] == 1
+        assert stats['wasted'] == 1
+
+    @pytest.mark.asyncio
+    async def test_memory_cap_drops_oldest(self):
+        store = TTSPrefetchStore(ttl=60, max_bytes=2 * 2400 * 2)
+        keys = [make_prefetch_key(f"Utterance {i}") for i in range(3)]
+        for key in keys:
+            store.schedule(key, _synth())
+            await asyncio.sleep(0.01)
+
+        assert store.get_stats()['evicted'] == 1
+        assert await store.take(keys[0]) is None
+        assert await store.take(keys[2]) is not None
+
+    @pytest.mark.asyncio
+    async def test_failed_synthesis_is_a_miss(self):
+        store = TTSPrefetchStore(ttl=60, max_bytes=1 << 20)
+        key = make_prefetch_key("Never arrives.")
+        store.schedule(key, _synth(fail=True))
+
+        assert await store.take(key) is None
+        assert store.get_stats()['failures'] == 1
+
+
+class TestPrefetchPlayback:
+    """Test converse's TTS path plays prefetched audio."""
+
+    @pytest.mark.asyncio
+    async def test_failover_plays_prefetched_audio(self):
+        from voice_mode.tools.converse import text_to_speech_with_failover
+
+        store = get_prefetch_store()
+        store.clear()
+        store.schedule(make_prefetch_key("Here you go.", voice="af_sky"), _synth())
+        await asyncio.sleep(0.01)
+
+        with patch("voice_mode.core.play_cached_audio", AsyncMock(return_value=True)) as play, \
+             patch("voice_mode.simple_failover.simple_tts_failover") as failover:
+            success, metrics, config = await text_to_speech_with_failover("Here you go.", voice="af_sky")
+
+        assert success
+        play.assert_called_once()
+        failover.assert_not_called()
+        assert metrics['prefetch_hit']
+        assert metrics['cache_saved'] == pytest.approx(0.8)
+        assert config['base_url'] == 'http://127.0.0.1:8880/v1'
+        store.clear()
+        store.reset_stats()
@@ -0,0 +1,98 @@
+"""Tests for the streaming VAD input stage."""
+
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from voice_mode.resample import resample
+from voice_mode.vad_frontend import VADFrontEnd
+
+RATE = 24000
+CHUNK = 720  # 30ms
+
+
+def _noise(seconds, seed=0):
+    return np.random.default_rng(seed).normal(0, 3000, int(seconds * RATE)).astype(np.int16)
+
+
+def _chunks(audio, size=CHUNK):
+    return [audio[i:i + size] for i in range(0, len(audio), size)]
+
+
+class TestVADFrontEnd:
+    """Test resampling and framing for WebRTC VAD."""
+
+    def test_one_frame_per_recorder_chunk(self):
+        front_end = VADFrontEnd(RATE, 30)
+        counts = [len(front_end.process(chunk)) for chunk in _chunks(_noise(0.9))]
+        assert counts == [1] * len(counts)
+        assert front_end.vad_rate == 16000
+        assert front_end.frame_samples == 480
+
+    def test_matches_whole_recording_resample(self):
+        audio = _noise(1.0)
+        front_end = VADFrontEnd(RATE, 30)
+        # Uneven chunk sizes, as PTT callbacks can deliver
+        frames = [f for chunk in _chunks(audio, 1000) for f in front_end.process(chunk)]
+        streamed = np.frombuffer(b"".join(frames), dtype=np.int16)
+
+        delay = front_end._resampler.delay
+        assert np.array_equal(streamed[:delay], np.zeros(delay, dtype=np.int16))
+        assert np.array_equal(streamed[delay:], resample(audio, RATE, 16000)[:len(streamed) - delay])
+
+    def test_supported_rate_is_not_resampled(self):
+        audio = _noise(0.1)[:1600]
+        front_end = VADFrontEnd(16000, 30)
+        frames = front_end.process(audio)
+        assert front_end.vad_rate == 16000
+        assert frames == [audio[:480].tobytes(), audio[480:960].tobytes(), audio[960:1440].tobytes()]
+
+    def test_float_input_is_converted(self):
+        front_end = VADFrontEnd(16000, 30)
+        (frame,) = front_end.process(np.full(480, 0.5, dtype=np.float32))
+        assert np.frombuffer(frame, dtype=np.int16)[0] == 16383
+
+
+class TestIsSpeech:
+    """Test chunk-level VAD decisions."""
+
+    def test_any_speech_frame_makes_the_chunk_speech(self):
+        vad = MagicMock()
+        vad.is_speech.side_effect = [False, True]
+        front_end = VADFrontEnd(16000, 30)
+
+        assert front_end.is_speech(vad, np.zeros(960, dtype=np.int16))
+        assert all(call.args[1] == 16000 for call in vad.is_speech.call_args_list)
+
+    def test_chunk_without_a_frame_keeps_the_last_decision(self):
+        vad = MagicMock()
+        vad.is_speech.return_value = True
+        front_end = VADFrontEnd(16000, 30)
+
+        assert not front_end.is_speech(vad, np.zeros(100, dtype=np.int16))
+        assert front_end.is_speech(vad, np.zeros(400, dtype=np.int16))
+        vad.is_speech.reset_mock()
+        assert front_end.is_speech(vad, np.zeros(100, dtype=np.int16))
+        vad.is_speech.assert_not_called()
+
+    def test_vad_errors_reach_the_caller(self):
+        vad = MagicMock()
+        vad.is_speech.side_effect = ValueError("bad frame")
+        with pytest.raises(ValueError):
+            VADFrontEnd(RATE, 30).is_speech(vad, _noise(0.03))
+
+    def test_real_vad_hears_speech_like_audio(self):
+        webrtcvad = pytest.importorskip("webrtcvad")
+        vad = webrtcvad.Vad(1)
+        t = np.arange(int(RATE * 1.0)) / RATE
+        phase = 2 * np.pi * np.cumsum(140 + 30 * np.sin(2 * np.pi * 3 * t)) / RATE
+        voiced = (sum(np.sin(k * phase) / k for k in range(1, 25)) * 6000).astype(np.int16)
+        silence = np.zeros(RATE, dtype=np.int16)
+
+        front_end = VADFrontEnd(RATE, 30)
+        decisions = [front_end.is_speech(vad, chunk) for chunk in _chunks(np.concatenate([voiced, silence]))]
+        half = len(decisions) // 2
+        assert sum(decisions[:half]) > 0.8 * half
+        # WebRTC VAD holds a speech decision for a few frames after speech ends
+        assert not any(decisions[-half // 2:])